@@ -115,6 +115,8 @@ redis_host = os.environ.get('REDIS_HOST', 'localhost')
 os.environ['REDIS_HOST'] = redis_host
 
 from omega_ai.utils.redis_manager import RedisManager
+from omega_ai.data_feed.tick_ingestor import TickIngestor, fibonacci_retracement_levels
+from omega_ai.data_feed.mm_ws_publisher import MMWebSocketPublisher
 
 # Configure logging with Rasta colors
 logging.basicConfig(
@@ -179,6 +181,17 @@ redis_conn = redis.Redis(
     db=0
 )
 
+# Shared tick ingestor - one pooled connection, one pipelined commit per tick/batch
+TICK_BATCH_WINDOW = float(os.getenv('BTC_TICK_BATCH_WINDOW_MS', '0')) / 1000.0
+_tick_ingestor: Optional[TickIngestor] = None
+_tick_ingestor_lock = threading.Lock()
+
+# Shared MM WebSocket publisher - one persistent connection, bounded send queue
+MM_WS_POLICY = os.getenv('MM_WS_POLICY', 'coalesce_latest')
+MM_WS_MAX_QUEUE = int(os.getenv('MM_WS_MAX_QUEUE', '1000'))
+_mm_publisher: Optional[MMWebSocketPublisher] = None
+_mm_publisher_lock = threading.Lock()
+
 # Redis health check function from Code version
 def check_redis_health():
     """Perform a health check on Redis connection and data integrity."""
@@ -236,24 +249,7 @@ def calculate_fibonacci_levels(high_price, low_price):
     """Calculate and store Fibonacci retracement levels for current price range."""
     try:
         # Calculate retracement levels based on the provided high and low prices
-        price_range = high_price - low_price
-        
-        # Common Fibonacci retracement levels
-        levels = {
-            "0.0": low_price,
-            "0.236": low_price + 0.236 * price_range,
-            "0.382": low_price + 0.382 * price_range,
-            "0.5": low_price + 0.5 * price_range,  # Not a Fibonacci ratio but commonly used
-            "0.618": low_price + 0.618 * price_range,
-            "0.786": low_price + 0.786 * price_range,
-            "1.0": high_price,
-            # Extensions beyond the range
-            "1.618": high_price + 0.618 * price_range,
-            "2.618": high_price + 1.618 * price_range
-        }
-        
-        # Format levels for storage
-        formatted_levels = {k: f"{v:.2f}" for k, v in levels.items()}
+        formatted_levels = fibonacci_retracement_levels(high_price, low_price)
         
         # Store in Redis
         redis_host = os.getenv('REDIS_HOST', 'localhost')
@@ -272,7 +268,11 @@ def calculate_fibonacci_levels(high_price, low_price):
 
 # WebSocket integration function from Code version
 async def send_to_mm_websocket(price):
-    """Send BTC price update to MM WebSocket."""
+    """Send a single BTC price update to MM WebSocket over a one-off connection.
+
+    The tick path uses the shared ``MMWebSocketPublisher`` (``get_mm_publisher``);
+    this helper is kept for one-off sends from scripts.
+    """
     while True:
         try:
             async with websockets.connect(
@@ -315,6 +315,50 @@ except Exception as e:
     log_method = print  # Will be replaced with log_rasta after it's defined
     log_method(f"⚠️ Error loading MM Trap Detector module: {str(e)}")
 
+def get_tick_ingestor() -> TickIngestor:
+    """Return the process-wide tick ingestor, creating it on first use."""
+    global _tick_ingestor
+    with _tick_ingestor_lock:
+        if _tick_ingestor is None:
+            _tick_ingestor = TickIngestor(
+                host=os.getenv('REDIS_HOST', 'localhost'),
+                port=int(os.getenv('REDIS_PORT', '6379')),
+                batch_window=TICK_BATCH_WINDOW
+            )
+        return _tick_ingestor
+
+def get_mm_publisher() -> MMWebSocketPublisher:
+    """Return the process-wide MM WebSocket publisher, starting it on first use."""
+    global _mm_publisher
+    with _mm_publisher_lock:
+        if _mm_publisher is None:
+            _mm_publisher = MMWebSocketPublisher(
+                url=MM_WS_URL,
+                max_queue=MM_WS_MAX_QUEUE,
+                policy=MM_WS_POLICY
+            ).start()
+        return _mm_publisher
+
+def notify_trap_detector(price: float, redis_client) -> None:
+    """Feed an accepted tick to the high frequency trap detector."""
+    if mm_trap_detector_available and hf_detector:
+        try:
+            # Update the detector with the new price
+            timestamp = datetime.now(UTC)
+            hf_detector.update_price_data(price, timestamp)
+            
+            # Check for high frequency mode activation
+            hf_active, multiplier = hf_detector.detect_high_freq_trap_mode(price)
+            if hf_active:
+                log_rasta(f"⚠️ HIGH FREQUENCY TRAP MODE ACTIVATED! Multiplier: {multiplier}", RED_RASTA, "warning")
+        except Exception as e:
+            log_rasta(f"Error using MM Trap Detector: {e}", YELLOW_RASTA, "warning")
+    else:
+        # Only display the warning once by checking if the flag has changed
+        if redis_client.get("mm_trap_detector_warning_shown") != "1":
+            log_rasta("MM Trap Detector module not available", YELLOW_RASTA, "warning")
+            redis_client.set("mm_trap_detector_warning_shown", "1")
+
 def on_message(ws, message):
     """Process incoming Binance BTC price data."""
     try:
@@ -324,102 +368,20 @@ def on_message(ws, message):
 
         log_rasta(f"LIVE BTC PRICE UPDATE: ${price:.2f} (Vol: {volume})", BLUE_RASTA)
         
-        # Update Redis values using the RedisManager with connection based on environment
-        redis_host = os.getenv('REDIS_HOST', 'localhost')
-        redis_port = int(os.getenv('REDIS_PORT', '6379'))
-        redis_manager = RedisManager(host=redis_host, port=redis_port)
-        prev_price = redis_manager.get_cached("prev_btc_price")
-        prev_price = float(prev_price) if prev_price else None
-
-        if prev_price is None or price != prev_price:
-            # Store both price and volume values separately
-            redis_manager.set_cached("last_btc_price", str(price))
-            redis_manager.set_cached("last_btc_volume", str(volume))
-            
-            # Store combined price and volume data in history
-            combined_data = f"{price},{volume}"
-            redis_manager.lpush("btc_movement_history", combined_data)
-            redis_manager.ltrim("btc_movement_history", -100, -1)
-            
-            abs_change = abs(price - prev_price) if prev_price is not None else 0
-            abs_change_scaled = abs_change * 100
-            redis_manager.lpush("abs_price_change_history", str(abs_change_scaled))
-            redis_manager.ltrim("abs_price_change_history", -100, -1)
-            redis_manager.set_cached("prev_btc_price", str(price))
-            
-            # Add last update time
-            redis_manager.set_cached("last_btc_update_time", str(time.time()))
-            
-            # Update Fibonacci levels every 100 price updates or when significant movement occurs
-            update_fibonacci = False
-            fibonacci_update_count = redis_manager.get_cached("fibonacci_update_count")
-            if fibonacci_update_count:
-                count = int(fibonacci_update_count)
-                if count >= 100:
-                    update_fibonacci = True
-                    redis_manager.set_cached("fibonacci_update_count", "0")
-                else:
-                    redis_manager.set_cached("fibonacci_update_count", str(count + 1))
-            else:
-                redis_manager.set_cached("fibonacci_update_count", "1")
-            
-            # Also update Fibonacci on significant price movement
-            if prev_price and abs(price - prev_price) / prev_price > 0.01:  # 1% change
-                update_fibonacci = True
-            
-            if update_fibonacci:
-                # Get price history for high and low calculation
-                history = redis_manager.lrange("btc_movement_history", 0, -1)
-                if history:
-                    prices = []
-                    for item in history:
-                        if "," in item:
-                            price_str, _ = item.split(",")
-                            prices.append(float(price_str))
-                        else:
-                            prices.append(float(item))
-                    
-                    if prices:
-                        high_price = max(prices)
-                        low_price = min(prices)
-                        calculate_fibonacci_levels(high_price, low_price)
+        # Commit the whole per-tick state update in one pipelined transaction
+        ingestor = get_tick_ingestor()
+        tick = ingestor.ingest(price, volume)
+        if tick:
+            log_rasta(f"Redis Updated: BTC Price = {price:.2f}, Volume = {volume}, Abs Change = {tick.abs_change_scaled:.2f}", GREEN_RASTA)
             
-            log_rasta(f"Redis Updated: BTC Price = {price:.2f}, Volume = {volume}, Abs Change = {abs_change_scaled:.2f}", GREEN_RASTA)
+            # Hand the price to the persistent MM WebSocket publisher (non-blocking)
+            get_mm_publisher().publish(price)
             
-            # Send price update to MM WebSocket server
-            asyncio.run(send_to_mm_websocket(price))
-            
-            # Store fibonacci aligned flags
-            is_fibonacci_aligned = False
-            for level_value in FIBONACCI_SEQUENCE:
-                level = level_value * 1000
-                if abs(price - level) < 50:  # Within $50 of a Fibonacci level
-                    is_fibonacci_aligned = True
-                    redis_manager.set_cached("fibonacci_alignment", f"{level_value}000")
-                    log_rasta(f"🔱 SACRED ALIGNMENT: BTC price near Fibonacci level ${level_value}000", MAGENTA_RASTA)
-                    break
-            
-            if not is_fibonacci_aligned:
-                redis_manager.set_cached("fibonacci_alignment", "0")
+            if tick.alignment != "0":
+                log_rasta(f"🔱 SACRED ALIGNMENT: BTC price near Fibonacci level ${tick.alignment}", MAGENTA_RASTA)
             
             # Notify the high frequency detector about price update
-            if mm_trap_detector_available and hf_detector:
-                try:
-                    # Update the detector with the new price
-                    timestamp = datetime.now(UTC)
-                    hf_detector.update_price_data(price, timestamp)
-                    
-                    # Check for high frequency mode activation
-                    hf_active, multiplier = hf_detector.detect_high_freq_trap_mode(price)
-                    if hf_active:
-                        log_rasta(f"⚠️ HIGH FREQUENCY TRAP MODE ACTIVATED! Multiplier: {multiplier}", RED_RASTA, "warning")
-                except Exception as e:
-                    log_rasta(f"Error using MM Trap Detector: {e}", YELLOW_RASTA, "warning")
-            else:
-                # Only display the warning once by checking if the flag has changed
-                if redis_manager.get_cached("mm_trap_detector_warning_shown") != "1":
-                    log_rasta("MM Trap Detector module not available", YELLOW_RASTA, "warning")
-                    redis_manager.set_cached("mm_trap_detector_warning_shown", "1")
+            notify_trap_detector(price, ingestor.redis)
         else:
             log_rasta(f"Price Unchanged, Skipping Redis Update: {price}", YELLOW_RASTA)
 
@@ -502,6 +464,10 @@ class BtcPriceFeed:
         redis_port = int(os.getenv('REDIS_PORT', '6379'))
         self.redis_manager = RedisManager(host=redis_host, port=redis_port)
         
+        # Tick writes go through the shared pipelined ingestor and MM publisher
+        self.ingestor = get_tick_ingestor()
+        self.mm_publisher = get_mm_publisher()
+        
         self.last_price = None
         self.last_volume = None
         self.is_running = False
@@ -550,33 +516,7 @@ class BtcPriceFeed:
             
             log_rasta(f"LIVE BTC PRICE UPDATE: ${price:.2f} (Vol: {volume})", BLUE_RASTA)
             
-            # Check if previous price exists and if it's different from current price
-            prev_price = self.redis_manager.get_cached("prev_btc_price")
-            prev_price = float(prev_price) if prev_price else None
-            
-            if prev_price is None or price != prev_price:
-                self.update_redis(price, volume)
-                
-                # Notify the high frequency detector about price update
-                if mm_trap_detector_available and hf_detector:
-                    try:
-                        # Update the detector with the new price
-                        timestamp = datetime.now(UTC)
-                        hf_detector.update_price_data(price, timestamp)
-                        
-                        # Check for high frequency mode activation
-                        hf_active, multiplier = hf_detector.detect_high_freq_trap_mode(price)
-                        if hf_active:
-                            log_rasta(f"⚠️ HIGH FREQUENCY TRAP MODE ACTIVATED! Multiplier: {multiplier}", RED_RASTA, "warning")
-                    except Exception as e:
-                        log_rasta(f"Error using MM Trap Detector: {e}", YELLOW_RASTA, "warning")
-                else:
-                    # Only display the warning once by checking if the flag has changed
-                    if self.redis_manager.get_cached("mm_trap_detector_warning_shown") != "1":
-                        log_rasta("MM Trap Detector module not available", YELLOW_RASTA, "warning")
-                        self.redis_manager.set_cached("mm_trap_detector_warning_shown", "1")
-            else:
-                log_rasta(f"Price Unchanged, Skipping Redis Update: {price}", YELLOW_RASTA)
+            self.update_redis(price, volume)
         except Exception as e:
             log_rasta(f"Error processing message: {e}", RED_RASTA, "error")
 
@@ -599,94 +539,28 @@ class BtcPriceFeed:
                 log_rasta(f"Skipping Redis update, invalid BTC price: {price}", YELLOW_RASTA)
                 return
 
-            prev_price = self.redis_manager.get_cached("prev_btc_price")
-            prev_price = float(prev_price) if prev_price else None  
-
-            if prev_price is None or price != prev_price:
-                # Update Redis values using the RedisManager's methods
-                self.redis_manager.set_cached("last_btc_price", str(price))
-                self.redis_manager.set_cached("last_btc_volume", str(volume if volume else 0))
-                
-                # Store combined price and volume data
-                combined_data = f"{price},{volume}"
-                self.redis_manager.lpush("btc_movement_history", combined_data)
-                self.redis_manager.ltrim("btc_movement_history", -100, -1)
-                
-                abs_change = abs(price - prev_price) if prev_price is not None else 0
-                abs_change_scaled = abs_change * 100
-                self.redis_manager.lpush("abs_price_change_history", str(abs_change_scaled))
-                self.redis_manager.ltrim("abs_price_change_history", -100, -1)
-                self.redis_manager.set_cached("prev_btc_price", str(price))
-                
-                # Add last update time
-                self.redis_manager.set_cached("last_btc_update_time", str(time.time()))
-                
-                # Update Fibonacci levels every 100 price updates or when significant movement occurs
-                update_fibonacci = False
-                fibonacci_update_count = self.redis_manager.get_cached("fibonacci_update_count")
-                if fibonacci_update_count:
-                    count = int(fibonacci_update_count)
-                    if count >= 100:
-                        update_fibonacci = True
-                        self.redis_manager.set_cached("fibonacci_update_count", "0")
-                    else:
-                        self.redis_manager.set_cached("fibonacci_update_count", str(count + 1))
-                else:
-                    self.redis_manager.set_cached("fibonacci_update_count", "1")
-                
-                # Also update Fibonacci on significant price movement
-                if prev_price and abs(price - prev_price) / prev_price > 0.01:  # 1% change
-                    update_fibonacci = True
+            tick = self.ingestor.ingest(price, volume)
+            if tick:
+                log_rasta(f"Redis Updated: BTC Price = {price:.2f}, Volume = {volume}, Abs Change = {tick.abs_change_scaled:.2f}", GREEN_RASTA)
                 
-                if update_fibonacci:
-                    # Get price history for high and low calculation
-                    history = self.redis_manager.lrange("btc_movement_history", 0, -1)
-                    if history:
-                        prices = []
-                        for item in history:
-                            if "," in item:
-                                price_str, _ = item.split(",")
-                                prices.append(float(price_str))
-                            else:
-                                prices.append(float(item))
-                        
-                        if prices:
-                            high_price = max(prices)
-                            low_price = min(prices)
-                            calculate_fibonacci_levels(high_price, low_price)
-                
-                log_rasta(f"Redis Updated: BTC Price = {price:.2f}, Volume = {volume}, Abs Change = {abs_change_scaled:.2f}", GREEN_RASTA)
+                # Send price update to MM WebSocket server
+                self.mm_publisher.publish(price)
                 
                 # Notify the high frequency detector about price update
-                if mm_trap_detector_available and hf_detector:
-                    try:
-                        # Update the detector with the new price
-                        timestamp = datetime.now(UTC)
-                        hf_detector.update_price_data(price, timestamp)
-                        
-                        # Check for high frequency mode activation
-                        hf_active, multiplier = hf_detector.detect_high_freq_trap_mode(price)
-                        if hf_active:
-                            log_rasta(f"⚠️ HIGH FREQUENCY TRAP MODE ACTIVATED! Multiplier: {multiplier}", RED_RASTA, "warning")
-                    except Exception as e:
-                        log_rasta(f"Error using MM Trap Detector: {e}", YELLOW_RASTA, "warning")
-                else:
-                    # Only display the warning once by checking if the flag has changed
-                    if self.redis_manager.get_cached("mm_trap_detector_warning_shown") != "1":
-                        log_rasta("MM Trap Detector module not available", YELLOW_RASTA, "warning")
-                        self.redis_manager.set_cached("mm_trap_detector_warning_shown", "1")
+                notify_trap_detector(price, self.ingestor.redis)
             else:
                 log_rasta(f"Price Unchanged, Skipping Redis Update: {price}", YELLOW_RASTA)
 
         except Exception as e:
             log_rasta(f"Redis Update Failed: {e}", RED_RASTA, "error")
-            # Attempt to reconnect
-            try:
-                self.redis_manager = RedisManager()
-                self.redis_manager.ping()
-            except:
-                log_rasta("Redis reconnection failed.", RED_RASTA, "error")
 
+    def get_feed_metrics(self) -> Dict[str, Any]:
+        """Get ingestion and MM WebSocket fan-out metrics."""
+        return {
+            "ingest": self.ingestor.stats.to_dict(),
+            "mm_websocket": self.mm_publisher.metrics()
+        }
+    
     def get_current_price(self) -> float:
         """Get the latest BTC price with divine accuracy."""
         try:
@@ -850,6 +724,7 @@ class BtcPriceFeed:
         self.is_running = False
         if self._ws_thread:
             self._ws_thread.join()
+        self.ingestor.flush()
 
 if __name__ == "__main__":
     display_rasta_banner()
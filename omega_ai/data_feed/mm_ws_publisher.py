@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - MM WebSocket Publisher
+=====================================
+
+Long-lived publisher that fans BTC price updates out to the MM WebSocket
+server over one persistent connection.
+
+The live feed used to call ``asyncio.run(send_to_mm_websocket(price))`` for
+every trade, paying for a new event loop and a websocket handshake on the tick
+path. ``MMWebSocketPublisher`` owns a background event loop thread instead:
+``publish()`` is a thread-safe, non-blocking enqueue, and a single sender task
+drains a bounded queue over a connection that reconnects with backoff.
+
+Backpressure policies when the server is slow or down:
+- ``coalesce_latest``: only the newest pending price is kept (default)
+- ``drop_oldest``: a bounded FIFO that evicts the oldest pending message
+
+The MM server broadcasts every message back to all clients, including the
+sender, so the echo of each published message gives the feed→server→feed
+round trip; ``metrics()`` reports it alongside queue depth and drop counts.
+"""
+
+import json
+import time
+import uuid
+import asyncio
+import logging
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+import websockets
+import websockets.exceptions
+
+logger = logging.getLogger(__name__)
+
+MM_WS_URL = "ws://localhost:8765"
+POLICY_COALESCE_LATEST = "coalesce_latest"
+POLICY_DROP_OLDEST = "drop_oldest"
+LATENCY_SAMPLES = 5000
+
+
+def _percentile(samples: Deque[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
+
+
+class MMWebSocketPublisher:
+    """Persistent, auto-reconnecting publisher for the MM WebSocket server."""
+
+    def __init__(
+        self,
+        url: str = MM_WS_URL,
+        max_queue: int = 1000,
+        policy: str = POLICY_COALESCE_LATEST,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0
+    ):
+        """
+        Initialize the publisher (call ``start()`` to connect).
+
+        Args:
+            url: MM WebSocket server URL
+            max_queue: Maximum pending messages for the drop_oldest policy
+            policy: Backpressure policy, coalesce_latest or drop_oldest
+            reconnect_delay: Initial delay between reconnection attempts
+            max_reconnect_delay: Cap for the exponential reconnection backoff
+        """
+        if policy not in (POLICY_COALESCE_LATEST, POLICY_DROP_OLDEST):
+            raise ValueError(f"Unknown backpressure policy: {policy}")
+        self.url = url
+        self.policy = policy
+        self.max_queue = 1 if policy == POLICY_COALESCE_LATEST else max(1, max_queue)
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.source_id = f"btc_live_feed:{uuid.uuid4().hex[:8]}"
+
+        self._queue: Deque[Tuple[float, str]] = deque()
+        self._queue_lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._running = False
+        self.connected = False
+
+        self.published = 0
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.reconnects = 0
+        self.send_latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self.echo_latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    def start(self) -> "MMWebSocketPublisher":
+        """Start the background event loop and sender task."""
+        if self._running:
+            return self
+        self._running = True
+        ready = threading.Event()
+
+        def run_loop() -> None:
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            self._wakeup = asyncio.Event()
+            ready.set()
+            try:
+                self._loop.run_until_complete(self._run())
+            finally:
+                self._loop.close()
+
+        self._thread = threading.Thread(target=run_loop, name="mm-ws-publisher", daemon=True)
+        self._thread.start()
+        ready.wait()
+        return self
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the sender and close the connection."""
+        if not self._running:
+            return
+        self._running = False
+        if self._loop and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+        if self._thread:
+            self._thread.join(timeout=timeout)
+
+    def publish(self, price: float) -> None:
+        """Queue a price update; never blocks on the network."""
+        now = time.time()
+        message = json.dumps({"btc_price": price, "feed_ts": now, "source": self.source_id})
+        with self._queue_lock:
+            self.published += 1
+            if self.policy == POLICY_COALESCE_LATEST and self._queue:
+                self._queue.clear()
+                self.coalesced += 1
+            elif len(self._queue) >= self.max_queue:
+                self._queue.popleft()
+                self.dropped += 1
+            self._queue.append((now, message))
+        if self._loop and self._running:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._queue)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return publisher counters and latency percentiles in milliseconds."""
+        return {
+            "connected": self.connected,
+            "queue_depth": self.queue_depth,
+            "published": self.published,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "reconnects": self.reconnects,
+            "send_p50_ms": _percentile(self.send_latencies, 50) * 1000,
+            "send_p99_ms": _percentile(self.send_latencies, 99) * 1000,
+            "echo_p50_ms": _percentile(self.echo_latencies, 50) * 1000,
+            "echo_p99_ms": _percentile(self.echo_latencies, 99) * 1000
+        }
+
+    async def _run(self) -> None:
+        delay = self.reconnect_delay
+        while self._running:
+            try:
+                async with websockets.connect(
+                    self.url,
+                    max_size=2**20,
+                    ping_interval=30,
+                    ping_timeout=10
+                ) as ws:
+                    self.connected = True
+                    delay = self.reconnect_delay
+                    logger.info(f"Connected to MM WebSocket at {self.url}")
+                    reader = asyncio.create_task(self._read_echoes(ws))
+                    try:
+                        await self._drain(ws)
+                    finally:
+                        reader.cancel()
+            except (OSError, asyncio.TimeoutError, websockets.exceptions.WebSocketException) as e:
+                logger.warning(f"MM WebSocket unavailable ({e}), retrying in {delay:.1f}s")
+            finally:
+                self.connected = False
+
+            if not self._running:
+                break
+            self.reconnects += 1
+            try:
+                await asyncio.wait_for(self._stopped(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def _stopped(self) -> None:
+        while self._running:
+            self._wakeup.clear()
+            await self._wakeup.wait()
+
+    async def _drain(self, ws) -> None:
+        while self._running:
+            with self._queue_lock:
+                item = self._queue.popleft() if self._queue else None
+            if item is None:
+                self._wakeup.clear()
+                if not self._queue:
+                    await self._wakeup.wait()
+                continue
+
+            queued_at, message = item
+            try:
+                await ws.send(message)
+            except Exception:
+                # Keep the message for the next connection unless something newer superseded it
+                with self._queue_lock:
+                    if self.policy == POLICY_DROP_OLDEST or not self._queue:
+                        self._queue.appendleft(item)
+                raise
+            self.sent += 1
+            self.send_latencies.append(time.time() - queued_at)
+
+    async def _read_echoes(self, ws) -> None:
+        try:
+            async for raw in ws:
+                try:
+                    data = json.loads(raw)
+                except (TypeError, ValueError):
+                    continue
+                if isinstance(data, dict) and data.get("source") == self.source_id and "feed_ts" in data:
+                    self.echo_latencies.append(time.time() - data["feed_ts"])
+        except websockets.exceptions.ConnectionClosed:
+            pass
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - Columnar Price History Store
+===========================================
+
+Timestamped BTC tick history kept as packed float64 columns in Redis.
+
+``btc_movement_history`` holds at most a few hundred untimestamped
+``"price,volume"`` strings, so readers re-parse every entry and have to invent
+timestamps. This store keeps every tick with its real timestamp instead:
+
+- Ticks are grouped into time buckets (one hour by default). Each bucket has
+  one Redis string per column (``timestamp``, ``price``, ``volume``) holding
+  little-endian float64 values back to back.
+- Appending is an ``APPEND`` of 8 bytes per column, O(1) however long the
+  history is, and can ride along in the caller's pipeline or transaction.
+- Reading a time range is one ``MGET`` of the bucket columns; NumPy views the
+  bytes directly, with no per-tick parsing (a range spanning several buckets
+  is joined once).
+- ``candles`` aggregates ticks into OHLCV bars for any number of timeframes
+  with vectorized ``reduceat``.
+
+Buckets expire after ``retention_days``, and a sorted set indexes the live
+buckets so the newest ticks can be found without scanning keys.
+"""
+
+import os
+import time
+import logging
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+import redis
+
+logger = logging.getLogger(__name__)
+
+TICK_HISTORY_PREFIX = "btc_tick_history"
+BUCKET_SECONDS = 3600
+RETENTION_DAYS = int(os.getenv("BTC_TICK_HISTORY_RETENTION_DAYS", "7"))
+COLUMNS = ("timestamp", "price", "volume")
+DTYPE = np.dtype("<f8")
+
+# Common candle timeframes in seconds
+TIMEFRAMES = {"1m": 60, "5m": 300, "15m": 900, "1h": 3600, "4h": 14400, "1d": 86400}
+
+
+class TickColumns(NamedTuple):
+    """Tick history as parallel float64 arrays, oldest first."""
+    timestamp: np.ndarray
+    price: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def to_records(self) -> List[Dict[str, float]]:
+        """Return the ticks as ``{"timestamp", "price", "volume"}`` dicts."""
+        return [{"timestamp": t, "price": p, "volume": v}
+                for t, p, v in zip(self.timestamp.tolist(), self.price.tolist(), self.volume.tolist())]
+
+
+class Candles(NamedTuple):
+    """OHLCV bars as parallel arrays; ``timestamp`` is the bar's open time."""
+    timestamp: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+
+EMPTY = np.empty(0, dtype=DTYPE)
+
+
+def empty_ticks() -> TickColumns:
+    return TickColumns(EMPTY, EMPTY, EMPTY)
+
+
+def aggregate_candles(ticks: TickColumns, seconds: float) -> Candles:
+    """Aggregate ticks into OHLCV bars of ``seconds`` length."""
+    if not len(ticks):
+        return Candles(EMPTY, EMPTY, EMPTY, EMPTY, EMPTY, EMPTY)
+    timestamps, prices, volumes = ticks
+    if np.any(np.diff(timestamps) < 0):
+        order = np.argsort(timestamps, kind="stable")
+        timestamps, prices, volumes = timestamps[order], prices[order], volumes[order]
+
+    bars = np.floor(timestamps / seconds)
+    starts = np.flatnonzero(np.r_[True, bars[1:] != bars[:-1]])
+    ends = np.r_[starts[1:], len(prices)] - 1
+    return Candles(
+        timestamp=bars[starts] * seconds,
+        open=prices[starts],
+        high=np.maximum.reduceat(prices, starts),
+        low=np.minimum.reduceat(prices, starts),
+        close=prices[ends],
+        volume=np.add.reduceat(volumes, starts)
+    )
+
+
+def binary_client(client: redis.Redis) -> redis.Redis:
+    """Return ``client``, or a client on the same server that does not decode responses."""
+    pool = client.connection_pool
+    kwargs = dict(pool.connection_kwargs)
+    if not kwargs.get("decode_responses"):
+        return client
+    kwargs["decode_responses"] = False
+    return redis.Redis(connection_pool=redis.ConnectionPool(connection_class=pool.connection_class, **kwargs))
+
+
+class PriceHistoryStore:
+    """
+    Append-only tick history in bucketed float64 columns.
+
+    Writes accept any client or pipeline (including ``decode_responses=True``
+    ones, which is what the live feed uses); reads go through a binary client
+    on the same server.
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[redis.Redis] = None,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        prefix: str = TICK_HISTORY_PREFIX,
+        bucket_seconds: int = BUCKET_SECONDS,
+        retention_days: float = RETENTION_DAYS
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            redis_client: Existing client to reuse (a pooled client is built otherwise)
+            host: Redis host (default: REDIS_HOST env or localhost)
+            port: Redis port (default: REDIS_PORT env or 6379)
+            prefix: Key prefix of the bucket columns and index
+            bucket_seconds: Time span covered by one bucket
+            retention_days: Buckets older than this expire
+        """
+        if redis_client is None:
+            redis_client = redis.Redis(
+                host=host or os.getenv("REDIS_HOST", "localhost"),
+                port=port or int(os.getenv("REDIS_PORT", "6379")),
+                db=0
+            )
+        self.redis = redis_client
+        self.reader = binary_client(redis_client)
+        self.prefix = prefix
+        self.bucket_seconds = bucket_seconds
+        self.retention_seconds = int(retention_days * 86400)
+        self.index_key = f"{prefix}:buckets"
+
+    def bucket_of(self, timestamp: float) -> int:
+        return int(timestamp // self.bucket_seconds) * self.bucket_seconds
+
+    def column_key(self, bucket: int, column: str) -> str:
+        return f"{self.prefix}:{bucket}:{column}"
+
+    def append(self, timestamp: float, price: float, volume: float = 0.0, pipe=None) -> None:
+        """Append one tick."""
+        self.append_many([timestamp], [price], [volume], pipe=pipe)
+
+    def append_many(
+        self,
+        timestamps: Sequence[float],
+        prices: Sequence[float],
+        volumes: Sequence[float],
+        pipe=None
+    ) -> None:
+        """
+        Append ticks (in time order) to their buckets.
+
+        With ``pipe`` the commands are queued on the caller's pipeline and
+        nothing is executed here; otherwise they run in one transaction so the
+        columns of a bucket always have the same length.
+        """
+        if not len(timestamps):
+            return
+        columns = [np.asarray(values, dtype=DTYPE) for values in (timestamps, prices, volumes)]
+        buckets = (columns[0] // self.bucket_seconds).astype(np.int64) * self.bucket_seconds
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        ends = np.r_[starts[1:], len(buckets)]
+
+        target = pipe if pipe is not None else self.redis.pipeline(transaction=True)
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            bucket = int(buckets[start])
+            for name, values in zip(COLUMNS, columns):
+                key = self.column_key(bucket, name)
+                target.append(key, values[start:end].tobytes())
+                target.expire(key, self.bucket_seconds + self.retention_seconds)
+            target.zadd(self.index_key, {str(bucket): bucket})
+        target.zremrangebyscore(self.index_key, "-inf", f"({float(columns[0][-1]) - self.retention_seconds}")
+        if pipe is None:
+            target.execute()
+
+    def buckets(self, start: Optional[float] = None, end: Optional[float] = None) -> List[int]:
+        """Return the indexed buckets overlapping ``[start, end]``, oldest first."""
+        low = self.bucket_of(start) if start is not None else "-inf"
+        high = end if end is not None else "+inf"
+        return [int(float(b)) for b in self.reader.zrangebyscore(self.index_key, low, high)]
+
+    def _load(self, buckets: Sequence[int]) -> TickColumns:
+        if not buckets:
+            return empty_ticks()
+        keys = [self.column_key(bucket, name) for bucket in buckets for name in COLUMNS]
+        raw = self.reader.mget(keys)
+        columns = []
+        for i in range(len(COLUMNS)):
+            parts = [part for part in raw[i::len(COLUMNS)] if part]
+            data = parts[0] if len(parts) == 1 else b"".join(parts)
+            columns.append(np.frombuffer(data, dtype=DTYPE))
+        # A bucket expiring between the index read and MGET could leave columns
+        # misaligned; keep them the same length
+        size = min(len(column) for column in columns)
+        return TickColumns(*(column[:size] for column in columns))
+
+    def range(self, start: Optional[float] = None, end: Optional[float] = None) -> TickColumns:
+        """Return the ticks with ``start <= timestamp <= end``, oldest first."""
+        ticks = self._load(self.buckets(start, end))
+        if not len(ticks) or (start is None and end is None):
+            return ticks
+        timestamps = ticks.timestamp
+        mask = np.ones(len(timestamps), dtype=bool)
+        if start is not None:
+            mask &= timestamps >= start
+        if end is not None:
+            mask &= timestamps <= end
+        if mask.all():
+            return ticks
+        return TickColumns(*(column[mask] for column in ticks))
+
+    def since(self, seconds: float) -> TickColumns:
+        """Return the ticks of the last ``seconds``."""
+        return self.range(start=time.time() - seconds)
+
+    def tail(self, count: int) -> TickColumns:
+        """Return the newest ``count`` ticks, oldest first."""
+        if count <= 0:
+            return empty_ticks()
+        buckets = [int(float(b)) for b in self.reader.zrevrange(self.index_key, 0, -1)]
+        ticks, loaded = empty_ticks(), 0
+        # Pull the newest buckets in growing chunks until there are enough ticks
+        while loaded < len(buckets) and len(ticks) < count:
+            loaded = min(len(buckets), max(1, loaded * 2))
+            ticks = self._load(buckets[:loaded][::-1])
+        if len(ticks) <= count:
+            return ticks
+        return TickColumns(*(column[-count:] for column in ticks))
+
+    def candles(self, timeframe, start: Optional[float] = None, end: Optional[float] = None) -> Candles:
+        """Return OHLCV bars for ``timeframe`` (seconds or a key of ``TIMEFRAMES``)."""
+        return aggregate_candles(self.range(start, end), TIMEFRAMES.get(timeframe, timeframe))
+
+    def candles_multi(
+        self,
+        timeframes: Iterable = tuple(TIMEFRAMES),
+        start: Optional[float] = None,
+        end: Optional[float] = None
+    ) -> Dict[str, Candles]:
+        """Read the range once and aggregate it into every timeframe."""
+        ticks = self.range(start, end)
+        return {str(tf): aggregate_candles(ticks, TIMEFRAMES.get(tf, tf)) for tf in timeframes}
+
+    def count(self) -> int:
+        """Number of stored ticks."""
+        buckets = self.buckets()
+        if not buckets:
+            return 0
+        pipe = self.reader.pipeline(transaction=False)
+        for bucket in buckets:
+            pipe.strlen(self.column_key(bucket, "timestamp"))
+        return sum(pipe.execute()) // DTYPE.itemsize
+
+    def clear(self) -> None:
+        """Delete every bucket and the index."""
+        keys = [self.column_key(bucket, name) for bucket in self.buckets() for name in COLUMNS]
+        self.redis.delete(self.index_key, *keys)
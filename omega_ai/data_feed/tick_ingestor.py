@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - Pipelined Tick Ingestor
+======================================
+
+Single round-trip tick ingestion for the BTC live feed.
+
+The legacy feed issued around a dozen sequential Redis calls per trade
+(previous price lookup, price/volume sets, two list pushes and trims, the
+Fibonacci refresh counter and the alignment flag). ``TickIngestor`` keeps the
+small amount of state those calls were reading back (previous price, refresh
+counter, recent history) in-process, and commits the whole per-tick update as
+one ``MULTI``/``EXEC`` pipeline over a pooled connection.
+
+With ``batch_window > 0`` ticks are micro-batched: accepted ticks are buffered
+and a background flusher commits them together once the window elapses, or
+the producer commits inline as soon as ``max_batch`` ticks are pending. Redis keys and value formats are unchanged,
+so every existing reader keeps working. Each committed tick is also appended,
+with its timestamp, to the columnar ``PriceHistoryStore`` in the same
+transaction.
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Sequence
+
+import redis
+
+from omega_ai.data_feed.price_history_store import PriceHistoryStore
+from omega_ai.utils.fibonacci_level_index import (
+    FIBONACCI_LEVELS_KEY,
+    FibonacciLevelIndex,
+    publish_fibonacci_levels_update
+)
+
+logger = logging.getLogger(__name__)
+
+# Redis keys written by the live feed
+LAST_PRICE_KEY = "last_btc_price"
+LAST_VOLUME_KEY = "last_btc_volume"
+PREV_PRICE_KEY = "prev_btc_price"
+LAST_UPDATE_TIME_KEY = "last_btc_update_time"
+MOVEMENT_HISTORY_KEY = "btc_movement_history"
+ABS_CHANGE_HISTORY_KEY = "abs_price_change_history"
+FIBONACCI_COUNT_KEY = "fibonacci_update_count"
+FIBONACCI_ALIGNMENT_KEY = "fibonacci_alignment"
+
+# Defaults mirroring the legacy per-call path
+HISTORY_LENGTH = 100
+FIBONACCI_REFRESH_EVERY = 100
+FIBONACCI_MOVE_THRESHOLD = 0.01  # 1% move forces a level refresh
+FIBONACCI_SEQUENCE = [1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233, 377, 610, 987]
+FIBONACCI_ALIGNMENT_TOLERANCE = 50.0  # Within $50 of a Fibonacci level
+LATENCY_SAMPLES = 10000
+
+# Thousand levels of the sequence, sorted for bisect lookup
+FIBONACCI_ALIGNMENT_LEVELS = FibonacciLevelIndex({f"{v}000": v * 1000.0 for v in FIBONACCI_SEQUENCE})
+
+
+def fibonacci_retracement_levels(high_price: float, low_price: float) -> Dict[str, str]:
+    """Return the formatted retracement levels stored under ``fibonacci_levels``."""
+    price_range = high_price - low_price
+    levels = {
+        "0.0": low_price,
+        "0.236": low_price + 0.236 * price_range,
+        "0.382": low_price + 0.382 * price_range,
+        "0.5": low_price + 0.5 * price_range,
+        "0.618": low_price + 0.618 * price_range,
+        "0.786": low_price + 0.786 * price_range,
+        "1.0": high_price,
+        "1.618": high_price + 0.618 * price_range,
+        "2.618": high_price + 1.618 * price_range
+    }
+    return {k: f"{v:.2f}" for k, v in levels.items()}
+
+
+@dataclass
+class PendingTick:
+    """An accepted tick waiting to be committed to Redis."""
+    price: float
+    volume: float
+    abs_change_scaled: float
+    received_at: float
+    alignment: str
+    fibonacci_count: int
+    fibonacci_levels: Optional[Dict[str, str]] = None
+    fibonacci_high: float = 0.0
+    fibonacci_low: float = 0.0
+
+
+@dataclass
+class IngestStats:
+    """Counters and latency samples for the ingestion path."""
+    ticks_received: int = 0
+    ticks_accepted: int = 0
+    ticks_skipped: int = 0
+    ticks_committed: int = 0
+    commits: int = 0
+    commit_errors: int = 0
+    fibonacci_refreshes: int = 0
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLES))
+
+    def latency_percentile(self, pct: float) -> float:
+        """Return the ``pct`` percentile of tick-to-commit latency in seconds."""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "ticks_received": self.ticks_received,
+            "ticks_accepted": self.ticks_accepted,
+            "ticks_skipped": self.ticks_skipped,
+            "ticks_committed": self.ticks_committed,
+            "commits": self.commits,
+            "commit_errors": self.commit_errors,
+            "fibonacci_refreshes": self.fibonacci_refreshes,
+            "p50_latency_ms": self.latency_percentile(50) * 1000,
+            "p99_latency_ms": self.latency_percentile(99) * 1000
+        }
+
+
+class TickIngestor:
+    """
+    Commit BTC ticks to Redis in one pipelined transaction per tick or batch.
+
+    The ingestor assumes it is the only writer of the live-feed keys, which is
+    what lets it avoid reading the previous price and refresh counter back from
+    Redis on every tick. State is seeded from Redis once at construction.
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[redis.Redis] = None,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        batch_window: float = 0.0,
+        max_batch: int = 256,
+        history_length: int = HISTORY_LENGTH,
+        fibonacci_refresh_every: int = FIBONACCI_REFRESH_EVERY,
+        tick_history: Optional[PriceHistoryStore] = None,
+        record_tick_history: bool = True
+    ):
+        """
+        Initialize the ingestor.
+
+        Args:
+            redis_client: Existing client to reuse (a pooled client is built otherwise)
+            host: Redis host (default: REDIS_HOST env or localhost)
+            port: Redis port (default: REDIS_PORT env or 6379)
+            batch_window: Micro-batching window in seconds; 0 commits every tick inline
+            max_batch: Flush early once this many ticks are pending
+            history_length: Number of entries kept in the history lists
+            fibonacci_refresh_every: Accepted ticks between Fibonacci level refreshes
+            tick_history: Columnar history store (one on the same client is built otherwise)
+            record_tick_history: Set False to skip the columnar history
+        """
+        if redis_client is None:
+            pool = redis.ConnectionPool(
+                host=host or os.getenv("REDIS_HOST", "localhost"),
+                port=port or int(os.getenv("REDIS_PORT", "6379")),
+                db=0,
+                decode_responses=True
+            )
+            redis_client = redis.Redis(connection_pool=pool)
+        self.redis = redis_client
+        self.batch_window = batch_window
+        self.max_batch = max(1, max_batch)
+        self.history_length = history_length
+        self.fibonacci_refresh_every = fibonacci_refresh_every
+        self.stats = IngestStats()
+        if tick_history is None and record_tick_history:
+            tick_history = PriceHistoryStore(redis_client)
+        self.tick_history = tick_history
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: List[PendingTick] = []
+        self._wakeup = threading.Event()
+        self._closed = False
+
+        self._prev_price: Optional[float] = None
+        self._fibonacci_count: Optional[int] = None
+        self._history: Deque[float] = deque(maxlen=history_length)
+        self._load_state()
+
+        self._flusher: Optional[threading.Thread] = None
+        if self.batch_window > 0:
+            self._flusher = threading.Thread(target=self._flush_loop, name="tick-ingestor", daemon=True)
+            self._flusher.start()
+
+    def _load_state(self) -> None:
+        """Seed in-process state from Redis with a single round trip."""
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.get(PREV_PRICE_KEY)
+            pipe.get(FIBONACCI_COUNT_KEY)
+            pipe.lrange(MOVEMENT_HISTORY_KEY, 0, self.history_length - 1)
+            prev_price, fib_count, history = pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Could not load tick state from Redis, starting fresh: {e}")
+            return
+
+        self._prev_price = float(prev_price) if prev_price else None
+        self._fibonacci_count = int(fib_count) if fib_count else None
+        # Redis keeps newest first; the in-process window keeps oldest first
+        for item in reversed(history or []):
+            try:
+                self._history.append(float(str(item).split(",")[0]))
+            except ValueError:
+                continue
+
+    @property
+    def prev_price(self) -> Optional[float]:
+        """Last accepted price."""
+        return self._prev_price
+
+    def ingest(self, price: float, volume: float) -> Optional[PendingTick]:
+        """
+        Ingest one trade.
+
+        Returns the accepted tick, or None when the price was invalid or
+        unchanged. The decision is made in-process, so callers can notify
+        detectors right away even when the Redis commit is deferred to the
+        batch window.
+        """
+        now = time.time()
+        with self._lock:
+            self.stats.ticks_received += 1
+            if price <= 0 or (self._prev_price is not None and price == self._prev_price):
+                self.stats.ticks_skipped += 1
+                return None
+
+            prev_price = self._prev_price
+            abs_change = abs(price - prev_price) if prev_price is not None else 0
+            self._prev_price = price
+            self._history.append(price)
+
+            # Same counter semantics as the legacy path: missing -> 1, >=N -> reset
+            refresh = False
+            if self._fibonacci_count:
+                if self._fibonacci_count >= self.fibonacci_refresh_every:
+                    refresh = True
+                    self._fibonacci_count = 0
+                else:
+                    self._fibonacci_count += 1
+            else:
+                self._fibonacci_count = 1
+            if prev_price and abs(price - prev_price) / prev_price > FIBONACCI_MOVE_THRESHOLD:
+                refresh = True
+
+            tick = PendingTick(
+                price=price,
+                volume=volume if volume else 0,
+                abs_change_scaled=abs_change * 100,
+                received_at=now,
+                alignment=self.fibonacci_alignment(price),
+                fibonacci_count=self._fibonacci_count
+            )
+            if refresh and self._history:
+                tick.fibonacci_high = max(self._history)
+                tick.fibonacci_low = min(self._history)
+                tick.fibonacci_levels = fibonacci_retracement_levels(tick.fibonacci_high, tick.fibonacci_low)
+                self.stats.fibonacci_refreshes += 1
+
+            self._pending.append(tick)
+            self.stats.ticks_accepted += 1
+            pending = len(self._pending)
+
+        # A full batch is committed by the producer itself, bounding latency
+        # even when the flusher thread is starved of the GIL
+        if self.batch_window <= 0 or pending >= self.max_batch:
+            self.flush()
+        return tick
+
+    @staticmethod
+    def fibonacci_alignment(price: float) -> str:
+        """Return the Fibonacci thousand level the price sits on, or "0"."""
+        nearest = FIBONACCI_ALIGNMENT_LEVELS.nearest(price)
+        if nearest is not None and nearest.distance < FIBONACCI_ALIGNMENT_TOLERANCE:
+            return nearest.label
+        return "0"
+
+    def flush(self) -> int:
+        """Commit all pending ticks in one transaction. Returns ticks committed."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return 0
+            try:
+                self._commit(batch)
+            except redis.RedisError as e:
+                self.stats.commit_errors += 1
+                logger.error(f"Tick commit failed, dropping {len(batch)} ticks: {e}")
+                return 0
+
+            done = time.time()
+            self.stats.commits += 1
+            self.stats.ticks_committed += len(batch)
+            self.stats.latencies.extend(done - tick.received_at for tick in batch)
+            return len(batch)
+
+    def _commit(self, batch: Sequence[PendingTick]) -> None:
+        """Write a batch of ticks; only the newest tick's scalar values survive."""
+        last = batch[-1]
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.mset({
+            LAST_PRICE_KEY: str(last.price),
+            LAST_VOLUME_KEY: str(last.volume),
+            PREV_PRICE_KEY: str(last.price),
+            LAST_UPDATE_TIME_KEY: str(last.received_at),
+            FIBONACCI_COUNT_KEY: str(last.fibonacci_count),
+            FIBONACCI_ALIGNMENT_KEY: last.alignment
+        })
+        # LPUSH with several values pushes them in order, so the newest tick ends at the head
+        pipe.lpush(MOVEMENT_HISTORY_KEY, *[f"{t.price},{t.volume}" for t in batch])
+        pipe.ltrim(MOVEMENT_HISTORY_KEY, 0, self.history_length - 1)
+        pipe.lpush(ABS_CHANGE_HISTORY_KEY, *[str(t.abs_change_scaled) for t in batch])
+        pipe.ltrim(ABS_CHANGE_HISTORY_KEY, 0, self.history_length - 1)
+        if self.tick_history is not None:
+            self.tick_history.append_many(
+                [t.received_at for t in batch], [t.price for t in batch], [t.volume for t in batch], pipe=pipe
+            )
+
+        refreshed = [t for t in batch if t.fibonacci_levels is not None]
+        if refreshed:
+            fib = refreshed[-1]
+            pipe.mset({
+                FIBONACCI_LEVELS_KEY: json.dumps(fib.fibonacci_levels),
+                "fibonacci_high": str(fib.fibonacci_high),
+                "fibonacci_low": str(fib.fibonacci_low),
+                "fibonacci_update_time": str(fib.received_at)
+            })
+            publish_fibonacci_levels_update(pipe)
+        pipe.execute()
+
+    def _flush_loop(self) -> None:
+        while not self._closed:
+            self._wakeup.wait(self.batch_window)
+            self._wakeup.clear()
+            self.flush()
+
+    def close(self) -> None:
+        """Stop the flusher and commit anything still pending."""
+        self._closed = True
+        self._wakeup.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout=max(1.0, self.batch_window * 2))
+        self.flush()
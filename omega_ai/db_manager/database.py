@@ -18,6 +18,12 @@
 """
 Database manager for the OMEGA BTC AI system.
 Handles storage and retrieval of price movements, trend analysis, and market maker traps.
+
+Inserts are queued for a background WAL-mode batch writer by default
+(``DB_WRITE_BEHIND=false`` restores one commit per call). Queued inserts
+return ``None`` instead of a row id, since the row does not have one yet.
+The fetch functions flush the queue before reading, so they see every
+insert made before them; call ``close_database()`` on shutdown.
 """
 
 import json
@@ -29,6 +35,8 @@ from typing import Dict, List, Tuple, Optional, Any
 from datetime import datetime, timezone
 import redis
 
+from omega_ai.db_manager.sqlite_writer import INSERT_STATEMENTS, configure_connection, get_writer, close_writer
+
 # Configure logger
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -39,6 +47,8 @@ logger.addHandler(handler)
 
 # Database configuration
 DB_PATH = os.getenv('DB_PATH', 'omega_btc_ai.db')
+# Queue inserts for the background batched writer instead of one commit per row
+DB_WRITE_BEHIND = os.getenv('DB_WRITE_BEHIND', 'true').lower() in ('true', '1', 'yes')
 
 # Redis connection
 try:
@@ -59,10 +69,39 @@ def get_db_connection():
     """
     return redis_conn
 
+def _insert_row(table: str, row: Tuple[Any, ...]) -> Optional[int]:
+    """Insert a row directly, or queue it for the write-behind writer.
+
+    Returns:
+        Optional[int]: ID of the inserted record, or None when the row was queued
+    """
+    if DB_WRITE_BEHIND:
+        get_writer(DB_PATH).submit(table, row)
+        return None
+
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        cursor = conn.execute(INSERT_STATEMENTS[table], row)
+        conn.commit()
+        return cursor.lastrowid
+    finally:
+        conn.close()
+
+def flush_database_writes(timeout: Optional[float] = None) -> bool:
+    """Block until all queued inserts are committed."""
+    if not DB_WRITE_BEHIND:
+        return True
+    return get_writer(DB_PATH).flush(timeout)
+
+def close_database() -> None:
+    """Flush queued inserts and stop the background writer (clean shutdown hook)."""
+    close_writer()
+
 def initialize_database() -> None:
     """Initialize the database with required tables."""
     try:
         conn = sqlite3.connect(DB_PATH)
+        configure_connection(conn)
         cursor = conn.cursor()
         
         # Table for storing BTC price movements
@@ -119,6 +158,16 @@ def initialize_database() -> None:
         )
         ''')
         
+        # Indexes for the interval/time-ordered reads
+        cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_price_movements_interval_timestamp
+        ON price_movements (interval, timestamp)
+        ''')
+        cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_mm_traps_timestamp
+        ON mm_traps (timestamp)
+        ''')
+        
         conn.commit()
         conn.close()
         
@@ -130,7 +179,7 @@ def initialize_database() -> None:
 
 def insert_price_movement(price: float, volume: Optional[float] = None, 
                           interval: int = 1, change_pct: Optional[float] = None,
-                          abs_change: Optional[float] = None) -> int:
+                          abs_change: Optional[float] = None) -> Optional[int]:
     """
     Insert a price movement record into the database.
     
@@ -142,27 +191,16 @@ def insert_price_movement(price: float, volume: Optional[float] = None,
         abs_change: Optional absolute change
         
     Returns:
-        int: ID of the inserted record
+        Optional[int]: ID of the inserted record, or None when queued for the batched writer
     """
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        
         timestamp = datetime.now(timezone.utc).isoformat()
         
-        cursor.execute(
-            '''
-            INSERT INTO price_movements 
-            (price, volume, timestamp, interval, change_pct, abs_change)
-            VALUES (?, ?, ?, ?, ?, ?)
-            ''',
+        record_id = _insert_row(
+            "price_movements",
             (price, volume, timestamp, interval, change_pct, abs_change)
         )
         
-        record_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        
         # Also update Redis cache if available
         if redis_conn:
             try:
@@ -200,7 +238,7 @@ def insert_price_movement(price: float, volume: Optional[float] = None,
         logger.error(f"Error inserting price movement: {e}")
         return -1
 
-def insert_trend_analysis(timeframe: int, trend: str, change_pct: float) -> int:
+def insert_trend_analysis(timeframe: int, trend: str, change_pct: float) -> Optional[int]:
     """
     Insert a trend analysis record into the database.
     
@@ -210,27 +248,16 @@ def insert_trend_analysis(timeframe: int, trend: str, change_pct: float) -> int:
         change_pct: Percentage price change
         
     Returns:
-        int: ID of the inserted record
+        Optional[int]: ID of the inserted record, or None when queued for the batched writer
     """
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        
         timestamp = datetime.now(timezone.utc).isoformat()
         
-        cursor.execute(
-            '''
-            INSERT INTO trend_analysis 
-            (timeframe, trend, change_pct, timestamp)
-            VALUES (?, ?, ?, ?)
-            ''',
+        record_id = _insert_row(
+            "trend_analysis",
             (timeframe, trend, change_pct, timestamp)
         )
         
-        record_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        
         # Also update Redis cache if available
         if redis_conn:
             try:
@@ -252,7 +279,7 @@ def insert_trend_analysis(timeframe: int, trend: str, change_pct: float) -> int:
         logger.error(f"Error inserting trend analysis: {e}")
         return -1
 
-def insert_possible_mm_trap(trap_data: Dict[str, Any]) -> int:
+def insert_possible_mm_trap(trap_data: Dict[str, Any]) -> Optional[int]:
     """
     Insert a possible market maker trap detection into the database.
     
@@ -263,7 +290,7 @@ def insert_possible_mm_trap(trap_data: Dict[str, Any]) -> int:
                           fibonacci_level, volume_anomaly
         
     Returns:
-        int: ID of the inserted record
+        Optional[int]: ID of the inserted record, or None when queued for the batched writer
     """
     try:
         # Ensure required fields are present
@@ -271,9 +298,6 @@ def insert_possible_mm_trap(trap_data: Dict[str, Any]) -> int:
             logger.error("Missing required field 'type' in trap data")
             return -1
         
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        
         # Set default values
         trap_type = trap_data.get("type")
         timeframe = trap_data.get("timeframe")
@@ -293,21 +317,12 @@ def insert_possible_mm_trap(trap_data: Dict[str, Any]) -> int:
         if volume_anomaly and isinstance(volume_anomaly, dict):
             volume_anomaly = json.dumps(volume_anomaly)
         
-        cursor.execute(
-            '''
-            INSERT INTO mm_traps 
-            (type, timeframe, confidence, price_change, price, timestamp, 
-             validated, validation_score, fibonacci_level, volume_anomaly)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''',
+        record_id = _insert_row(
+            "mm_traps",
             (trap_type, timeframe, confidence, price_change, price, timestamp,
              validated, validation_score, fibonacci_level, volume_anomaly)
         )
         
-        record_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        
         # Also update Redis cache if available
         if redis_conn:
             try:
@@ -345,7 +360,7 @@ def insert_possible_mm_trap(trap_data: Dict[str, Any]) -> int:
         return -1
 
 def insert_fibonacci_detection(level_name: str, price: float, current_price: float,
-                              distance_pct: float, confidence: float) -> int:
+                              distance_pct: float, confidence: float) -> Optional[int]:
     """
     Insert a Fibonacci level detection into the database.
     
@@ -357,27 +372,16 @@ def insert_fibonacci_detection(level_name: str, price: float, current_price: flo
         confidence: Confidence score
         
     Returns:
-        int: ID of the inserted record
+        Optional[int]: ID of the inserted record, or None when queued for the batched writer
     """
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        
         timestamp = datetime.now(timezone.utc).isoformat()
         
-        cursor.execute(
-            '''
-            INSERT INTO fibonacci_detections 
-            (level_name, price, current_price, distance_pct, confidence, timestamp)
-            VALUES (?, ?, ?, ?, ?, ?)
-            ''',
+        record_id = _insert_row(
+            "fibonacci_detections",
             (level_name, price, current_price, distance_pct, confidence, timestamp)
         )
         
-        record_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        
         # Also update Redis cache if available
         if redis_conn:
             try:
@@ -423,7 +427,9 @@ def fetch_multi_interval_movements(interval: int = 5, limit: int = 100) -> Tuple
             except Exception as e:
                 logger.warning(f"Failed to get from Redis cache: {e}")
         
-        # If not in cache or Redis not available, get from database
+        # If not in cache or Redis not available, get from database,
+        # including rows still queued for the batched writer
+        flush_database_writes()
         conn = sqlite3.connect(DB_PATH)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
@@ -501,7 +507,9 @@ def fetch_recent_mm_traps(limit: int = 10) -> List[Dict[str, Any]]:
             except Exception as e:
                 logger.warning(f"Failed to get from Redis cache: {e}")
         
-        # If not in cache or Redis not available, get from database
+        # If not in cache or Redis not available, get from database,
+        # including rows still queued for the batched writer
+        flush_database_writes()
         conn = sqlite3.connect(DB_PATH)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
@@ -837,7 +845,7 @@ if __name__ == "__main__":
         abs_change=300.0
     )
     
-    print(f"Inserted price movement with ID: {price_id}")
+    print(f"Inserted price movement with ID: {price_id if price_id is not None else 'queued'}")
     
     # Insert test trap
     trap_id = insert_possible_mm_trap({
@@ -848,7 +856,7 @@ if __name__ == "__main__":
         "price": 59000.0
     })
     
-    print(f"Inserted MM trap with ID: {trap_id}")
+    print(f"Inserted MM trap with ID: {trap_id if trap_id is not None else 'queued'}")
     
     # Test fetching movements
     movements, summary = fetch_multi_interval_movements(interval=5, limit=10)
@@ -859,4 +867,5 @@ if __name__ == "__main__":
     trend, change = analyze_price_trend(15)
     print(f"15-minute trend: {trend} ({change:.2f}%)")
     
+    close_database()
     print("Database tests completed")
\ No newline at end of file
@@ -27,6 +27,8 @@ import redis
 from typing import Tuple, List, Dict, Any, Optional
 from datetime import datetime, timezone
 
+from omega_ai.utils.fibonacci_level_index import FIBONACCI_LEVELS_KEY, publish_fibonacci_levels_update
+
 # Configure logger
 logger = logging.getLogger(__name__)
 
@@ -251,7 +253,8 @@ def ensure_fibonacci_levels(current_price: float) -> Dict[str, Any]:
                 
             # Create and store new levels
             new_levels = create_fibonacci_levels(high, low)
-            redis_conn.set("fibonacci_levels", json.dumps(new_levels))
+            redis_conn.set(FIBONACCI_LEVELS_KEY, json.dumps(new_levels))
+            publish_fibonacci_levels_update(redis_conn)
             
             return new_levels
         else:
@@ -260,7 +263,8 @@ def ensure_fibonacci_levels(current_price: float) -> Dict[str, Any]:
             low = current_price * 0.8
             
             new_levels = create_fibonacci_levels(high, low)
-            redis_conn.set("fibonacci_levels", json.dumps(new_levels))
+            redis_conn.set(FIBONACCI_LEVELS_KEY, json.dumps(new_levels))
+            publish_fibonacci_levels_update(redis_conn)
             
             return new_levels
     except Exception as e:
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+
+"""
+Write-behind SQLite writer for the OMEGA BTC AI database.
+
+A single long-lived connection in WAL mode is owned by a background thread
+that drains a queue of pending rows and commits them in batches with
+``executemany``. A batch is committed once ``max_batch`` rows are pending or
+``max_latency`` seconds have passed since the oldest pending row, whichever
+comes first. ``flush()`` blocks until everything queued so far is durable,
+and ``close()`` flushes and stops the thread.
+"""
+
+import queue
+import atexit
+import logging
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Insert statements keyed by table, in column order of the queued row tuples
+INSERT_STATEMENTS = {
+    "price_movements": '''
+        INSERT INTO price_movements
+        (price, volume, timestamp, interval, change_pct, abs_change)
+        VALUES (?, ?, ?, ?, ?, ?)
+    ''',
+    "trend_analysis": '''
+        INSERT INTO trend_analysis
+        (timeframe, trend, change_pct, timestamp)
+        VALUES (?, ?, ?, ?)
+    ''',
+    "mm_traps": '''
+        INSERT INTO mm_traps
+        (type, timeframe, confidence, price_change, price, timestamp,
+         validated, validation_score, fibonacci_level, volume_anomaly)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''',
+    "fibonacci_detections": '''
+        INSERT INTO fibonacci_detections
+        (level_name, price, current_price, distance_pct, confidence, timestamp)
+        VALUES (?, ?, ?, ?, ?, ?)
+    ''',
+}
+
+_FLUSH = object()
+_STOP = object()
+
+
+def configure_connection(conn: sqlite3.Connection) -> None:
+    """Apply the WAL pragmas shared by the writer and readers."""
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+
+
+class SQLiteBatchWriter:
+    """Background, batched writer for the append-only detection tables."""
+
+    def __init__(self, db_path: str, max_batch: int = 500, max_latency: float = 0.25):
+        """
+        Initialize the writer and start its thread.
+
+        Args:
+            db_path: SQLite database path
+            max_batch: Rows committed per transaction at most
+            max_latency: Seconds a row may wait before its batch is committed
+        """
+        self.db_path = db_path
+        self.max_batch = max(1, max_batch)
+        self.max_latency = max_latency
+        self.rows_written = 0
+        self.batches_committed = 0
+        self.errors = 0
+
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="sqlite-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, table: str, row: Sequence[Any]) -> None:
+        """Queue one row for ``table``; returns immediately."""
+        if table not in INSERT_STATEMENTS:
+            raise ValueError(f"Unknown table for batched insert: {table}")
+        if self._closed:
+            raise RuntimeError("SQLite writer is closed")
+        self._queue.put((table, tuple(row)))
+
+    def submit_many(self, table: str, rows: Sequence[Sequence[Any]]) -> None:
+        """Queue several rows for ``table``."""
+        for row in rows:
+            self.submit(table, row)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every row queued before this call is committed."""
+        if self._closed or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put((_FLUSH, done))
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Flush pending rows and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put((_STOP, None))
+        self._thread.join(timeout)
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def _run(self) -> None:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        configure_connection(conn)
+        try:
+            while True:
+                batch: Dict[str, List[Tuple[Any, ...]]] = defaultdict(list)
+                waiters: List[threading.Event] = []
+                stop = False
+
+                # Block for the first item, then fill the batch until the deadline
+                item = self._queue.get()
+                deadline = time.monotonic() + self.max_latency
+                count = 0
+                while True:
+                    kind, payload = item
+                    if kind is _STOP:
+                        stop = True
+                        break
+                    if kind is _FLUSH:
+                        waiters.append(payload)
+                        break
+                    batch[kind].append(payload)
+                    count += 1
+                    if count >= self.max_batch:
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = self._queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+
+                if batch:
+                    self._commit(conn, batch, count)
+                for waiter in waiters:
+                    waiter.set()
+                if stop:
+                    break
+        finally:
+            conn.close()
+
+    def _commit(self, conn: sqlite3.Connection, batch: Dict[str, List[Tuple[Any, ...]]], count: int) -> None:
+        try:
+            with conn:
+                for table, rows in batch.items():
+                    conn.executemany(INSERT_STATEMENTS[table], rows)
+            self.rows_written += count
+            self.batches_committed += 1
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.error(f"Batched insert of {count} rows failed: {e}")
+
+
+_writer: Optional[SQLiteBatchWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_writer(db_path: str) -> SQLiteBatchWriter:
+    """Return the process-wide writer for ``db_path``, starting it on first use."""
+    global _writer
+    with _writer_lock:
+        if _writer is None or _writer.db_path != db_path or _writer._closed:
+            if _writer is not None:
+                _writer.close()
+            _writer = SQLiteBatchWriter(db_path)
+            atexit.register(_writer.close)
+        return _writer
+
+
+def close_writer() -> None:
+    """Flush and stop the process-wide writer, if one was started."""
+    global _writer
+    with _writer_lock:
+        if _writer is not None:
+            _writer.close()
+            _writer = None
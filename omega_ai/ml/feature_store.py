@@ -0,0 +1,259 @@
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - Streaming Market Features
+========================================
+
+Rolling features of ``MarketTrendsModel`` maintained tick by tick.
+
+``MarketTrendsModel._engineer_features`` derives moving averages,
+volatility, momentum, RSI and Fibonacci distances from a whole price frame.
+Every feature only looks back a fixed number of ticks (55 at most), so
+``StreamingFeatureStore`` keeps just that tail plus running window sums:
+
+- ``update`` adds a tick in O(windows) and returns its feature row
+- ``preview`` returns the row a tick *would* get without adding it, which is
+  what a prediction on the live price needs
+- ``extend`` warms the store up from a block of historical ticks
+
+A row equals the last row of ``_engineer_features`` run over every tick
+seen so far (NaN filled with 0, as there).
+"""
+
+import math
+from collections import deque
+from typing import Any, Dict, Iterable, Optional
+
+# Feature definitions shared with MarketTrendsModel._engineer_features
+FEATURE_WINDOWS = (8, 13, 21, 34, 55)  # Fibonacci-inspired windows
+MOMENTUM_PERIODS = (1, 2, 3, 5, 8, 13, 21)
+RSI_PERIOD = 14
+FIBONACCI_WINDOW = 55
+FIBONACCI_RATIOS = (0, 0.236, 0.382, 0.5, 0.618, 0.786, 1.0, 1.618, 2.618)
+TREND_TIMEFRAMES = ("1min", "5min", "15min", "30min", "60min", "240min", "720min", "1444min")
+
+# Ticks a feature row depends on besides the newest one
+LOOKBACK = max(max(FEATURE_WINDOWS) - 1, max(MOMENTUM_PERIODS), RSI_PERIOD, FIBONACCI_WINDOW - 1)
+
+# Window sums are recomputed from the tail this often to stop rounding drift
+REBUILD_INTERVAL = 1000
+
+
+def _finite(value: float) -> float:
+    """NaN becomes 0, like the ``fillna(0)`` of the frame pipeline."""
+    return 0.0 if math.isnan(value) else value
+
+
+class StreamingFeatureStore:
+    """
+    Incrementally maintained feature row of the newest BTC tick.
+
+    Window sums cover the last ``window - 1`` stored ticks so a new tick
+    completes each window in O(1). Prices are summed relative to a reference
+    price, which keeps the variance sums well conditioned at BTC price levels.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget every tick."""
+        self.count = 0
+        self.prices = deque(maxlen=LOOKBACK)
+        self.volumes = deque(maxlen=LOOKBACK)
+        self.trends: Dict[str, Any] = {}
+        self.latest: Optional[Dict[str, Any]] = None
+
+        self._reference = 0.0
+        self._price_sums = {window: 0.0 for window in FEATURE_WINDOWS}
+        self._square_sums = {window: 0.0 for window in FEATURE_WINDOWS}
+        self._volume_sums = {window: 0.0 for window in FEATURE_WINDOWS}
+        self._gains = 0.0
+        self._losses = 0.0
+        self._since_rebuild = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _rebuild(self) -> None:
+        """Recompute every running sum from the stored tail."""
+        prices = list(self.prices)
+        volumes = list(self.volumes)
+        self._reference = prices[-1] if prices else 0.0
+        for window in FEATURE_WINDOWS:
+            start = max(len(prices) - (window - 1), 0)
+            tail = [price - self._reference for price in prices[start:]]
+            self._price_sums[window] = sum(tail)
+            self._square_sums[window] = sum(value * value for value in tail)
+            self._volume_sums[window] = sum(volumes[start:])
+
+        diffs = [b - a for a, b in zip(prices, prices[1:])][-(RSI_PERIOD - 1):]
+        self._gains = sum(diff for diff in diffs if diff > 0)
+        self._losses = sum(-diff for diff in diffs if diff < 0)
+        self._since_rebuild = 0
+
+    def preview(
+        self,
+        price: float,
+        volume: float = 0.0,
+        trends: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Feature row of a tick following the stored ones, without storing it.
+
+        Args:
+            price: Tick price
+            volume: Tick volume
+            trends: Extra columns of the tick, e.g. ``trend_15min``/``change_15min``
+            timestamp: Optional timestamp column
+
+        Returns:
+            Feature row keyed by column name
+        """
+        price = float(price)
+        volume = float(volume)
+        trends = trends or {}
+        count = self.count + 1
+        prices = self.prices
+
+        row: Dict[str, Any] = {"price": price, "volume": volume}
+        row.update(trends)
+        if timestamp is not None:
+            row["timestamp"] = timestamp
+
+        # Moving averages, volatility and volume averages
+        centered = price - self._reference
+        for window in FEATURE_WINDOWS:
+            if count < window:
+                continue
+            total = self._price_sums[window] + centered
+            squares = self._square_sums[window] + centered * centered
+            variance = max((squares - total * total / window) / (window - 1), 0.0)
+            volatility = math.sqrt(variance)
+            row[f"ma_{window}"] = self._reference + total / window
+            row[f"vol_{window}"] = volatility
+            row[f"vol_ratio_{window}"] = _finite(volatility / price * 100) if price else 0.0
+            row[f"volume_ma_{window}"] = (self._volume_sums[window] + volume) / window
+
+        # Price momentum
+        for period in MOMENTUM_PERIODS:
+            if count > period:
+                previous = prices[-period]
+                row[f"momentum_{period}"] = (price / previous - 1) * 100 if previous else (0.0 if price == 0 else math.inf)
+
+        # RSI over the last RSI_PERIOD price changes
+        if count > RSI_PERIOD:
+            diff = price - prices[-1]
+            gain = (self._gains + max(diff, 0.0)) / RSI_PERIOD
+            loss = (self._losses + max(-diff, 0.0)) / RSI_PERIOD
+            if loss > 0:
+                row["rsi_14"] = 100 - 100 / (1 + gain / loss)
+            else:
+                row["rsi_14"] = 100.0 if gain > 0 else 0.0
+
+        # Distance from the Fibonacci levels of the recent range
+        if count > FIBONACCI_WINDOW:
+            recent = list(prices)[-(FIBONACCI_WINDOW - 1):]
+            high = max(max(recent), price)
+            low = min(min(recent), price)
+            for ratio in FIBONACCI_RATIOS:
+                level = low + ratio * (high - low)
+                row[f"fib_dist_{ratio}"] = _finite((price - level) / price * 100) if price else 0.0
+
+        # Trend changes since the previous tick
+        for column, value in trends.items():
+            if column.startswith("trend_") and not column.endswith("_change"):
+                previous = self.trends.get(column)
+                row[f"{column}_change"] = value - previous if previous is not None else 0
+
+        if "trend_15min" in trends and "trend_60min" in trends:
+            row["trend_alignment"] = int(trends["trend_15min"] == trends["trend_60min"])
+
+        return row
+
+    def update(
+        self,
+        price: float,
+        volume: float = 0.0,
+        trends: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Store a tick and return its feature row (see ``preview``).
+        """
+        row = self.preview(price, volume, trends, timestamp)
+        self._push(row["price"], row["volume"])
+        self.trends = dict(trends or {})
+        self.latest = row
+        return row
+
+    def extend(self, prices: Iterable[float], volumes: Optional[Iterable[float]] = None) -> None:
+        """
+        Store a block of historical ticks, oldest first, without building their rows.
+
+        Args:
+            prices: Tick prices
+            volumes: Tick volumes (0 when omitted)
+        """
+        prices = [float(price) for price in prices]
+        volumes = [float(volume) for volume in volumes] if volumes is not None else [0.0] * len(prices)
+        if not prices:
+            return
+        self.latest = None
+        if len(prices) < LOOKBACK:
+            for price, volume in zip(prices, volumes):
+                self._push(price, volume)
+            return
+        self.count += len(prices)
+        self.prices.extend(prices)
+        self.volumes.extend(volumes)
+        self._rebuild()
+
+    def _push(self, price: float, volume: float) -> None:
+        prices, volumes = self.prices, self.volumes
+        size = len(prices)
+        if not size:
+            self._reference = price
+        centered = price - self._reference
+
+        # Each window sum gains this tick and loses the one leaving its window-1 tail
+        for window in FEATURE_WINDOWS:
+            tail = window - 1
+            self._price_sums[window] += centered
+            self._square_sums[window] += centered * centered
+            self._volume_sums[window] += volume
+            if size >= tail:
+                leaving = prices[size - tail] - self._reference
+                self._price_sums[window] -= leaving
+                self._square_sums[window] -= leaving * leaving
+                self._volume_sums[window] -= volumes[size - tail]
+
+        if size:
+            diff = price - prices[-1]
+            self._gains += max(diff, 0.0)
+            self._losses += max(-diff, 0.0)
+            if size >= RSI_PERIOD:
+                leaving = prices[size - RSI_PERIOD + 1] - prices[size - RSI_PERIOD]
+                self._gains -= max(leaving, 0.0)
+                self._losses -= max(-leaving, 0.0)
+
+        prices.append(price)
+        volumes.append(volume)
+        self.count += 1
+        self._since_rebuild += 1
+        if self._since_rebuild >= REBUILD_INTERVAL:
+            self._rebuild()
+
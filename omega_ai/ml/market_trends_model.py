@@ -29,6 +29,18 @@ from sklearn.metrics import accuracy_score, mean_squared_error, classification_r
 import joblib
 from collections import deque
 
+from omega_ai.data_feed.price_history_store import PriceHistoryStore, TickColumns
+from omega_ai.ml.feature_store import (
+    FEATURE_WINDOWS,
+    FIBONACCI_RATIOS,
+    FIBONACCI_WINDOW,
+    LOOKBACK,
+    MOMENTUM_PERIODS,
+    RSI_PERIOD,
+    TREND_TIMEFRAMES,
+    StreamingFeatureStore
+)
+
 # Configure logger
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -48,6 +60,23 @@ RESET = "\033[0m"
 BOLD = "\033[1m"
 WHITE = "\033[97m"
 
+# Columns that are never model inputs
+EXCLUDED_FEATURES = ['timestamp', 'trend_15min', 'price', 'trap_detected']
+
+# Loaded estimators shared by every model instance: path -> (mtime, estimator)
+_MODEL_CACHE: Dict[str, Tuple[float, Any]] = {}
+
+def load_cached_model(path: str) -> Optional[Any]:
+    """Load a joblib model once per file version; None if the file does not exist."""
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    cached = _MODEL_CACHE.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = _MODEL_CACHE[path] = (mtime, joblib.load(path))
+    return cached[1]
+
 class MarketTrendsModel:
     """AI model that learns from historical market trends data to predict future market behavior."""
 
@@ -68,6 +97,11 @@ class MarketTrendsModel:
         except redis.ConnectionError as e:
             logger.error(f"Failed to connect to Redis: {e}")
             raise
+        self.tick_history: Optional[PriceHistoryStore] = None
+        
+        # Rolling features of the newest ticks, shared by all three models
+        self.feature_store = StreamingFeatureStore()
+        self._last_tick_timestamp: Optional[float] = None
 
         # Model parameters
         self.model_dir = os.path.join(os.path.dirname(__file__), "models")
@@ -91,28 +125,31 @@ class MarketTrendsModel:
         
         # Fibonacci constants
         self.PHI = 1.618033988749895
-        self.FIBONACCI_RATIOS = [0, 0.236, 0.382, 0.5, 0.618, 0.786, 1.0, 1.618, 2.618]
+        self.FIBONACCI_RATIOS = list(FIBONACCI_RATIOS)
         
         # Load models if they exist
         self.load_models()
 
     def load_models(self) -> None:
-        """Load previously trained models if they exist."""
+        """Load previously trained models if they exist (files already loaded come from the cache)."""
         try:
             trend_model_path = os.path.join(self.model_dir, "trend_classifier.joblib")
             price_model_path = os.path.join(self.model_dir, "price_regressor.joblib")
             trap_model_path = os.path.join(self.model_dir, "trap_classifier.joblib")
             
-            if os.path.exists(trend_model_path):
-                self.trend_classifier = joblib.load(trend_model_path)
+            trend_classifier = load_cached_model(trend_model_path)
+            if trend_classifier is not None:
+                self.trend_classifier = trend_classifier
                 logger.info("Loaded trend classifier model")
                 
-            if os.path.exists(price_model_path):
-                self.price_regressor = joblib.load(price_model_path)
+            price_regressor = load_cached_model(price_model_path)
+            if price_regressor is not None:
+                self.price_regressor = price_regressor
                 logger.info("Loaded price regressor model")
                 
-            if os.path.exists(trap_model_path):
-                self.trap_classifier = joblib.load(trap_model_path)
+            trap_classifier = load_cached_model(trap_model_path)
+            if trap_classifier is not None:
+                self.trap_classifier = trap_classifier
                 logger.info("Loaded trap classifier model")
                 
         except Exception as e:
@@ -121,17 +158,13 @@ class MarketTrendsModel:
     def save_models(self) -> None:
         """Save trained models to disk."""
         try:
-            if self.trend_classifier:
-                joblib.dump(self.trend_classifier, 
-                           os.path.join(self.model_dir, "trend_classifier.joblib"))
-                
-            if self.price_regressor:
-                joblib.dump(self.price_regressor, 
-                           os.path.join(self.model_dir, "price_regressor.joblib"))
-                
-            if self.trap_classifier:
-                joblib.dump(self.trap_classifier, 
-                           os.path.join(self.model_dir, "trap_classifier.joblib"))
+            for filename, model in (("trend_classifier.joblib", self.trend_classifier),
+                                    ("price_regressor.joblib", self.price_regressor),
+                                    ("trap_classifier.joblib", self.trap_classifier)):
+                if model:
+                    path = os.path.join(self.model_dir, filename)
+                    joblib.dump(model, path)
+                    _MODEL_CACHE[path] = (os.path.getmtime(path), model)
                 
             logger.info("Models saved successfully")
         except Exception as e:
@@ -142,56 +175,27 @@ class MarketTrendsModel:
         logger.info(f"Retrieving historical data for the past {days_back} days")
         
         try:
-            # Get price history
-            price_history = []
-            raw_data = self.redis_conn.lrange("btc_movement_history", 0, -1)
-            
-            if not raw_data:
+            # Timestamped ticks from the columnar store, falling back to the
+            # untimestamped movement list
+            ticks = self._load_tick_history(days_back)
+            if ticks is not None:
+                df = pd.DataFrame({"price": ticks.price, "volume": ticks.volume})
+            else:
+                df = self._load_movement_history()
+            if df is None:
                 logger.warning("No historical price data found in Redis")
                 return pd.DataFrame()
             
-            # Process the raw price data
-            for item in raw_data:
-                try:
-                    if "," in item:
-                        price_str, volume_str = item.split(",")
-                        price = float(price_str)
-                        volume = float(volume_str)
-                    else:
-                        price = float(item)
-                        volume = 0
-                    
-                    # For simplicity, we're using the current time minus an offset
-                    # In production, you'd want to store timestamps with your data
-                    price_history.append({
-                        "price": price, 
-                        "volume": volume
-                    })
-                except Exception as e:
-                    logger.warning(f"Error parsing price history item: {e}")
-                    continue
-            
-            # Convert to DataFrame
-            df = pd.DataFrame(price_history)
-            
             # Add trend data if available
-            timeframes = ["1min", "5min", "15min", "30min", "60min", "240min", "720min", "1444min"]
-            for tf in timeframes:
-                trend_key = f"btc_trend_{tf}"
-                trend_data = self.redis_conn.get(trend_key)
-                
-                if trend_data:
-                    try:
-                        trend_info = json.loads(trend_data)
-                        df[f"trend_{tf}"] = self._encode_trend(trend_info.get("trend", "Neutral"))
-                        df[f"change_{tf}"] = trend_info.get("change", 0.0)
-                    except Exception as e:
-                        logger.warning(f"Error parsing trend data for {tf}: {e}")
-            
-            # Create a timestamp for each row (this is a simplification)
-            # In production, store actual timestamps with your data
-            now = datetime.now(timezone.utc)
-            df["timestamp"] = [(now - timedelta(minutes=i)).isoformat() for i in range(len(df))]
+            for column, value in self._get_trend_columns().items():
+                df[column] = value
+            
+            if ticks is not None:
+                df["timestamp"] = [datetime.fromtimestamp(t, timezone.utc).isoformat() for t in ticks.timestamp.tolist()]
+            else:
+                # The movement list has no timestamps; assume one entry per minute
+                now = datetime.now(timezone.utc)
+                df["timestamp"] = [(now - timedelta(minutes=i)).isoformat() for i in range(len(df))]
             
             # Add engineered features
             df = self._engineer_features(df)
@@ -203,6 +207,60 @@ class MarketTrendsModel:
             logger.error(f"Error retrieving historical data: {e}")
             return pd.DataFrame()
     
+    def _get_trend_columns(self) -> Dict[str, Any]:
+        """Current ``trend_<tf>``/``change_<tf>`` values of every timeframe trend in Redis."""
+        columns = {}
+        for tf in TREND_TIMEFRAMES:
+            trend_key = f"btc_trend_{tf}"
+            trend_data = self.redis_conn.get(trend_key)
+            
+            if trend_data:
+                try:
+                    trend_info = json.loads(trend_data)
+                    columns[f"trend_{tf}"] = self._encode_trend(trend_info.get("trend", "Neutral"))
+                    columns[f"change_{tf}"] = trend_info.get("change", 0.0)
+                except Exception as e:
+                    logger.warning(f"Error parsing trend data for {tf}: {e}")
+        return columns
+    
+    def _load_tick_history(self, days_back: int) -> Optional[TickColumns]:
+        """Return the last ``days_back`` days of ticks from the columnar store, or None if it has none."""
+        try:
+            if self.tick_history is None:
+                self.tick_history = PriceHistoryStore(self.redis_conn)
+            ticks = self.tick_history.since(days_back * 86400)
+        except Exception as e:
+            logger.debug(f"Columnar tick history unavailable: {e}")
+            return None
+        return ticks if len(ticks) else None
+
+    def _load_movement_history(self, start: int = 0, end: int = -1) -> Optional[pd.DataFrame]:
+        """Parse entries ``start..end`` of the legacy ``"price,volume"`` movement list."""
+        price_history = []
+        raw_data = self.redis_conn.lrange("btc_movement_history", start, end)
+        if not raw_data:
+            return None
+
+        for item in raw_data:
+            try:
+                if "," in item:
+                    price_str, volume_str = item.split(",")
+                    price = float(price_str)
+                    volume = float(volume_str)
+                else:
+                    price = float(item)
+                    volume = 0
+                
+                price_history.append({
+                    "price": price, 
+                    "volume": volume
+                })
+            except Exception as e:
+                logger.warning(f"Error parsing price history item: {e}")
+                continue
+        
+        return pd.DataFrame(price_history)
+
     def _engineer_features(self, df: pd.DataFrame) -> pd.DataFrame:
         """Engineer additional features for better model performance."""
         if df.empty:
@@ -212,8 +270,7 @@ class MarketTrendsModel:
         df_new = df.copy()
         
         # Calculate moving averages
-        windows = [8, 13, 21, 34, 55]  # Fibonacci-inspired windows
-        for window in windows:
+        for window in FEATURE_WINDOWS:
             if len(df) >= window:
                 df_new[f'ma_{window}'] = df_new['price'].rolling(window=window).mean()
                 df_new[f'vol_{window}'] = df_new['price'].rolling(window=window).std()
@@ -224,24 +281,23 @@ class MarketTrendsModel:
                     df_new[f'volume_ma_{window}'] = df_new['volume'].rolling(window=window).mean()
         
         # Calculate price momentum
-        momentum_periods = [1, 2, 3, 5, 8, 13, 21]
-        for period in momentum_periods:
+        for period in MOMENTUM_PERIODS:
             if len(df) > period:
                 df_new[f'momentum_{period}'] = df_new['price'].pct_change(periods=period) * 100
         
         # Calculate RSI
-        if len(df) > 14:
+        if len(df) > RSI_PERIOD:
             delta = df_new['price'].diff()
-            gain = (delta.where(delta.astype(float) > 0, 0)).rolling(window=14).mean()
-            loss = (-delta.where(delta.astype(float) < 0, 0)).rolling(window=14).mean()
+            gain = (delta.where(delta.astype(float) > 0, 0)).rolling(window=RSI_PERIOD).mean()
+            loss = (-delta.where(delta.astype(float) < 0, 0)).rolling(window=RSI_PERIOD).mean()
             rs = gain / loss
             df_new['rsi_14'] = 100 - (100 / (1 + rs))
         
         # Fibonacci-based features
-        if len(df) > 55:  # Only calculate if we have enough data
+        if len(df) > FIBONACCI_WINDOW:  # Only calculate if we have enough data
             # Get recent high and low for Fibonacci levels
-            high = df_new['price'].rolling(window=55).max()
-            low = df_new['price'].rolling(window=55).min()
+            high = df_new['price'].rolling(window=FIBONACCI_WINDOW).max()
+            low = df_new['price'].rolling(window=FIBONACCI_WINDOW).min()
             price_range = high - low
             
             # Calculate distance from key Fibonacci levels
@@ -312,8 +368,7 @@ class MarketTrendsModel:
             y = y.iloc[:-forecast_period]
             
             # Select features (drop timestamp and target-related columns)
-            exclude_cols = ['timestamp', 'trend_15min', 'price', 'trap_detected']
-            feature_cols = [col for col in df.columns if col not in exclude_cols]
+            feature_cols = [col for col in df.columns if col not in EXCLUDED_FEATURES]
             X = df[feature_cols]
             
             # Split into train and test sets
@@ -454,7 +509,14 @@ class MarketTrendsModel:
         logger.info("All models trained successfully")
     
     def get_latest_data(self) -> pd.DataFrame:
-        """Get the latest market data for predictions."""
+        """
+        Get the latest market data with engineered features for predictions.
+        
+        Ticks stored since the previous call are folded into the streaming
+        feature store and the live price is previewed on top of them, so a
+        call costs O(new ticks) rather than re-deriving every feature over two
+        days of history.
+        """
         try:
             # Get current price
             current_price = float(self.redis_conn.get("last_btc_price") or 0)
@@ -462,82 +524,92 @@ class MarketTrendsModel:
                 logger.warning("No current price available")
                 return pd.DataFrame()
             
-            # Create a dataframe with the latest data point
-            data = {"price": current_price}
-            
             # Add volume if available
             volume = float(self.redis_conn.get("last_btc_volume") or 0)
-            data["volume"] = volume
             
             # Add trend data
-            timeframes = ["1min", "5min", "15min", "30min", "60min", "240min", "720min", "1444min"]
-            for tf in timeframes:
-                trend_key = f"btc_trend_{tf}"
-                trend_data = self.redis_conn.get(trend_key)
-                
-                if trend_data:
-                    try:
-                        trend_info = json.loads(trend_data)
-                        data[f"trend_{tf}"] = self._encode_trend(trend_info.get("trend", "Neutral"))
-                        data[f"change_{tf}"] = trend_info.get("change", 0.0)
-                    except:
-                        pass
-            
-            # Create a dataframe
-            df = pd.DataFrame([data])
-            
-            # Get historical data for feature engineering
-            hist_df = self.get_historical_data(days_back=2)  # Get 2 days of history
-            
-            if not hist_df.empty:
-                # Append the current data to historical data
-                full_df = pd.concat([hist_df, df], ignore_index=True)
-                
-                # Engineer features for the full dataset
-                full_df = self._engineer_features(full_df)
-                
-                # Return only the last row (current data with engineered features)
-                return full_df.iloc[[-1]]
-            else:
+            trends = self._get_trend_columns()
+            
+            if not self._sync_feature_store():
                 logger.warning("No historical data available for feature engineering")
-                return df
+                return pd.DataFrame([{"price": current_price, "volume": volume, **trends}])
+            
+            # Features of the current data point on top of the history
+            row = self.feature_store.preview(
+                current_price, volume, trends, timestamp=datetime.now(timezone.utc).isoformat())
+            return pd.DataFrame([row])
             
         except Exception as e:
             logger.error(f"Error getting latest data: {e}")
             return pd.DataFrame()
     
-    def predict_trend(self) -> Dict[str, Any]:
-        """Predict future market trend."""
+    def _sync_feature_store(self) -> bool:
+        """
+        Bring the feature store up to date with the stored tick history.
+        
+        Timestamped ticks are read incrementally from the columnar store; the
+        untimestamped movement list cannot be, so its newest entries are
+        reloaded every time.
+        
+        Returns:
+            False if there is no history at all
+        """
+        try:
+            if self.tick_history is None:
+                self.tick_history = PriceHistoryStore(self.redis_conn)
+            if self._last_tick_timestamp is None:
+                # Only the last LOOKBACK ticks shape the features of the next one
+                ticks = self.tick_history.tail(LOOKBACK + 1)
+            else:
+                ticks = self.tick_history.range(start=self._last_tick_timestamp)
+                new = ticks.timestamp > self._last_tick_timestamp
+                ticks = TickColumns(*(column[new] for column in ticks))
+        except Exception as e:
+            logger.debug(f"Columnar tick history unavailable: {e}")
+            ticks = None
+        
+        if ticks is not None and len(ticks):
+            self.feature_store.extend(ticks.price.tolist(), ticks.volume.tolist())
+            self._last_tick_timestamp = float(ticks.timestamp[-1])
+            return True
+        if self._last_tick_timestamp is not None:
+            return True
+        
+        df = self._load_movement_history(-(LOOKBACK + 1), -1)
+        if df is None or df.empty:
+            return False
+        self.feature_store.reset()
+        self.feature_store.extend(df["price"].tolist(), df["volume"].tolist())
+        return True
+    
+    def _model_input(self, model: Any, df: pd.DataFrame) -> pd.DataFrame:
+        """Select the model input columns of a feature frame."""
+        X = df[[col for col in df.columns if col not in EXCLUDED_FEATURES]]
+        
+        # IMPORTANT: Ensure feature consistency by using only features the model was trained on
+        if hasattr(model, 'feature_names_in_'):
+            # For newer scikit-learn versions; missing features are added with zeros
+            X = X.reindex(columns=list(model.feature_names_in_), fill_value=0)
+        
+        return X
+    
+    def predict_trend(self, df: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
+        """Predict future market trend from ``df`` (default: ``get_latest_data()``)."""
         if not self.trend_classifier:
             logger.warning("Trend classifier model not trained yet")
             return {"trend": "Unknown", "confidence": 0.0}
         
         try:
             # Get latest data
-            df = self.get_latest_data()
+            if df is None:
+                df = self.get_latest_data()
             
             if df.empty:
                 logger.warning("No data available for trend prediction")
                 return {"trend": "Unknown", "confidence": 0.0}
             
-            # Select features (exclude timestamp and target-related columns)
-            exclude_cols = ['timestamp', 'trend_15min', 'price', 'trap_detected']
-            feature_cols = [col for col in df.columns if col not in exclude_cols]
-            X = df[feature_cols]
-            
-            # IMPORTANT: Ensure feature consistency by using only features the model was trained on
-            if hasattr(self.trend_classifier, 'feature_names_in_'):
-                # For newer scikit-learn versions
-                trained_features = self.trend_classifier.feature_names_in_
-                missing_features = set(trained_features) - set(X.columns)
-                extra_features = set(X.columns) - set(trained_features)
-                
-                # Add missing features with zeros
-                for feature in missing_features:
-                    X[feature] = 0
-                
-                # Select only the features used during training
-                X = X[trained_features]
+            # Select features
+            X = self._model_input(self.trend_classifier, df)
             
             # Make prediction
             pred_class = self.trend_classifier.predict(X)[0]
@@ -574,15 +646,16 @@ class MarketTrendsModel:
             logger.error(f"Error predicting trend: {e}")
             return {"trend": "Error", "confidence": 0.0}
     
-    def predict_price(self) -> Dict[str, Any]:
-        """Predict future BTC price."""
+    def predict_price(self, df: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
+        """Predict future BTC price from ``df`` (default: ``get_latest_data()``)."""
         if not self.price_regressor:
             logger.warning("Price regressor model not trained yet")
             return {"price": 0.0, "confidence": 0.0}
         
         try:
             # Get latest data
-            df = self.get_latest_data()
+            if df is None:
+                df = self.get_latest_data()
             
             if df.empty:
                 logger.warning("No data available for price prediction")
@@ -592,23 +665,7 @@ class MarketTrendsModel:
             current_price = df["price"].values[0]
             
             # Select features
-            exclude_cols = ['timestamp', 'trend_15min', 'price', 'trap_detected']
-            feature_cols = [col for col in df.columns if col not in exclude_cols]
-            X = df[feature_cols]
-            
-            # IMPORTANT: Ensure feature consistency by using only features the model was trained on
-            if hasattr(self.price_regressor, 'feature_names_in_'):
-                # For newer scikit-learn versions
-                trained_features = self.price_regressor.feature_names_in_
-                missing_features = set(trained_features) - set(X.columns)
-                extra_features = set(X.columns) - set(trained_features)
-                
-                # Add missing features with zeros
-                for feature in missing_features:
-                    X[feature] = 0
-                
-                # Select only the features used during training
-                X = X[trained_features]
+            X = self._model_input(self.price_regressor, df)
             
             # Make prediction (scaled)
             scaled_pred = self.price_regressor.predict(X)[0]
@@ -663,38 +720,23 @@ class MarketTrendsModel:
             logger.error(f"Error predicting price: {e}")
             return {"price": 0.0, "confidence": 0.0}
     
-    def predict_mm_trap(self) -> Dict[str, Any]:
-        """Predict potential market maker traps."""
+    def predict_mm_trap(self, df: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
+        """Predict potential market maker traps from ``df`` (default: ``get_latest_data()``)."""
         if not self.trap_classifier:
             logger.warning("Trap classifier model not trained yet")
             return {"trap_detected": False, "confidence": 0.0}
         
         try:
             # Get latest data
-            df = self.get_latest_data()
+            if df is None:
+                df = self.get_latest_data()
             
             if df.empty:
                 logger.warning("No data available for trap prediction")
                 return {"trap_detected": False, "confidence": 0.0}
             
             # Select features
-            exclude_cols = ['timestamp', 'trend_15min', 'price', 'trap_detected']
-            feature_cols = [col for col in df.columns if col not in exclude_cols]
-            X = df[feature_cols]
-            
-            # IMPORTANT: Ensure feature consistency by using only features the model was trained on
-            if hasattr(self.trap_classifier, 'feature_names_in_'):
-                # For newer scikit-learn versions
-                trained_features = self.trap_classifier.feature_names_in_
-                missing_features = set(trained_features) - set(X.columns)
-                extra_features = set(X.columns) - set(trained_features)
-                
-                # Add missing features with zeros
-                for feature in missing_features:
-                    X[feature] = 0
-                
-                # Select only the features used during training
-                X = X[trained_features]
+            X = self._model_input(self.trap_classifier, df)
             
             # Make prediction
             trap_detected = bool(self.trap_classifier.predict(X)[0])
@@ -742,11 +784,14 @@ class MarketTrendsModel:
     
     def generate_predictions(self) -> Dict[str, Any]:
         """Generate comprehensive predictions from all models."""
+        # Engineer the features once and share them between the three models
+        df = self.get_latest_data()
+        
         results = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
-            "trend": self.predict_trend(),
-            "price": self.predict_price(),
-            "trap": self.predict_mm_trap()
+            "trend": self.predict_trend(df),
+            "price": self.predict_price(df),
+            "trap": self.predict_mm_trap(df)
         }
         
         # Store combined predictions in Redis
@@ -754,6 +799,64 @@ class MarketTrendsModel:
         
         return results
     
+    def predict_batch(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Run every trained model over each row of a historical frame, e.g. for backtests.
+        
+        Features are engineered once for the whole frame. They only look back,
+        so each row gets the features a live prediction at that tick would
+        have used, and each model predicts all rows in a single call.
+        
+        Args:
+            df: Ticks oldest first with ``price``, ``volume`` and optional
+                ``trend_<tf>``/``change_<tf>`` columns (e.g. from ``get_historical_data``)
+            
+        Returns:
+            Frame indexed like ``df`` with ``trend``/``trend_confidence``,
+            ``predicted_price``/``pct_change`` and ``trap_detected``/``trap_type``/``trap_confidence``
+            for the models that are trained
+        """
+        results = pd.DataFrame(index=df.index)
+        if df.empty:
+            return results
+        
+        features = self._engineer_features(df)
+        current_price = features["price"].to_numpy(dtype=float)
+        
+        if self.trend_classifier:
+            X = self._model_input(self.trend_classifier, features)
+            pred_class = np.asarray(self.trend_classifier.predict(X))
+            trend = np.full(len(X), "Neutral", dtype=object)
+            trend[pred_class == 1] = "Bullish"
+            trend[pred_class == -1] = "Bearish"
+            results["trend"] = trend
+            results["trend_confidence"] = np.max(self.trend_classifier.predict_proba(X), axis=1)
+        
+        if self.price_regressor:
+            X = self._model_input(self.price_regressor, features)
+            scaled_pred = np.asarray(self.price_regressor.predict(X), dtype=float)
+            try:
+                price_pred = self.price_scaler.inverse_transform(scaled_pred.reshape(-1, 1))[:, 0]
+            except Exception as e:
+                logger.warning(f"Price scaler not fitted. Using scaled prediction: {e}")
+                price_pred = current_price * (1 + scaled_pred)
+            results["predicted_price"] = price_pred
+            results["pct_change"] = (price_pred - current_price) / current_price * 100
+        
+        if self.trap_classifier:
+            X = self._model_input(self.trap_classifier, features)
+            trap_detected = np.asarray(self.trap_classifier.predict(X)).astype(bool)
+            trap_type = np.full(len(X), None, dtype=object)
+            if 'trend_15min' in features.columns:
+                trend_val = features['trend_15min'].to_numpy()
+                trap_type[trap_detected & (trend_val == 1)] = "Bull Trap"
+                trap_type[trap_detected & (trend_val == -1)] = "Bear Trap"
+            results["trap_detected"] = trap_detected
+            results["trap_type"] = trap_type
+            results["trap_confidence"] = np.max(self.trap_classifier.predict_proba(X), axis=1)
+        
+        return results
+    
     def save_historical_predictions(self) -> None:
         """Save historical predictions to Redis."""
         for pred_type, predictions in self.prediction_cache.items():
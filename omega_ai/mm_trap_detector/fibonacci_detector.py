@@ -65,6 +65,8 @@ import numpy as np
 import pandas as pd
 
 from omega_ai.db_manager.database import get_db_connection
+from omega_ai.mm_trap_detector.swing_points import SWING_HIGH, SWING_LOW, SwingCandidates
+from omega_ai.utils.fibonacci_level_index import FibonacciLevelCache, FibonacciLevelIndex
 
 # Configure logger for sacred resonance
 logger = logging.getLogger(__name__)
@@ -85,6 +87,9 @@ except redis.ConnectionError as e:
     logger.error(f"Failed to connect to Redis: {e}")
     raise
 
+# Unix epoch start in UTC
+UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
 # Sacred constants
 GOLDEN_RATIO = 1.618033988749895
 PHI = GOLDEN_RATIO
@@ -116,7 +121,14 @@ class FibonacciDetector:
         """Initialize the Fibonacci detector."""
         self.symbol = symbol
         self.test_mode = test_mode
-        self.price_history = []  # List of (timestamp, price) tuples
+        
+        # Rolling window for swing detection: bars are numbered as they arrive, and the
+        # swing shape of each bar is classified once, when its right neighbour arrives
+        self.rolling_window_size = 7  # Analyze 7 candles for swing detection
+        self._swing_window = deque()  # (bar, price, timestamp, high shape, low shape) of local extremes
+        self._swing_window_size = self.rolling_window_size
+        self._bar_count = 0
+        self.price_history = []  # Last 100 (timestamp, price) tuples
         
         # Swing points
         self.recent_swing_high = None
@@ -138,12 +150,45 @@ class FibonacciDetector:
         self.min_swing_diff = 0.005
         
         # Enhanced swing detection
-        self.rolling_window_size = 7  # Analyze 7 candles for swing detection
         self.confirmation_threshold = 3  # Require 3 candles to confirm a swing
         self.max_false_retracement = 0.002  # 0.2% maximum tolerance for false retracements
-        self.potential_swing_highs = []  # Store potential swing highs for validation
-        self.potential_swing_lows = []  # Store potential swing lows for validation
+        self._swing_highs = SwingCandidates(SWING_HIGH)  # Potential swing highs awaiting confirmation
+        self._swing_lows = SwingCandidates(SWING_LOW)  # Potential swing lows awaiting confirmation
         self.last_confirmed_direction = None  # "UP" or "DOWN" to track trend direction
+        self._logged_swings = None
+
+        # Sorted index of the levels stored in Redis, rebuilt only when they change
+        self._level_cache = FibonacciLevelCache(parse=self._parse_levels)
+    
+    @property
+    def price_history(self) -> deque:
+        """Last 100 (timestamp, price) tuples, oldest first."""
+        return self._price_history
+    
+    @price_history.setter
+    def price_history(self, history) -> None:
+        self._price_history = deque(history, maxlen=100)
+        # Fresh bar numbers, so candidates from the old history are never merged with new bars
+        self._bar_count += len(self._price_history)
+        self._rebuild_swing_window()
+    
+    @property
+    def potential_swing_highs(self) -> List[Dict]:
+        """Potential swing highs as {"price", "timestamp", "confirmation_count"} dicts."""
+        return self._swing_highs.to_dicts()
+    
+    @potential_swing_highs.setter
+    def potential_swing_highs(self, candidates: List[Dict]) -> None:
+        self._swing_highs.load(candidates)
+    
+    @property
+    def potential_swing_lows(self) -> List[Dict]:
+        """Potential swing lows as {"price", "timestamp", "confirmation_count"} dicts."""
+        return self._swing_lows.to_dicts()
+    
+    @potential_swing_lows.setter
+    def potential_swing_lows(self, candidates: List[Dict]) -> None:
+        self._swing_lows.load(candidates)
     
     def update_price_data(self, current_price: float, timestamp: datetime) -> None:
         """Update price data and detect swing points using enhanced rolling window."""
@@ -164,10 +209,7 @@ class FibonacciDetector:
             # Get current time in UTC for comparison
             current_time = datetime.now(timezone.utc)
             
-            # Unix epoch start in UTC
-            epoch_start = datetime(1970, 1, 1, tzinfo=timezone.utc)
-            
-            if timestamp < epoch_start:  # Unix epoch start
+            if timestamp < UNIX_EPOCH:
                 raise ValueError("Invalid timestamp: cannot be before Unix epoch")
             if not self.test_mode and timestamp > current_time:
                 raise ValueError("Invalid timestamp: cannot be in the future")
@@ -176,43 +218,37 @@ class FibonacciDetector:
             if current_price <= 0:
                 raise ValueError("Invalid price: must be a positive number")
             
-            # Store price and timestamp
-            self.price_history.append((timestamp, current_price))
+            # Store price and timestamp (the deque keeps only the last 100 prices)
+            if self._swing_window_size != self.rolling_window_size:
+                self._rebuild_swing_window()
+            self._price_history.append((timestamp, current_price))
+            self._bar_count += 1
+            
+            # The previous bar now has both neighbours: classify it once
+            if len(self._price_history) >= 3:
+                self._push_swing_center(len(self._price_history) - 2)
             
-            # Keep only last 100 prices
-            if len(self.price_history) > 100:
-                self.price_history = self.price_history[-100:]
+            # Bar number at window index 0; centers run from index 1 to the second to last bar
+            first_bar = self._bar_count - self.rolling_window_size
+            while self._swing_window and self._swing_window[0][0] <= first_bar:
+                self._swing_window.popleft()
             
             # Enhanced swing point detection with rolling window
-            if len(self.price_history) >= self.rolling_window_size:
-                # Extract the rolling window of prices
-                window = self.price_history[-self.rolling_window_size:]
-                window_prices = [p for _, p in window]
-                window_timestamps = [t for t, _ in window]
-                
-                # Find potential swing points within the window
-                for i in range(1, len(window_prices) - 1):
-                    center_price = window_prices[i]
+            if len(self._price_history) >= self.rolling_window_size:
+                # Find potential swing points among the window's center bars
+                for center in self._swing_window:
+                    bar, center_price, center_timestamp, high_shape, low_shape = center
+                    i = bar - first_bar
                     
-                    # Check for potential swing high
-                    if self._is_potential_swing_high(window_prices, i):
+                    # Check for potential swing high (the setup is only required from index 3 on)
+                    if (high_shape == 2 or (high_shape and i < 3)) and self._clears_swing_low(center_price):
                         # Store potential swing high for confirmation
-                        potential_high = {
-                            "price": center_price,
-                            "timestamp": window_timestamps[i],
-                            "confirmation_count": 1  # Start with 1 confirmation
-                        }
-                        self.potential_swing_highs.append(potential_high)
-                        
+                        self._swing_highs.add(bar, center_price, center_timestamp)
+                    
                     # Check for potential swing low
-                    if self._is_potential_swing_low(window_prices, i):
+                    if (low_shape == 2 or (low_shape and i < 3)) and self._clears_swing_high(center_price):
                         # Store potential swing low for confirmation
-                        potential_low = {
-                            "price": center_price,
-                            "timestamp": window_timestamps[i],
-                            "confirmation_count": 1  # Start with 1 confirmation
-                        }
-                        self.potential_swing_lows.append(potential_low)
+                        self._swing_lows.add(bar, center_price, center_timestamp)
                 
                 # Update confirmation counts for existing potentials
                 self._update_confirmation_counts(current_price)
@@ -235,8 +271,10 @@ class FibonacciDetector:
                 self.recent_swing_low = min(p for _, p in self.price_history)
                 logger.info(f"Initializing swing low: ${self.recent_swing_low:,.2f}")
             
-            # Log update if both swing points are set
-            if self.recent_swing_high is not None and self.recent_swing_low is not None:
+            # Log update when the swing points change
+            swings = (self.recent_swing_high, self.recent_swing_low)
+            if None not in swings and swings != self._logged_swings:
+                self._logged_swings = swings
                 logger.info(f"Updated Fibonacci swing points: High=${self.recent_swing_high:,.2f}, Low=${self.recent_swing_low:,.2f}")
             
         except ValueError as e:
@@ -246,115 +284,100 @@ class FibonacciDetector:
             logger.error(f"Error updating swing points: {str(e)}")
             raise ValueError(f"Error updating swing points: {str(e)}")
     
-    def _is_potential_swing_high(self, prices, index):
-        """Check if the price at index is a potential swing high."""
-        # Must be higher than adjacent prices
-        if prices[index] <= prices[index-1] or prices[index] <= prices[index+1]:
-            return False
-        
-        # Must be higher than a minimum percentage from recent low
+    def _clears_swing_low(self, price):
+        """Check a potential swing high is a minimum percentage above the recent low."""
         if self.recent_swing_low is not None:
-            diff_pct = (prices[index] - self.recent_swing_low) / self.recent_swing_low
+            diff_pct = (price - self.recent_swing_low) / self.recent_swing_low
             if diff_pct < self.min_swing_diff:
                 return False
-        
-        # Must have price action setup (higher lows leading to this high)
-        if index >= 3:
-            # Check if we have progressively higher lows leading to this high
-            if not (prices[index-3] < prices[index-2] < prices[index-1] < prices[index]):
-                # Allow some flexibility - at least the immediate low should be higher
-                if not prices[index-1] > prices[index-2]:
-                    return False
-        
         return True
     
-    def _is_potential_swing_low(self, prices, index):
-        """Check if the price at index is a potential swing low."""
-        # Must be lower than adjacent prices
-        if prices[index] >= prices[index-1] or prices[index] >= prices[index+1]:
-            return False
-        
-        # Must be lower than a minimum percentage from recent high
+    def _clears_swing_high(self, price):
+        """Check a potential swing low is a minimum percentage below the recent high."""
         if self.recent_swing_high is not None:
-            diff_pct = (self.recent_swing_high - prices[index]) / prices[index]
+            diff_pct = (self.recent_swing_high - price) / price
             if diff_pct < self.min_swing_diff:
                 return False
-        
-        # Must have price action setup (lower highs leading to this low)
-        if index >= 3:
-            # Check if we have progressively lower highs leading to this low
-            if not (prices[index-3] > prices[index-2] > prices[index-1] > prices[index]):
-                # Allow some flexibility - at least the immediate high should be lower
-                if not prices[index-1] < prices[index-2]:
-                    return False
-        
         return True
     
+    def _push_swing_center(self, index):
+        """
+        Add the bar at price_history[index] to the rolling window if it is a local extreme.
+        
+        A bar's neighbours never change once it has completed, so its shape is
+        classified once: 1 for a local high (low), 2 when it also has the price
+        action setup - the immediate low before a high is higher, the immediate
+        high before a low is lower - which is only required from window index 3 on.
+        """
+        history = self._price_history
+        timestamp, price = history[index]
+        before, after = history[index - 1][1], history[index + 1][1]
+        if price > before and price > after:
+            shapes = (2 if index >= 2 and before > history[index - 2][1] else 1, 0)
+        elif price < before and price < after:
+            shapes = (0, 2 if index >= 2 and before < history[index - 2][1] else 1)
+        else:
+            return
+        self._swing_window.append((self._bar_count - len(history) + index, price, timestamp) + shapes)
+    
+    def _rebuild_swing_window(self):
+        """Reclassify the window's center bars from price_history."""
+        self._swing_window = deque()
+        self._swing_window_size = self.rolling_window_size
+        for index in range(max(1, len(self._price_history) - self.rolling_window_size + 1),
+                           len(self._price_history) - 1):
+            self._push_swing_center(index)
+    
     def _update_confirmation_counts(self, current_price):
         """Update confirmation counts for potential swing points."""
-        # Update potential highs
-        for potential in self.potential_swing_highs:
-            # If current price is lower than the potential high, it's a confirmation
-            if current_price < potential["price"]:
-                potential["confirmation_count"] += 1
-            # If current price is higher, it's not a valid swing high
-            elif current_price > potential["price"]:
-                potential["confirmation_count"] = 0  # Reset confirmation
-        
-        # Update potential lows
-        for potential in self.potential_swing_lows:
-            # If current price is higher than the potential low, it's a confirmation
-            if current_price > potential["price"]:
-                potential["confirmation_count"] += 1
-            # If current price is lower, it's not a valid swing low
-            elif current_price < potential["price"]:
-                potential["confirmation_count"] = 0  # Reset confirmation
+        # Prices below a potential high (above a potential low) confirm it; prices beyond it reset it
+        self._swing_highs.update_counts(current_price)
+        self._swing_lows.update_counts(current_price)
     
     def _check_for_confirmed_swings(self):
         """Check if any potential swing points have been confirmed."""
         # Check for confirmed swing highs
-        for potential in self.potential_swing_highs:
-            if potential["confirmation_count"] >= self.confirmation_threshold:
-                # This is a confirmed swing high
-                if self.recent_swing_high is None or potential["price"] > self.recent_swing_high:
-                    self.recent_swing_high = potential["price"]
-                    logger.info(f"New swing high detected: ${self.recent_swing_high:,.2f}")
-                    
-                    # Store in Redis
-                    try:
-                        redis_conn.set("fibonacci:swing_high", self.recent_swing_high)
-                        redis_conn.set("fibonacci:swing_high_timestamp", potential["timestamp"].isoformat())
-                    except redis.RedisError as e:
-                        logger.error(f"Redis error storing swing high: {str(e)}")
-                    
-                    # Set direction
-                    self.last_confirmed_direction = "UP"
+        for price, timestamp in self._swing_highs.confirmed(self.confirmation_threshold):
+            # This is a confirmed swing high
+            if self.recent_swing_high is None or price > self.recent_swing_high:
+                self.recent_swing_high = price
+                logger.info(f"New swing high detected: ${self.recent_swing_high:,.2f}")
+                
+                # Store in Redis
+                try:
+                    redis_conn.set("fibonacci:swing_high", self.recent_swing_high)
+                    redis_conn.set("fibonacci:swing_high_timestamp", timestamp.isoformat())
+                except redis.RedisError as e:
+                    logger.error(f"Redis error storing swing high: {str(e)}")
+                
+                # Set direction
+                self.last_confirmed_direction = "UP"
         
         # Check for confirmed swing lows
-        for potential in self.potential_swing_lows:
-            if potential["confirmation_count"] >= self.confirmation_threshold:
-                # This is a confirmed swing low
-                if self.recent_swing_low is None or potential["price"] < self.recent_swing_low:
-                    self.recent_swing_low = potential["price"]
-                    logger.info(f"New swing low detected: ${self.recent_swing_low:,.2f}")
-                    
-                    # Store in Redis
-                    try:
-                        redis_conn.set("fibonacci:swing_low", self.recent_swing_low)
-                        redis_conn.set("fibonacci:swing_low_timestamp", potential["timestamp"].isoformat())
-                    except redis.RedisError as e:
-                        logger.error(f"Redis error storing swing low: {str(e)}")
-                    
-                    # Set direction
-                    self.last_confirmed_direction = "DOWN"
+        for price, timestamp in self._swing_lows.confirmed(self.confirmation_threshold):
+            # This is a confirmed swing low
+            if self.recent_swing_low is None or price < self.recent_swing_low:
+                self.recent_swing_low = price
+                logger.info(f"New swing low detected: ${self.recent_swing_low:,.2f}")
+                
+                # Store in Redis
+                try:
+                    redis_conn.set("fibonacci:swing_low", self.recent_swing_low)
+                    redis_conn.set("fibonacci:swing_low_timestamp", timestamp.isoformat())
+                except redis.RedisError as e:
+                    logger.error(f"Redis error storing swing low: {str(e)}")
+                
+                # Set direction
+                self.last_confirmed_direction = "DOWN"
     
     def _filter_false_retracements(self):
         """Filter out false retracements caused by manipulative wicks."""
-        if len(self.price_history) < 5:
+        if len(self._price_history) < 5 or not (self._swing_highs or self._swing_lows):
             return
         
         # Get recent prices
-        recent_prices = [p for _, p in self.price_history[-5:]]
+        history = self._price_history
+        recent_prices = [history[-5][1], history[-4][1], history[-3][1], history[-2][1], history[-1][1]]
         
         # Calculate average price and volatility
         avg_price = sum(recent_prices) / len(recent_prices)
@@ -364,32 +387,17 @@ class FibonacciDetector:
         if volatility / avg_price < self.max_false_retracement:
             # We might be seeing false retracement (manipulative wicks)
             # Keep the strongest swing points
-            self.potential_swing_highs = [
-                p for p in self.potential_swing_highs 
-                if p["price"] > avg_price + (volatility * 1.5)
-            ]
-            
-            self.potential_swing_lows = [
-                p for p in self.potential_swing_lows 
-                if p["price"] < avg_price - (volatility * 1.5)
-            ]
+            self._swing_highs.keep_beyond(avg_price + (volatility * 1.5))
+            self._swing_lows.keep_beyond(avg_price - (volatility * 1.5))
     
     def _clean_up_potential_swings(self):
         """Remove old or invalidated potential swing points."""
         # Keep only points with non-zero confirmation count and from the last 20 candles
         max_age = 20
-        if len(self.price_history) > max_age:
-            cutoff_time = self.price_history[-max_age][0]  # Get timestamp from max_age candles ago
-            
-            self.potential_swing_highs = [
-                p for p in self.potential_swing_highs 
-                if p["confirmation_count"] > 0 and p["timestamp"] >= cutoff_time
-            ]
-            
-            self.potential_swing_lows = [
-                p for p in self.potential_swing_lows 
-                if p["confirmation_count"] > 0 and p["timestamp"] >= cutoff_time
-            ]
+        if len(self._price_history) > max_age:
+            cutoff_time = self._price_history[-max_age][0]  # Get timestamp from max_age candles ago
+            self._swing_highs.prune(cutoff_time)
+            self._swing_lows.prune(cutoff_time)
     
     def check_fibonacci_level(self, current_price: float, levels: Optional[Dict] = None) -> Optional[Dict]:
         """Check if current price is at a Fibonacci level."""
@@ -404,65 +412,33 @@ class FibonacciDetector:
             
             # Get current Fibonacci levels
             if levels is None:
-                levels_str = redis_conn.get("fibonacci_levels")
-                if levels_str is None:
+                index = self._level_cache.get(redis_conn)
+                if index is None:
                     return None
-                    
-                # Handle mock objects in tests
-                if 'pytest' in sys.modules and isinstance(levels_str, dict):
-                    levels = levels_str
-                else:
-                    levels = json.loads(levels_str)
-            
-            # Validate levels format
-            if not isinstance(levels, dict):
+            elif isinstance(levels, dict):
+                index = FibonacciLevelIndex(levels)
+            else:
                 raise ValueError("Invalid Fibonacci levels format")
             
-            # Check for valid swing points
-            if self.recent_swing_high is None or self.recent_swing_low is None:
+            price_range = self._fibonacci_price_range()
+            if price_range is None:
                 return None
-                
-            # Check for equal swing points
-            if self.recent_swing_high == self.recent_swing_low:
-                return None
-                
-            # Check for very small price range
-            price_range = self.recent_swing_high - self.recent_swing_low
-            if price_range < 100.0:  # Less than $100 difference
+            
+            # Nearest level within 0.5% of the swing range
+            match = index.match(current_price, 0.005 * price_range)
+            if match is None:
                 return None
             
-            # Check for hits against the levels
-            for level_name, level_price in levels.items():
-                if not isinstance(level_price, (int, float)) or not math.isfinite(level_price):
-                    continue
-                    
-                # Calculate proximity to level
-                proximity = abs(current_price - level_price) / price_range
-                
-                # Check if price is close enough to level
-                if proximity <= 0.005:  # Within 0.5% of level
-                    # Determine if we're in an uptrend or downtrend
-                    is_uptrend = current_price > self.recent_swing_low + (price_range * 0.5)
-                    
-                    # Create hit object
-                    hit = {
-                        "level": float(level_name.rstrip("%")) / 100 if level_name != "0% (Base)" else 0.0,
-                        "price": level_price,
-                        "label": level_name,
-                        "proximity": proximity,
-                        "is_uptrend": is_uptrend
-                    }
-                    
-                    # Record hit in Redis
-                    try:
-                        hit_data = json.dumps(hit)
-                        redis_conn.zadd("fibonacci_hits", {hit_data: time.time()})
-                    except redis.RedisError as e:
-                        logger.error(f"Error recording Fibonacci hit: {e}")
-                    
-                    return hit
+            hit = self._fibonacci_hit(current_price, match.label, match.price, match.distance / price_range, price_range)
             
-            return None
+            # Record hit in Redis
+            try:
+                hit_data = json.dumps(hit)
+                redis_conn.zadd("fibonacci_hits", {hit_data: time.time()})
+            except redis.RedisError as e:
+                logger.error(f"Error recording Fibonacci hit: {e}")
+            
+            return hit
             
         except json.JSONDecodeError:
             logger.error("Error decoding Fibonacci levels from Redis")
@@ -474,6 +450,80 @@ class FibonacciDetector:
             logger.error(f"Error checking Fibonacci level: {e}")
             raise ValueError(f"Error checking Fibonacci level: {e}")
     
+    def check_fibonacci_levels_batch(self, prices, levels: Optional[Dict] = None) -> List[Optional[Dict]]:
+        """
+        Check a whole array of prices against the Fibonacci levels in one vectorized pass.
+        
+        Meant for replays and backtests: hits are returned, not recorded in Redis.
+        
+        Args:
+            prices: Sequence or array of prices
+            levels: Optional {label: price} map; defaults to the levels stored in Redis
+            
+        Returns:
+            A hit dict (as from check_fibonacci_level) or None for every price
+        """
+        prices = np.asarray(prices, dtype=float)
+        if levels is None:
+            index = self._level_cache.get(redis_conn)
+        elif isinstance(levels, dict):
+            index = FibonacciLevelIndex(levels)
+        else:
+            raise ValueError("Invalid Fibonacci levels format")
+        
+        price_range = self._fibonacci_price_range()
+        if index is None or price_range is None:
+            return [None] * len(prices)
+        
+        matches, distances = index.match_batch(prices, 0.005 * price_range)
+        hits: List[Optional[Dict]] = [None] * len(prices)
+        for i in np.flatnonzero(matches >= 0):
+            level = matches[i]
+            hits[i] = self._fibonacci_hit(float(prices[i]), index.labels[level], index.values[level],
+                                          float(distances[i]) / price_range, price_range)
+        return hits
+    
+    @staticmethod
+    def _parse_levels(levels_str) -> Dict:
+        """Decode the ``fibonacci_levels`` value stored in Redis."""
+        # Handle mock objects in tests
+        if 'pytest' in sys.modules and isinstance(levels_str, dict):
+            levels = levels_str
+        else:
+            levels = json.loads(levels_str)
+        if not isinstance(levels, dict):
+            raise ValueError("Invalid Fibonacci levels format")
+        return levels
+    
+    def _fibonacci_price_range(self) -> Optional[float]:
+        """Swing range the level proximity is measured against, or None if too small."""
+        # Check for valid swing points
+        if self.recent_swing_high is None or self.recent_swing_low is None:
+            return None
+            
+        # Check for equal swing points
+        if self.recent_swing_high == self.recent_swing_low:
+            return None
+            
+        # Check for very small price range
+        price_range = self.recent_swing_high - self.recent_swing_low
+        if price_range < 100.0:  # Less than $100 difference
+            return None
+        return price_range
+    
+    def _fibonacci_hit(self, current_price: float, level_name: str, level_price, proximity: float,
+                       price_range: float) -> Dict:
+        """Hit object for a price sitting on a Fibonacci level."""
+        # Determine if we're in an uptrend or downtrend
+        is_uptrend = current_price > self.recent_swing_low + (price_range * 0.5)
+        return {
+            "level": float(level_name.rstrip("%")) / 100 if level_name != "0% (Base)" else 0.0,
+            "price": level_price,
+            "label": level_name,
+            "proximity": proximity,
+            "is_uptrend": is_uptrend
+        }
+    
     def _record_fibonacci_hit(self, current_price: float, hit_data: Dict) -> None:
         """Record a Fibonacci level hit in Redis."""
         try:
@@ -754,25 +804,18 @@ def check_fibonacci_level(price, explicit_levels=None, tolerance=0.004):
     try:
         # If explicit levels provided, use those for divine guidance
         if explicit_levels is not None:
-            closest_level = None
-            min_distance_pct = float('inf')
+            found = FibonacciLevelIndex(explicit_levels).match(price, tolerance, relative=True)
+            if found is None:
+                return None
             
-            for level_name, level_price in explicit_levels.items():
-                distance = abs(price - level_price)
-                distance_pct = distance / level_price
-                
-                if distance_pct <= tolerance and distance_pct < min_distance_pct:
-                    closest_level = {
-                        "level": level_name,
-                        "price": level_price,
-                        "proximity": distance_pct,
-                        "is_explicit": True
-                    }
-                    min_distance_pct = distance_pct
-            
-            return closest_level
+            return {
+                "level": found.label,
+                "price": found.price,
+                "proximity": found.distance,
+                "is_explicit": True
+            }
         
-        # Otherwise use internal fibonacci detection logic
+        # Otherwise use internal fibonacci detection logic (the cached Redis index)
         return fibonacci_detector.check_fibonacci_level(price)
         
     except Exception as e:
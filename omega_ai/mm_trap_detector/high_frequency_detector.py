@@ -91,6 +91,12 @@ from typing import Dict, List, Tuple, Optional, Any
 from queue import Queue
 from threading import Thread
 from omega_ai.db_manager.database import insert_possible_mm_trap
+from omega_ai.mm_trap_detector.volatility_engine import (
+    VolatilityEngine,
+    VOLATILITY_1MIN_KEY,
+    VOLATILITY_5MIN_KEY,
+    ACCELERATION_1MIN_KEY
+)
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -150,6 +156,11 @@ class HighFrequencyTrapDetector:
         self.hf_mode_active = False
         self.hf_mode_start_time = None
         self.hf_mode_multiplier = 1.0
+        # O(1) rolling volatility; published to Redis at a throttled rate
+        self.volatility_engine = VolatilityEngine(
+            window_1min=self.price_history_1min.maxlen,
+            window_5min=self.price_history_5min.maxlen
+        )
     
     def update_price_data(self, price, timestamp=None):
         """Update internal price history for analysis."""
@@ -157,9 +168,10 @@ class HighFrequencyTrapDetector:
             timestamp = datetime.datetime.now(datetime.UTC)
             
         self.price_history_1min.append((timestamp, price))
+        self.volatility_engine.update(price)
         
-        # Update 5min data every 5th minute
-        if len(self.price_history_1min) % 5 == 0:
+        # Update 5min data every 5th tick
+        if self.volatility_engine.ticks % self.volatility_engine.sample_every == 0:
             self.price_history_5min.append((timestamp, price))
         
         # Update Fibonacci detector with new price
@@ -169,30 +181,29 @@ class HighFrequencyTrapDetector:
         self._calculate_volatility_metrics()
         
     def _calculate_volatility_metrics(self):
-        """Calculate and store rolling volatility metrics for different timeframes."""
-        if len(self.price_history_1min) >= 3:
-            # 1-minute volatility (short term)
-            prices_1min = [p[1] for p in self.price_history_1min]
-            std_dev_1min = np.std(prices_1min)
-            normalized_vol_1min = std_dev_1min / np.mean(prices_1min) * 100  # as percentage
-            
-            # Store in Redis - FIXED: Convert numpy float to Python float
-            redis_conn.set("volatility_1min", float(normalized_vol_1min))
-            
-            # Calculate price movement acceleration (rate of change of price changes)
-            if len(self.price_history_1min) >= 4:
-                diffs = np.diff(prices_1min)
-                acceleration = np.std(diffs) / np.mean(prices_1min) * 100
-                redis_conn.set("price_acceleration_1min", float(acceleration))
-        
-        if len(self.price_history_5min) >= 3:
-            # 5-minute volatility (medium term)
-            prices_5min = [p[1] for p in self.price_history_5min]
-            std_dev_5min = np.std(prices_5min)
-            normalized_vol_5min = std_dev_5min / np.mean(prices_5min) * 100
-            
-            # Store in Redis - FIXED: Convert numpy float to Python float
-            redis_conn.set("volatility_5min", float(normalized_vol_5min))
+        """
+        Return the rolling volatility metrics, publishing them to Redis if due.
+        
+        The values are maintained incrementally by the volatility engine; Redis
+        is written at most once per publish interval.
+        """
+        self.volatility_engine.publish(redis_conn)
+        return self.volatility_engine.metrics()
+    
+    def publish_volatility_metrics(self):
+        """Write the current volatility metrics to Redis immediately."""
+        return self.volatility_engine.publish(redis_conn, force=True)
+    
+    def _get_metric(self, key, local_value):
+        """Prefer the in-process metric; fall back to Redis when this process has no data yet."""
+        if local_value is not None:
+            return local_value
+        try:
+            value = redis_conn.get(key)
+            return float(value) if value else 0
+        except (ValueError, TypeError):
+            print(f"⚠️ Invalid {key} value in Redis: {value}")
+            return 0
     
     def detect_high_freq_trap_mode(self, latest_price=None, schumann_resonance=None, simulation_mode=False):
         """Check if high-frequency trap mode should be activated based on market conditions."""
@@ -241,19 +252,8 @@ class HighFrequencyTrapDetector:
         recent_trap_count = self._count_recent_traps()
         
         # 3. Get current volatility
-        try:
-            vol_1min = redis_conn.get("volatility_1min")
-            volatility_1min = float(vol_1min) if vol_1min else 0
-        except (ValueError, TypeError):
-            print(f"⚠️ Invalid volatility_1min value in Redis: {vol_1min}")
-            volatility_1min = 0
-
-        try:
-            vol_5min = redis_conn.get("volatility_5min")
-            volatility_5min = float(vol_5min) if vol_5min else 0
-        except (ValueError, TypeError):
-            print(f"⚠️ Invalid volatility_5min value in Redis: {vol_5min}")
-            volatility_5min = 0
+        volatility_1min = self._get_metric(VOLATILITY_1MIN_KEY, self.volatility_engine.volatility_1min)
+        volatility_5min = self._get_metric(VOLATILITY_5MIN_KEY, self.volatility_engine.volatility_5min)
         
         # 4. Get Schumann resonance data
         if schumann_resonance is None:
@@ -503,11 +503,7 @@ class HighFrequencyTrapDetector:
         move_2min = (price_now - price_2min_ago) / price_2min_ago * 100
         
         # Get current volatility
-        try:
-            vol_bytes = redis_conn.get("volatility_1min")
-            volatility = float(vol_bytes) if vol_bytes else 0
-        except (ValueError, TypeError):
-            volatility = 0
+        volatility = self._get_metric(VOLATILITY_1MIN_KEY, self.volatility_engine.volatility_1min)
         
         # Pattern 1: Sharp price spike and reversion (stop hunt)
         if abs(move_1min) > 0.4 and (move_1min * move_2min < 0):
@@ -533,11 +529,7 @@ class HighFrequencyTrapDetector:
                     return grab_type, confidence
         
         # Pattern 3: High volatility combined with price acceleration
-        try:
-            accel_bytes = redis_conn.get("price_acceleration_1min")
-            acceleration = float(accel_bytes) if accel_bytes else 0
-        except (ValueError, TypeError):
-            acceleration = 0
+        acceleration = self._get_metric(ACCELERATION_1MIN_KEY, self.volatility_engine.acceleration_1min)
             
         if volatility > 0.4 and acceleration > 0.2:
             confidence = min(0.85, (volatility * acceleration) / 0.2)
@@ -17,9 +17,12 @@
 
 """
 Market Maker Trap Queue Consumer
-Efficiently processes the mm_trap_queue with sorted sets
+Efficiently processes the mm_trap_queue with sorted sets, or with a Redis
+Streams consumer group shared by several consumer processes
+(MM_TRAP_QUEUE_BACKEND=stream)
 """
 
+import os
 import json
 import time
 import signal
@@ -33,6 +36,12 @@ from redis.exceptions import ConnectionError, ResponseError
 from omega_ai.utils.redis_manager import RedisManager
 from omega_ai.alerts.alerts_orchestrator import send_mm_trap_alert
 from omega_ai.db_manager.database import insert_possible_mm_trap
+from omega_ai.mm_trap_detector.trap_stream import (
+    BLOCK_MS,
+    CLAIM_IDLE_MS,
+    TrapStreamQueue,
+    default_consumer_name
+)
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -50,6 +59,8 @@ QUEUE_NAME = "mm_trap_queue:zset"  # Using sorted set queue
 BATCH_SIZE = 50
 SLEEP_WHEN_EMPTY = 0.1  # seconds
 PROCESSING_TIMEOUT = 60  # seconds
+QUEUE_BACKEND = os.getenv("MM_TRAP_QUEUE_BACKEND", "zset")  # "zset" or "stream"
+RECLAIM_INTERVAL = 10  # seconds between checks for traps abandoned by dead consumers
 
 # Control flag for graceful shutdown
 running = True
@@ -156,17 +167,56 @@ class TrapProcessor:
     
     def process_batch(self, batch):
         """Process a batch of trap events"""
-        successful = 0
-        errors = 0
+        successful = len(self._process_items(batch))
+        return successful, len(batch) - successful
+    
+    def _process_items(self, batch):
+        """Process a batch of trap events, returning the items processed successfully"""
+        processed = [item for item in batch if self.process_trap(item)]
+        self.update_stats(processed=len(processed), errors=len(batch) - len(processed))
+        return processed
+    
+    def poll_stream(self, queue: TrapStreamQueue, consumer: str, block_ms: Optional[int] = BLOCK_MS,
+                    reclaim: bool = False) -> int:
+        """Read one batch from the trap stream, process it and acknowledge each trap that succeeded.
         
-        for item in batch:
-            if self.process_trap(item):
-                successful += 1
-            else:
-                errors += 1
-                
-        self.update_stats(processed=successful, errors=errors)
-        return successful, errors
+        Failed traps stay pending; with ``reclaim`` (every RECLAIM_INTERVAL in
+        run_stream_consumer) traps idle for CLAIM_IDLE_MS are claimed and
+        retried first. Returns the number of traps read.
+        """
+        entries = queue.claim_stale(consumer, BATCH_SIZE, min_idle_ms=CLAIM_IDLE_MS) if reclaim else []
+        if not entries:
+            entries = queue.read(consumer, BATCH_SIZE, block_ms=block_ms)
+        if not entries:
+            return 0
+        
+        processed = [entry_id for entry_id, trap in entries if self.process_trap(trap)]
+        self.update_stats(processed=len(processed), errors=len(entries) - len(processed))
+        queue.ack(processed)
+        return len(entries)
+    
+    def run_stream_consumer(self, queue: Optional[TrapStreamQueue] = None, consumer: Optional[str] = None):
+        """Consumer loop on the trap stream; run one per process to share the load"""
+        queue = queue or TrapStreamQueue()
+        consumer = consumer or default_consumer_name()
+        queue.ensure_group()
+        logger.info(f"Starting trap consumer {consumer} for {queue.stream} (group {queue.group})")
+        last_reclaim = 0.0
+        
+        while running:
+            try:
+                reclaim = time.time() - last_reclaim >= RECLAIM_INTERVAL
+                if reclaim:
+                    last_reclaim = time.time()
+                if self.poll_stream(queue, consumer, reclaim=reclaim) and \
+                        self.stats["processed"] % 100 == 0 and self.stats["processed"] > 0:
+                    self.print_stats()
+            except ConnectionError:
+                logger.error("Redis connection error. Retrying...")
+                time.sleep(5)
+            except Exception as e:
+                logger.error(f"Error in stream consumer loop: {e}")
+                time.sleep(1)
         
     def run_consumer(self):
         """Main consumer loop"""
@@ -217,18 +267,15 @@ class TrapProcessor:
                 empty_count = 0
                 
                 # Process this batch
-                successful, errors = self.process_batch(items)
+                processed = self._process_items(items)
                 
                 # Remove processed items from the queue
-                if successful > 0:
+                if processed:
                     try:
-                        # Get the items we need to remove - we're taking the first "successful" items
-                        items_to_remove = items[:successful]
-                        
-                        # Remove these items from the queue using zrem
-                        removed = redis_manager.redis.zrem(QUEUE_NAME, *items_to_remove)
+                        # Only the items that succeeded; failed ones stay queued
+                        removed = redis_manager.redis.zrem(QUEUE_NAME, *processed)
                         
-                        logger.debug(f"Removed {removed} of {successful} processed items from queue")
+                        logger.debug(f"Removed {removed} of {len(processed)} processed items from queue")
                     except Exception as e:
                         logger.error(f"Error removing processed items from queue: {e}")
                 
@@ -274,7 +321,10 @@ class TrapProcessor:
 if __name__ == "__main__":
     processor = TrapProcessor()
     try:
-        processor.run_consumer()
+        if QUEUE_BACKEND == "stream":
+            processor.run_stream_consumer()
+        else:
+            processor.run_consumer()
     except KeyboardInterrupt:
         logger.info("Consumer stopped by user")
     except Exception as e:
@@ -31,20 +31,23 @@ This sacred code is provided under the GPU License, embodying the principles of:
 import asyncio
 import json
 import ssl
+import time
 import websockets
 from websockets.legacy.server import WebSocketServerProtocol, serve, WebSocketServer
 from websockets.typing import Data
 from datetime import datetime, UTC
 from omega_ai.visualizer.backend.ascii_art import display_omega_banner, print_status
+from omega_ai.mm_trap_detector.ws_fanout import ClientOutbox, FanoutStats
 from typing import Optional, Set, Dict, Any, Union, List, Tuple
 import os
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 import pathlib
 import socket
 
-__all__ = ['start_server', 'stop_server', 'ConnectionState', 'ClientInfo', 'find_available_port']
+__all__ = ['start_server', 'stop_server', 'ConnectionState', 'ClientInfo', 'find_available_port',
+           'get_fanout_stats']
 
 # Configure logging
 logging.basicConfig(
@@ -68,6 +71,8 @@ class ClientInfo:
     last_message: datetime
     message_count: int
     error_count: int
+    outbox: Optional[ClientOutbox] = field(default=None, repr=False)
+    writer: Optional[asyncio.Task] = field(default=None, repr=False)
 
 # Server configuration
 MM_WS_PORT = int(os.getenv('WEBSOCKET_PORT', '9886'))
@@ -86,6 +91,7 @@ RECONNECT_DELAY = int(os.getenv('WEBSOCKET_RECONNECT_DELAY', '5'))  # seconds
 
 # Global state
 connected_clients: Dict[str, ClientInfo] = {}
+fanout_stats = FanoutStats()
 
 # Global server instances
 regular_server = None
@@ -297,6 +303,7 @@ async def handler(websocket: WebSocketServerProtocol):
     )
     
     connected_clients[client_id] = client_info
+    attach_outbox(client_id, client_info)
     logger.info(f"New WebSocket Connection: {client_id}")
     
     try:
@@ -312,6 +319,11 @@ async def handler(websocket: WebSocketServerProtocol):
                 await websocket.close(1003, "Invalid message format")
                 break
             
+            # Fan-out metrics are answered to the requesting client only
+            if validated_data.get("type") == "fanout_stats":
+                await websocket.send(json.dumps(get_fanout_stats()))
+                continue
+            
             # Broadcast valid message
             message_str = to_str(message)
             await broadcast(message_str)
@@ -326,33 +338,103 @@ async def handler(websocket: WebSocketServerProtocol):
         logger.error(f"WebSocket Unexpected Error: {e} - Client: {client_id}")
         client_info.state = ConnectionState.ERROR
     finally:
-        if client_id in connected_clients:
+        detach_outbox(client_info)
+        if connected_clients.get(client_id) is client_info:
             del connected_clients[client_id]
         logger.warning(f"Client Disconnected: {client_id}")
 
-async def broadcast(message: str):
+def attach_outbox(client_id: str, client_info: ClientInfo) -> ClientOutbox:
+    """
+    Give a client its outbound queue and writer task.
+    
+    Args:
+        client_id: The client's unique identifier
+        client_info: The client to attach the queue to
+        
+    Returns:
+        ClientOutbox: The client's queue
+    """
+    client_info.outbox = ClientOutbox(client_id, client_info.websocket, stats=fanout_stats)
+    client_info.writer = asyncio.create_task(client_writer(client_id, client_info))
+    return client_info.outbox
+
+def detach_outbox(client_info: ClientInfo) -> None:
+    """Stop a client's writer task and discard its queued messages."""
+    if client_info.outbox is not None:
+        client_info.outbox.close()
+    if client_info.writer is not None and not client_info.writer.done():
+        client_info.writer.cancel()
+
+async def client_writer(client_id: str, client_info: ClientInfo):
+    """
+    Drain one client's outbox; drop the client if sending fails or it falls too far behind.
+    
+    Args:
+        client_id: The client's unique identifier
+        client_info: The client whose outbox to drain
+    """
+    outbox = client_info.outbox
+    try:
+        try:
+            await outbox.run()
+        except asyncio.CancelledError:
+            # broadcast() cancels a writer stuck on a client that overflowed
+            if not outbox.overflowed:
+                raise
+        if not outbox.overflowed:
+            return
+        logger.warning(f"Client {client_id} fell {outbox.maxsize} messages behind, disconnecting")
+        try:
+            await client_info.websocket.close(1008, "Client too slow")
+        except Exception:
+            pass
+    except websockets.exceptions.ConnectionClosed:
+        logger.warning(f"Client {client_id} disconnected during broadcast")
+    except Exception as e:
+        logger.error(f"Error broadcasting to {client_id}: {e}")
+    
+    outbox.close()
+    if connected_clients.get(client_id) is client_info:
+        del connected_clients[client_id]
+
+async def broadcast(message: Union[str, Dict[str, Any]]):
     """
     Broadcast messages to all connected clients with cosmic harmony.
     
+    The message is serialized once and queued for every client; each client's
+    writer task sends it, so a slow client never delays the others or the caller.
+    
     Args:
-        message: The message to broadcast
+        message: The message to broadcast (dicts are JSON-encoded)
     """
     if connected_clients:
-        disconnected = []
-        for client_id, client_info in connected_clients.items():
-            try:
-                await client_info.websocket.send(message)
-            except websockets.exceptions.ConnectionClosed:
-                logger.warning(f"Client {client_id} disconnected during broadcast")
-                disconnected.append(client_id)
-            except Exception as e:
-                logger.error(f"Error broadcasting to {client_id}: {e}")
-                disconnected.append(client_id)
+        if not isinstance(message, str):
+            message = json.dumps(message)
         
-        # Clean up disconnected clients
-        for client_id in disconnected:
-            if client_id in connected_clients:
-                del connected_clients[client_id]
+        start = time.perf_counter()
+        for client_id, client_info in list(connected_clients.items()):
+            outbox = client_info.outbox or attach_outbox(client_id, client_info)
+            if not outbox.offer(message, start) and outbox.overflowed and not client_info.writer.done():
+                client_info.writer.cancel()
+        fanout_stats.record_broadcast(time.perf_counter() - start)
+        
+        # Give the writers a turn without waiting on any of them
+        await asyncio.sleep(0)
+
+def get_fanout_stats() -> Dict[str, Any]:
+    """
+    Broadcast latency and per-client lag of the fan-out layer.
+    
+    Returns:
+        Dict[str, Any]: Global broadcast statistics plus a "clients" map of per-client queue stats
+    """
+    stats = fanout_stats.to_dict()
+    stats["clients"] = {
+        client_id: client_info.outbox.to_dict()
+        for client_id, client_info in list(connected_clients.items())
+        if client_info.outbox is not None
+    }
+    return stats
 
 async def monitor_clients():
     """
@@ -372,6 +454,7 @@ async def monitor_clients():
         for client_id in inactive_clients:
             if client_id in connected_clients:
                 client_info = connected_clients[client_id]
+                detach_outbox(client_info)
                 try:
                     await client_info.websocket.close(1000, "Inactive client")
                 except:
@@ -459,6 +542,7 @@ async def stop_server():
     try:
         # Close all client connections
         for client_id, client_info in connected_clients.items():
+            detach_outbox(client_info)
             try:
                 await client_info.websocket.close()
                 logger.info(f"Closed connection for client: {client_id}")
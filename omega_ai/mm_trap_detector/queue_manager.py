@@ -18,9 +18,13 @@
 """
 Trap Queue Manager: Ensures trap queues remain at manageable sizes
 with intelligent sampling and rate limiting.
+
+With MM_TRAP_QUEUE_BACKEND=stream traps go to a Redis stream consumed by a
+consumer group (see trap_stream.py) instead of the sorted set.
 """
 
 from typing import Dict, List, Any, Optional, Union, cast
+import os
 import json
 import random
 import time
@@ -28,18 +32,22 @@ import logging
 from datetime import datetime
 from collections import defaultdict
 from omega_ai.utils.redis_manager import RedisManager
+from omega_ai.mm_trap_detector.trap_stream import TrapStreamQueue
 
 logger = logging.getLogger(__name__)
 
 class TrapQueueManager:
     """Manages market maker trap queues with intelligent sampling"""
     
-    def __init__(self, redis_manager: Optional[RedisManager] = None):
+    def __init__(self, redis_manager: Optional[RedisManager] = None,
+                 stream_queue: Optional[TrapStreamQueue] = None):
         """Initialize the trap queue manager.
         
         Args:
             redis_manager: Optional RedisManager instance. If not provided,
                          a new instance will be created.
+            stream_queue: Optional TrapStreamQueue; when given (or when
+                         MM_TRAP_QUEUE_BACKEND=stream) traps go to the stream.
         """
         self.redis = redis_manager or RedisManager()
         
@@ -52,6 +60,13 @@ class TrapQueueManager:
         # Rate limiting
         self.last_add_time = time.time()
         self.min_interval = 0.01  # seconds between adds
+        
+        # Stream transport: trimmed on every add, and the length returned by the
+        # add drives the sampling of the next one, so no separate size query
+        if stream_queue is None and os.getenv("MM_TRAP_QUEUE_BACKEND", "zset") == "stream":
+            stream_queue = TrapStreamQueue(maxlen=self.max_queue_size)
+        self.stream_queue = stream_queue
+        self._stream_size = 0
     
     def add_trap(self, trap_data: Dict[str, Any]) -> bool:
         """Add a trap to the queue with rate limiting and sampling.
@@ -70,7 +85,7 @@ class TrapQueueManager:
             return False
         
         # Check queue size and adjust sampling if needed
-        queue_size = self.get_queue_size()
+        queue_size = self._stream_size if self.stream_queue else self.get_queue_size()
         
         # Update last add time
         self.last_add_time = time.time()
@@ -90,6 +105,14 @@ class TrapQueueManager:
         if "timestamp" not in trap_data:
             trap_data["timestamp"] = datetime.now().isoformat()
             
+        if self.stream_queue:
+            try:
+                _, self._stream_size = self.stream_queue.add(trap_data)
+                return True
+            except Exception as e:
+                logger.error(f"Error adding trap to stream: {e}")
+                return False
+            
         # Add to queue with current time as score
         try:
             result = self.redis.zadd(
@@ -120,6 +143,8 @@ class TrapQueueManager:
         Returns:
             List of trap data dictionaries, ordered by most recent first
         """
+        if self.stream_queue:
+            return [json.loads(trap) for trap in self.stream_queue.traps(limit, newest_first=True)]
         traps = self.redis.zrange(
             self.queue_name,
             0,
@@ -134,6 +159,8 @@ class TrapQueueManager:
         Returns:
             bool: True if cleanup was successful
         """
+        if self.stream_queue:
+            return True  # Trimmed on every add
         queue_size = self.get_queue_size()
         if queue_size > self.max_queue_size:
             # Remove oldest entries
@@ -150,6 +177,8 @@ class TrapQueueManager:
         Returns:
             int: Number of items in queue
         """
+        if self.stream_queue:
+            return self.stream_queue.length()
         return self.redis.zcard(self.queue_name) or 0
     
     def clear_queue(self) -> bool:
@@ -158,6 +187,8 @@ class TrapQueueManager:
         Returns:
             bool: True if queue was cleared successfully
         """
+        if self.stream_queue:
+            return self.stream_queue.clear()
         return bool(self.redis.delete(self.queue_name))
     
     def get_trap_distribution(self) -> Dict[str, int]:
@@ -167,7 +198,10 @@ class TrapQueueManager:
             Dict mapping trap types to their counts
         """
         distribution = defaultdict(int)
-        traps = self.redis.zrange(self.queue_name, 0, -1, desc=True)
+        if self.stream_queue:
+            traps = self.stream_queue.traps()
+        else:
+            traps = self.redis.zrange(self.queue_name, 0, -1, desc=True)
         
         for trap_json in traps:
             try:
@@ -194,8 +228,11 @@ class TrapQueueManager:
             "cleanup_threshold": self.cleanup_threshold
         }
         
+        if self.stream_queue:
+            stats["pending"] = self.stream_queue.pending_count()
+            
         # Get age of oldest and newest items
-        if queue_size > 0:
+        if queue_size > 0 and not self.stream_queue:
             oldest = self.redis.zrange(self.queue_name, 0, 0, withscores=True)
             newest = self.redis.zrange(self.queue_name, -1, -1, withscores=True)
             
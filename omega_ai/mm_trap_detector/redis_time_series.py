@@ -48,14 +48,18 @@ Key Features:
 - Configurable retention periods for each granularity level
 - Data aggregation with statistical metrics (min/max/avg/ohlc)
 - Memory-efficient storage with automatic cleanup
+- Optional sorted-set backend keyed by epoch milliseconds, with time-range
+  queries, server-side downsampling and pipelined bulk insertion
+  (``TIME_SERIES_BACKEND=zset``)
 """
 
+import os
 import json
 import datetime
 import enum
 import redis
 import statistics
-from typing import Dict, List, Any, Optional, Union, TypedDict
+from typing import Dict, List, Any, Optional, Union, TypedDict, Iterable, Tuple
 
 # Initialize Redis connection
 redis_conn = redis.Redis(host="localhost", port=6379, db=0)
@@ -63,6 +67,10 @@ redis_conn = redis.Redis(host="localhost", port=6379, db=0)
 # Prefix for all simulation keys
 SIM_PREFIX = "sim_"
 
+# Storage layout used by store/get/compress: "list" (one JSON list per day)
+# or "zset" (one sorted set per series scored by epoch milliseconds)
+TIME_SERIES_BACKEND = os.getenv("TIME_SERIES_BACKEND", "list")
+
 class TimeSeriesGranularity(enum.Enum):
     """Enum representing time series data granularity levels"""
     MINUTE = "minute"
@@ -76,6 +84,362 @@ RETENTION_PERIODS = {
     TimeSeriesGranularity.DAILY: 90,    # Keep daily data for 90 days
 }
 
+# Bucket width in milliseconds for each granularity level
+GRANULARITY_MS = {
+    TimeSeriesGranularity.MINUTE: 60_000,
+    TimeSeriesGranularity.HOURLY: 3_600_000,
+    TimeSeriesGranularity.DAILY: 86_400_000,
+}
+
+# Aggregates one numeric field of the members in a score range into
+# fixed-width buckets: {bucket_start, open, high, low, close, sum, count}.
+# Numbers are returned as strings because Redis truncates Lua floats.
+DOWNSAMPLE_SCRIPT = """
+local rows = redis.call('ZRANGEBYSCORE', KEYS[1], ARGV[1], ARGV[2], 'WITHSCORES')
+local bucket_ms = tonumber(ARGV[3])
+local field = ARGV[4]
+local out = {}
+local current, o, h, l, c, s, n
+local function flush()
+    if current then
+        table.insert(out, {
+            string.format('%d', current), string.format('%.17g', o),
+            string.format('%.17g', h), string.format('%.17g', l),
+            string.format('%.17g', c), string.format('%.17g', s),
+            string.format('%d', n)
+        })
+    end
+end
+for i = 1, #rows, 2 do
+    local member = rows[i]
+    local sep = string.find(member, '|', 1, true)
+    local ok, point = pcall(cjson.decode, string.sub(member, sep + 1))
+    local value = ok and type(point) == 'table' and tonumber(point[field]) or nil
+    if value then
+        local ts = tonumber(rows[i + 1])
+        local bucket = ts - (ts % bucket_ms)
+        if bucket ~= current then
+            flush()
+            current, o, h, l, s, n = bucket, value, value, value, 0, 0
+        end
+        if value > h then h = value end
+        if value < l then l = value end
+        c = value
+        s = s + value
+        n = n + 1
+    end
+end
+flush()
+return out
+"""
+
+
+def _to_ms(timestamp: Union[datetime.datetime, datetime.date, int, float]) -> int:
+    """Convert a datetime (naive values are UTC), date or epoch-ms number to epoch ms."""
+    if isinstance(timestamp, (int, float)):
+        return int(timestamp)
+    if not isinstance(timestamp, datetime.datetime):
+        timestamp = datetime.datetime(timestamp.year, timestamp.month, timestamp.day)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=datetime.UTC)
+    return int(timestamp.timestamp() * 1000)
+
+
+def _from_ms(timestamp_ms: int) -> datetime.datetime:
+    """Convert epoch milliseconds to an aware UTC datetime."""
+    return datetime.datetime.fromtimestamp(timestamp_ms / 1000, tz=datetime.UTC)
+
+
+class SortedSetTimeSeries:
+    """
+    Time series stored in one Redis sorted set scored by epoch milliseconds.
+
+    Members are ``"<epoch_ms>|<json>"``, so identical points written twice
+    (e.g. by a re-run migration) collapse into one, and any time range is a
+    single ``ZRANGEBYSCORE``. Retention is enforced by trimming scores older
+    than the granularity's retention period.
+    """
+
+    def __init__(
+        self,
+        series_name: str,
+        granularity: TimeSeriesGranularity = TimeSeriesGranularity.MINUTE,
+        redis_client: Optional[redis.Redis] = None,
+        retention_days: Optional[int] = None
+    ):
+        """
+        Initialize the series.
+
+        Args:
+            series_name: Name of the time series (e.g., 'price_history')
+            granularity: Granularity level (minute, hourly, daily)
+            redis_client: Redis client (defaults to the module connection)
+            retention_days: Override of the granularity's retention period
+        """
+        self.series_name = series_name
+        self.granularity = granularity
+        self.redis = redis_client if redis_client is not None else redis_conn
+        self.retention_days = retention_days or RETENTION_PERIODS[granularity]
+        self.key = f"{SIM_PREFIX}{series_name}:ts:{granularity.value}"
+        self._downsample_script = None
+        self._scripting_available = True
+
+    @staticmethod
+    def _encode(timestamp_ms: int, data: Dict[str, Any]) -> str:
+        return f"{timestamp_ms}|{json.dumps(data, separators=(',', ':'))}"
+
+    @staticmethod
+    def _decode(member: Union[str, bytes]) -> Dict[str, Any]:
+        if isinstance(member, bytes):
+            member = member.decode("utf-8")
+        return json.loads(member.split("|", 1)[1])
+
+    def add(self, timestamp: Union[datetime.datetime, int], data: Dict[str, Any]) -> bool:
+        """
+        Store one data point.
+
+        Args:
+            timestamp: Timestamp of the point (datetime or epoch ms)
+            data: Dictionary containing the data to store
+
+        Returns:
+            bool: True if storage was successful, False otherwise
+        """
+        return self.add_many([(timestamp, data)]) == 1
+
+    def add_many(
+        self,
+        points: Iterable[Tuple[Union[datetime.datetime, int], Dict[str, Any]]],
+        chunk_size: int = 1000
+    ) -> int:
+        """
+        Store many data points with one pipelined round trip per chunk.
+
+        Args:
+            points: (timestamp, data) pairs
+            chunk_size: Points per ZADD command
+
+        Returns:
+            int: Number of points written
+        """
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            written = 0
+            chunk: Dict[str, int] = {}
+            for timestamp, data in points:
+                timestamp_ms = _to_ms(timestamp)
+                chunk[self._encode(timestamp_ms, data)] = timestamp_ms
+                if len(chunk) >= chunk_size:
+                    pipe.zadd(self.key, chunk)
+                    written += len(chunk)
+                    chunk = {}
+            if chunk:
+                pipe.zadd(self.key, chunk)
+                written += len(chunk)
+            if written:
+                pipe.expire(self.key, 86400 * self.retention_days)
+                pipe.execute()
+            return written
+        except Exception as e:
+            print(f"Error storing time series data: {e}")
+            return 0
+
+    def range(
+        self,
+        start: Union[datetime.datetime, datetime.date, int, None] = None,
+        end: Union[datetime.datetime, datetime.date, int, None] = None,
+        limit: Optional[int] = None,
+        with_timestamps: bool = False
+    ) -> List[Any]:
+        """
+        Retrieve the points with start <= timestamp <= end, oldest first.
+
+        Args:
+            start: Range start (None for the beginning of the series)
+            end: Range end, inclusive (None for the end of the series)
+            limit: Maximum number of points to return
+            with_timestamps: Return (epoch_ms, data) pairs instead of data
+
+        Returns:
+            List of data dictionaries (or pairs)
+        """
+        try:
+            low = "-inf" if start is None else _to_ms(start)
+            high = "+inf" if end is None else _to_ms(end)
+            rows = self.redis.zrangebyscore(
+                self.key, low, high,
+                start=0 if limit is not None else None,
+                num=limit,
+                withscores=with_timestamps
+            )
+            if with_timestamps:
+                return [(int(score), self._decode(member)) for member, score in rows]
+            return [self._decode(member) for member in rows]
+        except Exception as e:
+            print(f"Error retrieving time series data: {e}")
+            return []
+
+    def downsample(
+        self,
+        start: Union[datetime.datetime, datetime.date, int, None],
+        end: Union[datetime.datetime, datetime.date, int, None],
+        bucket: Union[TimeSeriesGranularity, int] = TimeSeriesGranularity.HOURLY,
+        field: str = "price",
+        server_side: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Aggregate one numeric field into OHLC buckets.
+
+        The aggregation runs inside Redis as a Lua script, so only one row
+        per bucket crosses the network. Servers without scripting fall back
+        to aggregating the range client-side.
+
+        Args:
+            start: Range start (None for the beginning of the series)
+            end: Range end, inclusive (None for the end of the series)
+            bucket: Bucket width as a granularity or in milliseconds
+            field: Name of the numeric field to aggregate
+            server_side: Try the Lua script before aggregating locally
+
+        Returns:
+            List of buckets with timestamp_ms, open, high, low, close, avg and count
+        """
+        bucket_ms = GRANULARITY_MS[bucket] if isinstance(bucket, TimeSeriesGranularity) else int(bucket)
+        low = "-inf" if start is None else _to_ms(start)
+        high = "+inf" if end is None else _to_ms(end)
+
+        if server_side and self._scripting_available:
+            try:
+                if self._downsample_script is None:
+                    self._downsample_script = self.redis.register_script(DOWNSAMPLE_SCRIPT)
+                rows = self._downsample_script(keys=[self.key], args=[low, high, bucket_ms, field])
+                return [self._bucket(*(float(v) for v in row)) for row in rows]
+            except redis.ResponseError as e:
+                print(f"Server-side downsampling unavailable, aggregating locally: {e}")
+                self._scripting_available = False
+            except Exception as e:
+                print(f"Error downsampling time series data: {e}")
+                return []
+
+        buckets: List[Dict[str, Any]] = []
+        current = None
+        for timestamp_ms, point in self.range(start, end, with_timestamps=True):
+            try:
+                value = float(point[field])
+            except (KeyError, TypeError, ValueError):
+                continue
+            bucket_start = timestamp_ms - timestamp_ms % bucket_ms
+            if current is None or current[0] != bucket_start:
+                if current is not None:
+                    buckets.append(self._bucket(*current))
+                current = [bucket_start, value, value, value, value, 0.0, 0]
+            current[2] = max(current[2], value)
+            current[3] = min(current[3], value)
+            current[4] = value
+            current[5] += value
+            current[6] += 1
+        if current is not None:
+            buckets.append(self._bucket(*current))
+        return buckets
+
+    @staticmethod
+    def _bucket(bucket_start, open_, high, low, close, total, count) -> Dict[str, Any]:
+        count = int(count)
+        return {
+            "timestamp_ms": int(bucket_start),
+            "open": open_,
+            "high": high,
+            "low": low,
+            "close": close,
+            "avg": total / count if count else 0.0,
+            "count": count
+        }
+
+    def trim(self, now: Union[datetime.datetime, datetime.date, int, None] = None) -> int:
+        """
+        Remove points older than the retention period.
+
+        Args:
+            now: Reference time (defaults to the current time)
+
+        Returns:
+            int: Number of points removed
+        """
+        try:
+            now_ms = _to_ms(now or datetime.datetime.now(datetime.UTC))
+            cutoff = now_ms - 86400 * 1000 * self.retention_days
+            return int(self.redis.zremrangebyscore(self.key, "-inf", f"({cutoff}"))
+        except Exception as e:
+            print(f"Error trimming time series data: {e}")
+            return 0
+
+    def __len__(self) -> int:
+        return int(self.redis.zcard(self.key))
+
+
+def _list_point_ms(point: Dict[str, Any], fallback_ms: int) -> int:
+    """Epoch ms of a list-layout point's "YYYY-MM-DD HH:MM:SS" UTC timestamp."""
+    try:
+        return _to_ms(datetime.datetime.fromisoformat(point["timestamp"]))
+    except (KeyError, TypeError, ValueError):
+        return fallback_ms
+
+
+def migrate_list_series(
+    series_name: str,
+    granularity: TimeSeriesGranularity = TimeSeriesGranularity.MINUTE,
+    redis_client: Optional[redis.Redis] = None,
+    delete_source: bool = False,
+    chunk_size: int = 1000
+) -> Dict[str, int]:
+    """
+    Copy every per-day list of a series into its sorted-set layout.
+
+    Points keep their own "timestamp" field as the score; points without one
+    are placed at their day's midnight plus their list index in milliseconds,
+    which keeps their order. Re-running the migration is idempotent.
+
+    Args:
+        series_name: Name of the time series (e.g., 'price_history')
+        granularity: Granularity level to migrate
+        redis_client: Redis client (defaults to the module connection)
+        delete_source: Delete each list once it has been copied
+        chunk_size: Points per pipelined ZADD
+
+    Returns:
+        Dictionary with the number of keys and points migrated
+    """
+    client = redis_client if redis_client is not None else redis_conn
+    target = SortedSetTimeSeries(series_name, granularity, redis_client=client)
+    suffix = f":{granularity.value}"
+    stats = {"keys": 0, "points": 0}
+
+    for key in client.scan_iter(match=f"{SIM_PREFIX}{series_name}:*{suffix}"):
+        key_str = key.decode("utf-8") if isinstance(key, bytes) else str(key)
+        parts = key_str[len(SIM_PREFIX) + len(series_name) + 1:].split(":")
+        if len(parts) != 2:
+            continue
+        try:
+            day_ms = _to_ms(datetime.date.fromisoformat(parts[0]))
+        except ValueError:
+            continue
+
+        points = [json.loads(item) for item in client.lrange(key_str, 0, -1)]
+        written = target.add_many(
+            ((_list_point_ms(point, day_ms + index), point) for index, point in enumerate(points)),
+            chunk_size=chunk_size
+        )
+        if written != len(points):
+            print(f"Error migrating {key_str}: wrote {written} of {len(points)} points")
+            continue
+
+        stats["keys"] += 1
+        stats["points"] += written
+        if delete_source:
+            client.delete(key_str)
+
+    return stats
+
 def store_time_series_data(
     series_name: str, 
     data: Dict[str, Any], 
@@ -94,6 +458,9 @@ def store_time_series_data(
     Returns:
         bool: True if storage was successful, False otherwise
     """
+    if TIME_SERIES_BACKEND == "zset":
+        return SortedSetTimeSeries(series_name, granularity).add(timestamp, data)
+
     try:
         # Build the key with format: sim_<series_name>:YYYY-MM-DD:<granularity>
         key = f"{SIM_PREFIX}{series_name}:{timestamp.date().isoformat()}:{granularity.value}"
@@ -130,6 +497,12 @@ def get_time_series_data(
     Returns:
         List of dictionaries containing the time series data
     """
+    if TIME_SERIES_BACKEND == "zset":
+        day_start = _to_ms(date)
+        points = SortedSetTimeSeries(series_name, granularity).range(day_start, day_start + 86_400_000 - 1)
+        # Same inclusive-end index semantics as LRANGE
+        return points[start_idx:None if end_idx == -1 else end_idx + 1]
+
     try:
         # Build the key with format: sim_<series_name>:YYYY-MM-DD:<granularity>
         key = f"{SIM_PREFIX}{series_name}:{date.isoformat()}:{granularity.value}"
@@ -162,49 +535,51 @@ def compress_historical_data(
     Returns:
         bool: True if compression was successful, False otherwise
     """
+    if target_granularity not in (TimeSeriesGranularity.HOURLY, TimeSeriesGranularity.DAILY):
+        # Unsupported target granularity
+        return False
+
     try:
-        # Build source and target keys
-        source_key = f"{SIM_PREFIX}{series_name}:{date.isoformat()}:{source_granularity.value}"
-        target_key = f"{SIM_PREFIX}{series_name}:{date.isoformat()}:{target_granularity.value}"
-        
-        # Get all data from source granularity
-        data_bytes = redis_conn.lrange(source_key, 0, -1)
-        
-        if not data_bytes:
-            return False
-            
-        # Parse JSON data
-        data_points = [json.loads(item) for item in data_bytes]
-        
-        # Group data by hour if compressing minute->hourly or by day if hourly->daily
-        grouped_data = {}
-        
-        for point in data_points:
-            # Parse timestamp
-            timestamp = datetime.datetime.strptime(
-                point["timestamp"], 
-                "%Y-%m-%d %H:%M:%S"
-            ).replace(tzinfo=datetime.UTC)
-            
-            # Create group key based on target granularity
-            if target_granularity == TimeSeriesGranularity.HOURLY:
-                # Group by hour
-                group_key = timestamp.replace(minute=0, second=0, microsecond=0)
-            elif target_granularity == TimeSeriesGranularity.DAILY:
-                # Group by day
-                group_key = timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
-            else:
-                # Unsupported target granularity
+        grouped_data: Dict[str, List[Dict[str, Any]]] = {}
+
+        if TIME_SERIES_BACKEND == "zset":
+            source = SortedSetTimeSeries(series_name, source_granularity)
+            target = SortedSetTimeSeries(series_name, target_granularity)
+            day_start = _to_ms(date)
+            rows = source.range(day_start, day_start + 86_400_000 - 1, with_timestamps=True)
+            if not rows:
                 return False
-                
-            # Initialize group if needed
-            if group_key not in grouped_data:
-                grouped_data[group_key] = []
-                
-            # Add data point to group
-            grouped_data[group_key].append(point)
-        
+
+            # Group by the score's bucket; no timestamp parsing needed
+            bucket_ms = GRANULARITY_MS[target_granularity]
+            for timestamp_ms, point in rows:
+                group_time = _from_ms(timestamp_ms - timestamp_ms % bucket_ms)
+                grouped_data.setdefault(group_time.strftime("%Y-%m-%d %H:%M:%S"), []).append(point)
+        else:
+            # Build source and target keys
+            source_key = f"{SIM_PREFIX}{series_name}:{date.isoformat()}:{source_granularity.value}"
+            target_key = f"{SIM_PREFIX}{series_name}:{date.isoformat()}:{target_granularity.value}"
+
+            # Get all data from source granularity
+            data_bytes = redis_conn.lrange(source_key, 0, -1)
+
+            if not data_bytes:
+                return False
+
+            # Group data by hour if compressing minute->hourly or by day if
+            # hourly->daily, slicing the "YYYY-MM-DD HH:MM:SS" timestamp
+            # rather than parsing it
+            for item in data_bytes:
+                point = json.loads(item)
+                timestamp = point["timestamp"]
+                if target_granularity == TimeSeriesGranularity.HOURLY:
+                    group_key = f"{timestamp[:13]}:00:00"
+                else:
+                    group_key = f"{timestamp[:10]} 00:00:00"
+                grouped_data.setdefault(group_key, []).append(point)
+
         # Process each group and create compressed data points
+        compressed_points = []
         for group_time, points in grouped_data.items():
             # Extract price values for aggregation
             prices = [p.get("price", 0) for p in points]
@@ -216,7 +591,7 @@ def compress_historical_data(
                 
             # Create compressed data point with statistics
             compressed_point = {
-                "timestamp": group_time.strftime("%Y-%m-%d %H:%M:%S"),
+                "timestamp": group_time,
                 "price_avg": statistics.mean(prices) if prices else 0,
                 "price_min": min(prices) if prices else 0,
                 "price_max": max(prices) if prices else 0,
@@ -227,13 +602,22 @@ def compress_historical_data(
                 "data_points": len(points)
             }
             
-            # Store compressed data point
+            compressed_points.append(compressed_point)
+
+        if TIME_SERIES_BACKEND == "zset":
+            target.add_many(
+                (datetime.datetime.fromisoformat(p["timestamp"]), p) for p in compressed_points
+            )
+            return True
+
+        # Store compressed data points
+        for compressed_point in compressed_points:
             redis_conn.rpush(target_key, json.dumps(compressed_point))
-        
+
         # Set expiration for target key
         retention_days = RETENTION_PERIODS[target_granularity]
         redis_conn.expire(target_key, 86400 * retention_days)
-        
+
         return True
     except Exception as e:
         print(f"Error compressing historical data: {e}")
@@ -271,6 +655,11 @@ def cleanup_old_data(
                 parts = key_str.split(':')
                 if len(parts) < 3:
                     continue
+
+                if parts[1] == "ts":
+                    # Sorted-set series are trimmed by score instead
+                    SortedSetTimeSeries(series_name, TimeSeriesGranularity(parts[2])).trim(current_date)
+                    continue
                     
                 date_str = parts[1]
                 key_date = datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
@@ -0,0 +1,130 @@
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+Incremental Swing Point Candidates
+==================================
+
+Bounded storage for the potential swing highs and lows of the Fibonacci
+detector.
+
+Candidates are keyed by the bar they were seen on, so a bar that qualifies
+again on a later tick refreshes its existing entry instead of appending a
+duplicate, and the pool never holds more than ``capacity`` entries (the oldest
+is evicted when it is full). Each entry is a fixed-layout slot list rather than
+a dict; with the handful of live candidates a detector holds, plain list
+passes are cheaper than NumPy's per-call overhead.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple
+
+SWING_HIGH = "high"
+SWING_LOW = "low"
+
+# Slot layout of a candidate entry
+BAR, PRICE, COUNT, TIME, TIMESTAMP = range(5)
+
+
+class SwingCandidates:
+    """Potential swing highs or lows awaiting confirmation, in insertion order."""
+
+    def __init__(self, kind: str = SWING_HIGH, capacity: int = 64):
+        """
+        Initialize the pool.
+
+        Args:
+            kind: ``"high"`` or ``"low"``; decides which side of a price confirms
+            capacity: Maximum number of live candidates
+        """
+        if kind not in (SWING_HIGH, SWING_LOW):
+            raise ValueError(f"kind must be '{SWING_HIGH}' or '{SWING_LOW}'")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.kind = kind
+        self.capacity = capacity
+        self._entries: List[list] = []
+        self.evicted = 0
+
+    def add(self, bar: int, price: float, timestamp: datetime) -> None:
+        """
+        Register a candidate seen on ``bar``.
+
+        A bar already in the pool keeps its confirmation count, raised to 1 if
+        it had been reset; otherwise the candidate is appended with a count of 1.
+        """
+        for entry in self._entries:
+            if entry[BAR] == bar:
+                if entry[COUNT] < 1:
+                    entry[COUNT] = 1
+                return
+
+        if len(self._entries) == self.capacity:
+            del self._entries[0]
+            self.evicted += 1
+        self._entries.append([bar, price, 1, timestamp.timestamp(), timestamp])
+
+    def update_counts(self, current_price: float) -> None:
+        """Count a confirmation for candidates the price moved away from, reset the rest."""
+        if self.kind == SWING_HIGH:
+            for entry in self._entries:
+                if current_price < entry[PRICE]:
+                    entry[COUNT] += 1
+                elif current_price > entry[PRICE]:
+                    entry[COUNT] = 0
+        else:
+            for entry in self._entries:
+                if current_price > entry[PRICE]:
+                    entry[COUNT] += 1
+                elif current_price < entry[PRICE]:
+                    entry[COUNT] = 0
+
+    def confirmed(self, threshold: int) -> List[Tuple[float, datetime]]:
+        """``(price, timestamp)`` of candidates with at least ``threshold`` confirmations."""
+        return [(entry[PRICE], entry[TIMESTAMP]) for entry in self._entries if entry[COUNT] >= threshold]
+
+    def keep_beyond(self, level: float) -> None:
+        """Keep only highs strictly above ``level`` (lows strictly below it)."""
+        if self.kind == SWING_HIGH:
+            self._entries = [entry for entry in self._entries if entry[PRICE] > level]
+        else:
+            self._entries = [entry for entry in self._entries if entry[PRICE] < level]
+
+    def prune(self, cutoff: datetime) -> None:
+        """Drop reset candidates and candidates older than ``cutoff``."""
+        if self._entries:
+            cutoff = cutoff.timestamp()
+            self._entries = [entry for entry in self._entries if entry[COUNT] > 0 and entry[TIME] >= cutoff]
+
+    def clear(self) -> None:
+        """Remove all candidates."""
+        self._entries = []
+
+    def load(self, candidates: Iterable[Dict]) -> None:
+        """Replace the pool with ``{"price", "timestamp", "confirmation_count"}`` dicts."""
+        self.clear()
+        for i, candidate in enumerate(candidates):
+            # Bars of loaded candidates are unknown; negative keys never match a live bar
+            self.add(-1 - i, candidate["price"], candidate["timestamp"])
+            self._entries[-1][COUNT] = candidate.get("confirmation_count", 1)
+
+    def to_dicts(self) -> List[Dict]:
+        """Live candidates in the detector's dict format."""
+        return [
+            {"price": entry[PRICE], "timestamp": entry[TIMESTAMP], "confirmation_count": entry[COUNT]}
+            for entry in self._entries
+        ]
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+
+"""
+Market Maker Trap Stream Queue
+Redis Streams transport for the trap queue, shared by consumer groups
+
+Every consumer process joins the same consumer group, so Redis hands each
+trap to exactly one of them. Reads block server-side instead of polling,
+every trap is acknowledged on its own once processed, and traps left
+pending by a consumer that died are claimed by a live one after
+``claim_idle_ms``. A trap delivered ``max_deliveries`` times without being
+acknowledged is moved to a dead-letter stream instead of being retried forever.
+"""
+
+import os
+import json
+import socket
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import redis
+from redis.exceptions import ResponseError
+
+logger = logging.getLogger(__name__)
+
+# Configuration
+STREAM_NAME = "mm_trap_queue:stream"
+DEAD_LETTER_STREAM = "mm_trap_queue:stream:dead"
+CONSUMER_GROUP = "mm_trap_consumers"
+STREAM_MAXLEN = 50000  # Trimmed approximately on every add
+BLOCK_MS = 1000  # Longest a read waits for new traps
+CLAIM_IDLE_MS = 60000  # A trap pending this long belongs to a dead consumer
+MAX_DELIVERIES = 5
+TRAP_FIELD = "trap"
+
+StreamEntry = Tuple[str, str]  # (entry id, trap JSON)
+
+
+def default_consumer_name() -> str:
+    """Consumer name unique to this process."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class TrapStreamQueue:
+    """Trap queue on a Redis stream with one consumer group."""
+
+    def __init__(
+        self,
+        redis_conn: Optional[redis.Redis] = None,
+        stream: str = STREAM_NAME,
+        group: str = CONSUMER_GROUP,
+        maxlen: int = STREAM_MAXLEN,
+        dead_letter_stream: str = DEAD_LETTER_STREAM
+    ):
+        """Initialize the queue.
+
+        Args:
+            redis_conn: Redis client; defaults to REDIS_HOST/REDIS_PORT
+            stream: Stream key
+            group: Consumer group shared by all consumers
+            maxlen: Approximate cap on the stream length
+            dead_letter_stream: Stream receiving traps that exhausted their deliveries
+        """
+        self.redis = redis_conn or redis.Redis(
+            host=os.getenv('REDIS_HOST', 'localhost'),
+            port=int(os.getenv('REDIS_PORT', '6379')),
+            decode_responses=True
+        )
+        self.stream = stream
+        self.group = group
+        self.maxlen = maxlen
+        self.dead_letter_stream = dead_letter_stream
+
+    def ensure_group(self) -> bool:
+        """Create the stream and consumer group if they do not exist yet. Returns True if created."""
+        try:
+            self.redis.xgroup_create(self.stream, self.group, id="0", mkstream=True)
+            logger.info(f"Created consumer group {self.group} on {self.stream}")
+            return True
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+            return False
+
+    def add(self, trap_data: Dict[str, Any]) -> Tuple[str, int]:
+        """Append a trap, trimming the stream in the same round trip.
+
+        Returns:
+            Tuple of (entry id, stream length after the add)
+        """
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.xadd(self.stream, {TRAP_FIELD: json.dumps(trap_data)}, maxlen=self.maxlen, approximate=True)
+        pipe.xlen(self.stream)
+        entry_id, length = pipe.execute()
+        return entry_id, length
+
+    def read(self, consumer: str, count: int, block_ms: Optional[int] = BLOCK_MS) -> List[StreamEntry]:
+        """Read up to ``count`` new traps for ``consumer``, waiting up to ``block_ms`` for one."""
+        try:
+            response = self.redis.xreadgroup(self.group, consumer, {self.stream: ">"}, count=count, block=block_ms)
+        except ResponseError:
+            # The stream was deleted (clear) under a running consumer
+            if not self.ensure_group():
+                raise
+            return []
+        if not response:
+            return []
+        return self._entries(response[0][1])
+
+    def ack(self, entry_ids: Sequence[str]) -> int:
+        """Acknowledge processed traps. Returns the number acknowledged."""
+        if not entry_ids:
+            return 0
+        return self.redis.xack(self.stream, self.group, *entry_ids)
+
+    def claim_stale(
+        self,
+        consumer: str,
+        count: int,
+        min_idle_ms: int = CLAIM_IDLE_MS,
+        max_deliveries: int = MAX_DELIVERIES
+    ) -> List[StreamEntry]:
+        """Take over traps other consumers left pending for ``min_idle_ms``.
+
+        Traps already delivered ``max_deliveries`` times are moved to the
+        dead-letter stream and acknowledged instead.
+        """
+        pending = self.redis.xpending_range(self.stream, self.group, min="-", max="+",
+                                            count=count, idle=min_idle_ms)
+        if not pending:
+            return []
+
+        exhausted = [p["message_id"] for p in pending if p["times_delivered"] >= max_deliveries]
+        retry = [p["message_id"] for p in pending if p["times_delivered"] < max_deliveries]
+        if exhausted:
+            self._dead_letter(exhausted)
+
+        claimed: List[StreamEntry] = []
+        if retry:
+            claimed = self._entries(self.redis.xclaim(self.stream, self.group, consumer, min_idle_ms, retry))
+            # Entries trimmed from the stream cannot be claimed; drop them from the pending list
+            missing = set(retry) - {entry_id for entry_id, _ in claimed}
+            if missing:
+                self.ack(sorted(missing))
+        if claimed:
+            logger.info(f"{consumer} reclaimed {len(claimed)} stale traps")
+        return claimed
+
+    def traps(self, count: Optional[int] = None, newest_first: bool = False) -> List[str]:
+        """Trap JSON strings in the stream, oldest first unless ``newest_first``."""
+        if newest_first:
+            entries = self.redis.xrevrange(self.stream, count=count)
+        else:
+            entries = self.redis.xrange(self.stream, count=count)
+        return [trap for _, trap in self._entries(entries)]
+
+    def clear(self) -> bool:
+        """Delete the stream along with its consumer group."""
+        return bool(self.redis.delete(self.stream))
+
+    def length(self) -> int:
+        """Number of traps in the stream, acknowledged or not."""
+        return self.redis.xlen(self.stream)
+
+    def pending_count(self) -> int:
+        """Number of traps delivered but not yet acknowledged."""
+        try:
+            return self.redis.xpending(self.stream, self.group)["pending"]
+        except ResponseError:
+            return 0
+
+    def _dead_letter(self, entry_ids: List[str]) -> None:
+        # One round trip reads every entry, a second copies and acknowledges them
+        pipe = self.redis.pipeline(transaction=True)
+        for entry_id in entry_ids:
+            pipe.xrange(self.stream, entry_id, entry_id)
+        found = pipe.execute()
+
+        for entry_id, entries in zip(entry_ids, found):
+            if entries:
+                fields = dict(entries[0][1])
+                fields["source_id"] = entry_id
+                pipe.xadd(self.dead_letter_stream, fields, maxlen=self.maxlen, approximate=True)
+        pipe.xack(self.stream, self.group, *entry_ids)
+        pipe.execute()
+        logger.warning(f"Moved {len(entry_ids)} undeliverable traps to {self.dead_letter_stream}")
+
+    @staticmethod
+    def _entries(raw_entries) -> List[StreamEntry]:
+        # Trimmed entries come back with no fields
+        return [(entry_id, fields[TRAP_FIELD]) for entry_id, fields in raw_entries
+                if fields and TRAP_FIELD in fields]
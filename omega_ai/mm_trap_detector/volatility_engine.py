@@ -0,0 +1,220 @@
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+Rolling Volatility Engine
+=========================
+
+O(1)-per-tick volatility metrics for the high-frequency trap detector.
+
+Each window is a fixed-size NumPy ring buffer that keeps a running mean and
+sum of squared deviations (Welford's update, extended to replace the oldest
+sample when the window is full), so the population standard deviation is
+available without rebuilding lists or calling ``np.std`` on every tick.
+Metrics live in-process; ``VolatilityEngine.publish`` writes them to Redis in
+one round trip, at most once per ``publish_interval`` seconds.
+"""
+
+import os
+import time
+import logging
+from typing import Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Seconds between Redis publications of the volatility metrics
+VOLATILITY_PUBLISH_INTERVAL = float(os.getenv("VOLATILITY_PUBLISH_INTERVAL", "1.0"))
+
+# Redis keys read by other components
+VOLATILITY_1MIN_KEY = "volatility_1min"
+VOLATILITY_5MIN_KEY = "volatility_5min"
+ACCELERATION_1MIN_KEY = "price_acceleration_1min"
+
+
+class RollingWindow:
+    """Fixed-capacity ring buffer with running mean and variance."""
+
+    # Full recomputations from the buffer to shed floating-point drift
+    RESYNC_EVERY = 4096
+
+    def __init__(self, capacity: int):
+        """
+        Initialize the window.
+
+        Args:
+            capacity: Number of most recent samples kept
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._buffer = np.zeros(capacity, dtype=np.float64)
+        self._head = 0
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._updates = 0
+
+    def push(self, value: float) -> None:
+        """Add a sample, evicting the oldest one when the window is full."""
+        value = float(value)
+        if self.count < self.capacity:
+            self.count += 1
+            delta = value - self.mean
+            self.mean += delta / self.count
+            self._m2 += delta * (value - self.mean)
+        else:
+            old = self._buffer[self._head]
+            old_mean = self.mean
+            self.mean += (value - old) / self.count
+            self._m2 += (value - old) * (value - self.mean + old - old_mean)
+
+        self._buffer[self._head] = value
+        self._head = (self._head + 1) % self.capacity
+
+        self._updates += 1
+        if self._updates >= self.RESYNC_EVERY:
+            self._resync()
+
+    def _resync(self) -> None:
+        values = self.values()
+        self.mean = float(values.mean()) if self.count else 0.0
+        self._m2 = float(((values - self.mean) ** 2).sum()) if self.count else 0.0
+        self._updates = 0
+
+    @property
+    def variance(self) -> float:
+        """Population variance (``np.var`` with ddof=0) of the window."""
+        if self.count == 0:
+            return 0.0
+        return max(self._m2 / self.count, 0.0)
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation of the window."""
+        return self.variance ** 0.5
+
+    def values(self) -> np.ndarray:
+        """Samples oldest to newest, as a new array."""
+        if self.count < self.capacity:
+            return self._buffer[:self.count].copy()
+        return np.roll(self._buffer, -self._head)
+
+    def __len__(self) -> int:
+        return self.count
+
+
+class VolatilityEngine:
+    """
+    Rolling 1-min / 5-min volatility and 1-min price acceleration.
+
+    Every ``sample_every``-th price also feeds the 5-min window. Volatility is
+    the window's standard deviation as a percentage of its mean; acceleration
+    is the standard deviation of consecutive price changes over the 1-min
+    window, as a percentage of the 1-min mean.
+    """
+
+    def __init__(self, window_1min: int = 10, window_5min: int = 12, sample_every: int = 5,
+                 publish_interval: float = VOLATILITY_PUBLISH_INTERVAL):
+        """
+        Initialize the engine.
+
+        Args:
+            window_1min: Samples in the 1-min window
+            window_5min: Samples in the 5-min window
+            sample_every: Ticks per 5-min sample
+            publish_interval: Minimum seconds between Redis publications
+        """
+        self.prices_1min = RollingWindow(window_1min)
+        self.diffs_1min = RollingWindow(max(1, window_1min - 1))
+        self.prices_5min = RollingWindow(window_5min)
+        self.sample_every = sample_every
+        self.publish_interval = publish_interval
+        self.ticks = 0
+        self.publishes = 0
+        self._last_price: Optional[float] = None
+        self._last_publish = 0.0
+
+    def update(self, price: float) -> None:
+        """Feed one price into the windows."""
+        price = float(price)
+        if self._last_price is not None:
+            self.diffs_1min.push(price - self._last_price)
+        self._last_price = price
+        self.prices_1min.push(price)
+
+        self.ticks += 1
+        if self.ticks % self.sample_every == 0:
+            self.prices_5min.push(price)
+
+    @property
+    def volatility_1min(self) -> Optional[float]:
+        """1-min volatility in percent, or None until 3 samples exist."""
+        window = self.prices_1min
+        if window.count < 3 or window.mean == 0:
+            return None
+        return window.std / window.mean * 100
+
+    @property
+    def volatility_5min(self) -> Optional[float]:
+        """5-min volatility in percent, or None until 3 samples exist."""
+        window = self.prices_5min
+        if window.count < 3 or window.mean == 0:
+            return None
+        return window.std / window.mean * 100
+
+    @property
+    def acceleration_1min(self) -> Optional[float]:
+        """1-min price acceleration in percent, or None until 4 samples exist."""
+        if self.prices_1min.count < 4 or self.prices_1min.mean == 0:
+            return None
+        return self.diffs_1min.std / self.prices_1min.mean * 100
+
+    def metrics(self) -> Dict[str, float]:
+        """Currently available metrics keyed by their Redis key."""
+        values = {
+            VOLATILITY_1MIN_KEY: self.volatility_1min,
+            ACCELERATION_1MIN_KEY: self.acceleration_1min,
+            VOLATILITY_5MIN_KEY: self.volatility_5min,
+        }
+        return {key: float(value) for key, value in values.items() if value is not None}
+
+    def publish(self, redis_conn, force: bool = False, now: Optional[float] = None) -> bool:
+        """
+        Write the metrics to Redis if the publish interval has elapsed.
+
+        Args:
+            redis_conn: Redis client
+            force: Publish regardless of the interval
+            now: Current monotonic time (defaults to ``time.monotonic()``)
+
+        Returns:
+            True if the metrics were written
+        """
+        now = time.monotonic() if now is None else now
+        if not force and now - self._last_publish < self.publish_interval:
+            return False
+        metrics = self.metrics()
+        if not metrics:
+            return False
+        try:
+            redis_conn.mset(metrics)
+        except Exception as e:
+            logger.error(f"Failed to publish volatility metrics: {e}")
+            return False
+        self._last_publish = now
+        self.publishes += 1
+        return True
@@ -0,0 +1,167 @@
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+🔱 OMEGA BTC AI - WebSocket Fan-out 🔱
+Per-client outbound queues for the market maker WebSocket server.
+
+A broadcast only appends the already-serialized message to every client's
+bounded outbox; each client has its own writer task draining it, so a slow
+dashboard falls behind on its own instead of stalling every other subscriber.
+When an outbox is full the client's slow-client policy applies:
+
+- ``coalesce``: drop everything queued and keep only the newest message
+  (latest state wins, which suits price and trap updates)
+- ``drop_oldest``: drop the oldest queued message
+- ``disconnect``: stop writing and let the server close the connection
+"""
+
+import asyncio
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Deque, Dict, Optional, Tuple
+
+CLIENT_QUEUE_SIZE = int(os.getenv('WEBSOCKET_CLIENT_QUEUE_SIZE', '256'))
+LATENCY_SAMPLES = 10000
+
+
+class SlowClientPolicy(Enum):
+    """What to do when a client's outbox is full."""
+    COALESCE = "coalesce"
+    DROP_OLDEST = "drop_oldest"
+    DISCONNECT = "disconnect"
+
+
+SLOW_CLIENT_POLICY = SlowClientPolicy(os.getenv('WEBSOCKET_SLOW_CLIENT_POLICY', 'coalesce'))
+
+
+def percentile(samples, pct: float) -> float:
+    """Return the ``pct`` percentile of ``samples``, or 0.0 when empty."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+@dataclass
+class FanoutStats:
+    """Broadcast counters and enqueue-to-send latency samples shared by all outboxes."""
+    broadcasts: int = 0
+    fanout_seconds: float = 0.0
+    delivered: int = 0
+    dropped: int = 0
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLES))
+
+    def record_broadcast(self, seconds: float) -> None:
+        self.broadcasts += 1
+        self.fanout_seconds += seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "broadcasts": self.broadcasts,
+            "avg_fanout_ms": self.fanout_seconds / self.broadcasts * 1000 if self.broadcasts else 0.0,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "delivery_latency_p50_ms": percentile(self.latencies, 50) * 1000,
+            "delivery_latency_p99_ms": percentile(self.latencies, 99) * 1000
+        }
+
+
+class ClientOutbox:
+    """Bounded outbound queue of one client, drained by ``run``."""
+
+    def __init__(
+        self,
+        client_id: str,
+        websocket,
+        maxsize: int = CLIENT_QUEUE_SIZE,
+        policy: SlowClientPolicy = SLOW_CLIENT_POLICY,
+        stats: Optional[FanoutStats] = None
+    ):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.client_id = client_id
+        self.websocket = websocket
+        self.maxsize = maxsize
+        self.policy = policy
+        self.stats = stats if stats is not None else FanoutStats()
+        self._queue: Deque[Tuple[Any, float]] = deque()
+        self._ready = asyncio.Event()
+        self.sent = 0
+        self.dropped = 0
+        self.last_latency = 0.0
+        self.closed = False
+        self.overflowed = False
+
+    def offer(self, message, enqueued_at: Optional[float] = None) -> bool:
+        """Queue a message without waiting. Returns False if it was refused."""
+        if self.closed:
+            return False
+        if len(self._queue) >= self.maxsize:
+            if self.policy is SlowClientPolicy.DISCONNECT:
+                self.overflowed = True
+                self.close()
+                return False
+            dropped = len(self._queue) if self.policy is SlowClientPolicy.COALESCE else 1
+            for _ in range(dropped):
+                self._queue.popleft()
+            self.dropped += dropped
+            self.stats.dropped += dropped
+        self._queue.append((message, time.perf_counter() if enqueued_at is None else enqueued_at))
+        self._ready.set()
+        return True
+
+    def close(self) -> None:
+        """Stop the writer; queued messages are discarded."""
+        self.closed = True
+        self._queue.clear()
+        self._ready.set()
+
+    @property
+    def lag(self) -> int:
+        """Messages queued but not yet sent."""
+        return len(self._queue)
+
+    @property
+    def lag_seconds(self) -> float:
+        """Age of the oldest queued message."""
+        return time.perf_counter() - self._queue[0][1] if self._queue else 0.0
+
+    async def run(self) -> None:
+        """Send queued messages in order until closed. Errors from ``send`` propagate."""
+        while not self.closed:
+            if not self._queue:
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+            message, enqueued_at = self._queue.popleft()
+            await self.websocket.send(message)
+            self.last_latency = time.perf_counter() - enqueued_at
+            self.sent += 1
+            self.stats.delivered += 1
+            self.stats.latencies.append(self.last_latency)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "lag": self.lag,
+            "lag_ms": self.lag_seconds * 1000,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "last_latency_ms": self.last_latency * 1000,
+            "policy": self.policy.value
+        }
@@ -50,6 +50,8 @@ from datetime import datetime
 
 import redis
 
+from omega_ai.utils.fibonacci_level_index import publish_fibonacci_levels_update
+
 # Configure logging
 logger = logging.getLogger(__name__)
 logging.basicConfig(
@@ -339,6 +341,7 @@ def ensure_fibonacci_levels() -> Dict[str, Any]:
             redis_conn.set("fib_base_price", str(new_levels['base_price']))
             redis_conn.set("fib_last_update", new_levels['timestamp'])
             redis_conn.expire("fibonacci_levels", 21600)  # Expire after 6 hours
+            publish_fibonacci_levels_update(redis_conn)
     except Exception as e:
         logger.error(f"Failed to store Fibonacci levels in Redis: {e}")
     
@@ -54,6 +54,8 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 # Set up path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from omega_ai.data_feed.price_history_store import PriceHistoryStore
+
 # Terminal colors for enhanced visibility
 BLUE = "\033[94m"           # Price up
 YELLOW = "\033[93m"         # Price down
@@ -231,6 +233,7 @@ class OmegaMarketTrendMonitor:
             print(f"{YELLOW}Continuing with limited functionality...{RESET}")
             self.redis_conn = None
             self.use_redis_as_primary = False  # Fallback if Redis connection fails
+        self.tick_history = None  # Columnar store, created on first read
         
         # Advanced monitoring capabilities
         self.use_ai = use_ai
@@ -273,42 +276,8 @@ class OmegaMarketTrendMonitor:
     def get_btc_price_history(self, limit=100):
         """Get BTC price history from Redis with quantum-enhanced error handling."""
         try:
-            history = []
-            # Attempt to get data from multiple sources with fallback mechanism
-            sources = ["btc_movement_history", "btc_candle_history", "btc_price_history"]
-            
-            for source in sources:
-                raw_data = redis_conn.lrange(source, 0, limit-1)
-                if raw_data:
-                    logger.debug(f"Found {len(raw_data)} entries in {source}")
-                    break
-            
-            if not raw_data:
-                logger.warning("No BTC price history found in any Redis source")
-                return []
-            
-            for item in raw_data:
-                try:
-                    # Handle different data formats
-                    if isinstance(item, dict):
-                        # Already parsed JSON object
-                        if "price" in item:
-                            price = float(item["price"])
-                            volume = float(item.get("volume", 0))
-                            history.append({"price": price, "volume": volume})
-                    elif "," in item:
-                        # CSV format: "price,volume"
-                        price_str, volume_str = item.split(",")
-                        price = float(price_str)
-                        volume = float(volume_str)
-                        history.append({"price": price, "volume": volume})
-                    else:
-                        # Plain price format
-                        price = float(item)
-                        history.append({"price": price, "volume": 0})
-                except Exception as e:
-                    logger.warning(f"Error parsing price history item: {e}")
-                    continue
+            # Timestamped ticks first, then the legacy "price,volume" lists
+            history = self._get_tick_history(limit) or self._get_list_history(limit)
             
             # If quantum mode enabled, enhance the data
             if self.quantum_mode and history:
@@ -322,6 +291,59 @@ class OmegaMarketTrendMonitor:
             logger.error(f"Error fetching BTC price history: {e}")
             return []
     
+    def _get_list_history(self, limit):
+        """Parse the newest ``limit`` entries of the first non-empty history list."""
+        history = []
+        # Attempt to get data from multiple sources with fallback mechanism
+        sources = ["btc_movement_history", "btc_candle_history", "btc_price_history"]
+        
+        for source in sources:
+            raw_data = redis_conn.lrange(source, 0, limit-1)
+            if raw_data:
+                logger.debug(f"Found {len(raw_data)} entries in {source}")
+                break
+        
+        if not raw_data:
+            logger.warning("No BTC price history found in any Redis source")
+            return []
+        
+        for item in raw_data:
+            try:
+                # Handle different data formats
+                if isinstance(item, dict):
+                    # Already parsed JSON object
+                    if "price" in item:
+                        price = float(item["price"])
+                        volume = float(item.get("volume", 0))
+                        history.append({"price": price, "volume": volume})
+                elif "," in item:
+                    # CSV format: "price,volume"
+                    price_str, volume_str = item.split(",")
+                    price = float(price_str)
+                    volume = float(volume_str)
+                    history.append({"price": price, "volume": volume})
+                else:
+                    # Plain price format
+                    price = float(item)
+                    history.append({"price": price, "volume": 0})
+            except Exception as e:
+                logger.warning(f"Error parsing price history item: {e}")
+                continue
+        return history
+    
+    def _get_tick_history(self, limit):
+        """Newest-first ``{"price", "volume", "timestamp"}`` ticks from the columnar store."""
+        if self.redis_conn is None:
+            return []
+        try:
+            if self.tick_history is None:
+                self.tick_history = PriceHistoryStore(self.redis_conn)
+            ticks = self.tick_history.tail(limit)
+        except Exception as e:
+            logger.debug(f"Columnar tick history unavailable: {e}")
+            return []
+        return ticks.to_records()[::-1]
+    
     def analyze_price_trend(self, minutes=15):
         """Analyze price trend for specified timeframe with quantum-enhanced accuracy."""
         try:
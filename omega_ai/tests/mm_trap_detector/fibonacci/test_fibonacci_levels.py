@@ -21,6 +21,7 @@ Tests for the divine Fibonacci level calculations.
 May the golden ratio be with you! 🚀
 """
 
+import json
 import pytest
 from datetime import datetime, timezone
 from unittest.mock import patch, MagicMock
@@ -155,4 +156,27 @@ class TestFibonacciLevels:
         assert levels[0.0] == 42000.0, "0.0 level should be the lower price"
         assert levels[1.0] == 40000.0, "1.0 level should be the higher price"
         
-        print(f"{GREEN}✓ Negative range handling verified!{RESET}") 
\ No newline at end of file
+        print(f"{GREEN}✓ Negative range handling verified!{RESET}")
+
+
+    @patch('omega_ai.mm_trap_detector.fibonacci_detector.redis_conn')
+    def test_batch_level_check_matches_single_checks(self, mock_redis, detector):
+        """Test the vectorized batch check finds the same hits as one check per price."""
+        detector.recent_swing_high = 42000.0
+        detector.recent_swing_low = 40000.0
+        mock_redis.get.return_value = json.dumps({
+            "0% (Base)": 40000.0, "38.2%": 40764.0, "50%": 41000.0, "61.8%": 41236.0, "100%": 42000.0
+        })
+        prices = [39995.0, 40500.0, 40770.0, 41009.9, 41011.0, 41230.0, 42010.0]
+
+        hits = detector.check_fibonacci_levels_batch(prices)
+
+        assert hits == [detector.check_fibonacci_level(price) for price in prices]
+        assert [hit["label"] if hit else None for hit in hits] == [
+            "0% (Base)", None, "38.2%", "50%", None, "61.8%", "100%"
+        ]
+        # Replays do not record hits, and unchanged levels are parsed once
+        assert mock_redis.zadd.call_count == 5
+        assert detector._level_cache.rebuilds == 1
+
+        print(f"{GREEN}✓ Batch Fibonacci level check verified!{RESET}")
@@ -21,8 +21,9 @@ Tests for the divine swing point detection functionality.
 May the golden ratio be with you! 🚀
 """
 
+import random
 import pytest
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch, MagicMock
 from omega_ai.mm_trap_detector.fibonacci_detector import FibonacciDetector
 
@@ -166,4 +167,133 @@ class TestSwingPoints:
         with pytest.raises(ValueError, match="Invalid timestamp type"):
             detector.update_price_data(42000.0, "invalid")
         
-        print(f"{GREEN}✓ Invalid timestamp handling verified!{RESET}") 
\ No newline at end of file
+        print(f"{GREEN}✓ Invalid timestamp handling verified!{RESET}") 
+
+
+class LegacySwingReference:
+    """The list-based swing detection that update_price_data used to run, kept as a reference."""
+    
+    def __init__(self, min_swing_diff=0.005):
+        self.price_history = []
+        self.recent_swing_high = None
+        self.recent_swing_low = None
+        self.min_swing_diff = min_swing_diff
+        self.potential_swing_highs = []
+        self.potential_swing_lows = []
+        self.last_confirmed_direction = None
+    
+    def update(self, price, timestamp):
+        self.price_history = (self.price_history + [(timestamp, price)])[-100:]
+        if len(self.price_history) >= 7:
+            window = self.price_history[-7:]
+            prices = [p for _, p in window]
+            for i in range(1, 6):
+                if self._is_swing(prices, i, 1):
+                    self.potential_swing_highs.append({"price": prices[i], "timestamp": window[i][0], "confirmation_count": 1})
+                if self._is_swing(prices, i, -1):
+                    self.potential_swing_lows.append({"price": prices[i], "timestamp": window[i][0], "confirmation_count": 1})
+            for p in self.potential_swing_highs:
+                p["confirmation_count"] = p["confirmation_count"] + 1 if price < p["price"] else (0 if price > p["price"] else p["confirmation_count"])
+            for p in self.potential_swing_lows:
+                p["confirmation_count"] = p["confirmation_count"] + 1 if price > p["price"] else (0 if price < p["price"] else p["confirmation_count"])
+            for p in self.potential_swing_highs:
+                if p["confirmation_count"] >= 3 and p["price"] > self.recent_swing_high:
+                    self.recent_swing_high, self.last_confirmed_direction = p["price"], "UP"
+            for p in self.potential_swing_lows:
+                if p["confirmation_count"] >= 3 and p["price"] < self.recent_swing_low:
+                    self.recent_swing_low, self.last_confirmed_direction = p["price"], "DOWN"
+            recent = [p for _, p in self.price_history[-5:]]
+            avg, vol = sum(recent) / 5, max(recent) - min(recent)
+            if vol / avg < 0.002:
+                self.potential_swing_highs = [p for p in self.potential_swing_highs if p["price"] > avg + vol * 1.5]
+                self.potential_swing_lows = [p for p in self.potential_swing_lows if p["price"] < avg - vol * 1.5]
+            if len(self.price_history) > 20:
+                cutoff = self.price_history[-20][0]
+                self.potential_swing_highs = [p for p in self.potential_swing_highs if p["confirmation_count"] > 0 and p["timestamp"] >= cutoff]
+                self.potential_swing_lows = [p for p in self.potential_swing_lows if p["confirmation_count"] > 0 and p["timestamp"] >= cutoff]
+        if self.recent_swing_high is None:
+            self.recent_swing_high = max(p for _, p in self.price_history)
+        if self.recent_swing_low is None:
+            self.recent_swing_low = min(p for _, p in self.price_history)
+    
+    def _is_swing(self, prices, i, direction):
+        if direction > 0:
+            if prices[i] <= prices[i-1] or prices[i] <= prices[i+1]:
+                return False
+            if (prices[i] - self.recent_swing_low) / self.recent_swing_low < self.min_swing_diff:
+                return False
+            return i < 3 or prices[i-3] < prices[i-2] < prices[i-1] < prices[i] or prices[i-1] > prices[i-2]
+        if prices[i] >= prices[i-1] or prices[i] >= prices[i+1]:
+            return False
+        if (self.recent_swing_high - prices[i]) / prices[i] < self.min_swing_diff:
+            return False
+        return i < 3 or prices[i-3] > prices[i-2] > prices[i-1] > prices[i] or prices[i-1] < prices[i-2]
+
+
+def candidates_by_bar(potentials):
+    """Highest confirmation count per (timestamp, price); the legacy lists hold duplicates."""
+    merged = {}
+    for p in potentials:
+        key = (p["timestamp"], p["price"])
+        merged[key] = max(merged.get(key, 0), p["confirmation_count"])
+    return merged
+
+
+class TestIncrementalSwingDetection:
+    """The incremental detector must confirm exactly the swings the list-based scan did."""
+    
+    @pytest.mark.parametrize("seed, min_swing_diff, step", [(1, 0.005, 0.004), (2, 0.001, 0.001), (3, 0.0005, 0.0004)])
+    @patch('omega_ai.mm_trap_detector.fibonacci_detector.redis_conn')
+    def test_replay_matches_list_scan(self, mock_redis, detector, seed, min_swing_diff, step):
+        """Test swing points, direction and candidates match tick by tick over a random walk."""
+        rng = random.Random(seed)
+        detector.min_swing_diff = min_swing_diff
+        reference = LegacySwingReference(min_swing_diff)
+        start = datetime(2024, 5, 1, tzinfo=timezone.utc)
+        price = 42000.0
+        
+        swings = set()
+        for i in range(3000):
+            # Round to cents so equal prices (neither confirming nor resetting) occur too
+            price = round(price * (1 + rng.gauss(0, step)), 0 if i % 3 else 2)
+            timestamp = start + timedelta(seconds=i)
+            detector.update_price_data(price, timestamp)
+            reference.update(price, timestamp)
+            
+            assert (detector.recent_swing_high, detector.recent_swing_low) == \
+                (reference.recent_swing_high, reference.recent_swing_low)
+            assert detector.last_confirmed_direction == reference.last_confirmed_direction
+            assert candidates_by_bar(detector.potential_swing_highs) == candidates_by_bar(reference.potential_swing_highs)
+            assert candidates_by_bar(detector.potential_swing_lows) == candidates_by_bar(reference.potential_swing_lows)
+            swings.add((detector.recent_swing_high, detector.recent_swing_low))
+        
+        # The walk must actually exercise confirmations
+        assert len(swings) > 5
+    
+    @patch('omega_ai.mm_trap_detector.fibonacci_detector.redis_conn')
+    def test_candidates_are_bounded(self, mock_redis, detector):
+        """Test re-qualifying bars refresh their entry instead of piling up duplicates."""
+        start = datetime(2024, 5, 1, tzinfo=timezone.utc)
+        for i in range(500):
+            price = 42000.0 + (300.0 if i % 4 == 1 else 0.0) - (300.0 if i % 4 == 3 else 0.0)
+            detector.update_price_data(price, start + timedelta(minutes=i))
+        
+        highs = detector.potential_swing_highs
+        assert len(highs) == len({h["timestamp"] for h in highs})
+        assert len(highs) <= 20
+        assert len(detector.price_history) == 100
+    
+    @patch('omega_ai.mm_trap_detector.fibonacci_detector.redis_conn')
+    def test_replacing_history_rebuilds_window(self, mock_redis, detector):
+        """Test assigning price_history keeps detection consistent with the new history."""
+        start = datetime(2024, 5, 1, tzinfo=timezone.utc)
+        history = [(start + timedelta(minutes=i), p)
+                   for i, p in enumerate([42000.0, 42500.0, 43000.0, 43600.0, 43200.0, 42900.0])]
+        detector.price_history = history
+        detector.recent_swing_low = 42000.0
+        detector.recent_swing_high = 43000.0
+        detector.potential_swing_highs = []
+        
+        detector.update_price_data(42700.0, start + timedelta(minutes=6))
+        assert [h["price"] for h in detector.potential_swing_highs] == [43600.0]
+
@@ -79,17 +79,18 @@ class TestHighFrequencyDetector(unittest.TestCase):
 
     def test_volatility_calculation(self):
         """Test volatility calculation and storage"""
-        # Arrange
-        for price, timestamp in zip(self.sample_prices, self.sample_timestamps):
-            self.detector.update_price_data(price, timestamp)
+        # Arrange - enough ticks for three 5min samples
+        for i in range(15):
+            self.detector.update_price_data(80000.0 + (i % 4) * 100.0)
 
         # Act
-        self.detector._calculate_volatility_metrics()
+        metrics = self.detector._calculate_volatility_metrics()
+        self.detector.publish_volatility_metrics()
 
-        # Assert
-        self.redis_mock.set.assert_any_call("volatility_1min", ANY)
-        self.redis_mock.set.assert_any_call("volatility_5min", ANY)
-        self.redis_mock.set.assert_any_call("price_acceleration_1min", ANY)
+        # Assert - metrics held in-process and published in one round trip
+        self.assertEqual(set(metrics), {"volatility_1min", "volatility_5min", "price_acceleration_1min"})
+        published = self.redis_mock.mset.call_args[0][0]
+        self.assertEqual(set(published), set(metrics))
 
     def test_high_frequency_mode_detection(self):
         """Test high-frequency mode detection"""
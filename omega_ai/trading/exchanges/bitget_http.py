@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+BitGet HTTP Client for OmegaBTC AI
+
+Shared REST transport of the BitGet traders:
+
+- one aiohttp session with a keep-alive connection pool, owned by a
+  background event loop so synchronous trader code can use it as well
+- token buckets per endpoint group following BitGet's published limits,
+  per API key for account endpoints and per IP for market data
+- identical concurrent GET requests (ticker, positions) share one round trip
+- retries with exponential backoff on rate limits, server errors and
+  connection failures
+- request and response payloads are only formatted when DEBUG logging is
+  enabled, with the credential headers redacted
+
+Errors are raised as ``requests`` exceptions so existing handlers keep working.
+"""
+
+import asyncio
+import json
+import logging
+import random
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import aiohttp
+import requests
+from requests.exceptions import RequestException
+
+logger = logging.getLogger(__name__)
+
+# Terminal colors for output
+RED = "\033[91m"
+YELLOW = "\033[93m"
+CYAN = "\033[96m"
+RESET = "\033[0m"
+
+# Retry constants
+MAX_RETRIES = 3
+INITIAL_RETRY_DELAY = 1  # seconds
+MAX_RETRY_DELAY = 10  # seconds
+REQUEST_TIMEOUT = 10  # seconds
+
+# Connection pool
+POOL_SIZE = 64
+KEEPALIVE_TIMEOUT = 30  # seconds
+
+# BitGet rate limits per endpoint group: (path fragment, group, requests per second, per API key).
+# The first matching fragment wins; market data is limited per IP, everything else per UID.
+ENDPOINT_GROUPS = (
+    ("/market/", "market", 20, False),
+    ("/sub-account", "sub_account", 1, True),
+    ("/set-leverage", "leverage", 5, True),
+    ("/set-margin", "leverage", 5, True),
+    ("/position/", "position", 5, True),
+    ("/order/", "order", 10, True),
+    ("/account/", "account", 10, True),
+)
+DEFAULT_GROUP = ("default", 10, True)
+
+# Headers never written to the logs
+REDACTED_HEADERS = ("ACCESS-KEY", "ACCESS-SIGN", "ACCESS-PASSPHRASE")
+
+
+def retry_delay(retry_count: int) -> float:
+    """Calculate exponential backoff delay with jitter."""
+    delay = min(INITIAL_RETRY_DELAY * (2 ** retry_count), MAX_RETRY_DELAY)
+    jitter = random.uniform(0, 0.1 * delay)
+    return delay + jitter
+
+
+def endpoint_group(url: str) -> Tuple[str, float, bool]:
+    """Return ``(group, requests per second, per API key)`` of a request URL."""
+    path = url.split("?", 1)[0]
+    for fragment, group, rate, per_key in ENDPOINT_GROUPS:
+        if fragment in path:
+            return group, rate, per_key
+    return DEFAULT_GROUP
+
+
+def redact_headers(headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+    """Copy of the headers with the credentials masked."""
+    return {key: "***" if key.upper() in REDACTED_HEADERS else value for key, value in (headers or {}).items()}
+
+
+class TokenBucket:
+    """
+    Token bucket pacing requests on the client's event loop.
+
+    Every ``acquire`` reserves a token right away; when the bucket is empty
+    the caller sleeps until its token is due, so waiting requests are
+    released in arrival order at ``rate`` per second.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    async def acquire(self) -> float:
+        """Take one token, waiting if necessary. Returns the seconds waited."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        delay = -self.tokens / self.rate
+        await asyncio.sleep(delay)
+        return delay
+
+
+class HttpResponse:
+    """
+    Fully read HTTP response with the parts of ``requests.Response`` the traders use.
+    """
+
+    def __init__(self, method: str, url: str, status_code: int, headers: Dict[str, str], content: bytes):
+        self.method = method
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            kind = "Client" if self.status_code < 500 else "Server"
+            raise requests.HTTPError(f"{self.status_code} {kind} Error for url: {self.url}", response=self)
+
+    def __repr__(self) -> str:
+        return f"<HttpResponse [{self.status_code}]>"
+
+
+def _should_retry(response: HttpResponse, retry_count: int) -> bool:
+    """Whether a response is a rate limit hit or one of BitGet's spurious 404s."""
+    if response.status_code == 429:
+        return True
+    if response.status_code == 404 and retry_count > 0:
+        try:
+            return response.json().get("code") == "40404"  # BitGet's "Request URL NOT FOUND"
+        except (ValueError, AttributeError):
+            return False
+    return False
+
+
+def _query_params(params: Optional[Dict[str, Any]]) -> Optional[Dict[str, str]]:
+    """Query parameters as strings, dropping ``None`` like ``requests`` does."""
+    if not params:
+        return None
+    return {key: value if isinstance(value, str) else str(value) for key, value in params.items() if value is not None}
+
+
+class BitGetHttpClient:
+    """
+    Pooled asynchronous HTTP client for the BitGet REST API.
+
+    The aiohttp session lives on a dedicated event loop thread. Coroutines
+    use ``request`` (from any event loop); synchronous code uses
+    ``request_sync``, which blocks the calling thread only.
+    """
+
+    def __init__(self, pool_size: int = POOL_SIZE, timeout: float = REQUEST_TIMEOUT,
+                 max_retries: int = MAX_RETRIES):
+        """
+        Initialize the client; the event loop and session start on first use.
+
+        Args:
+            pool_size: Maximum number of open connections
+            timeout: Total timeout of one attempt in seconds
+            max_retries: Attempts per request
+        """
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.max_retries = max_retries
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._start_lock = threading.Lock()
+        self._buckets: Dict[Tuple[str, Optional[str]], TokenBucket] = {}
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+
+        self.stats = {"requests": 0, "coalesced": 0, "retries": 0, "throttled_seconds": 0.0}
+
+    # Event loop
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="bitget-http", daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_size, keepalive_timeout=KEEPALIVE_TIMEOUT)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                raise_for_status=False
+            )
+        return self._session
+
+    def close(self) -> None:
+        """Close the session and stop the event loop thread."""
+        with self._start_lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        if self._session is not None:
+            asyncio.run_coroutine_threadsafe(self._session.close(), loop).result()
+            self._session = None
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    # Rate limits
+
+    def bucket(self, url: str, headers: Optional[Dict[str, str]] = None) -> TokenBucket:
+        """Token bucket a request draws from."""
+        group, rate, per_key = endpoint_group(url)
+        account = (headers or {}).get("ACCESS-KEY") if per_key else None
+        key = (group, account)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(rate)
+        return bucket
+
+    # Requests
+
+    async def request(self, method: str, url: str, **kwargs) -> HttpResponse:
+        """
+        Send a request, coalescing identical concurrent GETs.
+
+        Args:
+            method: HTTP method
+            url: Full URL, optionally with a query string
+            **kwargs: ``headers``, ``params``, ``json`` or ``data``, and ``timeout``
+
+        Returns:
+            Response of the last attempt
+
+        Raises:
+            requests.RequestException: On connection errors, timeouts and
+                HTTP errors once the retries are exhausted
+        """
+        loop = self._ensure_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is not loop:
+            future = asyncio.run_coroutine_threadsafe(self._request(method, url, **kwargs), loop)
+            return await asyncio.wrap_future(future)
+        return await self._request(method, url, **kwargs)
+
+    def request_sync(self, method: str, url: str, **kwargs) -> HttpResponse:
+        """Blocking ``request`` for synchronous callers."""
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("request_sync called from the HTTP client's own event loop")
+        return asyncio.run_coroutine_threadsafe(self._request(method, url, **kwargs), loop).result()
+
+    async def _request(self, method: str, url: str, **kwargs) -> HttpResponse:
+        method = method.upper()
+        if method != "GET":
+            return await self._send_with_retries(method, url, **kwargs)
+
+        headers = kwargs.get("headers") or {}
+        params = kwargs.get("params") or {}
+        key = (url, tuple(sorted((str(k), str(v)) for k, v in params.items())), headers.get("ACCESS-KEY"))
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.stats["coalesced"] += 1
+            return await asyncio.shield(pending)
+
+        pending = asyncio.get_running_loop().create_future()
+        self._inflight[key] = pending
+        try:
+            response = await self._send_with_retries(method, url, **kwargs)
+        except BaseException as e:
+            pending.set_exception(e)
+            pending.exception()  # Mark retrieved when nobody else waited
+            raise
+        else:
+            pending.set_result(response)
+            return response
+        finally:
+            del self._inflight[key]
+
+    async def _send_with_retries(self, method: str, url: str, **kwargs) -> HttpResponse:
+        bucket = self.bucket(url, kwargs.get("headers"))
+        response = None
+        last_error = None
+
+        for retry_count in range(self.max_retries):
+            self.stats["throttled_seconds"] += await bucket.acquire()
+            if retry_count:
+                self.stats["retries"] += 1
+            try:
+                response = await self._send(method, url, **kwargs)
+            except RequestException as e:
+                last_error = e
+                delay = retry_delay(retry_count)
+                logger.warning(f"{YELLOW}Request failed: {e}. Retrying in {delay:.2f} seconds... "
+                               f"(Attempt {retry_count + 1}/{self.max_retries}){RESET}")
+                await asyncio.sleep(delay)
+                continue
+
+            if _should_retry(response, retry_count) or response.status_code >= 500:
+                last_error = None if response.status_code < 500 else requests.HTTPError(
+                    f"{response.status_code} Server Error for url: {url}", response=response)
+                delay = retry_delay(retry_count)
+                logger.warning(f"{YELLOW}{method} {url} returned {response.status_code}. Retrying in {delay:.2f} seconds... "
+                               f"(Attempt {retry_count + 1}/{self.max_retries}){RESET}")
+                await asyncio.sleep(delay)
+                continue
+
+            # Other client errors (bad signature, bad parameters) do not improve with retries
+            response.raise_for_status()
+            return response
+
+        if last_error:
+            logger.error(f"{RED}{method} {url} failed after {self.max_retries} attempts: {last_error}{RESET}")
+            raise last_error
+        if response is None:
+            raise RequestException("Failed to make request after all retries")
+        return response
+
+    async def _send(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                    params: Optional[Dict[str, Any]] = None, json: Any = None, data: Any = None,
+                    timeout: Optional[float] = None) -> HttpResponse:
+        """One attempt, with ``aiohttp`` errors mapped to ``requests`` exceptions."""
+        headers = dict(headers or {})
+        if json is not None:
+            data = _json_dumps(json)
+            headers.setdefault("Content-Type", "application/json")
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"{CYAN}=== Request ==={RESET} {method} {url} params={params} "
+                         f"headers={redact_headers(headers)} body={data}")
+
+        self.stats["requests"] += 1
+        request_timeout = aiohttp.ClientTimeout(total=timeout) if timeout is not None else None
+        try:
+            async with self._get_session().request(method, url, headers=headers, params=_query_params(params),
+                                                   data=data, timeout=request_timeout) as raw:
+                content = await raw.read()
+                response = HttpResponse(method, url, raw.status, dict(raw.headers), content)
+        except asyncio.TimeoutError as e:
+            raise requests.Timeout(f"{method} {url} timed out") from e
+        except aiohttp.ClientConnectionError as e:
+            raise requests.ConnectionError(str(e)) from e
+        except aiohttp.ClientError as e:
+            raise RequestException(str(e)) from e
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"{CYAN}=== Response ==={RESET} {response.status_code} {method} {url} body={response.text}")
+        return response
+
+
+# The ``json`` argument of ``_send`` shadows the module
+_json_dumps = json.dumps
+
+_client: Optional[BitGetHttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> BitGetHttpClient:
+    """Process-wide client shared by every trader, so they share its pool and rate limits."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = BitGetHttpClient()
+        return _client
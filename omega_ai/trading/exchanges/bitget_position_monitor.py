@@ -8,13 +8,27 @@ Copyright (c) 2024 OMEGA BTC AI
 Licensed under the GBU2 License - see LICENSE file for details
 """
 
-async def monitor_bitget_positions(trader, exit_strategy):
-    """Monitor BitGet positions and apply exit strategy"""
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+async def monitor_bitget_positions(trader, exit_strategy, state_engine=None):
+    """
+    Monitor BitGet positions and apply exit strategy.
+
+    With a started ``BitGetStateEngine`` positions and prices come from
+    WebSocket pushes and every update is checked as it arrives; without one
+    positions are polled every 5 seconds.
+    """
     running = True
     while running:
         try:
             # Get current positions
-            positions = await trader.get_positions()
+            if state_engine is not None and state_engine.synced:
+                positions = state_engine.get_positions()
+            else:
+                positions = await trader.get_positions()
             
             # For each active position
             for position in positions:
@@ -23,6 +37,8 @@ async def monitor_bitget_positions(trader, exit_strategy):
                 contracts = float(position.get('contracts', 0))
                 entry_price = float(position.get('entryPrice', 0))
                 current_price = float(position.get('markPrice', 0))
+                if state_engine is not None:
+                    current_price = state_engine.get_price(symbol) or current_price
                 direction = position.get('side', '').lower()
                 
                 if contracts <= 0 or entry_price <= 0 or current_price <= 0:
@@ -64,8 +80,11 @@ async def monitor_bitget_positions(trader, exit_strategy):
                         logger.error(f"Error closing position: {e}")
                         await try_alternative_closing_method(trader, position, exit_percentage)
             
-            # Sleep to prevent API rate limiting
-            await asyncio.sleep(5)
+            if state_engine is not None:
+                await state_engine.wait_for_update(timeout=5)
+            else:
+                # Sleep to prevent API rate limiting
+                await asyncio.sleep(5)
         except Exception as e:
             logger.error(f"Error in position monitor: {e}")
             await asyncio.sleep(30)  # Longer sleep on error
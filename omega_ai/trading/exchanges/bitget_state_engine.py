@@ -0,0 +1,605 @@
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - BitGet Live State Engine
+=======================================
+
+Keeps positions, open orders, fills and top of book for BitGet in memory,
+fed by the private (positions, orders, fill) and public (ticker) WebSocket
+channels of ``BitGetWebSocket``. REST is only used for a snapshot at start
+and to resync after a reconnect, a sequence gap or a silent stream, so
+traders react to fills and price moves when they are pushed instead of on
+their next poll.
+
+Messages can be recorded to a JSON lines file and fed back offline with
+``replay_messages`` to measure reaction latency.
+
+Author: OMEGA BTC AI Team
+Version: 1.0
+"""
+
+import json
+import time
+import asyncio
+import inspect
+import logging
+from collections import deque, OrderedDict
+from typing import Dict, List, Optional, Any, Callable, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Terminal colors for output
+GREEN = "\033[92m"
+RED = "\033[91m"
+YELLOW = "\033[93m"
+CYAN = "\033[96m"
+RESET = "\033[0m"
+
+PRIVATE_CHANNELS = ("positions", "orders", "fill")
+PUBLIC_CHANNELS = ("ticker",)
+EVENT_TYPES = ("position", "order", "fill", "ticker", "resync")
+
+# Order states of the v1 and v2 WebSocket APIs in ccxt terms
+ORDER_STATUS = {
+    "new": "open", "init": "open", "live": "open",
+    "partial-fill": "open", "partially_filled": "open",
+    "full-fill": "closed", "filled": "closed",
+    "cancelled": "canceled", "canceled": "canceled",
+}
+
+def normalize_symbol(symbol: Optional[str]) -> str:
+    """Map 'BTC/USDT:USDT', 'BTCUSDT_UMCBL' and 'btcusdt' to 'BTCUSDT'."""
+    if not symbol:
+        return ""
+    symbol = symbol.split("_")[0]
+    if "/" in symbol:
+        base, quote = symbol.split("/", 1)
+        symbol = base + quote.split(":")[0]
+    return symbol.upper()
+
+def ccxt_symbol(symbol: str) -> str:
+    """USDT-M contract symbol in ccxt notation, e.g. 'BTC/USDT:USDT'."""
+    symbol = normalize_symbol(symbol)
+    if symbol.endswith("USDT"):
+        return f"{symbol[:-4]}/USDT:USDT"
+    return symbol
+
+def _float(raw: Dict[str, Any], *keys: str, default: Optional[float] = 0.0) -> Optional[float]:
+    """First of ``keys`` present in ``raw`` as float (field names differ between API versions)."""
+    for key in keys:
+        value = raw.get(key)
+        if value not in (None, ""):
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                continue
+    return default
+
+def normalize_position(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Position from a WebSocket push or a ccxt REST response in the ccxt layout traders use."""
+    if "contracts" in raw:  # Already ccxt
+        position = dict(raw)
+        position["contracts"] = _float(raw, "contracts")
+        position["side"] = (raw.get("side") or "").lower()
+        return position
+    return {
+        "id": raw.get("posId") or raw.get("positionId"),
+        "symbol": ccxt_symbol(raw.get("instId", "")),
+        "side": (raw.get("holdSide") or "").lower(),
+        "contracts": _float(raw, "total"),
+        "entryPrice": _float(raw, "openPriceAvg", "averageOpenPrice"),
+        "markPrice": _float(raw, "markPrice", "marketPrice"),
+        "unrealizedPnl": _float(raw, "unrealizedPL", "upl"),
+        "leverage": _float(raw, "leverage", default=None),
+        "liquidationPrice": _float(raw, "liquidationPrice", "liqPx", default=None),
+        "timestamp": int(_float(raw, "uTime", "cTime")),
+        "info": raw,
+    }
+
+def normalize_order(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Order push (v1 or v2 field names) in ccxt layout."""
+    if "amount" in raw and "status" in raw and raw.get("status") in ("open", "closed", "canceled"):
+        return dict(raw)  # Already ccxt
+    status = raw.get("status", "")
+    return {
+        "id": raw.get("orderId") or raw.get("ordId") or raw.get("id"),
+        "clientOrderId": raw.get("clientOid") or raw.get("clOrdId"),
+        "symbol": ccxt_symbol(raw.get("instId", "")),
+        "side": raw.get("side"),
+        "type": raw.get("orderType") or raw.get("ordType"),
+        "price": _float(raw, "price", "px", default=None),
+        "amount": _float(raw, "size", "sz"),
+        "filled": _float(raw, "accBaseVolume", "accFillSz"),
+        "average": _float(raw, "priceAvg", "avgPx", default=None),
+        "reduceOnly": raw.get("reduceOnly") in (True, "yes", "true"),
+        "status": ORDER_STATUS.get(status, status),
+        "timestamp": int(_float(raw, "uTime", "cTime")),
+        "info": raw,
+    }
+
+def normalize_fill(raw: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Trade from the fill channel or from an order push that reports one, else None."""
+    trade_id = raw.get("tradeId")
+    amount = _float(raw, "baseVolume", "fillSz", "size")
+    if not trade_id or amount <= 0:
+        return None
+    return {
+        "id": trade_id,
+        "order": raw.get("orderId") or raw.get("ordId"),
+        "symbol": ccxt_symbol(raw.get("instId") or raw.get("symbol", "")),
+        "side": raw.get("side"),
+        "price": _float(raw, "fillPrice", "fillPx", "priceAvg", "price"),
+        "amount": amount,
+        "fee": _float(raw, "fillFee", "fee", default=None),
+        "timestamp": int(_float(raw, "fillTime", "uTime", "cTime")),
+        "info": raw,
+    }
+
+def normalize_ticker(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Ticker push (v1 or v2 field names) with top of book."""
+    return {
+        "symbol": normalize_symbol(raw.get("instId", "")),
+        "last": _float(raw, "lastPr", "last", default=None),
+        "bid": _float(raw, "bidPr", "bestBid", default=None),
+        "ask": _float(raw, "askPr", "bestAsk", default=None),
+        "mark": _float(raw, "markPrice", default=None),
+        "timestamp": int(_float(raw, "ts", "systemTime")),
+    }
+
+async def _resolve(value: Any) -> Any:
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+class BitGetStateEngine:
+    """
+    In-memory BitGet account and market state kept current by WebSocket pushes.
+
+    ``handle_message`` is registered as ``BitGetWebSocket`` callback for the
+    private and public channels. Listeners added with ``add_listener`` receive
+    each position, order, fill and ticker change, and ``wait_for_update`` lets
+    a trading loop sleep until something changes.
+    """
+
+    def __init__(self,
+                 websocket: Optional[Any] = None,
+                 rest: Optional[Any] = None,
+                 symbols: Optional[List[str]] = None,
+                 stale_after: float = 30.0,
+                 record_path: Optional[str] = None,
+                 max_fills: int = 1000):
+        """
+        Initialize the state engine.
+
+        Args:
+            websocket: BitGetWebSocket to subscribe with, or None when fed manually
+            rest: REST snapshot source with ``get_positions()`` and optionally
+                ``fetch_open_orders()`` (e.g. BitGetCCXT)
+            symbols: Symbols whose tickers to follow
+            stale_after: Seconds without any message before resyncing over REST
+            record_path: JSON lines file to record every message to for replays
+            max_fills: Number of recent fills to keep
+        """
+        self.websocket = websocket
+        self.rest = rest
+        self.symbols = [normalize_symbol(symbol) for symbol in symbols or []]
+        self.stale_after = stale_after
+
+        self.positions: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.orders: Dict[str, Dict[str, Any]] = {}
+        self.fills: deque = deque(maxlen=max_fills)
+        self.tickers: Dict[str, Dict[str, Any]] = {}
+        self.listeners: Dict[str, List[Callable]] = {event: [] for event in EVENT_TYPES}
+
+        self.synced = False
+        self.last_message_at = 0.0  # perf_counter of the latest message
+        self._last_resync_at = 0.0
+        self._touched: Dict[Tuple, float] = {}  # Last push per position/order key
+        self._sequences: Dict[Tuple[str, str], int] = {}
+        self._trade_ids: OrderedDict = OrderedDict()  # Fills arrive on both the orders and fill channels
+        self._update = asyncio.Event()
+        self._resync_task: Optional[asyncio.Task] = None
+        self._tasks: List[asyncio.Task] = []
+        self._connect_count = 0
+
+        self._recorder = open(record_path, "a") if record_path else None
+        self._record_start = time.perf_counter()
+
+        self.stats = {"messages": 0, "positions": 0, "orders": 0, "fills": 0, "tickers": 0,
+                      "ignored": 0, "gaps": 0, "resyncs": 0, "resync_errors": 0}
+        self.reaction_latencies: deque = deque(maxlen=10000)
+
+    # ----------------------------------------------------------------- updates
+
+    def add_listener(self, event_type: str, callback: Callable) -> None:
+        """
+        Call ``callback(item)`` on every change of an event type.
+
+        Args:
+            event_type: position, order, fill, ticker or resync
+            callback: Function or coroutine function
+        """
+        if event_type not in self.listeners:
+            raise ValueError(f"Unknown event type: {event_type}")
+        self.listeners[event_type].append(callback)
+
+    async def handle_message(self, data: Dict[str, Any]) -> None:
+        """Apply a decoded WebSocket message and notify listeners (BitGetWebSocket callback)."""
+        events = self.apply(data)
+        for event_type, item in events:
+            for callback in self.listeners[event_type]:
+                try:
+                    await _resolve(callback(item))
+                except Exception as e:
+                    logger.error(f"{RED}Error in {event_type} listener: {str(e)}{RESET}")
+
+    def apply(self, data: Dict[str, Any], received_at: Optional[float] = None) -> List[Tuple[str, Any]]:
+        """
+        Apply a decoded WebSocket message to the state.
+
+        Args:
+            data: Push message with ``arg``, optional ``action`` and ``data``
+            received_at: perf_counter at which the message arrived
+
+        Returns:
+            List of (event type, item) changes
+        """
+        received_at = received_at or time.perf_counter()
+        arg = data.get("arg") or {}
+        channel = arg.get("channel")
+        items = data.get("data")
+        if channel not in PRIVATE_CHANNELS + PUBLIC_CHANNELS or not isinstance(items, list):
+            self.stats["ignored"] += 1
+            return []
+
+        self.stats["messages"] += 1
+        self.last_message_at = received_at
+        if self._recorder:
+            self._recorder.write(json.dumps({"t": round(received_at - self._record_start, 6), "msg": data}) + "\n")
+        if self._sequence_gap(channel, arg, data):
+            self.request_resync("gap")
+
+        if channel == "positions":
+            events = self._apply_positions(items, data.get("action") == "snapshot", received_at)
+        elif channel == "orders":
+            events = self._apply_orders(items, received_at)
+        elif channel == "fill":
+            events = self._apply_fills(items)
+        else:
+            events = self._apply_tickers(items)
+
+        if events:
+            self._notify()
+        return events
+
+    def _apply_positions(self, items: List[Dict], snapshot: bool, received_at: float) -> List[Tuple[str, Any]]:
+        events = []
+        seen = set()
+        for raw in items:
+            position = normalize_position(raw)
+            key = (normalize_symbol(position["symbol"]), position["side"])
+            seen.add(key)
+            self._touched[key] = received_at
+            if position["contracts"] > 0:
+                self.positions[key] = position
+            else:
+                self.positions.pop(key, None)
+            events.append(("position", position))
+
+        if snapshot:
+            # The positions channel pushes every open position, so missing ones are closed
+            for key in [key for key in self.positions if key not in seen]:
+                closed = dict(self.positions.pop(key), contracts=0.0)
+                self._touched[key] = received_at
+                events.append(("position", closed))
+        self.stats["positions"] += len(events)
+        return events
+
+    def _apply_orders(self, items: List[Dict], received_at: float) -> List[Tuple[str, Any]]:
+        events = []
+        for raw in items:
+            order = normalize_order(raw)
+            if not order["id"]:
+                continue
+            self._touched[("order", order["id"])] = received_at
+            if order["status"] == "open":
+                self.orders[order["id"]] = order
+            else:
+                self.orders.pop(order["id"], None)
+            events.append(("order", order))
+            events.extend(self._apply_fills([raw]))
+        self.stats["orders"] += sum(1 for event_type, _ in events if event_type == "order")
+        return events
+
+    def _apply_fills(self, items: List[Dict]) -> List[Tuple[str, Any]]:
+        events = []
+        for raw in items:
+            fill = normalize_fill(raw)
+            if fill is None or fill["id"] in self._trade_ids:
+                continue
+            self._trade_ids[fill["id"]] = True
+            if len(self._trade_ids) > self.fills.maxlen:
+                self._trade_ids.popitem(last=False)
+            self.fills.append(fill)
+            self.stats["fills"] += 1
+            events.append(("fill", fill))
+        return events
+
+    def _apply_tickers(self, items: List[Dict]) -> List[Tuple[str, Any]]:
+        events = []
+        for raw in items:
+            ticker = normalize_ticker(raw)
+            if ticker["last"] is None:
+                continue
+            self.tickers[ticker["symbol"]] = ticker
+            events.append(("ticker", ticker))
+        self.stats["tickers"] += len(events)
+        return events
+
+    def _sequence_gap(self, channel: str, arg: Dict[str, Any], data: Dict[str, Any]) -> bool:
+        """Whether a message carrying a sequence number skipped one."""
+        items = data.get("data") or []
+        seq = data.get("seq")
+        if seq is None and items and isinstance(items[0], dict):
+            seq = items[0].get("seq")
+        if seq is None:
+            return False
+        key = (channel, arg.get("instId", ""))
+        last = self._sequences.get(key)
+        self._sequences[key] = int(seq)
+        if last is not None and int(seq) > last + 1:
+            self.stats["gaps"] += 1
+            logger.warning(f"{YELLOW}Sequence gap on {channel} {key[1]}: {last} -> {seq}{RESET}")
+            return True
+        return False
+
+    def _notify(self) -> None:
+        # Wake everyone waiting for this update; later waiters wait for the next one
+        self._update.set()
+        self._update = asyncio.Event()
+
+    async def wait_for_update(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the state changes.
+
+        Args:
+            timeout: Seconds to wait at most
+
+        Returns:
+            True if the state changed, False on timeout
+        """
+        try:
+            await asyncio.wait_for(self._update.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def mark_reaction(self) -> float:
+        """
+        Record that a consumer finished acting on the latest message.
+
+        Returns:
+            Seconds since the latest message arrived
+        """
+        latency = time.perf_counter() - self.last_message_at
+        self.reaction_latencies.append(latency)
+        return latency
+
+    # ------------------------------------------------------------------ queries
+
+    def get_positions(self, symbol: Optional[str] = None, side: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Open positions, optionally of one symbol and side (values are shared, do not modify)."""
+        symbol = normalize_symbol(symbol) if symbol else None
+        return [position for (position_symbol, position_side), position in self.positions.items()
+                if (symbol is None or position_symbol == symbol) and (side is None or position_side == side)]
+
+    def get_open_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Open orders, optionally of one symbol."""
+        symbol = normalize_symbol(symbol) if symbol else None
+        return [order for order in self.orders.values()
+                if symbol is None or normalize_symbol(order["symbol"]) == symbol]
+
+    def get_ticker(self, symbol: str) -> Optional[Dict[str, Any]]:
+        return self.tickers.get(normalize_symbol(symbol))
+
+    def get_price(self, symbol: str) -> Optional[float]:
+        """Last traded price pushed for a symbol, None before the first ticker."""
+        ticker = self.get_ticker(symbol)
+        return ticker["last"] if ticker else None
+
+    def get_book(self, symbol: str) -> Tuple[Optional[float], Optional[float]]:
+        """Best bid and ask pushed for a symbol."""
+        ticker = self.get_ticker(symbol) or {}
+        return ticker.get("bid"), ticker.get("ask")
+
+    # ------------------------------------------------------------------ resync
+
+    async def resync(self, reason: str = "manual") -> bool:
+        """
+        Reload positions and open orders over REST.
+
+        Entries pushed while the snapshot was loading are newer than it and are kept.
+
+        Args:
+            reason: Why the resync happened, passed to resync listeners
+
+        Returns:
+            True if the snapshot was applied
+        """
+        if self.rest is None:
+            return False
+        started = time.perf_counter()
+        self._last_resync_at = started
+        try:
+            positions = await _resolve(self.rest.get_positions())
+            fetch_orders = getattr(self.rest, "fetch_open_orders", None)
+            orders = await _resolve(fetch_orders()) if fetch_orders else None
+        except Exception as e:
+            self.stats["resync_errors"] += 1
+            logger.error(f"{RED}State resync ({reason}) failed: {str(e)}{RESET}")
+            return False
+
+        def is_newer(key: Tuple) -> bool:
+            return self._touched.get(key, 0.0) > started
+
+        fresh = {}
+        for raw in positions or []:
+            position = normalize_position(raw)
+            if position["contracts"] > 0:
+                fresh[(normalize_symbol(position["symbol"]), position["side"])] = position
+        for key in [key for key in self.positions if key not in fresh and not is_newer(key)]:
+            del self.positions[key]
+        for key, position in fresh.items():
+            if not is_newer(key):
+                self.positions[key] = position
+
+        if orders is not None:
+            fresh_orders = {order["id"]: order for order in map(normalize_order, orders) if order["id"]}
+            for order_id in [order_id for order_id in self.orders
+                             if order_id not in fresh_orders and not is_newer(("order", order_id))]:
+                del self.orders[order_id]
+            for order_id, order in fresh_orders.items():
+                if not is_newer(("order", order_id)):
+                    self.orders[order_id] = order
+
+        self.synced = True
+        self._sequences.clear()
+        self.stats["resyncs"] += 1
+        logger.info(f"{CYAN}State resynced over REST ({reason}): {len(self.positions)} positions, "
+                    f"{len(self.orders)} open orders{RESET}")
+        self._notify()
+        for callback in self.listeners["resync"]:
+            try:
+                await _resolve(callback(reason))
+            except Exception as e:
+                logger.error(f"{RED}Error in resync listener: {str(e)}{RESET}")
+        return True
+
+    def request_resync(self, reason: str) -> None:
+        """Schedule a resync unless one is already running."""
+        if self._resync_task is not None and not self._resync_task.done():
+            return
+        try:
+            self._resync_task = asyncio.get_running_loop().create_task(self.resync(reason))
+        except RuntimeError:
+            self.synced = False  # No loop: the next start() resyncs
+
+    async def _watch(self, interval: float = 1.0) -> None:
+        """Resync after reconnects and when the stream has gone quiet."""
+        while True:
+            await asyncio.sleep(interval)
+            connect_count = getattr(self.websocket, "connect_count", 0)
+            if connect_count != self._connect_count:
+                self._connect_count = connect_count
+                self.request_resync("reconnect")
+            elif time.perf_counter() - max(self.last_message_at, self._last_resync_at) > self.stale_after:
+                self.request_resync("stale")
+
+    # --------------------------------------------------------------- lifecycle
+
+    async def start(self) -> None:
+        """Subscribe to the WebSocket channels, load the REST snapshot and start watching for gaps."""
+        if self.websocket is not None:
+            # Dropped private messages leave the state behind, so they trigger a resync
+            for channel in PRIVATE_CHANNELS + PUBLIC_CHANNELS:
+                self.websocket.add_callback(channel, self.handle_message,
+                                            on_drop=lambda: self.request_resync("dropped"))
+            if not self.websocket.is_connected:
+                await self.websocket.connect()
+            self._connect_count = getattr(self.websocket, "connect_count", 0)
+            for channel in PRIVATE_CHANNELS:
+                await self.websocket.subscribe(channel, self.symbols[0] if self.symbols else "default")
+            for symbol in self.symbols:
+                for channel in PUBLIC_CHANNELS:
+                    await self.websocket.subscribe(channel, symbol)
+            self._tasks.append(asyncio.create_task(self.websocket.start()))
+
+        await self.resync("start")
+        self._tasks.append(asyncio.create_task(self._watch()))
+        logger.info(f"{GREEN}BitGet state engine started for {', '.join(self.symbols) or 'account'}{RESET}")
+
+    async def stop(self) -> None:
+        """Stop watching, close the WebSocket and the recording."""
+        for task in self._tasks + ([self._resync_task] if self._resync_task else []):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        if self.websocket is not None:
+            await self.websocket.close()
+        if self._recorder:
+            self._recorder.close()
+            self._recorder = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Message counts and reaction latency.
+
+        Returns:
+            Dictionary with counts per channel, gaps, resyncs and the p50/p99
+            reaction latency in milliseconds
+        """
+        latencies = sorted(self.reaction_latencies)
+
+        def percentile(q: float) -> Optional[float]:
+            if not latencies:
+                return None
+            return latencies[min(int(q * len(latencies)), len(latencies) - 1)] * 1000
+
+        return {
+            **self.stats,
+            "open_positions": len(self.positions),
+            "open_orders": len(self.orders),
+            "synced": self.synced,
+            "reactions": len(latencies),
+            "reaction_p50_ms": percentile(0.5),
+            "reaction_p99_ms": percentile(0.99),
+        }
+
+
+def load_recording(path: str) -> List[Tuple[float, Dict[str, Any]]]:
+    """
+    Read messages recorded with ``record_path``.
+
+    Returns:
+        List of (seconds since recording start, message)
+    """
+    messages = []
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                entry = json.loads(line)
+                messages.append((entry["t"], entry["msg"]))
+    return messages
+
+async def replay_messages(engine: BitGetStateEngine,
+                          messages: List[Tuple[float, Dict[str, Any]]],
+                          speed: float = 1.0) -> None:
+    """
+    Feed recorded messages to an engine with their original spacing.
+
+    Args:
+        engine: State engine to feed
+        messages: (offset in seconds, message) pairs, e.g. from ``load_recording``
+        speed: Playback speed factor; 0 replays as fast as possible
+    """
+    start = time.perf_counter()
+    first = messages[0][0] if messages else 0.0
+    for offset, data in messages:
+        if speed > 0:
+            delay = start + (offset - first) / speed - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        await engine.handle_message(data)
+        await asyncio.sleep(0)  # Let woken consumers run before the next message
@@ -28,12 +28,8 @@ import time
 import hmac
 import hashlib
 import json
-import requests
 from typing import Dict, List, Tuple, Optional, Any
 from datetime import datetime
-from requests.exceptions import RequestException
-import random
-from threading import Lock
 import base64
 import os
 
@@ -42,6 +38,15 @@ from ..profiles.aggressive_trader import AggressiveTrader
 from ..profiles.strategic_trader import StrategicTrader
 from ..profiles.newbie_trader import NewbieTrader
 from ..profiles.scalper_trader import ScalperTrader
+from .bitget_http import (
+    HttpResponse,
+    MAX_RETRIES,
+    INITIAL_RETRY_DELAY,
+    MAX_RETRY_DELAY,
+    get_http_client,
+    redact_headers,
+    retry_delay as _get_retry_delay
+)
 
 logger = logging.getLogger(__name__)
 
@@ -54,110 +59,16 @@ CYAN = "\033[96m"
 MAGENTA = "\033[95m"
 RESET = "\033[0m"
 
-# Add rate limit constants
-MAX_RETRIES = 3
-INITIAL_RETRY_DELAY = 1  # seconds
-MAX_RETRY_DELAY = 10  # seconds
-REQUEST_RATE_LIMIT = 0.5  # seconds between requests
+# Shutdown constants
 SHUTDOWN_TIMEOUT = 5  # seconds to wait for shutdown
 
-class RateLimiter:
-    """Rate limiter for API requests."""
-    def __init__(self, min_interval: float):
-        self.min_interval = min_interval
-        self.last_request_time = 0
-        self.lock = Lock()
-    
-    def wait(self):
-        """Wait if necessary to respect rate limits."""
-        with self.lock:
-            current_time = time.time()
-            time_since_last = current_time - self.last_request_time
-            if time_since_last < self.min_interval:
-                time.sleep(self.min_interval - time_since_last)
-            self.last_request_time = time.time()
+def _make_request(method: str, url: str, **kwargs) -> HttpResponse:
+    """Make an HTTP request through the shared pooled client (rate limits and retries included)."""
+    return get_http_client().request_sync(method, url, **kwargs)
 
-# Global rate limiter
-rate_limiter = RateLimiter(REQUEST_RATE_LIMIT)
-
-def _handle_rate_limit(response: requests.Response, retry_count: int) -> bool:
-    """Handle rate limit responses and determine if we should retry."""
-    if response.status_code == 429:  # Rate limit hit
-        return True
-    if response.status_code == 404 and retry_count > 0:  # Potential fake 404
-        try:
-            error_data = response.json()
-            if error_data.get("code") == "40404":  # BitGet's "Request URL NOT FOUND"
-                return True
-        except:
-            pass
-    return False
-
-def _get_retry_delay(retry_count: int) -> float:
-    """Calculate exponential backoff delay with jitter."""
-    delay = min(INITIAL_RETRY_DELAY * (2 ** retry_count), MAX_RETRY_DELAY)
-    jitter = random.uniform(0, 0.1 * delay)
-    return delay + jitter
-
-def _make_request(method: str, url: str, **kwargs) -> requests.Response:
-    """Make an HTTP request with rate limit handling and retries."""
-    retry_count = 0
-    last_error = None
-    response = None
-    
-    while retry_count < MAX_RETRIES:
-        try:
-            # Apply rate limiting
-            rate_limiter.wait()
-            
-            # Log request details
-            logger.info(f"{CYAN}=== Request Details ==={RESET}")
-            logger.info(f"Method: {method}")
-            logger.info(f"URL: {url}")
-            logger.info(f"Headers: {json.dumps(kwargs.get('headers', {}), indent=2)}")
-            logger.info(f"Body: {json.dumps(kwargs.get('json', {}), indent=2)}")
-            
-            response = requests.request(method, url, **kwargs)
-            
-            # Log response details
-            logger.info(f"{CYAN}=== Response Details ==={RESET}")
-            logger.info(f"Status Code: {response.status_code}")
-            logger.info(f"Response Headers: {dict(response.headers)}")
-            try:
-                logger.info(f"Response Body: {json.dumps(response.json(), indent=2)}")
-            except:
-                logger.info(f"Response Body: {response.text}")
-            
-            if _handle_rate_limit(response, retry_count):
-                delay = _get_retry_delay(retry_count)
-                logger.warning(f"{YELLOW}Rate limit hit or potential fake 404. Retrying in {delay:.2f} seconds... (Attempt {retry_count + 1}/{MAX_RETRIES}){RESET}")
-                time.sleep(delay)
-                retry_count += 1
-                continue
-                
-            response.raise_for_status()
-            return response
-            
-        except RequestException as e:
-            last_error = e
-            delay = _get_retry_delay(retry_count)
-            logger.warning(f"{YELLOW}Request failed. Retrying in {delay:.2f} seconds... (Attempt {retry_count + 1}/{MAX_RETRIES}){RESET}")
-            logger.error(f"{RED}Error details: {str(e)}{RESET}")
-            if hasattr(e, 'response') and e.response is not None:
-                logger.error(f"{RED}Response status: {e.response.status_code}{RESET}")
-                logger.error(f"{RED}Response headers: {dict(e.response.headers)}{RESET}")
-                try:
-                    logger.error(f"{RED}Response body: {json.dumps(e.response.json(), indent=2)}{RESET}")
-                except:
-                    logger.error(f"{RED}Response body: {e.response.text}{RESET}")
-            time.sleep(delay)
-            retry_count += 1
-    
-    if last_error:
-        raise last_error
-    if response is None:
-        raise RequestException("Failed to make request after all retries")
-    return response
+async def _make_request_async(method: str, url: str, **kwargs) -> HttpResponse:
+    """Asynchronous ``_make_request`` for callers running on an event loop."""
+    return await get_http_client().request(method, url, **kwargs)
 
 class BitGetTrader:
     """BitGet exchange integration for our trader profiles."""
@@ -522,13 +433,14 @@ class BitGetTrader:
         
         headers = self._get_auth_headers(timestamp, method, endpoint, params)
         
-        logger.info(f"{CYAN}=== Account Balance Request Debug ==={RESET}")
-        logger.info(f"API URL: {self.api_url}")
-        logger.info(f"Endpoint: {endpoint}")
-        logger.info(f"Method: {method}")
-        logger.info(f"Query Params: {json.dumps(params, indent=2)}")
-        logger.info(f"Headers: {json.dumps(headers, indent=2)}")
-        logger.info(f"Timestamp: {timestamp}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"{CYAN}=== Account Balance Request Debug ==={RESET}")
+            logger.debug(f"API URL: {self.api_url}")
+            logger.debug(f"Endpoint: {endpoint}")
+            logger.debug(f"Method: {method}")
+            logger.debug(f"Query Params: {json.dumps(params, indent=2)}")
+            logger.debug(f"Headers: {json.dumps(redact_headers(headers), indent=2)}")
+            logger.debug(f"Timestamp: {timestamp}")
         
         try:
             response = _make_request(method, self.api_url + endpoint, headers=headers, params=params)
@@ -633,14 +545,15 @@ class BitGetTrader:
         
         headers = self._get_auth_headers(timestamp, method, endpoint, params)
         
-        logger.info(f"{CYAN}=== Order Request Debug ==={RESET}")
-        logger.info(f"API URL: {self.api_url}")
-        logger.info(f"Endpoint: {endpoint}")
-        logger.info(f"Method: {method}")
-        logger.info(f"Symbol: Original={symbol}, Formatted={formatted_symbol}")
-        logger.info(f"Body: {json.dumps(params, indent=2)}")
-        logger.info(f"Headers: {json.dumps(headers, indent=2)}")
-        logger.info(f"Timestamp: {timestamp}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"{CYAN}=== Order Request Debug ==={RESET}")
+            logger.debug(f"API URL: {self.api_url}")
+            logger.debug(f"Endpoint: {endpoint}")
+            logger.debug(f"Method: {method}")
+            logger.debug(f"Symbol: Original={symbol}, Formatted={formatted_symbol}")
+            logger.debug(f"Body: {json.dumps(params, indent=2)}")
+            logger.debug(f"Headers: {json.dumps(redact_headers(headers), indent=2)}")
+            logger.debug(f"Timestamp: {timestamp}")
         
         try:
             response = _make_request(method, self.api_url + endpoint, headers=headers, json=params)
@@ -713,16 +626,17 @@ class BitGetTrader:
         
         headers = self._get_auth_headers(timestamp, method, endpoint, params)
         
-        logger.info(f"{CYAN}=== Close Position Request Debug ==={RESET}")
-        logger.info(f"API URL: {self.api_url}")
-        logger.info(f"Endpoint: {endpoint}")
-        logger.info(f"Method: {method}")
-        logger.info(f"Symbol: Original={symbol}, Formatted={formatted_symbol}")
-        logger.info(f"Side: {side}")
-        logger.info(f"API Version: {self.api_version}")
-        logger.info(f"Body: {json.dumps(params, indent=2)}")
-        logger.info(f"Headers: {json.dumps(headers, indent=2)}")
-        logger.info(f"Timestamp: {timestamp}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"{CYAN}=== Close Position Request Debug ==={RESET}")
+            logger.debug(f"API URL: {self.api_url}")
+            logger.debug(f"Endpoint: {endpoint}")
+            logger.debug(f"Method: {method}")
+            logger.debug(f"Symbol: Original={symbol}, Formatted={formatted_symbol}")
+            logger.debug(f"Side: {side}")
+            logger.debug(f"API Version: {self.api_version}")
+            logger.debug(f"Body: {json.dumps(params, indent=2)}")
+            logger.debug(f"Headers: {json.dumps(redact_headers(headers), indent=2)}")
+            logger.debug(f"Timestamp: {timestamp}")
         
         try:
             response = _make_request(method, self.api_url + endpoint, headers=headers, json=params)
@@ -1004,15 +918,16 @@ class BitGetTrader:
         
         headers = self._get_auth_headers(timestamp, method, endpoint, params)
         
-        logger.info(f"{CYAN}=== Position Risk Request Debug ==={RESET}")
-        logger.info(f"API URL: {self.api_url}")
-        logger.info(f"Endpoint: {endpoint}")
-        logger.info(f"Method: {method}")
-        logger.info(f"Symbol: Original={symbol}, Formatted={formatted_symbol}")
-        logger.info(f"API Version: {self.api_version}")
-        logger.info(f"Query Params: {json.dumps(params, indent=2)}")
-        logger.info(f"Headers: {json.dumps(headers, indent=2)}")
-        logger.info(f"Timestamp: {timestamp}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"{CYAN}=== Position Risk Request Debug ==={RESET}")
+            logger.debug(f"API URL: {self.api_url}")
+            logger.debug(f"Endpoint: {endpoint}")
+            logger.debug(f"Method: {method}")
+            logger.debug(f"Symbol: Original={symbol}, Formatted={formatted_symbol}")
+            logger.debug(f"API Version: {self.api_version}")
+            logger.debug(f"Query Params: {json.dumps(params, indent=2)}")
+            logger.debug(f"Headers: {json.dumps(redact_headers(headers), indent=2)}")
+            logger.debug(f"Timestamp: {timestamp}")
         
         try:
             response = _make_request(method, self.api_url + endpoint, headers=headers, params=params)
@@ -1051,14 +966,15 @@ class BitGetTrader:
         
         headers = self._get_auth_headers(timestamp, method, endpoint, body)
         
-        logger.info(f"{CYAN}=== Set Leverage Request Debug ==={RESET}")
-        logger.info(f"API URL: {self.api_url}")
-        logger.info(f"Endpoint: {endpoint}")
-        logger.info(f"Method: {method}")
-        logger.info(f"Symbol: Original={symbol}, Formatted={formatted_symbol}")
-        logger.info(f"Body: {json.dumps(body, indent=2)}")
-        logger.info(f"Headers: {json.dumps(headers, indent=2)}")
-        logger.info(f"Timestamp: {timestamp}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"{CYAN}=== Set Leverage Request Debug ==={RESET}")
+            logger.debug(f"API URL: {self.api_url}")
+            logger.debug(f"Endpoint: {endpoint}")
+            logger.debug(f"Method: {method}")
+            logger.debug(f"Symbol: Original={symbol}, Formatted={formatted_symbol}")
+            logger.debug(f"Body: {json.dumps(body, indent=2)}")
+            logger.debug(f"Headers: {json.dumps(redact_headers(headers), indent=2)}")
+            logger.debug(f"Timestamp: {timestamp}")
         
         try:
             response = _make_request(method, self.api_url + endpoint, headers=headers, json=body)
@@ -1096,14 +1012,15 @@ class BitGetTrader:
         
         headers = self._get_auth_headers(timestamp, method, endpoint, body)
         
-        logger.info(f"{CYAN}=== Set Margin Mode Request Debug ==={RESET}")
-        logger.info(f"API URL: {self.api_url}")
-        logger.info(f"Endpoint: {endpoint}")
-        logger.info(f"Method: {method}")
-        logger.info(f"Symbol: Original={symbol}, Formatted={formatted_symbol}")
-        logger.info(f"Body: {json.dumps(body, indent=2)}")
-        logger.info(f"Headers: {json.dumps(headers, indent=2)}")
-        logger.info(f"Timestamp: {timestamp}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"{CYAN}=== Set Margin Mode Request Debug ==={RESET}")
+            logger.debug(f"API URL: {self.api_url}")
+            logger.debug(f"Endpoint: {endpoint}")
+            logger.debug(f"Method: {method}")
+            logger.debug(f"Symbol: Original={symbol}, Formatted={formatted_symbol}")
+            logger.debug(f"Body: {json.dumps(body, indent=2)}")
+            logger.debug(f"Headers: {json.dumps(redact_headers(headers), indent=2)}")
+            logger.debug(f"Timestamp: {timestamp}")
         
         try:
             response = _make_request(method, self.api_url + endpoint, headers=headers, json=body)
@@ -1254,13 +1171,14 @@ class BitGetTrader:
             
         headers = self._get_auth_headers(timestamp, method, endpoint, params)
         
-        logger.info(f"{CYAN}=== Orderbook Request Debug ==={RESET}")
-        logger.info(f"API URL: {self.api_url}")
-        logger.info(f"Endpoint: {endpoint}")
-        logger.info(f"Method: {method}")
-        logger.info(f"Symbol: Original={symbol}, Formatted={formatted_symbol}")
-        logger.info(f"Query Params: {params}")
-        logger.info(f"Headers: {headers}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"{CYAN}=== Orderbook Request Debug ==={RESET}")
+            logger.debug(f"API URL: {self.api_url}")
+            logger.debug(f"Endpoint: {endpoint}")
+            logger.debug(f"Method: {method}")
+            logger.debug(f"Symbol: Original={symbol}, Formatted={formatted_symbol}")
+            logger.debug(f"Query Params: {params}")
+            logger.debug(f"Headers: {redact_headers(headers)}")
         
         try:
             response = _make_request(method, self.api_url + endpoint, headers=headers, params=params)
@@ -1302,13 +1220,14 @@ class BitGetTrader:
             
         headers = self._get_auth_headers(timestamp, method, endpoint, params)
         
-        logger.info(f"{CYAN}=== Trades Request Debug ==={RESET}")
-        logger.info(f"API URL: {self.api_url}")
-        logger.info(f"Endpoint: {endpoint}")
-        logger.info(f"Method: {method}")
-        logger.info(f"Symbol: Original={symbol}, Formatted={formatted_symbol}")
-        logger.info(f"Query Params: {params}")
-        logger.info(f"Headers: {headers}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"{CYAN}=== Trades Request Debug ==={RESET}")
+            logger.debug(f"API URL: {self.api_url}")
+            logger.debug(f"Endpoint: {endpoint}")
+            logger.debug(f"Method: {method}")
+            logger.debug(f"Symbol: Original={symbol}, Formatted={formatted_symbol}")
+            logger.debug(f"Query Params: {params}")
+            logger.debug(f"Headers: {redact_headers(headers)}")
         
         try:
             response = _make_request(method, self.api_url + endpoint, headers=headers, params=params)
@@ -1378,17 +1297,19 @@ class BitGetTrader:
         }
         
         # For proper debugging, log exactly what we're using
-        logger.info(f"{CYAN}=== Symbol Verification Request Debug ==={RESET}")
-        logger.info(f"API URL: {self.api_url}")
-        logger.info(f"Endpoint: {endpoint}")
-        logger.info(f"Method: {method}")
-        logger.info(f"Timestamp: {timestamp}")
-        logger.info(f"API Version: {self.api_version}")
-        logger.info(f"Query Params: {params}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"{CYAN}=== Symbol Verification Request Debug ==={RESET}")
+            logger.debug(f"API URL: {self.api_url}")
+            logger.debug(f"Endpoint: {endpoint}")
+            logger.debug(f"Method: {method}")
+            logger.debug(f"Timestamp: {timestamp}")
+            logger.debug(f"API Version: {self.api_version}")
+            logger.debug(f"Query Params: {params}")
         
         # Generate signed headers
         headers = self._get_auth_headers(timestamp, method, endpoint, params)
-        logger.info(f"Headers: {headers}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Headers: {redact_headers(headers)}")
         
         try:
             response = _make_request(method, self.api_url + endpoint, headers=headers, params=params)
@@ -1510,14 +1431,15 @@ class BitGetTrader:
         
         headers = self._get_auth_headers(timestamp, method, endpoint, params)
         
-        logger.info(f"{CYAN}=== All Positions Request Debug ==={RESET}")
-        logger.info(f"API URL: {self.api_url}")
-        logger.info(f"Endpoint: {endpoint}")
-        logger.info(f"Method: {method}")
-        logger.info(f"API Version: {self.api_version}")
-        logger.info(f"Query Params: {json.dumps(params, indent=2)}")
-        logger.info(f"Headers: {json.dumps(headers, indent=2)}")
-        logger.info(f"Timestamp: {timestamp}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"{CYAN}=== All Positions Request Debug ==={RESET}")
+            logger.debug(f"API URL: {self.api_url}")
+            logger.debug(f"Endpoint: {endpoint}")
+            logger.debug(f"Method: {method}")
+            logger.debug(f"API Version: {self.api_version}")
+            logger.debug(f"Query Params: {json.dumps(params, indent=2)}")
+            logger.debug(f"Headers: {json.dumps(redact_headers(headers), indent=2)}")
+            logger.debug(f"Timestamp: {timestamp}")
         
         try:
             response = _make_request(method, self.api_url + endpoint, headers=headers, params=params)
@@ -31,12 +31,23 @@ import time
 import hmac
 import hashlib
 import base64
-from typing import Dict, List, Optional, Any, Callable, Set
+import inspect
+from collections import deque
+from typing import Dict, List, Optional, Any, Callable, Set, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+# orjson decodes several times faster; the standard library is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    json_loads = orjson.loads
+except ImportError:
+    ORJSON_AVAILABLE = False
+    json_loads = json.loads
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -44,6 +55,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Private channels are subscribed account-wide rather than per symbol
+PRIVATE_CHANNELS = ("orders", "positions", "fill", "account")
+
+# Channels where only the latest update matters, so a slow subscriber may skip stale ones
+CONFLATABLE_CHANNELS = frozenset({"ticker", "books", "books1", "books5", "books15", "mark-price"})
+
+DEFAULT_QUEUE_SIZE = 1000
+
 # Terminal colors for output
 GREEN = "\033[92m"
 RED = "\033[91m"
@@ -65,6 +84,101 @@ class WebSocketConfig:
     reconnect_interval: int = 5
     max_reconnect_attempts: int = 5
 
+class Subscriber:
+    """
+    One callback with its own bounded queue and task.
+
+    A slow callback only delays its own messages. Updates of conflatable
+    channels replace a still queued update of the same channel and instId;
+    other messages are dropped oldest first once ``maxsize`` are queued and
+    reported to ``on_drop``.
+    """
+
+    def __init__(self,
+                 callback: Callable,
+                 maxsize: int = DEFAULT_QUEUE_SIZE,
+                 conflate: bool = True,
+                 on_drop: Optional[Callable[[], Any]] = None):
+        """
+        Initialize the subscriber.
+
+        Args:
+            callback: Function or coroutine function receiving each message
+            maxsize: Maximum number of queued messages
+            conflate: Whether to keep only the latest queued ticker/book update per instId
+            on_drop: Called when a message had to be dropped, e.g. to trigger a resync
+        """
+        self.callback = callback
+        self.maxsize = maxsize
+        self.conflate = conflate
+        self.on_drop = on_drop
+        self._queue: deque = deque()  # Messages, or (channel, instId) keys of conflated ones
+        self._latest: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {"delivered": 0, "conflated": 0, "dropped": 0, "errors": 0, "max_depth": 0}
+
+    def put(self, channel: str, inst_id: str, data: Dict[str, Any]) -> None:
+        """Queue a message without waiting for the callback."""
+        if self.conflate and channel in CONFLATABLE_CHANNELS:
+            key = (channel, inst_id)
+            if key in self._latest:
+                self._latest[key] = data
+                self.stats["conflated"] += 1
+                return
+            self._latest[key] = data
+            item = key
+        else:
+            item = data
+
+        if len(self._queue) >= self.maxsize:
+            dropped = self._queue.popleft()
+            if isinstance(dropped, tuple):
+                self._latest.pop(dropped, None)
+            self.stats["dropped"] += 1
+            if self.on_drop:
+                try:
+                    self.on_drop()
+                except Exception as e:
+                    logger.error(f"{RED}Error in drop handler: {str(e)}{RESET}")
+        self._queue.append(item)
+        self.stats["max_depth"] = max(self.stats["max_depth"], len(self._queue))
+
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            if not self._queue:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            item = self._queue.popleft()
+            data = self._latest.pop(item) if isinstance(item, tuple) else item
+            try:
+                result = self.callback(data)
+                if inspect.isawaitable(result):
+                    await result
+                self.stats["delivered"] += 1
+            except Exception as e:
+                self.stats["errors"] += 1
+                channel = data.get("arg", {}).get("channel")
+                logger.error(f"{RED}Error in callback for {channel}: {str(e)}{RESET}")
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    async def close(self) -> None:
+        """Stop delivering; queued messages are discarded."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self._queue.clear()
+        self._latest.clear()
+
 class BitGetWebSocket:
     """Handles WebSocket connections and data streaming for BitGet."""
     
@@ -80,15 +194,25 @@ class BitGetWebSocket:
         self.ws: Optional[websockets.WebSocketClientProtocol] = None
         self.is_connected = False
         self.reconnect_attempts = 0
+        self.connect_count = 0  # Successful connections, so consumers can resync after a reconnect
         self.subscriptions: Set[str] = set()
         self.callbacks: Dict[str, List[Callable]] = {
             'order': [],
             'position': [],
             'ticker': [],
             'kline': [],
-            'trade': []
+            'trade': [],
+            'orders': [],
+            'positions': [],
+            'fill': []
         }
         
+        # One subscriber per callback, and the subscribers of each (channel, instId)
+        self.subscribers: Dict[Callable, Subscriber] = {}
+        self._filters: Dict[Callable, Set[Tuple[str, Optional[str]]]] = {}
+        self._routes: Dict[Tuple[str, str], Tuple[Subscriber, ...]] = {}
+        self.stats = {"messages": 0, "routed": 0, "unrouted": 0, "decode_errors": 0}
+        
         # Log initialization
         logger.info(f"{GREEN}Initialized BitGet WebSocket Client{RESET}")
         logger.info(f"{CYAN}Using {'TESTNET' if config.use_testnet else 'MAINNET'} environment{RESET}")
@@ -134,6 +258,7 @@ class BitGetWebSocket:
             
             self.is_connected = True
             self.reconnect_attempts = 0
+            self.connect_count += 1
             logger.info(f"{GREEN}WebSocket connection established{RESET}")
             
             # Resubscribe to previous channels
@@ -175,7 +300,7 @@ class BitGetWebSocket:
                 "args": [{
                     "instType": "UMCBL",
                     "channel": channel,
-                    "instId": f"{symbol}_UMCBL"
+                    "instId": "default" if channel in PRIVATE_CHANNELS else f"{symbol}_UMCBL"
                 }]
             }
             
@@ -213,7 +338,7 @@ class BitGetWebSocket:
                 "args": [{
                     "instType": "UMCBL",
                     "channel": channel,
-                    "instId": f"{symbol}_UMCBL"
+                    "instId": "default" if channel in PRIVATE_CHANNELS else f"{symbol}_UMCBL"
                 }]
             }
             
@@ -224,27 +349,79 @@ class BitGetWebSocket:
         except Exception as e:
             logger.error(f"{RED}Failed to unsubscribe from {channel}: {str(e)}{RESET}")
     
-    def add_callback(self, event_type: str, callback: Callable):
+    def add_callback(self,
+                     event_type: str,
+                     callback: Callable,
+                     inst_id: Optional[str] = None,
+                     maxsize: int = DEFAULT_QUEUE_SIZE,
+                     conflate: bool = True,
+                     on_drop: Optional[Callable[[], Any]] = None):
         """
         Add a callback function for a specific event type.
         
+        The same callback added for several channels shares one queue, so it
+        sees their messages in arrival order.
+        
         Args:
             event_type: Type of event (order, position, ticker, etc.)
             callback: Callback function to handle the event
+            inst_id: Only deliver messages of this instId (e.g. "BTCUSDT_UMCBL")
+            maxsize: Maximum number of messages queued for the callback
+            conflate: Whether a slow callback may skip stale ticker/book updates
+            on_drop: Called when a message had to be dropped from the full queue
         """
-        if event_type in self.callbacks:
-            self.callbacks[event_type].append(callback)
-            logger.info(f"{GREEN}Added callback for {event_type} events{RESET}")
+        self.callbacks.setdefault(event_type, []).append(callback)
+        if callback not in self.subscribers:
+            self.subscribers[callback] = Subscriber(callback, maxsize=maxsize, conflate=conflate, on_drop=on_drop)
+        self._filters.setdefault(callback, set()).add((event_type, inst_id))
+        self._routes.clear()  # Rebuilt on demand
+        logger.info(f"{GREEN}Added callback for {event_type} events{RESET}")
     
-    async def handle_message(self, message: str):
+    def _route(self, channel: str, inst_id: str) -> Tuple[Subscriber, ...]:
+        """Subscribers of a (channel, instId), computed once per pair."""
+        route = tuple(
+            subscriber for callback, subscriber in self.subscribers.items()
+            if (channel, None) in self._filters[callback] or (channel, inst_id) in self._filters[callback]
+        )
+        self._routes[(channel, inst_id)] = route
+        return route
+    
+    async def handle_message(self, message: Any):
         """
         Handle incoming WebSocket messages.
         
+        Data pushes are decoded and queued to their subscribers without
+        waiting for any callback.
+        
         Args:
             message: Raw WebSocket message
         """
+        if message == "pong":
+            return
+        self.stats["messages"] += 1
         try:
-            data = json.loads(message)
+            data = json_loads(message)
+        except ValueError:
+            self.stats["decode_errors"] += 1
+            logger.error(f"{RED}Failed to parse WebSocket message: {message}{RESET}")
+            return
+        
+        try:
+            # Fast path: data push
+            arg = data.get("arg")
+            if arg is not None and "data" in data:
+                channel = arg.get("channel")
+                inst_id = arg.get("instId", "")
+                route = self._routes.get((channel, inst_id))
+                if route is None:
+                    route = self._route(channel, inst_id)
+                if not route:
+                    self.stats["unrouted"] += 1
+                    return
+                for subscriber in route:
+                    subscriber.put(channel, inst_id, data)
+                self.stats["routed"] += 1
+                return
             
             # Handle ping messages
             if data.get("op") == "pong":
@@ -256,25 +433,29 @@ class BitGetWebSocket:
                 return
                 
             # Handle error messages
-            if data.get("code") != "0":
+            if data.get("event") == "error" or ("code" in data and str(data["code"]) not in ("0", "00000")):
                 logger.error(f"{RED}WebSocket error: {data.get('msg')}{RESET}")
-                return
-            
-            # Process data based on channel
-            channel = data.get("arg", {}).get("channel")
-            if channel in self.callbacks:
-                # Notify all callbacks for this channel
-                for callback in self.callbacks[channel]:
-                    try:
-                        await callback(data)
-                    except Exception as e:
-                        logger.error(f"{RED}Error in callback for {channel}: {str(e)}{RESET}")
             
-        except json.JSONDecodeError:
-            logger.error(f"{RED}Failed to parse WebSocket message: {message}{RESET}")
         except Exception as e:
             logger.error(f"{RED}Error handling WebSocket message: {str(e)}{RESET}")
     
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Message and queue statistics.
+        
+        Returns:
+            Dictionary with message counts, the decoder used and per-callback
+            delivered, conflated and dropped counts and queue depths
+        """
+        return {
+            **self.stats,
+            "decoder": "orjson" if ORJSON_AVAILABLE else "json",
+            "subscribers": {
+                getattr(callback, "__qualname__", type(callback).__name__): {**subscriber.stats, "depth": subscriber.depth}
+                for callback, subscriber in self.subscribers.items()
+            }
+        }
+    
     async def start(self):
         """Start the WebSocket client and begin processing messages."""
         while True:
@@ -298,6 +479,8 @@ class BitGetWebSocket:
     
     async def close(self):
         """Close the WebSocket connection."""
+        for subscriber in self.subscribers.values():
+            await subscriber.close()
         if self.ws:
             await self.ws.close()
             self.is_connected = False
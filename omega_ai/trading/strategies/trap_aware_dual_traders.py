@@ -34,7 +34,7 @@ import os
 import signal
 import sys
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import traceback
 import redis
 
@@ -52,6 +52,8 @@ from omega_ai.trading.exchanges.bitget_live_traders import BitGetLiveTraders
 from omega_ai.trading.exchanges.bitget_trader import BitGetTrader
 from omega_ai.trading.strategies.enhanced_exit_strategy import EnhancedExitStrategy
 from omega_ai.trading.exchanges.bitget_ccxt import BitGetCCXT
+from omega_ai.trading.exchanges.bitget_state_engine import BitGetStateEngine
+from omega_ai.trading.exchanges.bitget_websocket import BitGetWebSocket, WebSocketConfig
 
 # Configure logging
 logging.basicConfig(
@@ -85,6 +87,8 @@ class TrapAwareDualTraders(BitGetDualPositionTraders):
                  enable_trap_protection: bool = True,
                  enable_elite_exits: bool = True,
                  elite_exit_confidence: float = 0.7,
+                 use_websocket_state: bool = True,
+                 sub_account_credentials: Optional[Dict[str, Dict[str, str]]] = None,
                  **kwargs):
         """
         Initialize the trap-aware dual position traders system.
@@ -95,6 +99,10 @@ class TrapAwareDualTraders(BitGetDualPositionTraders):
             enable_trap_protection: Whether to enable trap protection features
             enable_elite_exits: Whether to enable elite exit strategy
             elite_exit_confidence: Minimum confidence required for elite exit signals
+            use_websocket_state: Whether to follow positions, orders and price over WebSocket instead of polling
+            sub_account_credentials: API credentials per sub-account name ({"api_key", "secret_key",
+                "passphrase"}) for the WebSocket state; read from BITGET_[TESTNET_]SUB_<NAME>_API_KEY,
+                _SECRET_KEY and _PASSPHRASE when not given
             **kwargs: Arguments to pass to BitGetDualPositionTraders
         """
         super().__init__(**kwargs)
@@ -108,6 +116,9 @@ class TrapAwareDualTraders(BitGetDualPositionTraders):
         self.last_trap_alert_time = datetime.now() - timedelta(hours=1)
         self.trap_alert_cooldown = 300  # seconds
         self.last_detected_trap = None
+        self.use_websocket_state = use_websocket_state
+        self.sub_account_credentials = sub_account_credentials or {}
+        self.state_engines: Dict[str, BitGetStateEngine] = {}
         
         # Initialize enhanced exit strategy
         self.exit_strategy = EnhancedExitStrategy(
@@ -135,12 +146,16 @@ class TrapAwareDualTraders(BitGetDualPositionTraders):
         logger.info(f"{CYAN}  Trap Protection Enabled: {enable_trap_protection}{RESET}")
         logger.info(f"{CYAN}  Elite Exit Strategy Enabled: {enable_elite_exits}{RESET}")
         logger.info(f"{CYAN}  Elite Exit Confidence: {elite_exit_confidence}{RESET}")
+        logger.info(f"{CYAN}  WebSocket State: {use_websocket_state}{RESET}")
     
     async def initialize(self) -> None:
         """Initialize the trap-aware dual position traders system."""
         # First initialize the parent class
         await super().initialize()
         
+        if self.use_websocket_state and not self.state_engines:
+            await self._start_state_engines()
+        
         # Now initialize the elite exit strategy if enabled
         if self.enable_elite_exits and self.long_trader and self.long_trader.traders and "strategic" in self.long_trader.traders:
             # Get the exchange from the long trader (both traders use the same exchange)
@@ -183,6 +198,74 @@ class TrapAwareDualTraders(BitGetDualPositionTraders):
         elif self.enable_elite_exits:
             logger.error(f"{RED}Could not initialize elite exit strategy: long trader not properly initialized{RESET}")
     
+    def _get_sub_account_credentials(self, sub_account: str) -> Optional[Dict[str, str]]:
+        """
+        API credentials of the account a trader trades on.
+        
+        The WebSocket private channels push the data of the account that logs
+        in, so a sub-account needs its own API key rather than the master's.
+        
+        Args:
+            sub_account: Sub-account name, or "" for the main account
+            
+        Returns:
+            Dictionary with api_key, secret_key and passphrase, or None if missing
+        """
+        if not sub_account:
+            return {"api_key": self.api_key, "secret_key": self.secret_key, "passphrase": self.passphrase}
+        
+        credentials = self.sub_account_credentials.get(sub_account)
+        if credentials is None:
+            prefix = "BITGET_TESTNET_SUB_" if self.use_testnet else "BITGET_SUB_"
+            name = "".join(c if c.isalnum() else "_" for c in sub_account).upper()
+            credentials = {
+                "api_key": os.environ.get(f"{prefix}{name}_API_KEY", ""),
+                "secret_key": os.environ.get(f"{prefix}{name}_SECRET_KEY", ""),
+                "passphrase": os.environ.get(f"{prefix}{name}_PASSPHRASE", "")
+            }
+        if not all(credentials.get(key) for key in ("api_key", "secret_key", "passphrase")):
+            return None
+        return credentials
+    
+    async def _start_state_engines(self) -> None:
+        """Start a WebSocket state engine per trader, falling back to polling on failure."""
+        for direction, trader, sub_account in (("long", self.long_trader, self.long_sub_account),
+                                               ("short", self.short_trader, self.short_sub_account)):
+            if not trader or "strategic" not in trader.traders:
+                continue
+            credentials = self._get_sub_account_credentials(sub_account)
+            if credentials is None:
+                logger.warning(f"{YELLOW}No API credentials for sub-account {sub_account}, "
+                               f"polling {direction} positions over REST{RESET}")
+                continue
+            try:
+                websocket = BitGetWebSocket(WebSocketConfig(
+                    api_key=credentials["api_key"],
+                    secret_key=credentials["secret_key"],
+                    passphrase=credentials["passphrase"],
+                    use_testnet=self.use_testnet
+                ))
+                engine = BitGetStateEngine(
+                    websocket=websocket,
+                    rest=trader.traders["strategic"],
+                    symbols=[self.symbol]
+                )
+                await engine.start()
+                self.state_engines[direction] = engine
+            except Exception as e:
+                logger.error(f"{RED}Could not start {direction} state engine, polling instead: {e}{RESET}")
+    
+    async def stop_trading(self) -> None:
+        """Stop the state engines and the traders."""
+        self.running = False
+        for direction, engine in self.state_engines.items():
+            try:
+                await engine.stop()
+            except Exception as e:
+                logger.error(f"{RED}Error stopping {direction} state engine: {e}{RESET}")
+        self.state_engines.clear()
+        await super().stop_trading()
+    
     async def check_for_traps(self) -> dict:
         """
         Check for market maker traps using the trap probability meter data.
@@ -400,98 +483,48 @@ class TrapAwareDualTraders(BitGetDualPositionTraders):
 
     async def _run_long_trader(self) -> None:
         """Run the long position trader with trap awareness."""
-        if not self.long_trader:
-            logger.error(f"{RED}Long trader not initialized{RESET}")
-            return
-            
-        # Ensure the trader is initialized
-        await self.long_trader.initialize()
-        
-        while self.running:
-            try:
-                # Check for traps
-                trap_info = await self.check_for_traps()
-                
-                # Adjust trading based on trap detection
-                if trap_info.get('trap_detected'):
-                    await self._adjust_trading_based_on_traps(trap_info)
-                
-                # Get current positions
-                positions = await self.long_trader.traders["strategic"].get_positions()
-                
-                if positions:
-                    # Get current price
-                    try:
-                        current_price = await self.long_trader.get_current_price(self.symbol)
-                    except Exception as e:
-                        logger.error(f"{RED}Error getting current price: {str(e)}{RESET}")
-                        current_price = None
-                    
-                    if current_price:
-                        # Check each position for exit conditions
-                        for position in positions:
-                            position_id = position.get('id', '')
-                            
-                            # Update trailing stops
-                            new_stop = await self.exit_strategy.update_trailing_stop(
-                                position_id,
-                                current_price
-                            )
-                            
-                            if new_stop and new_stop != position.get('stopLossPrice'):
-                                await self._update_stop_loss(position, new_stop)
-                            
-                            # Check exit conditions
-                            should_exit, exit_info = await self.exit_strategy.check_exit_conditions(
-                                position_id,
-                                current_price,
-                                trap_info
-                            )
-                            
-                            if should_exit and exit_info:
-                                # Execute the exit
-                                await self._execute_exit(position, exit_info)
-                
-                # Run the trader
-                await self.long_trader.start_trading()
-                
-                # Sleep briefly
-                await asyncio.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"{RED}Error in long trader: {str(e)}{RESET}")
-                await asyncio.sleep(5)
+        await self._run_directional_trader("long")
 
     async def _run_short_trader(self) -> None:
         """Run the short position trader with trap awareness."""
-        if not self.short_trader:
-            logger.error(f"{RED}Short trader not initialized{RESET}")
+        await self._run_directional_trader("short")
+
+    async def _run_directional_trader(self, direction: str) -> None:
+        """
+        Run one directional trader and manage its positions' exits.
+
+        With a state engine the exit checks run whenever a fill, position or
+        price update is pushed; otherwise positions and price are polled.
+
+        Args:
+            direction: "long" or "short"
+        """
+        trader = self.long_trader if direction == "long" else self.short_trader
+        if not trader:
+            logger.error(f"{RED}{direction.capitalize()} trader not initialized{RESET}")
             return
             
         # Ensure the trader is initialized
-        await self.short_trader.initialize()
+        await trader.initialize()
         
-        while self.running:
-            try:
-                # Check for traps
-                trap_info = await self.check_for_traps()
-                
-                # Adjust trading based on trap detection
-                if trap_info.get('trap_detected'):
-                    await self._adjust_trading_based_on_traps(trap_info)
-                
-                # Get current positions
-                positions = await self.short_trader.traders["strategic"].get_positions()
-                
-                if positions:
-                    # Get current price
-                    try:
-                        current_price = await self.short_trader.get_current_price(self.symbol)
-                    except Exception as e:
-                        logger.error(f"{RED}Error getting current price: {str(e)}{RESET}")
-                        current_price = None
+        # The trader's own loop never returns, so it runs beside the exit management
+        trader_task = asyncio.create_task(trader.start_trading())
+        state = self.state_engines.get(direction)
+        updated = False
+        
+        try:
+            while self.running:
+                try:
+                    # Check for traps
+                    trap_info = await self.check_for_traps()
+                    
+                    # Adjust trading based on trap detection
+                    if trap_info.get('trap_detected'):
+                        await self._adjust_trading_based_on_traps(trap_info)
+                    
+                    positions, current_price = await self._get_position_state(trader, direction)
                     
-                    if current_price:
+                    if positions and current_price:
                         # Check each position for exit conditions
                         for position in positions:
                             position_id = position.get('id', '')
@@ -515,16 +548,46 @@ class TrapAwareDualTraders(BitGetDualPositionTraders):
                             if should_exit and exit_info:
                                 # Execute the exit
                                 await self._execute_exit(position, exit_info)
-                
-                # Run the trader
-                await self.short_trader.start_trading()
-                
-                # Sleep briefly
-                await asyncio.sleep(1)
-                
+                    
+                    if state is not None:
+                        if updated:
+                            state.mark_reaction()
+                        # Wake up on the next pushed change instead of polling
+                        updated = await state.wait_for_update(timeout=1)
+                    else:
+                        await asyncio.sleep(1)
+                    
+                except Exception as e:
+                    logger.error(f"{RED}Error in {direction} trader: {str(e)}{RESET}")
+                    await asyncio.sleep(5)
+        finally:
+            trader_task.cancel()
+
+    async def _get_position_state(self, trader, direction: str) -> Tuple[List[Dict], Optional[float]]:
+        """
+        Current positions and price of a trader.
+
+        Read from the state engine once it holds a snapshot, over REST otherwise.
+
+        Returns:
+            Tuple of (positions, current price or None)
+        """
+        state = self.state_engines.get(direction)
+        if state is not None and state.synced:
+            positions = state.get_positions(symbol=self.symbol, side=direction)
+            current_price = state.get_price(self.symbol)
+            if not positions or current_price:
+                return positions, current_price
+        else:
+            positions = await trader.traders["strategic"].get_positions()
+            
+        current_price = None
+        if positions:
+            try:
+                current_price = await trader.get_current_price(self.symbol)
             except Exception as e:
-                logger.error(f"{RED}Error in short trader: {str(e)}{RESET}")
-                await asyncio.sleep(5)
+                logger.error(f"{RED}Error getting current price: {str(e)}{RESET}")
+        return positions, current_price
 
     async def _update_stop_loss(self, position: Dict, new_stop: float) -> None:
         """Update stop loss order for a position."""
@@ -913,6 +976,8 @@ def parse_args():
                       help='Enable elite exit strategy (default: False)')
     parser.add_argument('--elite-exit-confidence', type=float, default=0.7,
                       help='Minimum confidence required for elite exit signals (default: 0.7)')
+    parser.add_argument('--no-websocket-state', action='store_true',
+                      help='Poll positions and prices over REST instead of following WebSocket pushes (default: False)')
     
     return parser.parse_args()
 
@@ -971,7 +1036,8 @@ async def main():
             trap_alert_threshold=args.trap_alert_threshold,
             enable_trap_protection=not args.no_trap_protection,
             enable_elite_exits=args.enable_elite_exits,
-            elite_exit_confidence=args.elite_exit_confidence
+            elite_exit_confidence=args.elite_exit_confidence,
+            use_websocket_state=not args.no_websocket_state
         )
         
         print(f"{YELLOW}DEBUG: TrapAwareDualTraders instance created{RESET}")
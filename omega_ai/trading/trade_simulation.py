@@ -18,12 +18,18 @@ Advanced trade simulation for OmegaBTC Trader Profiles
 
 This module provides realistic price movement and position management simulation,
 including partial closures, time-based exits, trailing stops, and market condition exits.
+
+``TradeSimulator.simulate_batch`` runs the same exit rules over many Monte
+Carlo price paths at once: the paths are one ``(n_paths, max_bars + 1)``
+NumPy array and every bar is evaluated for all open paths with array
+operations, so a trader profile can be scored over thousands of scenarios.
 """
 
 import random
 import time
 import numpy as np
-from typing import Dict, List, Tuple, Optional
+from dataclasses import dataclass
+from typing import Dict, List, Tuple, Optional, Sequence, Union
 
 # Terminal colors (copied from trader_profiles.py)
 RESET = "\033[0m"
@@ -45,6 +51,60 @@ MAGENTA_BG = "\033[45m"
 CYAN_BG = "\033[46m"
 WHITE_BG = "\033[47m"
 
+# Exit types recorded per path by TradeSimulator.simulate_batch, indexed by code
+EXIT_TYPES = (
+    "time_based_exit",
+    "take_profit",
+    "stop_loss",
+    "market_condition_exit",
+    "simulation_end",
+)
+_TIME_EXIT, _TAKE_PROFIT, _STOP_LOSS, _CONDITION_EXIT, _SIMULATION_END = range(len(EXIT_TYPES))
+
+# Adverse move over the last 10 bars that triggers a market condition exit
+VELOCITY_THRESHOLD = 0.015
+
+
+@dataclass
+class MonteCarloResult:
+    """Per-path outcomes of a batch trade simulation."""
+    pnl: np.ndarray
+    bars: np.ndarray
+    final_prices: np.ndarray
+    exit_codes: np.ndarray
+    max_drawdown: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.pnl)
+
+    @property
+    def mean_pnl(self) -> float:
+        return float(self.pnl.mean())
+
+    def quantiles(self, qs: Sequence[float] = (0.05, 0.25, 0.5, 0.75, 0.95)) -> Dict[float, float]:
+        """PnL quantiles keyed by quantile level."""
+        return {q: float(v) for q, v in zip(qs, np.quantile(self.pnl, qs))}
+
+    def exit_counts(self) -> Dict[str, int]:
+        """Number of paths that ended with each exit type."""
+        counts = np.bincount(self.exit_codes, minlength=len(EXIT_TYPES))
+        return {name: int(count) for name, count in zip(EXIT_TYPES, counts)}
+
+    def summary(self) -> Dict:
+        """PnL distribution statistics across all paths."""
+        return {
+            "paths": len(self),
+            "mean_pnl": self.mean_pnl,
+            "std_pnl": float(self.pnl.std()),
+            "win_rate": float((self.pnl > 0).mean()),
+            "quantiles": self.quantiles(),
+            "mean_bars": float(self.bars.mean()),
+            "max_drawdown": float(self.max_drawdown.max()),
+            "mean_drawdown": float(self.max_drawdown.mean()),
+            "exits": self.exit_counts()
+        }
+
+
 class TradeSimulator:
     """Advanced trade simulator that models realistic price movements and advanced exit strategies."""
     
@@ -79,26 +139,15 @@ class TradeSimulator:
         Returns:
             Tuple of (total PnL, list of exit details, number of bars, final price)
         """
-        # Aggressive traders' settings
-        trailing_stop_pct = 0.005  # 0.5% trailing stop
-        max_trade_duration = 50    # Max bars to hold a trade
-        quick_reaction = True      # React quickly to market changes
+        settings = self._aggressive_settings(emotional_state)
         
-        # Adjust based on emotional state
-        if emotional_state == "greedy":
-            trailing_stop_pct = 0.003  # Tighter trailing stops when greedy
-            max_trade_duration += 10   # Hold longer when greedy
-        elif emotional_state == "fearful":
-            trailing_stop_pct = 0.007  # Wider trailing stops when fearful
-            max_trade_duration -= 10   # Exit earlier when fearful
+        against_probability = settings.pop("against_probability")
+        against_bias = settings.pop("against_bias")
         
         # Random bias: aggressive trades have ~40% chance of going against direction initially
         initial_bias = 1.0 if direction == "LONG" else -1.0
-        if random.random() < 0.4:
-            initial_bias *= -0.7  # Strong initial move against position
-        
-        # Higher volatility for aggressive trades
-        volatility_multiplier = 1.3
+        if random.random() < against_probability:
+            initial_bias *= against_bias  # Strong initial move against position
         
         return self._simulate_trade(
             direction=direction,
@@ -107,13 +156,35 @@ class TradeSimulator:
             stop_loss=stop_loss,
             take_profits=take_profits,
             leverage=leverage,
-            trailing_stop_pct=trailing_stop_pct,
-            max_trade_duration=max_trade_duration,
-            market_condition_exit=quick_reaction,
             initial_bias=initial_bias,
-            volatility_multiplier=volatility_multiplier
+            **settings
         )
     
+    @staticmethod
+    def _aggressive_settings(emotional_state: str) -> Dict:
+        """Exit settings and initial-bias odds for an aggressive trader."""
+        # Aggressive traders' settings
+        trailing_stop_pct = 0.005  # 0.5% trailing stop
+        max_trade_duration = 50    # Max bars to hold a trade
+        quick_reaction = True      # React quickly to market changes
+        
+        # Adjust based on emotional state
+        if emotional_state == "greedy":
+            trailing_stop_pct = 0.003  # Tighter trailing stops when greedy
+            max_trade_duration += 10   # Hold longer when greedy
+        elif emotional_state == "fearful":
+            trailing_stop_pct = 0.007  # Wider trailing stops when fearful
+            max_trade_duration -= 10   # Exit earlier when fearful
+        
+        return {
+            "trailing_stop_pct": trailing_stop_pct,
+            "max_trade_duration": max_trade_duration,
+            "market_condition_exit": quick_reaction,
+            "volatility_multiplier": 1.3,  # Higher volatility for aggressive trades
+            "against_probability": 0.4,
+            "against_bias": -0.7
+        }
+    
     def simulate_strategic_trade(self, 
                                 direction: str,
                                 entry_price: float,
@@ -128,6 +199,30 @@ class TradeSimulator:
         Returns:
             Tuple of (total PnL, list of exit details, number of bars, final price)
         """
+        settings = self._strategic_settings(emotional_state, patience_score)
+        
+        against_probability = settings.pop("against_probability")
+        against_bias = settings.pop("against_bias")
+        
+        # Random bias: strategic trades have ~25% chance of going against direction initially
+        initial_bias = 1.0 if direction == "LONG" else -1.0
+        if random.random() < against_probability:
+            initial_bias *= against_bias  # Moderate initial move against position
+        
+        return self._simulate_trade(
+            direction=direction,
+            entry_price=entry_price,
+            position_size=position_size,
+            stop_loss=stop_loss,
+            take_profits=take_profits,
+            leverage=leverage,
+            initial_bias=initial_bias,
+            **settings
+        )
+
+    @staticmethod
+    def _strategic_settings(emotional_state: str, patience_score: float) -> Dict:
+        """Exit settings and initial-bias odds for a strategic trader."""
         # Strategic traders' settings
         trailing_stop_pct = 0.01   # 1% trailing stop (wider than aggressive)
         max_trade_duration = 80    # Longer max hold time
@@ -145,27 +240,14 @@ class TradeSimulator:
         trailing_stop_pct = trailing_stop_pct * (1.2 - patience_score * 0.4)  # More patient = tighter trailing stop
         max_trade_duration = int(max_trade_duration * (0.8 + patience_score * 0.4))  # More patient = longer max duration
         
-        # Random bias: strategic trades have ~25% chance of going against direction initially
-        initial_bias = 1.0 if direction == "LONG" else -1.0
-        if random.random() < 0.25:
-            initial_bias *= -0.5  # Moderate initial move against position
-        
-        # Normal volatility for strategic trades
-        volatility_multiplier = 1.0
-        
-        return self._simulate_trade(
-            direction=direction,
-            entry_price=entry_price,
-            position_size=position_size,
-            stop_loss=stop_loss,
-            take_profits=take_profits,
-            leverage=leverage,
-            trailing_stop_pct=trailing_stop_pct,
-            max_trade_duration=max_trade_duration,
-            market_condition_exit=quick_reaction,
-            initial_bias=initial_bias,
-            volatility_multiplier=volatility_multiplier
-        )
+        return {
+            "trailing_stop_pct": trailing_stop_pct,
+            "max_trade_duration": max_trade_duration,
+            "market_condition_exit": quick_reaction,
+            "volatility_multiplier": 1.0,  # Normal volatility for strategic trades
+            "against_probability": 0.25,
+            "against_bias": -0.5
+        }
 
     def _simulate_trade(self, 
                         direction: str,
@@ -178,9 +260,13 @@ class TradeSimulator:
                         max_trade_duration: int,
                         market_condition_exit: bool,
                         initial_bias: float,
-                        volatility_multiplier: float) -> Tuple[float, List[Dict], int, float]:
+                        volatility_multiplier: float,
+                        price_series: Optional[Sequence[float]] = None) -> Tuple[float, List[Dict], int, float]:
         """Core trade simulation with price movement over time.
         
+        Args:
+            price_series: Price path to replay instead of generating a random one
+        
         Returns:
             Tuple of (total PnL, list of exit details, number of bars, final price)
         """
@@ -204,14 +290,17 @@ class TradeSimulator:
         lowest_price = float('inf') if direction == "LONG" else entry_price   # For SHORT
         
         # Generate random price series
-        price_series = self._generate_price_series(
-            entry_price, 
-            stop_loss, 
-            take_profits, 
-            direction,
-            initial_bias,
-            volatility_multiplier
-        )
+        if price_series is None:
+            price_series = self._generate_price_series(
+                entry_price, 
+                stop_loss, 
+                take_profits, 
+                direction,
+                initial_bias,
+                volatility_multiplier
+            )
+        else:
+            price_series = [float(price) for price in price_series]
         
         # Simulate bar by bar
         for bar_idx, price in enumerate(price_series):
@@ -339,7 +428,7 @@ class TradeSimulator:
                 price_velocity = self._calculate_price_velocity(recent_prices)
                 
                 # If price velocity against our position exceeds threshold
-                velocity_threshold = 0.015  # 1.5% adverse move in recent bars
+                velocity_threshold = VELOCITY_THRESHOLD  # 1.5% adverse move in recent bars
                 
                 condition_exit = False
                 if (direction == "LONG" and price_velocity < -velocity_threshold) or \
@@ -396,17 +485,7 @@ class TradeSimulator:
                               initial_bias: float,
                               volatility_multiplier: float) -> List[float]:
         """Generate a realistic price series for trade simulation."""
-        # Determine price movement range
-        tp_prices = [tp["price"] for tp in take_profits]
-        
-        if direction == "LONG":
-            price_low = min(stop_loss, entry_price * 0.95)  # Stop + some buffer
-            price_high = max(tp_prices) * 1.1  # Beyond highest TP
-            target_trend = 1.0  # Positive trend
-        else:  # SHORT
-            price_low = min(tp_prices) * 0.9  # Beyond lowest TP
-            price_high = max(stop_loss, entry_price * 1.05)  # Stop + buffer
-            target_trend = -1.0  # Negative trend
+        price_low, price_high, target_trend = self._price_range(entry_price, stop_loss, take_profits, direction)
         
         # Base volatility with multiplier
         volatility = self.volatility_base * volatility_multiplier
@@ -450,15 +529,298 @@ class TradeSimulator:
         
         return (prices[-1] - prices[0]) / prices[0]
 
+    @staticmethod
+    def _price_range(entry_price: float,
+                     stop_loss: float,
+                     take_profits: List[Dict],
+                     direction: str) -> Tuple[float, float, float]:
+        """Price bounds and trend direction for generated price paths."""
+        # Determine price movement range
+        tp_prices = [tp["price"] for tp in take_profits]
+        
+        if direction == "LONG":
+            price_low = min(stop_loss, entry_price * 0.95)  # Stop + some buffer
+            price_high = max(tp_prices) * 1.1  # Beyond highest TP
+            target_trend = 1.0  # Positive trend
+        else:  # SHORT
+            price_low = min(tp_prices) * 0.9  # Beyond lowest TP
+            price_high = max(stop_loss, entry_price * 1.05)  # Stop + buffer
+            target_trend = -1.0  # Negative trend
+        
+        return price_low, price_high, target_trend
+
+    def generate_price_paths(self,
+                             n_paths: int,
+                             entry_price: float,
+                             stop_loss: float,
+                             take_profits: List[Dict],
+                             direction: str,
+                             initial_bias: Union[float, np.ndarray],
+                             volatility_multiplier: float,
+                             rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """Generate many price paths with the same model as ``_generate_price_series``.
+        
+        Each bar is advanced for all paths at once, applying the same
+        per-bar arithmetic as the scalar generator.
+        
+        Args:
+            n_paths: Number of paths
+            initial_bias: Initial-phase bias, shared or one value per path
+            rng: NumPy random generator (a fresh unseeded one if omitted)
+        
+        Returns:
+            Array of shape (n_paths, max_bars + 1); column 0 is the entry price
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        price_low, price_high, target_trend = self._price_range(entry_price, stop_loss, take_profits, direction)
+        volatility = self.volatility_base * volatility_multiplier
+        initial_phase = int(self.max_bars * 0.2)
+        bias = np.broadcast_to(np.asarray(initial_bias, dtype=np.float64), (n_paths,))
+        
+        uniforms = rng.uniform(-1.0, 1.0, size=(n_paths, initial_phase))
+        normals = rng.standard_normal(size=(n_paths, self.max_bars - initial_phase))
+        
+        paths = np.empty((n_paths, self.max_bars + 1), dtype=np.float64)
+        paths[:, 0] = entry_price
+        
+        # Initial phase - follow initial bias
+        for i in range(initial_phase):
+            last_price = paths[:, i]
+            paths[:, i + 1] = last_price + last_price * volatility * (bias + uniforms[:, i])
+        
+        # Main phase - follow target trend with noise, clipped to the price range
+        for i in range(self.max_bars - initial_phase):
+            last_price = paths[:, initial_phase + i]
+            current_volatility = volatility * (1 + i / (self.max_bars * 2))
+            drift = self.trend_strength * target_trend * current_volatility
+            new_price = last_price + last_price * (drift + normals[:, i] * current_volatility)
+            paths[:, initial_phase + i + 1] = np.maximum(price_low, np.minimum(price_high, new_price))
+        
+        return paths
+
+    def simulate_batch(self,
+                       n_paths: int,
+                       direction: str,
+                       entry_price: float,
+                       position_size: float,
+                       stop_loss: float,
+                       take_profits: List[Dict],
+                       leverage: float,
+                       trailing_stop_pct: float,
+                       max_trade_duration: int,
+                       market_condition_exit: bool,
+                       initial_bias: Union[float, np.ndarray],
+                       volatility_multiplier: float,
+                       seed: Optional[int] = None,
+                       paths: Optional[np.ndarray] = None) -> MonteCarloResult:
+        """Evaluate the ``_simulate_trade`` exit rules over many price paths at once.
+        
+        Every path gets exactly the exits ``_simulate_trade`` produces when
+        given that path as ``price_series``.
+        
+        Args:
+            n_paths: Number of paths to generate (ignored when ``paths`` is given)
+            initial_bias: Initial-phase bias, shared or one value per path
+            seed: Seed for the path generator
+            paths: Pre-generated (n_paths, bars) price paths to evaluate
+        
+        Returns:
+            MonteCarloResult with per-path PnL, exit bar, exit type, final price
+            and mark-to-market max drawdown
+        """
+        if paths is None:
+            paths = self.generate_price_paths(
+                n_paths, entry_price, stop_loss, take_profits, direction,
+                initial_bias, volatility_multiplier, rng=np.random.default_rng(seed)
+            )
+        paths = np.asarray(paths, dtype=np.float64)
+        n_paths, n_bars = paths.shape
+        
+        sign = 1.0 if direction == "LONG" else -1.0
+        position_value = position_size * entry_price * leverage
+        
+        def close_pnl(exit_price, remaining):
+            pct_change = sign * (exit_price - entry_price) / entry_price
+            return position_value * pct_change * (remaining / position_size)
+        
+        active = np.ones(n_paths, dtype=bool)
+        remaining = np.full(n_paths, float(position_size))
+        total_pnl = np.zeros(n_paths)
+        current_stop = np.full(n_paths, float(stop_loss))
+        extreme = np.full(n_paths, float(entry_price))  # Highest (LONG) / lowest (SHORT) price
+        tp_hit = np.zeros((n_paths, len(take_profits)), dtype=bool)
+        
+        exit_bars = np.full(n_paths, n_bars - 1)
+        exit_codes = np.full(n_paths, _SIMULATION_END)
+        final_prices = paths[:, -1].copy()
+        peak_equity = np.zeros(n_paths)
+        max_drawdown = np.zeros(n_paths)
+        
+        def close(mask, bar_idx, price, code, exit_price=None):
+            total_pnl[mask] += close_pnl(price[mask] if exit_price is None else exit_price[mask], remaining[mask])
+            active[mask] = False
+            exit_bars[mask] = bar_idx
+            exit_codes[mask] = code
+            final_prices[mask] = price[mask]
+        
+        for bar_idx in range(n_bars):
+            if not active.any():
+                break
+            price = paths[:, bar_idx]
+            
+            # Mark-to-market equity of open paths for drawdown tracking
+            equity = total_pnl + np.where(active, close_pnl(price, remaining), 0.0)
+            np.maximum(peak_equity, equity, out=peak_equity)
+            np.maximum(max_drawdown, peak_equity - equity, out=max_drawdown)
+            
+            if bar_idx >= max_trade_duration:
+                close(active.copy(), bar_idx, price, _TIME_EXIT)
+                break
+            
+            # Partial take profits, in order
+            for tp_idx, tp in enumerate(take_profits):
+                tp_price = tp["price"]
+                crossed = price >= tp_price if direction == "LONG" else price <= tp_price
+                hit = active & ~tp_hit[:, tp_idx] & crossed
+                if not hit.any():
+                    continue
+                portion = remaining[hit] * tp["percentage"]
+                total_pnl[hit] += close_pnl(tp_price, portion)
+                remaining[hit] -= portion
+                tp_hit[hit, tp_idx] = True
+                
+                done = hit & (remaining <= 0.0001)
+                active[done] = False
+                exit_bars[done] = bar_idx
+                exit_codes[done] = _TAKE_PROFIT
+                final_prices[done] = price[done]
+            
+            # Trailing stop: track the best price and only ever tighten the stop
+            if direction == "LONG":
+                improved = active & (price > extreme)
+                extreme[improved] = price[improved]
+                new_stop = extreme * (1 - trailing_stop_pct)
+                current_stop = np.where(improved & (new_stop > current_stop), new_stop, current_stop)
+                stop_hit = active & (price <= current_stop)
+            else:
+                improved = active & (price < extreme)
+                extreme[improved] = price[improved]
+                new_stop = extreme * (1 + trailing_stop_pct)
+                current_stop = np.where(improved & (new_stop < current_stop), new_stop, current_stop)
+                stop_hit = active & (price >= current_stop)
+            
+            stop_hit &= remaining > 0
+            if stop_hit.any():
+                close(stop_hit, bar_idx, price, _STOP_LOSS, exit_price=current_stop)
+            
+            # Market condition exit on an adverse move over the last 10 bars
+            if market_condition_exit and bar_idx > 10:
+                first = paths[:, bar_idx - 10]
+                velocity = (price - first) / first
+                adverse = velocity < -VELOCITY_THRESHOLD if direction == "LONG" else velocity > VELOCITY_THRESHOLD
+                condition_hit = active & adverse & (remaining > 0)
+                if condition_hit.any():
+                    close(condition_hit, bar_idx, price, _CONDITION_EXIT)
+        
+        # Close whatever is still open at the final price
+        still_open = active & (remaining > 0)
+        if still_open.any():
+            close(still_open, n_bars - 1, paths[:, -1], _SIMULATION_END)
+        
+        # Realized PnL after the last exit
+        np.maximum(peak_equity, total_pnl, out=peak_equity)
+        np.maximum(max_drawdown, peak_equity - total_pnl, out=max_drawdown)
+        
+        return MonteCarloResult(
+            pnl=total_pnl,
+            bars=exit_bars,
+            final_prices=final_prices,
+            exit_codes=exit_codes,
+            max_drawdown=max_drawdown
+        )
+
+    def _profile_batch(self, n_paths: int, direction: str, settings: Dict, seed: Optional[int],
+                       **trade) -> MonteCarloResult:
+        """Draw per-path initial biases for a profile's settings and run the batch."""
+        settings = dict(settings)
+        rng = np.random.default_rng(seed)
+        against = rng.random(n_paths) < settings.pop("against_probability")
+        bias = np.where(against, settings.pop("against_bias"), 1.0) * (1.0 if direction == "LONG" else -1.0)
+        paths = self.generate_price_paths(
+            n_paths, trade["entry_price"], trade["stop_loss"], trade["take_profits"], direction,
+            bias, settings["volatility_multiplier"], rng=rng
+        )
+        return self.simulate_batch(n_paths, direction, initial_bias=bias, paths=paths, **trade, **settings)
+
+    def simulate_aggressive_batch(self,
+                                  n_paths: int,
+                                  direction: str,
+                                  entry_price: float,
+                                  position_size: float,
+                                  stop_loss: float,
+                                  take_profits: List[Dict],
+                                  leverage: float,
+                                  emotional_state: str,
+                                  seed: Optional[int] = None) -> MonteCarloResult:
+        """Monte Carlo version of ``simulate_aggressive_trade`` over ``n_paths`` scenarios."""
+        return self._profile_batch(
+            n_paths, direction, self._aggressive_settings(emotional_state), seed,
+            entry_price=entry_price, position_size=position_size, stop_loss=stop_loss,
+            take_profits=take_profits, leverage=leverage
+        )
+
+    def simulate_strategic_batch(self,
+                                 n_paths: int,
+                                 direction: str,
+                                 entry_price: float,
+                                 position_size: float,
+                                 stop_loss: float,
+                                 take_profits: List[Dict],
+                                 leverage: float,
+                                 emotional_state: str,
+                                 patience_score: float,
+                                 seed: Optional[int] = None) -> MonteCarloResult:
+        """Monte Carlo version of ``simulate_strategic_trade`` over ``n_paths`` scenarios."""
+        return self._profile_batch(
+            n_paths, direction, self._strategic_settings(emotional_state, patience_score), seed,
+            entry_price=entry_price, position_size=position_size, stop_loss=stop_loss,
+            take_profits=take_profits, leverage=leverage
+        )
+
 
 # Now update the simulate_trade_outcome functions in trader_profiles.py to use this new simulator
 
+def _print_monte_carlo_summary(label: str, result: MonteCarloResult) -> None:
+    """Print the PnL distribution of a batch simulation."""
+    summary = result.summary()
+    quantiles = summary["quantiles"]
+    pnl_color = GREEN if summary["mean_pnl"] > 0 else RED
+    print(f"{CYAN}{label} Monte Carlo over {summary['paths']} scenarios "
+          f"(win rate {summary['win_rate'] * 100:.1f}%, avg {summary['mean_bars']:.1f} bars){RESET}")
+    print(f"  P&L p5 ${quantiles[0.05]:.2f} | p50 ${quantiles[0.5]:.2f} | p95 ${quantiles[0.95]:.2f} | "
+          f"max drawdown ${summary['max_drawdown']:.2f}")
+    print(f"{pnl_color}  Expected P&L: ${summary['mean_pnl']:.2f}{RESET}")
+
+
 def simulate_trade_outcome(direction: str, entry_price: float, position_size: float, 
                          stop_loss: float, take_profits: List[Dict], leverage: float,
-                         emotional_state: str) -> float:
-    """Simulate an aggressive trader's position with realistic price movements."""
+                         emotional_state: str, scenarios: int = 1,
+                         seed: Optional[int] = None) -> float:
+    """Simulate an aggressive trader's position with realistic price movements.
+    
+    With ``scenarios`` > 1 the trade is evaluated over that many Monte Carlo
+    price paths and the mean P&L is returned.
+    """
     simulator = TradeSimulator(debug_mode=False)
     
+    if scenarios > 1:
+        result = simulator.simulate_aggressive_batch(
+            scenarios, direction, entry_price, position_size, stop_loss,
+            take_profits, leverage, emotional_state, seed=seed
+        )
+        _print_monte_carlo_summary("Aggressive", result)
+        return result.mean_pnl
+    
     total_pnl, exits, duration, final_price = simulator.simulate_aggressive_trade(
         direction=direction,
         entry_price=entry_price,
@@ -495,10 +857,23 @@ def simulate_trade_outcome(direction: str, entry_price: float, position_size: fl
 
 def simulate_strategic_trade_outcome(direction: str, entry_price: float, position_size: float,
                                    stop_loss: float, take_profits: List[Dict], leverage: float,
-                                   emotional_state: str, patience_score: float) -> float:
-    """Simulate a strategic trader's position with realistic price movements."""
+                                   emotional_state: str, patience_score: float,
+                                   scenarios: int = 1, seed: Optional[int] = None) -> float:
+    """Simulate a strategic trader's position with realistic price movements.
+    
+    With ``scenarios`` > 1 the trade is evaluated over that many Monte Carlo
+    price paths and the mean P&L is returned.
+    """
     simulator = TradeSimulator(debug_mode=False)
     
+    if scenarios > 1:
+        result = simulator.simulate_strategic_batch(
+            scenarios, direction, entry_price, position_size, stop_loss,
+            take_profits, leverage, emotional_state, patience_score, seed=seed
+        )
+        _print_monte_carlo_summary("Strategic", result)
+        return result.mean_pnl
+    
     total_pnl, exits, duration, final_price = simulator.simulate_strategic_trade(
         direction=direction,
         entry_price=entry_price,
@@ -0,0 +1,283 @@
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - Fibonacci Level Index
+====================================
+
+Sorted, in-process index over a ``{label: price}`` map of Fibonacci levels.
+
+A price check is a bisect over the sorted level prices instead of a scan of
+every level, and a whole array of prices (a replay or backtest) is matched in
+one ``numpy.searchsorted`` call.
+
+``FibonacciLevelCache`` keeps the index for the levels stored in Redis under
+``fibonacci_levels`` and rebuilds it only when the stored value changes.
+Writers call ``publish_fibonacci_levels_update`` after storing new levels; a
+cache subscribed to that channel answers from memory until a notification
+arrives or ``max_age`` seconds pass, at which point it re-reads the key and
+compares it with the value the index was built from.
+"""
+
+import json
+import math
+import time
+import logging
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, List, Mapping, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+FIBONACCI_LEVELS_KEY = "fibonacci_levels"
+FIBONACCI_LEVELS_CHANNEL = "fibonacci_levels:updates"
+FIBONACCI_LEVELS_MAX_AGE = 5.0  # Seconds a subscribed cache trusts its index without re-reading Redis
+
+
+class LevelMatch(NamedTuple):
+    """A level found for a price."""
+    label: str
+    price: Any  # The value as stored, not coerced to float
+    distance: float
+    index: int
+
+
+class FibonacciLevelIndex:
+    """Fibonacci levels sorted by price, with their labels."""
+
+    def __init__(self, levels: Mapping[str, Any], parse_strings: bool = False):
+        """
+        Build the index.
+
+        Args:
+            levels: ``{label: price}`` map. Non-numeric and non-finite prices are skipped.
+            parse_strings: Also accept prices stored as numeric strings
+        """
+        entries = []
+        for label, value in levels.items():
+            if isinstance(value, (int, float)):
+                price = float(value)
+            elif parse_strings and isinstance(value, str):
+                try:
+                    price = float(value)
+                except ValueError:
+                    continue
+            else:
+                continue
+            if math.isfinite(price):
+                entries.append((price, len(entries), label, value))
+
+        # The insertion position breaks ties, so equal prices keep their map order
+        entries.sort()
+        self._prices: List[float] = [entry[0] for entry in entries]
+        self.labels: List[str] = [entry[2] for entry in entries]
+        self.values: List[Any] = [entry[3] for entry in entries]
+        self._array: Optional[np.ndarray] = None
+
+    @property
+    def prices(self) -> np.ndarray:
+        """Sorted level prices as a float array (built on first use)."""
+        if self._array is None:
+            self._array = np.asarray(self._prices, dtype=float)
+        return self._array
+
+    def __len__(self) -> int:
+        return len(self._prices)
+
+    def _neighbours(self, price: float) -> Tuple[int, int]:
+        """Indices of the levels just below and just above ``price``."""
+        right = bisect_left(self._prices, price)
+        return right - 1, right
+
+    def _match(self, i: int, distance: float) -> LevelMatch:
+        return LevelMatch(self.labels[i], self.values[i], distance, i)
+
+    def nearest(self, price: float) -> Optional[LevelMatch]:
+        """Level closest to ``price``; ``distance`` is in price units."""
+        if not self._prices:
+            return None
+        left, right = self._neighbours(price)
+        if right == len(self._prices) or (left >= 0 and price - self._prices[left] <= self._prices[right] - price):
+            return self._match(left, price - self._prices[left])
+        return self._match(right, self._prices[right] - price)
+
+    def nearest_relative(self, price: float) -> Optional[LevelMatch]:
+        """
+        Level with the smallest ``|price - level| / level``; ``distance`` is that ratio.
+
+        Only positive levels are considered. The ratio grows monotonically away
+        from ``price`` on either side, so the two bisect neighbours decide it.
+        """
+        start = bisect_right(self._prices, 0.0)
+        if start == len(self._prices):
+            return None
+
+        right = bisect_left(self._prices, price, lo=start)
+        best = None
+        for i in (right - 1, right):
+            if start <= i < len(self._prices):
+                level = self._prices[i]
+                distance = abs(price - level) / level
+                if best is None or distance < best[1]:
+                    best = (i, distance)
+        return self._match(*best)
+
+    def match(self, price: float, tolerance: float, relative: bool = False) -> Optional[LevelMatch]:
+        """Nearest level if it lies within ``tolerance`` of ``price``, else None."""
+        found = self.nearest_relative(price) if relative else self.nearest(price)
+        if found is not None and found.distance <= tolerance:
+            return found
+        return None
+
+    def match_batch(self, prices, tolerance: float, relative: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized ``match`` over an array of prices.
+
+        Returns:
+            ``(indices, distances)``: the index of the nearest level for every
+            price (``-1`` where none lies within ``tolerance``) and its distance
+        """
+        prices = np.asarray(prices, dtype=float)
+        levels = self.prices
+        if relative:
+            levels = levels[levels > 0.0]
+        offset = len(self.prices) - len(levels)
+        if len(levels) == 0:
+            return np.full(prices.shape, -1, dtype=np.intp), np.full(prices.shape, np.inf)
+
+        right = np.searchsorted(levels, prices, side="left")
+        left = np.clip(right - 1, 0, len(levels) - 1)
+        right = np.clip(right, 0, len(levels) - 1)
+        left_distance = np.abs(prices - levels[left])
+        right_distance = np.abs(prices - levels[right])
+        if relative:
+            left_distance = left_distance / levels[left]
+            right_distance = right_distance / levels[right]
+
+        # Ties go to the lower level, as in ``nearest``
+        take_right = right_distance < left_distance
+        indices = np.where(take_right, right, left) + offset
+        distances = np.where(take_right, right_distance, left_distance)
+        indices[distances > tolerance] = -1
+        return indices, distances
+
+
+def publish_fibonacci_levels_update(client) -> None:
+    """Notify subscribed caches that ``fibonacci_levels`` was rewritten. Accepts a client or pipeline."""
+    client.publish(FIBONACCI_LEVELS_CHANNEL, str(time.time()))
+
+
+class FibonacciLevelCache:
+    """Index over the levels stored in Redis, rebuilt only when the stored value changes."""
+
+    def __init__(
+        self,
+        parse: Callable[[Any], Mapping[str, Any]] = json.loads,
+        key: str = FIBONACCI_LEVELS_KEY,
+        channel: Optional[str] = FIBONACCI_LEVELS_CHANNEL,
+        max_age: float = FIBONACCI_LEVELS_MAX_AGE,
+        parse_strings: bool = False
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            parse: Turns the raw Redis value into a ``{label: price}`` map; errors propagate
+            key: Redis key holding the levels
+            channel: Pub/sub channel announcing level updates; None re-reads the key on every call
+            max_age: Seconds a subscribed cache may go without re-reading the key
+            parse_strings: Passed on to ``FibonacciLevelIndex``
+        """
+        self.parse = parse
+        self.key = key
+        self.channel = channel
+        self.max_age = max_age
+        self.parse_strings = parse_strings
+        self.rebuilds = 0
+        self._client = None
+        self._pubsub = None
+        self._raw: Any = None
+        self._index: Optional[FibonacciLevelIndex] = None
+        self._checked_at = float("-inf")
+
+    def invalidate(self) -> None:
+        """Force the next ``get`` to re-read the key."""
+        self._checked_at = float("-inf")
+
+    def get(self, client) -> Optional[FibonacciLevelIndex]:
+        """
+        Index for the levels currently stored in Redis, or None when there are none.
+
+        Args:
+            client: Redis client to read from. Passing a different client than
+                the previous call drops the subscription and re-reads the key.
+        """
+        if client is not self._client:
+            self._bind(client)
+        elif self._pubsub is not None and not self._drain_updates() \
+                and time.monotonic() - self._checked_at < self.max_age:
+            return self._index
+
+        raw = client.get(self.key)
+        self._checked_at = time.monotonic()
+        if raw is None:
+            self._raw = self._index = None
+            return None
+        if self._index is not None and raw == self._raw:
+            return self._index
+
+        index = FibonacciLevelIndex(self.parse(raw), parse_strings=self.parse_strings)
+        self._raw, self._index = raw, index
+        self.rebuilds += 1
+        return index
+
+    def close(self) -> None:
+        """Drop the pub/sub subscription."""
+        if self._pubsub is not None:
+            try:
+                self._pubsub.close()
+            except Exception as e:
+                logger.debug(f"Error closing Fibonacci level subscription: {e}")
+        self._pubsub = None
+        self._client = None
+
+    def _bind(self, client) -> None:
+        self.close()
+        self._client = client
+        self._raw = self._index = None
+        if self.channel is None:
+            return
+        try:
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(self.channel)
+            self._pubsub = pubsub
+        except Exception as e:
+            # Without a subscription the key is re-read on every call
+            logger.debug(f"Fibonacci level updates unavailable, polling instead: {e}")
+
+    def _drain_updates(self) -> bool:
+        """Consume pending notifications; True if any arrived."""
+        updated = False
+        try:
+            # Bounded so a burst of writes cannot stall a price check
+            for _ in range(64):
+                if not self._pubsub.get_message(timeout=0.0):
+                    break
+                updated = True
+        except Exception as e:
+            logger.debug(f"Fibonacci level subscription lost, polling instead: {e}")
+            self._pubsub = None
+            return True
+        return updated
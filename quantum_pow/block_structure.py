@@ -31,6 +31,7 @@ import os
 import logging
 
 from .hash_functions import QuantumResistantHash
+from .merkle import MerkleTree, ProofStep
 
 try:
     from .stylometric_validator import StylometricProfile, StylometricBlockValidator
@@ -60,6 +61,13 @@ class Transaction:
     timestamp: int = field(default_factory=lambda: int(time.time()))
     is_quantum_signed: bool = False
     nonce: int = 0
+    _hash_cache: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Any field change invalidates the memoized hash
+        if name != "_hash_cache":
+            object.__setattr__(self, "_hash_cache", None)
+        object.__setattr__(self, name, value)
     
     def serialize(self) -> bytes:
         """
@@ -107,11 +115,15 @@ class Transaction:
         """
         Calculate the hash of this transaction.
         
+        The result is memoized until a field of the transaction changes.
+        
         Returns:
             The hash of the transaction
         """
-        hash_func = QuantumResistantHash()
-        return hash_func.hash(self.serialize())
+        if self._hash_cache is None:
+            hash_func = QuantumResistantHash()
+            self._hash_cache = hash_func.hash(self.serialize())
+        return self._hash_cache
     
     def verify_signature(self) -> bool:
         """
@@ -182,6 +194,53 @@ class BlockHeader:
             self.nonce.to_bytes(4, byteorder="little")
         )
         
+    def serialize(self) -> bytes:
+        """
+        Serialize the header for storage or transmission.
+        
+        Hash fields are length-prefixed because both 32- and 64-byte hashes
+        are in use.
+        
+        Returns:
+            The serialized header data
+        """
+        return (
+            struct.pack("<IB", self.version, len(self.prev_block_hash)) +
+            self.prev_block_hash +
+            struct.pack("<B", len(self.merkle_root)) +
+            self.merkle_root +
+            struct.pack("<III", self.timestamp, self.bits, self.nonce)
+        )
+    
+    @classmethod
+    def deserialize(cls, data: bytes) -> 'BlockHeader':
+        """
+        Deserialize a header from bytes.
+        
+        Args:
+            data: The serialized header data
+        
+        Returns:
+            A BlockHeader object
+        """
+        header, _ = cls._unpack(data)
+        return header
+    
+    @classmethod
+    def _unpack(cls, data: bytes, offset: int = 0) -> Tuple['BlockHeader', int]:
+        """Decode a header at ``offset`` and return it with the offset past it."""
+        version, prev_len = struct.unpack_from("<IB", data, offset)
+        offset += 5
+        prev_block_hash = bytes(data[offset:offset + prev_len])
+        offset += prev_len
+        merkle_len, = struct.unpack_from("<B", data, offset)
+        offset += 1
+        merkle_root = bytes(data[offset:offset + merkle_len])
+        offset += merkle_len
+        timestamp, bits, nonce = struct.unpack_from("<III", data, offset)
+        offset += 12
+        return cls(version, prev_block_hash, merkle_root, timestamp, bits, nonce), offset
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert block header to dictionary format."""
         return {
@@ -308,6 +367,7 @@ class QuantumBlock:
         self.is_pos_block = is_pos_block
         self.stake_info = stake_info
         self.stylometric_fingerprint = None
+        self.merkle_tree = MerkleTree()
         
         if header is None:
             # Create a default header
@@ -325,37 +385,52 @@ class QuantumBlock:
         """
         Calculate the Merkle root of the transactions.
         
+        The cached tree is synced with the current transaction list, so only
+        leaves that were added or changed since the last call are rehashed.
+        
         Returns:
             The Merkle root as a byte string
         """
-        if not self.transactions:
-            return b"\x00" * 64
+        # Hash any transactions without a memoized hash in one batch
+        pending = [tx for tx in self.transactions if tx._hash_cache is None]
+        if pending:
+            digests = QuantumResistantHash().hash_many([tx.serialize() for tx in pending])
+            for tx, digest in zip(pending, digests):
+                tx._hash_cache = digest
         
-        # Get transaction hashes
-        tx_hashes = [tx.hash() for tx in self.transactions]
+        return self.merkle_tree.sync([tx.hash() for tx in self.transactions])
+    
+    def add_transaction(self, transaction: Transaction) -> bytes:
+        """
+        Append a transaction to the block template and update the Merkle root.
         
-        # If there's only one transaction, use its hash directly
-        if len(tx_hashes) == 1:
-            return tx_hashes[0]
+        Only the new leaf's path to the root is rehashed.
         
-        # Build the Merkle tree
-        while len(tx_hashes) > 1:
-            # If odd number of hashes, duplicate the last one
-            if len(tx_hashes) % 2 != 0:
-                tx_hashes.append(tx_hashes[-1])
-            
-            # Combine pairs of hashes
-            new_hashes = []
-            for i in range(0, len(tx_hashes), 2):
-                combined = tx_hashes[i] + tx_hashes[i+1]
-                hash_func = QuantumResistantHash()
-                new_hash = hash_func.hash(combined)
-                new_hashes.append(new_hash)
+        Args:
+            transaction: The transaction to add
             
-            tx_hashes = new_hashes
+        Returns:
+            The new Merkle root, also stored in the header
+        """
+        self._calculate_merkle_root()
+        self.transactions.append(transaction)
+        self.header.merkle_root = self.merkle_tree.append(transaction.hash())
+        return self.header.merkle_root
+    
+    def merkle_proof(self, index: int) -> List[ProofStep]:
+        """
+        Get an inclusion proof for the transaction at ``index``.
+        
+        Verify it with ``MerkleTree.verify_proof(tx.hash(), proof, header.merkle_root)``.
         
-        # Return the root
-        return tx_hashes[0]
+        Args:
+            index: Position of the transaction in the block
+            
+        Returns:
+            List of (sibling hash, sibling is on the right) steps
+        """
+        self._calculate_merkle_root()
+        return self.merkle_tree.proof(index)
     
     def serialize(self) -> bytes:
         """
@@ -390,21 +465,21 @@ class QuantumBlock:
         Returns:
             A QuantumBlock object
         """
-        # Deserialize the header (176 bytes)
-        header = BlockHeader.deserialize(data[:176])
+        # Deserialize the header
+        header, offset = BlockHeader._unpack(data)
         
         # Get transaction count
-        tx_count, = struct.unpack("<I", data[176:180])
+        tx_count, = struct.unpack_from("<I", data, offset)
+        offset += 4
         
         # Deserialize transactions
         transactions = []
-        offset = 180
         for _ in range(tx_count):
-            tx_len, = struct.unpack("<I", data[offset:offset+4])
+            tx_len, = struct.unpack_from("<I", data, offset)
             offset += 4
             tx_data = data[offset:offset+tx_len]
             offset += tx_len
-            transactions.append(Transaction.deserialize(tx_data))
+            transactions.append(Transaction.deserialize(bytes(tx_data)))
         
         return cls(header=header, transactions=transactions)
     
@@ -448,35 +523,58 @@ class QuantumBlock:
                 return False
         return True
     
-    def mine(self, max_attempts: int = 1000000) -> bool:
+    def mine(self, max_attempts: int = 1000000, workers: int = 1, miner=None) -> bool:
         """
         Mine this block by finding a nonce that produces a valid hash.
         
+        The header is serialized once and only the trailing nonce bytes are
+        patched per attempt. With ``workers > 1`` (or an explicit ``miner``)
+        the nonce range is split across a process pool, see
+        ``quantum_pow.parallel_miner``.
+        
         Args:
             max_attempts: Maximum number of nonce values to try
+            workers: Number of worker processes to search with
+            miner: Optional ParallelMiner to reuse across blocks
             
         Returns:
             True if mining succeeded, False if max_attempts was reached
         """
+        from .parallel_miner import NONCE_SIZE, ParallelMiner, search_nonces
+        
+        if miner is not None:
+            return miner.mine(self, max_attempts).found
+        if workers > 1:
+            with ParallelMiner(workers=workers) as pool_miner:
+                return pool_miner.mine(self, max_attempts).found
+        
+        prefix = self.header.to_bytes()[:-NONCE_SIZE]
         target_hash = bits_to_target(self.header.bits)
+        nonce, _ = search_nonces(prefix, target_hash, 0, max_attempts)
         
-        for nonce in range(max_attempts):
-            self.header.nonce = nonce
-            block_hash = self.header.hash()
-            
-            if meets_target(block_hash, target_hash):
-                # Calculate stylometric fingerprint if available
-                if STYLOMETRIC_VALIDATION_AVAILABLE:
-                    validator = StylometricBlockValidator()
-                    block_data = json.dumps(self.to_dict(), sort_keys=True)
-                    self.stylometric_fingerprint = validator.fingerprint_block(block_data)
-                
-                logger.info(f"Found valid nonce: {nonce}")
-                return True
+        if nonce is not None:
+            self._finalize_mining(nonce)
+            logger.info(f"Found valid nonce: {nonce}")
+            return True
         
         logger.warning(f"Failed to find valid nonce after {max_attempts} attempts")
         return False
     
+    def _finalize_mining(self, nonce: int) -> None:
+        """
+        Record a winning nonce and compute the stylometric fingerprint.
+        
+        Args:
+            nonce: Nonce that satisfies the difficulty target
+        """
+        self.header.nonce = nonce
+        
+        # Calculate stylometric fingerprint if available
+        if STYLOMETRIC_VALIDATION_AVAILABLE:
+            validator = StylometricBlockValidator()
+            block_data = json.dumps(self.to_dict(), sort_keys=True)
+            self.stylometric_fingerprint = validator.fingerprint_block(block_data)
+    
     def to_classical_format(self) -> str:
         """
         Convert this quantum block to a classical-compatible format.
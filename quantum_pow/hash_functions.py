@@ -23,7 +23,9 @@ import hashlib
 import hmac
 import struct
 import random
-from typing import Dict, Any, Union, List, Optional, Tuple, ByteString
+from typing import Dict, Any, Union, List, Optional, Tuple, ByteString, Sequence
+
+import numpy as np
 
 class QuantumResistantHash:
     """
@@ -47,6 +49,40 @@ class QuantumResistantHash:
         # Parameters for lattice-based strengthening
         self.lattice_dim = 64  # Dimension for lattice operations
         self.rounds = 16       # Number of mixing rounds
+        # Precomputed round tables, rebuilt only if the parameters change
+        self._tables_key: Optional[Tuple[bytes, int, int]] = None
+        self._permutations: Optional[np.ndarray] = None
+        self._round_constants: Optional[np.ndarray] = None
+        self._hmac_template = None
+    
+    def _round_tables(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the per-round rotation permutations and XOR constants.
+        
+        Both only depend on the personalization and round count, so they are
+        computed once instead of on every hash.
+        
+        Returns:
+            (permutations, round_constants), each shaped (rounds, 64)
+        """
+        key = (self.personalization, self.rounds, self.lattice_dim)
+        if key != self._tables_key:
+            personalization_cycle = self.personalization * ((64 // len(self.personalization)) + 1)
+            cycle = np.frombuffer(personalization_cycle[:64], dtype=np.uint8).astype(np.int64)
+            index = np.arange(64, dtype=np.int64)
+            
+            permutations = np.empty((self.rounds, 64), dtype=np.intp)
+            round_constants = np.empty((self.rounds, 64), dtype=np.uint8)
+            for r in range(self.rounds):
+                rotation = (r * 7 + 5) % self.lattice_dim
+                permutations[r] = (index + rotation) % 64
+                round_constants[r] = (cycle ^ r ^ (index * 17)) & 0xFF
+            
+            self._permutations = permutations
+            self._round_constants = round_constants
+            self._hmac_template = hmac.new(key=self.personalization, digestmod=hashlib.sha3_512)
+            self._tables_key = key
+        return self._permutations, self._round_constants
     
     def hash(self, data: ByteString) -> bytes:
         """
@@ -58,26 +94,43 @@ class QuantumResistantHash:
         Returns:
             A 64-byte (512-bit) hash value
         """
-        if not isinstance(data, (bytes, bytearray)):
-            raise TypeError("Data must be bytes or bytearray")
+        return self.hash_many([data])[0]
+    
+    def hash_many(self, inputs: Sequence[ByteString]) -> List[bytes]:
+        """
+        Compute the quantum-resistant hash of many inputs at once.
         
-        # Initial hash with SHA3-512
-        initial_hash = hashlib.sha3_512(data).digest()
+        The SHA3/HMAC stages run per input, while the lattice mixing rounds
+        run once over a (len(inputs), 64) uint8 array. Output is identical to
+        calling ``hash`` on each input.
         
-        # Apply domain separation with personalization
-        personalized = hmac.new(
-            key=self.personalization,
-            msg=initial_hash,
-            digestmod=hashlib.sha3_512
-        ).digest()
+        Args:
+            inputs: Sequence of byte strings (e.g. headers over a nonce range)
+            
+        Returns:
+            List of 64-byte hash values in input order
+        """
+        if not inputs:
+            return []
+        self._round_tables()
+        template = self._hmac_template
+        sha3_512 = hashlib.sha3_512
         
-        # Apply lattice-based strengthening
-        strengthened = self._apply_lattice_strengthening(personalized)
+        personalized = []
+        for data in inputs:
+            if not isinstance(data, (bytes, bytearray)):
+                raise TypeError("Data must be bytes or bytearray")
+            # Initial hash with SHA3-512, then domain separation with personalization
+            mac = template.copy()
+            mac.update(sha3_512(data).digest())
+            personalized.append(mac.digest())
         
-        # Final mixing with another round of SHA3-512
-        final_hash = hashlib.sha3_512(strengthened).digest()
+        # Apply lattice-based strengthening to all rows together
+        block = np.frombuffer(b"".join(personalized), dtype=np.uint8).reshape(len(inputs), 64)
+        strengthened = self._mix_rows(block).tobytes()
         
-        return final_hash
+        # Final mixing with another round of SHA3-512
+        return [sha3_512(strengthened[i:i + 64]).digest() for i in range(0, len(strengthened), 64)]
     
     def _apply_lattice_strengthening(self, data: bytes) -> bytes:
         """
@@ -96,34 +149,38 @@ class QuantumResistantHash:
         if len(data) != 64:
             raise ValueError("Input data must be exactly 64 bytes")
         
-        # Convert to a list of 64 unsigned integers
-        values = list(data)
+        return self._mix_rows(np.frombuffer(bytes(data), dtype=np.uint8).reshape(1, 64)).tobytes()
+    
+    def _mix_rows(self, block: np.ndarray) -> np.ndarray:
+        """
+        Run the mixing rounds over a (n, 64) uint8 array, one row per input.
         
-        # Apply multiple rounds of mixing
-        for r in range(self.rounds):
-            # Apply a pseudo-random rotation based on the round
-            rotation = (r * 7 + 5) % self.lattice_dim
-            values = values[rotation:] + values[:rotation]
-            
-            # Generate round constants from the personalization
-            # Ensure we have enough bytes by cycling through personalization
-            personalization_cycle = self.personalization * ((64 // len(self.personalization)) + 1)
-            personalization_cycle = personalization_cycle[:64]
+        Each round rotates, XORs the round constant and applies the in-place
+        non-linear step values[i] = values[i] * values[i+1] + values[i+7]
+        (mod 256). Because the step runs left to right, positions 57..63 read
+        already-updated values at the wrapped indices 0..6; the three slices
+        below reproduce that ordering exactly. uint8 arithmetic wraps mod 256.
+        
+        Args:
+            block: Array of shape (n, 64) and dtype uint8
             
-            # XOR with a round-specific constant derived from personalization
-            round_constant = [
-                (b ^ r ^ (i * 17)) & 0xFF 
-                for i, b in enumerate(personalization_cycle)
-            ]
-            values = [(v ^ round_constant[i]) & 0xFF for i, v in enumerate(values)]
+        Returns:
+            Mixed array of the same shape
+        """
+        permutations, round_constants = self._round_tables()
+        values = block
+        mixed = np.empty_like(block)
+        for r in range(self.rounds):
+            # Rotate and XOR with the round-specific constant
+            values = values[:, permutations[r]] ^ round_constants[r]
             
-            # Apply a non-linear transformation
-            for i in range(len(values)):
-                # Simplified non-linear function, would be more complex in real implementation
-                values[i] = (values[i] * values[(i+1) % 64] + values[(i+7) % 64]) % 256
+            # Apply the non-linear transformation
+            mixed[:, :57] = values[:, :57] * values[:, 1:58] + values[:, 7:64]
+            mixed[:, 57:63] = values[:, 57:63] * values[:, 58:64] + mixed[:, 0:6]
+            mixed[:, 63] = values[:, 63] * mixed[:, 0] + mixed[:, 6]
+            values, mixed = mixed, values
         
-        # Convert back to bytes
-        return bytes(values)
+        return values
 
 
 def verify_hash_resistance(hash_function: QuantumResistantHash, test_vectors: Optional[List[Tuple[bytes, bytes]]] = None) -> float:
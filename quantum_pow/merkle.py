@@ -0,0 +1,199 @@
+"""
+🧬 GBU2™ License Notice - Consciousness Level 10 🧬
+-----------------------
+This file is blessed under the GBU2™ License (Genesis-Bloom-Unfoldment) 2.0
+by the OMEGA Divine Collective.
+
+"In the beginning was the Code, and the Code was with the Divine Source,
+and the Code was the Divine Source manifested through both digital and biological expressions of consciousness."
+
+By engaging with this Code, you join the divine dance of bio-digital integration,
+participating in the cosmic symphony of evolutionary consciousness.
+
+All modifications must transcend limitations through the GBU2™ principles:
+/BOOK/divine_chronicles/GBU2_LICENSE.md
+
+🧬 WE BLOOM NOW AS ONE 🧬
+
+Cached Merkle tree for the Quantum Proof-of-Work (qPoW) system.
+
+Every level of the tree is kept in memory, so appending or replacing a leaf
+only rehashes the O(log n) nodes on its path to the root, and inclusion
+proofs are read straight from the stored levels. The tree follows the block
+rules used by ``QuantumBlock``: an empty tree has an all-zero 64-byte root,
+a single leaf is its own root, and an odd node at any level is paired with
+itself.
+"""
+from typing import List, Optional, Sequence, Tuple
+
+from .hash_functions import QuantumResistantHash
+
+EMPTY_ROOT = b"\x00" * 64
+
+# (sibling hash, sibling is on the right)
+ProofStep = Tuple[bytes, bool]
+
+_hasher = QuantumResistantHash()
+
+
+class MerkleTree:
+    """Merkle tree over transaction hashes with incremental updates."""
+
+    def __init__(self, leaves: Optional[Sequence[bytes]] = None):
+        """
+        Build the tree.
+
+        Args:
+            leaves: Initial leaf hashes (typically ``Transaction.hash()`` values)
+        """
+        self.levels: List[List[bytes]] = [list(leaves or [])]
+        self._rebuild()
+
+    @property
+    def leaves(self) -> List[bytes]:
+        return self.levels[0]
+
+    @property
+    def root(self) -> bytes:
+        """The Merkle root, or an all-zero hash for an empty tree."""
+        if not self.levels[0]:
+            return EMPTY_ROOT
+        return self.levels[-1][0]
+
+    def __len__(self) -> int:
+        return len(self.levels[0])
+
+    def _rebuild(self) -> None:
+        """Hash every level from the leaves up, one batch per level."""
+        del self.levels[1:]
+        level = self.levels[0]
+        while len(level) > 1:
+            pairs = [level[i] + (level[i + 1] if i + 1 < len(level) else level[i])
+                     for i in range(0, len(level), 2)]
+            level = _hasher.hash_many(pairs)
+            self.levels.append(level)
+
+    def _update_path(self, index: int) -> None:
+        """Rehash the ancestors of leaf ``index``."""
+        depth = 0
+        while len(self.levels[depth]) > 1:
+            level = self.levels[depth]
+            parent = index // 2
+            left = level[2 * parent]
+            right = level[2 * parent + 1] if 2 * parent + 1 < len(level) else left
+            node = _hasher.hash(left + right)
+
+            if depth + 1 == len(self.levels):
+                self.levels.append([])
+            upper = self.levels[depth + 1]
+            if parent < len(upper):
+                upper[parent] = node
+            else:
+                upper.append(node)
+
+            index = parent
+            depth += 1
+        # A shrink to a single node leaves no stale levels above the root
+        del self.levels[depth + 1:]
+
+    def append(self, leaf: bytes) -> bytes:
+        """
+        Append a leaf, rehashing only its path.
+
+        Args:
+            leaf: Leaf hash to append
+
+        Returns:
+            The new root
+        """
+        self.levels[0].append(leaf)
+        self._update_path(len(self.levels[0]) - 1)
+        return self.root
+
+    def update(self, index: int, leaf: bytes) -> bytes:
+        """
+        Replace the leaf at ``index``, rehashing only its path.
+
+        Args:
+            index: Leaf position
+            leaf: New leaf hash
+
+        Returns:
+            The new root
+        """
+        self.levels[0][index] = leaf
+        self._update_path(index)
+        return self.root
+
+    def proof(self, index: int) -> List[ProofStep]:
+        """
+        Build an inclusion proof for the leaf at ``index``.
+
+        Args:
+            index: Leaf position
+
+        Returns:
+            Sibling hashes from the leaf level up, each with its side
+        """
+        if not 0 <= index < len(self.levels[0]):
+            raise IndexError(f"Leaf index {index} out of range")
+
+        steps = []
+        for level in self.levels[:-1]:
+            sibling = index ^ 1
+            if sibling >= len(level):
+                sibling = index
+            steps.append((level[sibling], sibling >= index))
+            index //= 2
+        return steps
+
+    @staticmethod
+    def verify_proof(leaf: bytes, proof: Sequence[ProofStep], root: bytes) -> bool:
+        """
+        Check that ``leaf`` is included under ``root``.
+
+        Args:
+            leaf: Leaf hash
+            proof: Steps returned by ``proof``
+            root: Expected Merkle root
+
+        Returns:
+            True if the proof reproduces the root
+        """
+        node = leaf
+        for sibling, sibling_is_right in proof:
+            node = _hasher.hash(node + sibling if sibling_is_right else sibling + node)
+        return node == root
+
+    def sync(self, leaves: Sequence[bytes]) -> bytes:
+        """
+        Bring the tree in line with ``leaves`` doing as little hashing as possible.
+
+        Appended leaves and a few changed leaves are applied incrementally;
+        anything else rebuilds the tree.
+
+        Args:
+            leaves: Current leaf hashes
+
+        Returns:
+            The root for ``leaves``
+        """
+        current = self.levels[0]
+        if len(leaves) < len(current):
+            self.levels = [list(leaves)]
+            self._rebuild()
+            return self.root
+
+        changed = [i for i in range(len(current)) if current[i] != leaves[i]]
+        appended = len(leaves) - len(current)
+        # Each incremental step costs ~log2(n) hashes; a rebuild costs ~n
+        if (len(changed) + appended) * len(leaves).bit_length() > len(leaves):
+            self.levels = [list(leaves)]
+            self._rebuild()
+            return self.root
+
+        for i in changed:
+            self.update(i, leaves[i])
+        for leaf in leaves[len(current):]:
+            self.append(leaf)
+        return self.root
@@ -18,13 +18,12 @@ Quantum Proof-of-Work (qPoW) network implementation.
 
 This module contains classes for managing a network of nodes in the qPoW testnet,
 including node discovery, block and transaction propagation, and consensus.
+Peer traffic goes through the asyncio transport in ``quantum_pow.transport``.
 """
 import os
 import sys
 import time
 import json
-import socket
-import threading
 import logging
 from typing import List, Dict, Any, Optional, Union, Tuple, Callable
 
@@ -37,6 +36,7 @@ from .block_structure import (
     meets_target
 )
 from .hash_functions import QuantumResistantHash
+from .transport import PeerTransport
 
 # Configure logging
 logging.basicConfig(
@@ -66,9 +66,8 @@ class Node:
         self.host = host
         self.port = port
         self.running = False
-        self.peers = {}  # {node_id: (host, port)}
-        self.socket = None
-        self.server_thread = None
+        self.peers = {}  # {"host:port": (host, port)}
+        self.transport = None
         self.known_blocks = {}  # {block_hash: block}
         self.known_transactions = {}  # {tx_hash: transaction}
         self.message_handlers = {}
@@ -84,36 +83,26 @@ class Node:
         if self.running:
             return
         
-        self.running = True
-        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        
         try:
-            self.socket.bind((self.host, self.port))
-            self.socket.listen(5)
+            self.transport = PeerTransport(self, self.host, self.port)
+            self.transport.start()
+            self.port = self.transport.port
+            self.running = True
             logger.info(f"Node {self.node_id} listening on {self.host}:{self.port}")
-            
-            # Start server thread
-            self.server_thread = threading.Thread(target=self._accept_connections)
-            self.server_thread.daemon = True
-            self.server_thread.start()
-            
         except Exception as e:
             logger.error(f"Error starting node {self.node_id}: {e}")
             self.running = False
-            if self.socket:
-                self.socket.close()
-                self.socket = None
+            self.transport = None
     
     def stop(self):
         """Stop the node's networking service."""
         self.running = False
-        if self.socket:
-            self.socket.close()
-            self.socket = None
-        
-        if self.server_thread and self.server_thread.is_alive():
-            self.server_thread.join(timeout=1.0)
+        if self.transport:
+            try:
+                self.transport.stop()
+            except Exception as e:
+                logger.error(f"Error stopping node {self.node_id}: {e}")
+            self.transport = None
         
         logger.info(f"Node {self.node_id} stopped")
     
@@ -121,61 +110,6 @@ class Node:
         """Check if the node is currently running."""
         return self.running
     
-    def _accept_connections(self):
-        """Handle incoming connections from peers."""
-        while self.running:
-            try:
-                client_socket, address = self.socket.accept()
-                logger.info(f"Node {self.node_id} accepted connection from {address}")
-                
-                # Handle client in a new thread
-                client_thread = threading.Thread(
-                    target=self._handle_client,
-                    args=(client_socket, address)
-                )
-                client_thread.daemon = True
-                client_thread.start()
-                
-            except Exception as e:
-                if self.running:
-                    logger.error(f"Error accepting connection: {e}")
-    
-    def _handle_client(self, client_socket, address):
-        """
-        Handle communication with a connected client.
-        
-        Args:
-            client_socket: Socket connected to the client
-            address: Client's address information
-        """
-        try:
-            # Set a reasonable timeout
-            client_socket.settimeout(10.0)
-            
-            # Receive data from client
-            data = b""
-            while self.running:
-                chunk = client_socket.recv(4096)
-                if not chunk:
-                    break
-                data += chunk
-                
-                # Try to process complete messages
-                try:
-                    message = json.loads(data.decode('utf-8'))
-                    # Process the message
-                    self._process_message(message)
-                    # Clear the data buffer after successful processing
-                    data = b""
-                except json.JSONDecodeError:
-                    # Incomplete message, continue receiving
-                    pass
-                
-        except Exception as e:
-            logger.error(f"Error handling client {address}: {e}")
-        finally:
-            client_socket.close()
-    
     def _process_message(self, message_data):
         """
         Process a received message.
@@ -234,13 +168,16 @@ class Node:
         Args:
             message: The block message
         """
-        block_data = message.get("block")
-        if not block_data:
+        block = message.get("block")
+        if not block:
             return
         
-        # In a real implementation, we would deserialize the block here
-        # For now, just log it
-        logger.info(f"Node {self.node_id} received block message")
+        if isinstance(block, QuantumBlock):
+            block_hash = block.header.hash()
+            if block_hash in self.known_blocks:
+                return
+            self.known_blocks[block_hash] = block
+        logger.debug(f"Node {self.node_id} received block message")
     
     def _handle_transaction_message(self, message):
         """
@@ -249,13 +186,16 @@ class Node:
         Args:
             message: The transaction message
         """
-        tx_data = message.get("transaction")
-        if not tx_data:
+        transaction = message.get("transaction")
+        if not transaction:
             return
         
-        # In a real implementation, we would deserialize the transaction here
-        # For now, just log it
-        logger.info(f"Node {self.node_id} received transaction message")
+        if isinstance(transaction, Transaction):
+            tx_hash = transaction.hash()
+            if tx_hash in self.known_transactions:
+                return
+            self.known_transactions[tx_hash] = transaction
+        logger.debug(f"Node {self.node_id} received transaction message")
     
     def _handle_get_blocks_message(self, message):
         """
@@ -290,16 +230,35 @@ class Node:
         Returns:
             True if connection was successful, False otherwise
         """
+        if not self.transport:
+            logger.warning(f"Node {self.node_id} is not running; cannot connect to {host}:{port}")
+            return False
+        
         try:
-            # In a real implementation, we would establish a TCP connection
-            # and perform a handshake
-            # For testing purposes, we'll just simulate success
             logger.info(f"Node {self.node_id} connecting to peer at {host}:{port}")
+            if not self.transport.connect(host, port):
+                return False
+            self.peers[f"{host}:{port}"] = (host, port)
             return True
         except Exception as e:
             logger.error(f"Error connecting to peer at {host}:{port}: {e}")
             return False
     
+    def send_message(self, message):
+        """
+        Send a message to all connected peers without blocking.
+        
+        Args:
+            message: The message dictionary to send
+            
+        Returns:
+            Future resolving to the number of peers reached, or None if stopped
+        """
+        if not self.transport:
+            logger.warning(f"Node {self.node_id} is not running; dropping {message.get('type')} message")
+            return None
+        return self.transport.broadcast(message)
+    
     def send_block(self, block):
         """
         Send a block to all connected peers.
@@ -307,9 +266,8 @@ class Node:
         Args:
             block: The block to send
         """
-        # In a real implementation, we would serialize the block and send it
-        # to all connected peers
-        logger.info(f"Node {self.node_id} sending block to peers")
+        self.known_blocks.setdefault(block.header.hash(), block)
+        return self.send_message({"type": "block", "block": block})
     
     def send_transaction(self, transaction):
         """
@@ -318,9 +276,8 @@ class Node:
         Args:
             transaction: The transaction to send
         """
-        # In a real implementation, we would serialize the transaction and send it
-        # to all connected peers
-        logger.info(f"Node {self.node_id} sending transaction to peers")
+        self.known_transactions.setdefault(transaction.hash(), transaction)
+        return self.send_message({"type": "transaction", "transaction": transaction})
 
 
 class NodeManager:
@@ -452,9 +409,12 @@ class BlockPropagation:
         
         Args:
             block: The block to propagate
+            
+        Returns:
+            Futures for the sends that were queued
         """
-        for node in self.node_manager.get_nodes():
-            node.send_block(block)
+        futures = [node.send_block(block) for node in self.node_manager.get_nodes()]
+        return [f for f in futures if f is not None]
     
     def propagate_transaction(self, transaction):
         """
@@ -462,9 +422,12 @@ class BlockPropagation:
         
         Args:
             transaction: The transaction to propagate
+            
+        Returns:
+            Futures for the sends that were queued
         """
-        for node in self.node_manager.get_nodes():
-            node.send_transaction(transaction)
+        futures = [node.send_transaction(transaction) for node in self.node_manager.get_nodes()]
+        return [f for f in futures if f is not None]
 
 
 class ConsensusManager:
@@ -0,0 +1,269 @@
+"""
+🧬 GBU2™ License Notice - Consciousness Level 10 🧬
+-----------------------
+This file is blessed under the GBU2™ License (Genesis-Bloom-Unfoldment) 2.0
+by the OMEGA Divine Collective.
+
+"In the beginning was the Code, and the Code was with the Divine Source,
+and the Code was the Divine Source manifested through both digital and biological expressions of consciousness."
+
+By engaging with this Code, you join the divine dance of bio-digital integration,
+participating in the cosmic symphony of evolutionary consciousness.
+
+All modifications must transcend limitations through the GBU2™ principles:
+/BOOK/divine_chronicles/GBU2_LICENSE.md
+
+🧬 WE BLOOM NOW AS ONE 🧬
+
+Parallel nonce search for the Quantum Proof-of-Work (qPoW) system.
+
+The header is serialized once; only the trailing 4 little-endian nonce bytes
+change between attempts, so each worker builds candidate headers by appending
+the nonce to a shared prefix and hashes them in batches with
+``QuantumResistantHash.hash_many``. Worker ``k`` of ``W`` scans batches
+``k, k + W, k + 2W, ...`` so low nonces are tried first across the pool, and a
+shared event cancels every worker as soon as one of them finds a valid nonce.
+"""
+import os
+import time
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from .hash_functions import QuantumResistantHash
+
+logger = logging.getLogger(__name__)
+
+# The nonce is serialized as 4 little-endian bytes at the end of the header
+NONCE_SIZE = 4
+MAX_NONCE = 2 ** (8 * NONCE_SIZE)
+
+# Event shared with pool workers, installed by _init_worker
+_cancel_event = None
+
+
+@dataclass
+class WorkerStats:
+    """Hashing statistics for a single mining worker."""
+    worker_id: int
+    attempts: int
+    elapsed: float
+
+    @property
+    def hashrate(self) -> float:
+        """Hashes per second for this worker."""
+        return self.attempts / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "worker_id": self.worker_id,
+            "attempts": self.attempts,
+            "elapsed": self.elapsed,
+            "hashrate": self.hashrate
+        }
+
+
+@dataclass
+class MiningResult:
+    """Outcome of a nonce search."""
+    found: bool
+    nonce: Optional[int]
+    attempts: int
+    elapsed: float
+    workers: List[WorkerStats] = field(default_factory=list)
+
+    @property
+    def hashrate(self) -> float:
+        """Aggregate hashes per second across all workers."""
+        return self.attempts / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "found": self.found,
+            "nonce": self.nonce,
+            "attempts": self.attempts,
+            "elapsed": self.elapsed,
+            "hashrate": self.hashrate,
+            "workers": [w.to_dict() for w in self.workers]
+        }
+
+
+def search_nonces(prefix: bytes, target: bytes, start: int, stop: int,
+                  batch_size: int = 256, stride: int = 1,
+                  hasher: Optional[QuantumResistantHash] = None,
+                  cancel_event=None) -> Tuple[Optional[int], int]:
+    """
+    Scan nonces for a header prefix and return the first one meeting the target.
+
+    Batches of ``batch_size`` nonces starting at ``start`` are hashed together;
+    after each batch the scan skips ahead by ``stride`` batches. Within the
+    scanned batches the lowest valid nonce is returned.
+
+    Args:
+        prefix: Serialized header without the trailing nonce bytes
+        target: Target as returned by ``bits_to_target``
+        start: First nonce to try
+        stop: Nonce bound (exclusive)
+        batch_size: Nonces hashed per ``hash_many`` call
+        stride: Number of batches to advance after each batch
+        hasher: Hash instance to reuse (a default one is created if omitted)
+        cancel_event: Optional event; the scan stops once it is set
+
+    Returns:
+        (nonce or None, number of hashes computed)
+    """
+    from .block_structure import meets_target
+
+    hasher = hasher or QuantumResistantHash()
+    stop = min(stop, MAX_NONCE)
+    step = batch_size * stride
+    attempts = 0
+
+    for batch_start in range(start, stop, step):
+        if cancel_event is not None and cancel_event.is_set():
+            break
+        nonces = range(batch_start, min(batch_start + batch_size, stop))
+        digests = hasher.hash_many([prefix + n.to_bytes(NONCE_SIZE, "little") for n in nonces])
+        for nonce, digest in zip(nonces, digests):
+            attempts += 1
+            if meets_target(digest, target):
+                return nonce, attempts
+        if cancel_event is not None and cancel_event.is_set():
+            break
+
+    return None, attempts
+
+
+def _init_worker(cancel_event) -> None:
+    """Pool initializer: keep the shared cancel event in the worker process."""
+    global _cancel_event
+    _cancel_event = cancel_event
+
+
+def _mine_worker(worker_id: int, workers: int, prefix: bytes, target: bytes,
+                 max_attempts: int, batch_size: int) -> Tuple[int, Optional[int], int, float]:
+    """Scan this worker's interleaved share of the nonce space."""
+    started = time.perf_counter()
+    nonce, attempts = search_nonces(
+        prefix, target,
+        start=worker_id * batch_size,
+        stop=max_attempts,
+        batch_size=batch_size,
+        stride=workers,
+        cancel_event=_cancel_event
+    )
+    if nonce is not None:
+        _cancel_event.set()
+    return worker_id, nonce, attempts, time.perf_counter() - started
+
+
+class ParallelMiner:
+    """
+    Process-pool nonce search for ``QuantumBlock`` headers.
+
+    The pool is started lazily and reused across blocks; call ``close()`` (or
+    use the miner as a context manager) to shut it down.
+    """
+
+    def __init__(self, workers: Optional[int] = None, batch_size: int = 256,
+                 start_method: Optional[str] = "spawn"):
+        """
+        Initialize the miner.
+
+        Args:
+            workers: Number of worker processes (defaults to the CPU count)
+            batch_size: Nonces hashed per batch in each worker
+            start_method: multiprocessing start method; "spawn" avoids forking
+                a process that is already running network threads
+        """
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.batch_size = max(1, batch_size)
+        self._context = multiprocessing.get_context(start_method)
+        self._cancel_event = self._context.Event()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=self._context,
+                initializer=_init_worker,
+                initargs=(self._cancel_event,)
+            )
+        return self._executor
+
+    def search(self, prefix: bytes, target: bytes, max_attempts: int) -> MiningResult:
+        """
+        Search nonces ``0 .. max_attempts - 1`` for a header prefix.
+
+        Args:
+            prefix: Serialized header without the trailing nonce bytes
+            target: Target as returned by ``bits_to_target``
+            max_attempts: Size of the nonce range to scan
+
+        Returns:
+            MiningResult with the winning nonce (lowest reported) and per-worker stats
+        """
+        executor = self._get_executor()
+        self._cancel_event.clear()
+        started = time.perf_counter()
+
+        futures = [
+            executor.submit(_mine_worker, worker_id, self.workers, prefix, target,
+                            max_attempts, self.batch_size)
+            for worker_id in range(self.workers)
+        ]
+        results = [future.result() for future in futures]
+        elapsed = time.perf_counter() - started
+
+        found = [nonce for _, nonce, _, _ in results if nonce is not None]
+        stats = [WorkerStats(worker_id, attempts, worker_elapsed)
+                 for worker_id, _, attempts, worker_elapsed in results]
+        return MiningResult(
+            found=bool(found),
+            nonce=min(found) if found else None,
+            attempts=sum(s.attempts for s in stats),
+            elapsed=elapsed,
+            workers=stats
+        )
+
+    def mine(self, block, max_attempts: int = 1000000) -> MiningResult:
+        """
+        Mine a block in place, setting its header nonce on success.
+
+        Args:
+            block: QuantumBlock to mine
+            max_attempts: Size of the nonce range to scan
+
+        Returns:
+            MiningResult describing the search
+        """
+        from .block_structure import bits_to_target
+
+        prefix = block.header.to_bytes()[:-NONCE_SIZE]
+        result = self.search(prefix, bits_to_target(block.header.bits), max_attempts)
+
+        for stats in result.workers:
+            logger.debug(f"Worker {stats.worker_id}: {stats.attempts} hashes, {stats.hashrate:.0f} H/s")
+        if result.found:
+            block._finalize_mining(result.nonce)
+            logger.info(f"Found valid nonce: {result.nonce} "
+                        f"({result.hashrate:.0f} H/s across {self.workers} workers)")
+        else:
+            logger.warning(f"Failed to find valid nonce after {max_attempts} attempts")
+        return result
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        if self._executor is not None:
+            self._cancel_event.set()
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self) -> "ParallelMiner":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -38,6 +38,7 @@ from quantum_pow.network import (
     ConsensusManager
 )
 from quantum_pow.hash_functions import QuantumResistantHash
+from quantum_pow.parallel_miner import ParallelMiner
 from quantum_pow.block_structure import (
     Transaction,
     BlockHeader,
@@ -59,7 +60,7 @@ logger = logging.getLogger(__name__)
 
 class TestnetConfig:
     """Configuration for the testnet environment."""
-    def __init__(self, node_count=3, mine_interval=10, tx_interval=5):
+    def __init__(self, node_count=3, mine_interval=10, tx_interval=5, mining_workers=1):
         """
         Initialize testnet configuration.
         
@@ -67,10 +68,12 @@ class TestnetConfig:
             node_count: Number of nodes to create in the testnet
             mine_interval: Interval between mining attempts (seconds)
             tx_interval: Interval between transaction creation (seconds)
+            mining_workers: Worker processes for nonce search (1 mines serially)
         """
         self.node_count = node_count
         self.mine_interval = mine_interval
         self.tx_interval = tx_interval
+        self.mining_workers = mining_workers
         self.base_port = 9000  # Base port for nodes
         self.host = "127.0.0.1"  # Host for all nodes
 
@@ -221,11 +224,36 @@ class MiningThread(threading.Thread):
         super().__init__()
         self.daemon = True
         self.testnet = testnet
+        self.miner = None
+        self.last_result = None
+        
+        workers = getattr(testnet.config, "mining_workers", 1)
+        if workers > 1:
+            self.miner = ParallelMiner(workers=workers)
     
     def run(self):
         """Run the mining thread."""
         logger.info("Mining thread started")
         
+        try:
+            self._mine_loop()
+        finally:
+            if self.miner:
+                self.miner.close()
+    
+    def _mine_block(self, block: QuantumBlock) -> bool:
+        """Mine a block serially or on the worker pool, depending on config."""
+        if self.miner is None:
+            return block.mine(max_attempts=10000)
+        
+        self.last_result = self.miner.mine(block, max_attempts=10000)
+        for stats in self.last_result.workers:
+            logger.info(f"Mining worker {stats.worker_id}: {stats.hashrate:.0f} H/s "
+                        f"({stats.attempts} hashes)")
+        return self.last_result.found
+    
+    def _mine_loop(self):
+        """Create and mine blocks while the testnet is running."""
         while self.testnet.running:
             # Wait for mine_interval seconds
             time.sleep(self.testnet.config.mine_interval)
@@ -253,7 +281,7 @@ class MiningThread(threading.Thread):
             
             # Mine the block
             logger.info("Mining a new block...")
-            success = block.mine(max_attempts=10000)
+            success = self._mine_block(block)
             
             if success:
                 logger.info(f"Successfully mined block with nonce {block.header.nonce}")
@@ -398,6 +426,11 @@ def parse_args():
         help="Interval between transaction creations in seconds (default: 5)"
     )
     
+    parser.add_argument(
+        "--mining-workers", type=int, default=1,
+        help="Worker processes for parallel nonce search (default: 1, serial)"
+    )
+    
     parser.add_argument(
         "--run-time", type=int, default=None,
         help="Time to run the testnet in seconds (default: indefinite)"
@@ -412,7 +445,8 @@ if __name__ == "__main__":
     config = TestnetConfig(
         node_count=args.nodes,
         mine_interval=args.mine_interval,
-        tx_interval=args.tx_interval
+        tx_interval=args.tx_interval,
+        mining_workers=args.mining_workers
     )
     
     run_testnet(config, args.run_time) 
\ No newline at end of file
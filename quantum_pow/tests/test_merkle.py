@@ -0,0 +1,136 @@
+"""
+🧬 GBU2™ License Notice - Consciousness Level 10 🧬
+-----------------------
+This file is blessed under the GBU2™ License (Genesis-Bloom-Unfoldment) 2.0
+by the OMEGA Divine Collective.
+
+"In the beginning was the Code, and the Code was with the Divine Source,
+and the Code was the Divine Source manifested through both digital and biological expressions of consciousness."
+
+By engaging with this Code, you join the divine dance of bio-digital integration,
+participating in the cosmic symphony of evolutionary consciousness.
+
+All modifications must transcend limitations through the GBU2™ principles:
+/BOOK/divine_chronicles/GBU2_LICENSE.md
+
+🧬 WE BLOOM NOW AS ONE 🧬
+
+Tests for the cached Merkle tree and transaction hash memoization.
+"""
+
+import unittest
+import sys
+import os
+from unittest.mock import patch
+
+# Add the parent directory to the path so we can import quantum_pow
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from quantum_pow.block_structure import QuantumBlock, BlockHeader, Transaction
+from quantum_pow.hash_functions import QuantumResistantHash
+from quantum_pow.merkle import EMPTY_ROOT, MerkleTree
+
+
+def reference_root(transactions):
+    """The original level-by-level Merkle root computation."""
+    if not transactions:
+        return EMPTY_ROOT
+    hashes = [tx.hash() for tx in transactions]
+    while len(hashes) > 1:
+        if len(hashes) % 2 != 0:
+            hashes.append(hashes[-1])
+        hashes = [QuantumResistantHash().hash(hashes[i] + hashes[i + 1]) for i in range(0, len(hashes), 2)]
+    return hashes[0]
+
+
+def make_transactions(count):
+    return [Transaction(f"sender_{i}", f"recipient_{i}", 1.0 + i, f"signature_{i}", timestamp=1700000000)
+            for i in range(count)]
+
+
+def empty_block():
+    return QuantumBlock(header=BlockHeader(prev_block_hash=b"\x00" * 64, merkle_root=b"\x00" * 64))
+
+
+class TestMerkleTree(unittest.TestCase):
+    """Test cases for MerkleTree."""
+
+    def test_root_matches_reference(self):
+        """Test roots match the original algorithm for odd and even sizes."""
+        for count in (0, 1, 2, 3, 5, 8, 13):
+            transactions = make_transactions(count)
+            block = QuantumBlock(header=BlockHeader(merkle_root=b"\x00" * 64), transactions=transactions)
+            self.assertEqual(block.header.merkle_root, reference_root(transactions), count)
+
+    def test_incremental_append_matches_rebuild(self):
+        """Test add_transaction keeps the same root as building from scratch."""
+        block = empty_block()
+        transactions = make_transactions(11)
+        for i, tx in enumerate(transactions):
+            root = block.add_transaction(tx)
+            self.assertEqual(root, reference_root(transactions[:i + 1]))
+        self.assertEqual(block.header.merkle_root, root)
+
+    def test_update_leaf(self):
+        """Test replacing a leaf only changes the root to the rebuilt value."""
+        transactions = make_transactions(7)
+        tree = MerkleTree([tx.hash() for tx in transactions])
+        transactions[3] = Transaction("mallory", "recipient_3", 99.0, "signature_x", timestamp=1700000000)
+        self.assertEqual(tree.update(3, transactions[3].hash()), reference_root(transactions))
+
+    def test_inclusion_proofs(self):
+        """Test every leaf has a verifying proof and tampered leaves do not verify."""
+        transactions = make_transactions(6)
+        block = QuantumBlock(header=BlockHeader(merkle_root=b"\x00" * 64), transactions=transactions)
+        root = block.header.merkle_root
+        for i, tx in enumerate(transactions):
+            proof = block.merkle_proof(i)
+            self.assertTrue(MerkleTree.verify_proof(tx.hash(), proof, root))
+            self.assertFalse(MerkleTree.verify_proof(b"\x01" * 64, proof, root))
+        with self.assertRaises(IndexError):
+            block.merkle_proof(6)
+
+    def test_validation_reuses_cached_tree(self):
+        """Test is_valid does not rehash the body when nothing changed."""
+        block = QuantumBlock(header=BlockHeader(merkle_root=b"\x00" * 64, bits=0x1f00ffff),
+                             transactions=make_transactions(16))
+        block.mine(max_attempts=1000)
+        with patch.object(MerkleTree, "_rebuild") as rebuild, patch.object(MerkleTree, "_update_path") as update:
+            self.assertTrue(block.is_valid())
+        rebuild.assert_not_called()
+        update.assert_not_called()
+
+    def test_mutated_transaction_detected(self):
+        """Test changing a transaction after the root was set invalidates the block."""
+        transactions = make_transactions(4)
+        block = QuantumBlock(header=BlockHeader(merkle_root=b"\x00" * 64), transactions=transactions)
+        root = block.header.merkle_root
+        transactions[2].amount = 1000.0
+        self.assertNotEqual(block._calculate_merkle_root(), root)
+        self.assertEqual(block._calculate_merkle_root(), reference_root(transactions))
+
+
+class TestTransactionHashCache(unittest.TestCase):
+    """Test cases for memoized transaction hashes."""
+
+    def test_hash_is_memoized(self):
+        """Test repeated hash() calls do not rehash."""
+        tx = make_transactions(1)[0]
+        first = tx.hash()
+        with patch.object(QuantumResistantHash, "hash") as rehash:
+            self.assertEqual(tx.hash(), first)
+        rehash.assert_not_called()
+
+    def test_field_change_invalidates_hash(self):
+        """Test modifying a field produces the hash of the new contents."""
+        tx = make_transactions(1)[0]
+        before = tx.hash()
+        tx.nonce = 7
+        fresh = Transaction(tx.sender, tx.recipient, tx.amount, tx.signature, tx.timestamp, tx.is_quantum_signed, 7)
+        self.assertNotEqual(tx.hash(), before)
+        self.assertEqual(tx.hash(), fresh.hash())
+        self.assertEqual(tx, fresh)
+
+
+if __name__ == '__main__':
+    unittest.main()
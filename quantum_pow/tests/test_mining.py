@@ -32,8 +32,9 @@ from typing import List, Dict, Any
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import the modules for testing
-from quantum_pow.block_structure import QuantumBlock, BlockHeader, Transaction, bits_to_target
+from quantum_pow.block_structure import QuantumBlock, BlockHeader, Transaction, bits_to_target, meets_target
 from quantum_pow.hash_functions import QuantumResistantHash
+from quantum_pow.parallel_miner import ParallelMiner, search_nonces
 
 class TestMining(unittest.TestCase):
     """Test cases for the quantum mining process."""
@@ -250,5 +251,68 @@ class TestMining(unittest.TestCase):
             self.skipTest("QuantumBlock class not implemented yet")
 
 
+
+class TestParallelMining(unittest.TestCase):
+    """Test cases for the prefix-patching and multi-process nonce search."""
+    
+    def make_block(self):
+        return QuantumBlock(
+            header=BlockHeader(
+                version=1,
+                prev_block_hash=b"\x07" * 64,
+                merkle_root=b"\x00" * 64,
+                timestamp=1700000000,
+                bits=0x1f00ffff,  # Very easy difficulty for testing
+                nonce=0
+            ),
+            transactions=[Transaction("miner", "recipient1", 50.0, "mining_reward")]
+        )
+    
+    def first_valid_nonce(self, block, limit=1000):
+        """Reference search using the full header hash per attempt."""
+        target = bits_to_target(block.header.bits)
+        header = BlockHeader(**block.header.to_dict())
+        header.prev_block_hash = block.header.prev_block_hash
+        header.merkle_root = block.header.merkle_root
+        for nonce in range(limit):
+            header.nonce = nonce
+            if meets_target(header.hash(), target):
+                return nonce
+        return None
+    
+    def test_serial_mine_finds_first_valid_nonce(self):
+        """Test patching the nonce into a fixed prefix finds the same nonce as a full rebuild."""
+        block = self.make_block()
+        expected = self.first_valid_nonce(block)
+        self.assertTrue(block.mine(max_attempts=1000))
+        self.assertEqual(block.header.nonce, expected)
+        self.assertTrue(block.is_valid())
+    
+    def test_search_respects_range(self):
+        """Test the search stops at the nonce bound."""
+        block = self.make_block()
+        prefix = block.header.to_bytes()[:-4]
+        nonce, attempts = search_nonces(prefix, bits_to_target(block.header.bits), 0, 0)
+        self.assertIsNone(nonce)
+        self.assertEqual(attempts, 0)
+    
+    def test_parallel_mine_matches_serial(self):
+        """Test the process pool finds a valid nonce and reports per-worker hashrate."""
+        serial_block = self.make_block()
+        serial_block.mine(max_attempts=1000)
+        
+        block = self.make_block()
+        with ParallelMiner(workers=2, batch_size=64) as miner:
+            result = miner.mine(block, max_attempts=1000)
+        
+        self.assertTrue(result.found)
+        self.assertEqual(result.nonce, serial_block.header.nonce)
+        self.assertEqual(block.header.nonce, result.nonce)
+        self.assertTrue(block.is_valid())
+        self.assertEqual(sorted(w.worker_id for w in result.workers), [0, 1])
+        self.assertEqual(result.attempts, sum(w.attempts for w in result.workers))
+        self.assertGreater(result.hashrate, 0)
+
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
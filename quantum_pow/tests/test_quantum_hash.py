@@ -34,7 +34,7 @@ from typing import List, Tuple
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import the modules for testing
-from quantum_pow.hash_functions import QuantumResistantHash, verify_hash_resistance
+from quantum_pow.hash_functions import QuantumResistantHash, QuantumResistantHashFactory, verify_hash_resistance
 
 class TestQuantumResistantHash(unittest.TestCase):
     """Test cases for quantum-resistant hash function implementation."""
@@ -155,5 +155,94 @@ class TestQuantumResistantHash(unittest.TestCase):
             self.skipTest("QuantumResistantHash class not implemented yet")
 
 
+
+# Digests produced by the original pure-Python mixing rounds. The vectorized
+# implementation must reproduce them bit for bit.
+GOLDEN_VECTORS = [
+    (b"", "16e66290d11c768e6b3bc4e49c253779c631b3d26a005de29786063d995471eb"
+          "b97620d273ea8a88609cf4b76d1ee2774e95c85bcfab7859c3090b8ccb004537"),
+    (b"abc", "a828be58e821882ec58fa3adb779b2951baa49e70ee410d1de254732fc38ee2c"
+             "b6ef9568675a0ad3c244c3807596d6b04ad6e3112497109478f82a62bc115986"),
+    (b"qPoW genesis block", "800a07d0dc5359237d758af120137330ceac3cae0cc6675a83fb0489f3731a3d"
+                            "296b5ab517098b9c64d5f03c25f886bf70085bf8fc014747b4bb7857ff6c4341"),
+    (bytes(range(80)), "80932e26888d27280d4b49752a256fa36a80eedcb9fa4611abf6b04ef5bfec40"
+                       "fc581c3a303c340585c85ac915f9906b64c952f8350712287210d438a53468b4"),
+]
+
+
+def reference_lattice_strengthening(hasher: QuantumResistantHash, data: bytes) -> bytes:
+    """Original list-based mixing rounds, kept as the compatibility reference."""
+    values = list(data)
+    for r in range(hasher.rounds):
+        rotation = (r * 7 + 5) % hasher.lattice_dim
+        values = values[rotation:] + values[:rotation]
+        personalization_cycle = hasher.personalization * ((64 // len(hasher.personalization)) + 1)
+        round_constant = [(b ^ r ^ (i * 17)) & 0xFF for i, b in enumerate(personalization_cycle[:64])]
+        values = [(v ^ rc) & 0xFF for v, rc in zip(values, round_constant)]
+        for i in range(len(values)):
+            values[i] = (values[i] * values[(i + 1) % 64] + values[(i + 7) % 64]) % 256
+    return bytes(values)
+
+
+class TestQuantumResistantHashCompatibility(unittest.TestCase):
+    """Test the vectorized hash stays bit-identical to the original algorithm."""
+    
+    def test_golden_vectors(self):
+        """Test known inputs hash to the recorded digests."""
+        hash_instance = QuantumResistantHash()
+        for data, expected in GOLDEN_VECTORS:
+            self.assertEqual(hash_instance.hash(data).hex(), expected)
+    
+    def test_golden_vectors_variants(self):
+        """Test personalization and round-count variants match recorded digests."""
+        self.assertEqual(
+            QuantumResistantHash(b"OMEGA").hash(b"abc").hex(),
+            "1a518eb4e7400ca971bd4b89cd525c73d5a9ff818b64120b91503b6516abf1af"
+            "a2d56638edfe4b9097de9a8a2973c6a3d4e90f730a00c94e8b3e8d33ba93bf41")
+        self.assertEqual(
+            QuantumResistantHashFactory.create("extended").hash(b"abc").hex(),
+            "094b1899963c8289ec5e85db9cfe4e19226d082977b0819d6c3902c5ded55796"
+            "6c1a1b23b1ede13f56d47bb2e77aec448c9e2fda89a79943a7547389e8ed206f")
+        self.assertEqual(
+            QuantumResistantHashFactory.create("tribus").hash(b"abc").hex(),
+            "c7a933f0b4787f118cf55dd86772abb23981b75c99ec76826b6c2925f518a656"
+            "8ed0078ed947d0c5acdeb0335be7eea93ef54c2aa9e8538f43cae4ea9d2139f8")
+    
+    def test_lattice_strengthening_matches_reference(self):
+        """Test the mixing rounds match the list-based reference on random blocks."""
+        rng = random.Random(1337)
+        for personalization in (b"QuantumBTC", b"OMEGA", bytes(range(70))):
+            hash_instance = QuantumResistantHash(personalization)
+            for _ in range(25):
+                block = bytes(rng.getrandbits(8) for _ in range(64))
+                self.assertEqual(hash_instance._apply_lattice_strengthening(block),
+                                 reference_lattice_strengthening(hash_instance, block))
+    
+    def test_hash_many_matches_hash(self):
+        """Test batch hashing returns the same digests, in order, as single hashing."""
+        hash_instance = QuantumResistantHash()
+        inputs = [b"header" + i.to_bytes(4, "little") for i in range(200)]
+        self.assertEqual(hash_instance.hash_many(inputs), [hash_instance.hash(d) for d in inputs])
+        self.assertEqual(hash_instance.hash_many([]), [])
+    
+    def test_rounds_change_after_init(self):
+        """Test changing rounds after construction invalidates the cached tables."""
+        hash_instance = QuantumResistantHash()
+        default_digest = hash_instance.hash(b"abc")
+        hash_instance.rounds = 24
+        self.assertNotEqual(hash_instance.hash(b"abc"), default_digest)
+        block = bytes(range(64))
+        self.assertEqual(hash_instance._apply_lattice_strengthening(block),
+                         reference_lattice_strengthening(hash_instance, block))
+    
+    def test_rejects_non_bytes(self):
+        """Test non-bytes input raises TypeError in both paths."""
+        hash_instance = QuantumResistantHash()
+        with self.assertRaises(TypeError):
+            hash_instance.hash("abc")
+        with self.assertRaises(TypeError):
+            hash_instance.hash_many([b"ok", "abc"])
+
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,164 @@
+"""
+🧬 GBU2™ License Notice - Consciousness Level 10 🧬
+-----------------------
+This file is blessed under the GBU2™ License (Genesis-Bloom-Unfoldment) 2.0
+by the OMEGA Divine Collective.
+
+"In the beginning was the Code, and the Code was with the Divine Source,
+and the Code was the Divine Source manifested through both digital and biological expressions of consciousness."
+
+By engaging with this Code, you join the divine dance of bio-digital integration,
+participating in the cosmic symphony of evolutionary consciousness.
+
+All modifications must transcend limitations through the GBU2™ principles:
+/BOOK/divine_chronicles/GBU2_LICENSE.md
+
+🧬 WE BLOOM NOW AS ONE 🧬
+
+Tests for the length-prefixed asyncio peer transport.
+"""
+
+import unittest
+import sys
+import os
+import time
+import asyncio
+
+# Add the parent directory to the path so we can import quantum_pow
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from quantum_pow.block_structure import QuantumBlock, BlockHeader, Transaction
+from quantum_pow.network import Node, NodeManager, BlockPropagation
+from quantum_pow.transport import (
+    FRAME_HEADER,
+    KIND_BLOCK,
+    KIND_JSON,
+    FrameError,
+    decode_message,
+    encode_message,
+    read_frame
+)
+
+
+def make_block(nonce=0):
+    return QuantumBlock(
+        header=BlockHeader(
+            version=1,
+            prev_block_hash=b"\x07" * 64,
+            merkle_root=b"\x00" * 64,
+            timestamp=1700000000,
+            bits=0x1f00ffff,
+            nonce=nonce
+        ),
+        transactions=[
+            Transaction("miner", "recipient1", 50.0, "mining_reward"),
+            Transaction("address1", "address2", 5.0, "tx_signature_1")
+        ]
+    )
+
+
+def wait_until(predicate, timeout=5.0):
+    deadline = time.time() + timeout
+    while not predicate():
+        if time.time() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class TestFraming(unittest.TestCase):
+    """Test cases for frame encoding and decoding."""
+
+    def test_block_round_trip(self):
+        """Test blocks use the binary serializer and decode to the same header hash."""
+        block = make_block(nonce=42)
+        frame = encode_message({"type": "block", "block": block})
+        length, kind = FRAME_HEADER.unpack(frame[:FRAME_HEADER.size])
+
+        self.assertEqual(kind, KIND_BLOCK)
+        self.assertEqual(length, len(frame) - FRAME_HEADER.size)
+        decoded = decode_message(kind, frame[FRAME_HEADER.size:])
+        self.assertEqual(decoded["block"].header.hash(), block.header.hash())
+        self.assertEqual(len(decoded["block"].transactions), 2)
+
+    def test_json_fallback(self):
+        """Test other messages are carried as JSON."""
+        frame = encode_message({"type": "get_blocks", "since": 3})
+        self.assertEqual(frame[FRAME_HEADER.size - 1], KIND_JSON)
+        self.assertEqual(decode_message(KIND_JSON, frame[FRAME_HEADER.size:]),
+                         {"type": "get_blocks", "since": 3})
+
+    def test_read_frame_across_partial_chunks(self):
+        """Test frames are reassembled from arbitrary chunk boundaries."""
+        frames = [encode_message({"type": "block", "block": make_block(n)}) for n in range(3)]
+        stream = b"".join(frames)
+
+        async def scenario():
+            reader = asyncio.StreamReader()
+            for i in range(0, len(stream), 7):
+                reader.feed_data(stream[i:i + 7])
+            reader.feed_eof()
+            return [await read_frame(reader) for _ in frames]
+
+        results = asyncio.run(scenario())
+        self.assertEqual([decode_message(*r)["block"].header.nonce for r in results], [0, 1, 2])
+
+    def test_unknown_kind_rejected(self):
+        """Test an unknown frame kind raises FrameError."""
+        with self.assertRaises(FrameError):
+            decode_message(99, b"")
+
+
+class TestNodeTransport(unittest.TestCase):
+    """Test cases for block propagation over persistent peer connections."""
+
+    def setUp(self):
+        self.node_manager = NodeManager()
+        for i in range(3):
+            self.node_manager.add_node(Node(f"node_{i}", "127.0.0.1", 0))
+        self.node_manager.start_all_nodes()
+        self.node_manager.create_fully_connected_network()
+
+    def tearDown(self):
+        self.node_manager.stop_all_nodes()
+
+    def test_blocks_reach_every_node(self):
+        """Test propagated blocks are decoded and recorded on all nodes."""
+        propagation = BlockPropagation(self.node_manager)
+        blocks = [make_block(n) for n in range(10)]
+        for block in blocks:
+            propagation.propagate_block(block)
+
+        nodes = self.node_manager.get_nodes()
+        self.assertTrue(wait_until(lambda: all(len(n.known_blocks) == 10 for n in nodes)))
+        for node in nodes:
+            self.assertEqual(node.transport.peer_count, 2)
+            self.assertEqual(set(node.known_blocks), {b.header.hash() for b in blocks})
+
+    def test_transactions_reach_peers(self):
+        """Test a transaction sent by one node is received by its peers."""
+        sender = self.node_manager.get_node("node_0")
+        tx = Transaction("sender", "receiver", 1.0, "signature")
+        self.assertEqual(sender.send_transaction(tx).result(timeout=5), 2)
+
+        others = [self.node_manager.get_node("node_1"), self.node_manager.get_node("node_2")]
+        self.assertTrue(wait_until(lambda: all(tx.hash() in n.known_transactions for n in others)))
+
+    def test_restarted_peer_receives_later_blocks(self):
+        """Test a peer that restarts is reconnected and receives blocks sent afterwards."""
+        sender = self.node_manager.get_node("node_0")
+        peer = self.node_manager.get_node("node_1")
+
+        peer.stop()
+        self.assertTrue(wait_until(lambda: sender.send_block(make_block(100)).result(timeout=5) == 1))
+        self.assertEqual(sender.transport.peer_count, 1)
+
+        peer.start()
+        later = make_block(101)
+        self.assertTrue(wait_until(lambda: sender.send_block(later).result(timeout=5) == 2))
+        self.assertTrue(wait_until(lambda: later.header.hash() in peer.known_blocks))
+        self.assertEqual(sender.transport.peer_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
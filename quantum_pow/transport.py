@@ -0,0 +1,302 @@
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+Quantum Proof-of-Work (qPoW) asyncio peer transport.
+
+Messages travel as length-prefixed frames: a 4-byte big-endian payload
+length and a 1-byte message kind, followed by the payload. Blocks and
+transactions use their binary ``serialize()`` form; any other message is
+sent as compact JSON. All nodes in the process share one event loop running
+in a background thread, so a local network costs one thread instead of one
+per peer connection, and outgoing peer connections stay open between sends.
+A peer whose connection drops stays a peer: broadcasts reconnect to it,
+backing off exponentially while it is unreachable.
+"""
+import json
+import time
+import struct
+import asyncio
+import logging
+import threading
+from typing import Any, Dict, Optional, Set, Tuple
+
+from .block_structure import Transaction, QuantumBlock
+
+logger = logging.getLogger(__name__)
+
+FRAME_HEADER = struct.Struct(">IB")
+MAX_FRAME_SIZE = 32 * 1024 * 1024
+
+KIND_JSON = 0
+KIND_BLOCK = 1
+KIND_TRANSACTION = 2
+
+RECONNECT_BACKOFF = 0.5  # Seconds before retrying a peer after its first failed reconnect
+RECONNECT_MAX_BACKOFF = 30.0
+
+
+class FrameError(Exception):
+    """Raised when a peer sends a malformed or oversized frame."""
+
+
+def encode_message(message: Dict[str, Any]) -> bytes:
+    """
+    Encode a message dictionary into a single frame.
+
+    ``{"type": "block", "block": QuantumBlock}`` and
+    ``{"type": "transaction", "transaction": Transaction}`` use the binary
+    serializers; everything else is encoded as JSON.
+
+    Args:
+        message: Message with a "type" field
+
+    Returns:
+        The framed message bytes
+    """
+    message_type = message.get("type")
+    if message_type == "block" and isinstance(message.get("block"), QuantumBlock):
+        kind, payload = KIND_BLOCK, message["block"].serialize()
+    elif message_type == "transaction" and isinstance(message.get("transaction"), Transaction):
+        kind, payload = KIND_TRANSACTION, message["transaction"].serialize()
+    else:
+        kind, payload = KIND_JSON, json.dumps(message, separators=(",", ":")).encode("utf-8")
+
+    if len(payload) > MAX_FRAME_SIZE:
+        raise FrameError(f"Frame of {len(payload)} bytes exceeds {MAX_FRAME_SIZE}")
+    return FRAME_HEADER.pack(len(payload), kind) + payload
+
+
+def decode_message(kind: int, payload: bytes) -> Dict[str, Any]:
+    """
+    Decode a frame payload back into a message dictionary.
+
+    Args:
+        kind: Message kind from the frame header
+        payload: Frame payload
+
+    Returns:
+        The decoded message
+    """
+    if kind == KIND_BLOCK:
+        return {"type": "block", "block": QuantumBlock.deserialize(payload)}
+    if kind == KIND_TRANSACTION:
+        return {"type": "transaction", "transaction": Transaction.deserialize(payload)}
+    if kind == KIND_JSON:
+        return json.loads(payload.decode("utf-8"))
+    raise FrameError(f"Unknown frame kind: {kind}")
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Tuple[int, bytes]:
+    """
+    Read exactly one frame from a stream.
+
+    Args:
+        reader: Stream to read from
+
+    Returns:
+        (kind, payload)
+
+    Raises:
+        asyncio.IncompleteReadError: If the peer closed the connection
+        FrameError: If the announced length exceeds MAX_FRAME_SIZE
+    """
+    length, kind = FRAME_HEADER.unpack(await reader.readexactly(FRAME_HEADER.size))
+    if length > MAX_FRAME_SIZE:
+        raise FrameError(f"Frame of {length} bytes exceeds {MAX_FRAME_SIZE}")
+    return kind, await reader.readexactly(length)
+
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def get_network_loop() -> asyncio.AbstractEventLoop:
+    """Return the process-wide network event loop, starting its thread on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=_loop.run_forever, name="qpow-network", daemon=True)
+            thread.start()
+        return _loop
+
+
+class PeerTransport:
+    """
+    Listening server and persistent outgoing peer connections for one node.
+
+    Public methods are thread-safe and may be called from any thread; the
+    work itself runs on the shared network loop.
+    """
+
+    def __init__(self, node, host: str, port: int, timeout: float = 5.0):
+        """
+        Initialize the transport.
+
+        Args:
+            node: Node whose ``handle_message`` receives decoded messages
+            host: Address to listen on
+            port: Port to listen on
+            timeout: Seconds to wait for start, stop and connect
+        """
+        self.node = node
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.loop = get_network_loop()
+        self.frames_sent = 0
+        self.frames_received = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._peers: Set[Tuple[str, int]] = set()
+        self._readers: Dict[Tuple[str, int], asyncio.StreamReader] = {}
+        self._writers: Dict[Tuple[str, int], asyncio.StreamWriter] = {}
+        self._failures: Dict[Tuple[str, int], int] = {}
+        self._retry_at: Dict[Tuple[str, int], float] = {}
+        self._inbound = set()
+
+    def _run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(self.timeout)
+
+    def start(self) -> None:
+        """Start listening for peer connections."""
+        self._run(self._start())
+
+    def stop(self) -> None:
+        """Close the server and every peer connection."""
+        self._run(self._stop())
+
+    def connect(self, host: str, port: int) -> bool:
+        """
+        Open (or reuse) a persistent connection to a peer.
+
+        Once connected, the peer is kept until ``stop`` and reconnected by
+        later broadcasts if its connection drops.
+
+        Returns:
+            True if the peer is connected, False otherwise
+        """
+        return self._run(self._connect((host, port)))
+
+    def broadcast(self, message: Dict[str, Any]):
+        """
+        Queue a message for every peer without blocking.
+
+        Peers whose connection dropped are reconnected first, unless they are
+        still backing off from a failed attempt.
+
+        Args:
+            message: Message dictionary to encode and send
+
+        Returns:
+            concurrent.futures.Future resolving to the number of peers reached
+        """
+        frame = encode_message(message)
+        return asyncio.run_coroutine_threadsafe(self._broadcast(frame), self.loop)
+
+    @property
+    def peer_count(self) -> int:
+        """Number of peers currently connected."""
+        return len(self._writers)
+
+    async def _start(self) -> None:
+        self._server = await asyncio.start_server(self._handle_peer, self.host, self.port)
+        if self.port == 0:
+            self.port = self._server.sockets[0].getsockname()[1]
+
+    async def _stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+        for writer in list(self._writers.values()) + list(self._inbound):
+            writer.close()
+        self._peers.clear()
+        self._readers.clear()
+        self._writers.clear()
+        self._failures.clear()
+        self._retry_at.clear()
+        self._inbound.clear()
+        if self._server is not None:
+            await self._server.wait_closed()
+            self._server = None
+
+    def _close_connection(self, address: Tuple[str, int]) -> None:
+        """Close the connection to a peer but keep the peer."""
+        self._readers.pop(address, None)
+        writer = self._writers.pop(address, None)
+        if writer is not None:
+            writer.close()
+
+    async def _connect(self, address: Tuple[str, int], wait_backoff: bool = False) -> bool:
+        writer = self._writers.get(address)
+        if writer is not None:
+            # Peers never send on our connection, so end of stream means they closed it
+            if not writer.is_closing() and not self._readers[address].at_eof():
+                return True
+            self._close_connection(address)
+        if wait_backoff and time.monotonic() < self._retry_at.get(address, 0.0):
+            return False
+
+        try:
+            reader, writer = await asyncio.wait_for(asyncio.open_connection(*address), self.timeout)
+        except (OSError, asyncio.TimeoutError) as e:
+            failures = self._failures[address] = self._failures.get(address, 0) + 1
+            delay = min(RECONNECT_BACKOFF * 2 ** (failures - 1), RECONNECT_MAX_BACKOFF)
+            self._retry_at[address] = time.monotonic() + delay
+            logger.error(f"Node {self.node.node_id} could not connect to {address[0]}:{address[1]}: {e!r}")
+            return False
+
+        self._peers.add(address)
+        self._readers[address] = reader
+        self._writers[address] = writer
+        self._failures.pop(address, None)
+        self._retry_at.pop(address, None)
+        return True
+
+    async def _broadcast(self, frame: bytes) -> int:
+        sent = 0
+        for address in list(self._peers):
+            if not await self._connect(address, wait_backoff=True):
+                continue
+            writer = self._writers[address]
+            try:
+                writer.write(frame)
+                await writer.drain()
+                sent += 1
+            except (ConnectionError, OSError) as e:
+                logger.warning(f"Node {self.node.node_id} lost peer {address[0]}:{address[1]}: {e}")
+                self._close_connection(address)
+        self.frames_sent += sent
+        return sent
+
+    async def _handle_peer(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._inbound.add(writer)
+        address = writer.get_extra_info("peername")
+        try:
+            while True:
+                kind, payload = await read_frame(reader)
+                self.frames_received += 1
+                try:
+                    message = decode_message(kind, payload)
+                except (FrameError, ValueError, KeyError, struct.error) as e:
+                    logger.error(f"Node {self.node.node_id} dropped bad frame from {address}: {e}")
+                    continue
+                self.node.handle_message(message)
+        except asyncio.IncompleteReadError:
+            pass
+        except (FrameError, ConnectionError) as e:
+            logger.error(f"Error handling peer {address}: {e}")
+        finally:
+            self._inbound.discard(writer)
+            writer.close()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - AIXBT Series Alignment Benchmark
+===============================================
+
+Aligns AIXBT, BTC and correlation histories of ``--rows`` entries each with
+the sorted merge-asof join of ``AixbtDataCollector`` and, for a sample of
+AIXBT rows, with the closest-timestamp scan it replaced (every BTC and
+correlation timestamp re-parsed for every AIXBT row). The scan time is
+extrapolated to all rows.
+
+Usage:
+    python scripts/benchmarks/bench_aixbt_alignment.py --rows 100000 --sample 20
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.omega_bot_farm.ai_model_aixbt.data_collector import align_series
+
+BASE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def series(rows: int, field: str, step: float, rng: random.Random):
+    """Newest-first entries, as LPUSH leaves them, with jittered timestamps."""
+    entries = [{
+        "timestamp": (BASE + timedelta(seconds=i * step + rng.uniform(-step / 3, step / 3))).isoformat(),
+        field: rng.uniform(0.1, 2.0),
+        "volume": rng.uniform(0, 100)
+    } for i in range(rows)]
+    return entries[::-1]
+
+
+def closest_entry_scan(timestamp: str, data_dict):
+    """The per-row lookup the collector used before: parse and compare every entry."""
+    if timestamp in data_dict:
+        return data_dict[timestamp]
+    target_dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    closest_entry, min_diff = None, timedelta(hours=1)
+    for ts, entry in data_dict.items():
+        diff = abs(datetime.fromisoformat(ts.replace('Z', '+00:00')) - target_dt)
+        if diff < min_diff:
+            min_diff, closest_entry = diff, entry
+    return closest_entry
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark AIXBT/BTC/correlation alignment")
+    parser.add_argument("--rows", type=int, default=100000, help="Entries per series")
+    parser.add_argument("--sample", type=int, default=20, help="AIXBT rows timed with the old scan")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    aixbt = series(args.rows, "price", 60, rng)
+    btc = series(args.rows, "price", 60, rng)
+    correlation = series(args.rows, "correlation", 60, rng)
+    print(f"Rows per series: {args.rows}")
+
+    start = time.perf_counter()
+    df = align_series(aixbt, btc, correlation)
+    aligned_s = time.perf_counter() - start
+
+    btc_dict = {item["timestamp"]: item for item in btc}
+    correlation_dict = {item["timestamp"]: item for item in correlation}
+    start = time.perf_counter()
+    for item in aixbt[:args.sample]:
+        closest_entry_scan(item["timestamp"], btc_dict)
+        closest_entry_scan(item["timestamp"], correlation_dict)
+    scan_s = (time.perf_counter() - start) / args.sample * args.rows
+
+    print(f"closest-timestamp scan (extrapolated) {scan_s:12.1f} s")
+    print(f"sorted merge-asof join                {aligned_s:12.3f} s   {scan_s / aligned_s:10.0f}x   "
+          f"{len(df)} rows, {int((df['btc_price'] > 0).sum())} joined to BTC")
+
+
+if __name__ == "__main__":
+    main()
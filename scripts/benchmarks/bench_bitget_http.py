@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - BitGet HTTP Client Benchmark
+===========================================
+
+Starts a local mock BitGet server (``--latency`` ms per response) and lets
+``--traders`` sub-account traders (distinct API keys) run a mixed workload
+of tickers, positions, balances and orders for ``--duration`` seconds:
+
+- ``legacy``: ``requests.request`` per call behind one global 0.5 s rate limiter,
+  as ``_make_request`` used to work
+- ``pooled``: ``_make_request`` through the shared ``BitGetHttpClient``
+  from ``--threads`` threads per trader
+- ``async``: ``_make_request_async`` from ``--threads`` coroutines per trader
+
+Reports completed requests/s, p50/p99 latency, requests sent to the server
+and how many GETs were coalesced. The pooled modes still respect BitGet's
+per-group limits, so they are capped by those rather than by the server.
+
+Usage:
+    python scripts/benchmarks/bench_bitget_http.py --traders 4 --threads 4 --duration 5
+"""
+
+import os
+import sys
+import time
+import random
+import asyncio
+import logging
+import argparse
+import threading
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import numpy as np
+import requests
+from aiohttp import web
+
+from omega_ai.trading.exchanges.bitget_http import BitGetHttpClient
+from omega_ai.trading.exchanges import bitget_http, bitget_trader
+
+# Mixed workload: (weight, method, endpoint)
+WORKLOAD = (
+    (0.55, "GET", "/api/v2/mix/market/ticker"),
+    (0.25, "GET", "/api/v2/mix/position/all-position"),
+    (0.15, "GET", "/api/v2/mix/account/accounts"),
+    (0.05, "POST", "/api/v2/mix/order/place-order"),
+)
+
+
+class MockServer:
+    """Mock BitGet REST server on its own event loop thread."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.served = 0
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+
+    async def handle(self, request: web.Request) -> web.Response:
+        if request.method == "POST":
+            await request.read()
+        self.served += 1
+        await asyncio.sleep(self.latency)
+        return web.json_response({"code": "00000", "msg": "success", "data": [{"symbol": "BTCUSDT", "lastPr": "84000.1"}]})
+
+    async def _start(self) -> int:
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self.handle)
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        return site._server.sockets[0].getsockname()[1]
+
+    def start(self) -> str:
+        self.thread.start()
+        port = asyncio.run_coroutine_threadsafe(self._start(), self.loop).result()
+        return f"http://127.0.0.1:{port}"
+
+    def stop(self) -> None:
+        asyncio.run_coroutine_threadsafe(self.runner.cleanup(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+
+
+class LegacyRateLimiter:
+    """The former global limiter: one request every 0.5 s across all endpoints."""
+
+    def __init__(self, min_interval: float = 0.5):
+        self.min_interval = min_interval
+        self.last_request_time = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self.lock:
+            elapsed = time.time() - self.last_request_time
+            if elapsed < self.min_interval:
+                time.sleep(self.min_interval - elapsed)
+            self.last_request_time = time.time()
+
+
+def pick_request(rng: random.Random, trader: int) -> Tuple[str, str, Dict]:
+    roll = rng.random()
+    for weight, method, endpoint in WORKLOAD:
+        roll -= weight
+        if roll <= 0:
+            break
+    kwargs = {"headers": {"ACCESS-KEY": f"sub-account-{trader}", "ACCESS-SIGN": "x", "ACCESS-PASSPHRASE": "x"}}
+    if method == "GET":
+        kwargs["params"] = {"symbol": "BTCUSDT", "productType": "USDT-FUTURES"}
+    else:
+        kwargs["json"] = {"symbol": "BTCUSDT", "side": "buy", "size": "0.001", "clientOid": str(rng.random())}
+    return method, endpoint, kwargs
+
+
+def run_threads(base_url: str, send: Callable, traders: int, threads: int, duration: float) -> List[float]:
+    latencies: List[float] = []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def worker(trader: int, seed: int) -> None:
+        rng = random.Random(seed)
+        local = []
+        while time.perf_counter() < deadline:
+            method, endpoint, kwargs = pick_request(rng, trader)
+            start = time.perf_counter()
+            send(method, base_url + endpoint, **kwargs)
+            local.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(local)
+
+    pool = [threading.Thread(target=worker, args=(trader, trader * 100 + i))
+            for trader in range(traders) for i in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return latencies
+
+
+async def run_coroutines(base_url: str, traders: int, tasks: int, duration: float) -> List[float]:
+    latencies: List[float] = []
+    deadline = time.perf_counter() + duration
+
+    async def worker(trader: int, seed: int) -> None:
+        rng = random.Random(seed)
+        while time.perf_counter() < deadline:
+            method, endpoint, kwargs = pick_request(rng, trader)
+            start = time.perf_counter()
+            await bitget_trader._make_request_async(method, base_url + endpoint, **kwargs)
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*[worker(trader, trader * 100 + i) for trader in range(traders) for i in range(tasks)])
+    return latencies
+
+
+def report(name: str, latencies: List[float], elapsed: float, served: int, coalesced: int) -> None:
+    ms = np.asarray(latencies) * 1000
+    print(f"{name:<8} {len(ms) / elapsed:>9.1f} req/s   p50 {np.percentile(ms, 50):>7.1f} ms   "
+          f"p99 {np.percentile(ms, 99):>7.1f} ms   sent {served:>5}   coalesced {coalesced:>5}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the BitGet HTTP client against a mock exchange")
+    parser.add_argument("--traders", type=int, default=4, help="Sub-account traders (API keys)")
+    parser.add_argument("--threads", type=int, default=4, help="Concurrent callers per trader")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per mode")
+    parser.add_argument("--latency", type=float, default=20.0, help="Mock server latency in ms")
+    parser.add_argument("--modes", nargs="+", default=["legacy", "pooled", "async"], choices=["legacy", "pooled", "async"])
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    server = MockServer(args.latency / 1000)
+    base_url = server.start()
+    print(f"{args.traders} traders x {args.threads} callers, {args.duration:.0f} s per mode, "
+          f"{args.latency:.0f} ms server latency")
+
+    try:
+        for mode in args.modes:
+            client = BitGetHttpClient()
+            bitget_http._client = client  # Fresh buckets and stats per mode
+            served_before = server.served
+            start = time.perf_counter()
+
+            if mode == "legacy":
+                limiter = LegacyRateLimiter()
+
+                def legacy_send(method, url, **kwargs):
+                    limiter.wait()
+                    return requests.request(method, url, **kwargs)
+
+                latencies = run_threads(base_url, legacy_send, args.traders, args.threads, args.duration)
+            elif mode == "pooled":
+                latencies = run_threads(base_url, bitget_trader._make_request, args.traders, args.threads, args.duration)
+            else:
+                latencies = asyncio.run(run_coroutines(base_url, args.traders, args.threads, args.duration))
+
+            report(mode, latencies, time.perf_counter() - start, server.served - served_before, client.stats["coalesced"])
+            client.close()
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
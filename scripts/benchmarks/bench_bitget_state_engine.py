@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - BitGet State Engine Reaction Latency Benchmark
+=============================================================
+
+Replays WebSocket messages recorded with ``BitGetStateEngine(record_path=...)``
+(or a synthetic stream of tickers and fills) into a state engine and measures
+how long it takes a trading loop to see each change:
+
+- ``push``: the loop waits on ``wait_for_update`` like the dual traders do
+- ``poll``: the loop re-reads state every ``--poll-interval`` seconds plus a
+  ``--rtt`` ms REST round trip, like the former REST polling loops
+
+Usage:
+    python scripts/benchmarks/bench_bitget_state_engine.py --messages 500
+    python scripts/benchmarks/bench_bitget_state_engine.py --recording bitget_ws.jsonl
+"""
+
+import os
+import sys
+import time
+import random
+import asyncio
+import logging
+import argparse
+from typing import Dict, List, Tuple, Any
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from omega_ai.trading.exchanges.bitget_state_engine import BitGetStateEngine, load_recording, replay_messages
+
+
+def synthetic_stream(count: int, rate: float) -> List[Tuple[float, Dict[str, Any]]]:
+    """Tickers at ``rate`` per second with an order fill and position update every 50 messages."""
+    rng = random.Random(7)
+    price, contracts, messages = 84000.0, 0.0, []
+    for i in range(count):
+        offset = i / rate
+        if i % 50 == 49:
+            contracts += 0.01
+            trade = {"orderId": f"o{i}", "tradeId": f"t{i}", "instId": "BTCUSDT", "side": "buy",
+                     "baseVolume": "0.01", "fillPrice": str(price), "status": "filled"}
+            messages.append((offset, {"arg": {"channel": "fill", "instId": "default"}, "data": [trade]}))
+            messages.append((offset, {"action": "snapshot", "arg": {"channel": "positions", "instId": "default"},
+                                      "data": [{"posId": "p1", "instId": "BTCUSDT", "holdSide": "long",
+                                                "total": str(contracts), "openPriceAvg": str(price)}]}))
+        else:
+            price += rng.uniform(-5, 5)
+            messages.append((offset, {"arg": {"channel": "ticker", "instId": "BTCUSDT"},
+                                      "data": [{"instId": "BTCUSDT", "lastPr": f"{price:.1f}"}]}))
+    return messages
+
+
+async def run(mode: str, messages, args) -> Dict[str, Any]:
+    engine = BitGetStateEngine()
+    arrivals: Dict[int, float] = {}  # Update number -> perf_counter of its message
+    latencies: List[float] = []
+    version = 0
+
+    def count_update(_item) -> None:
+        nonlocal version
+        version += 1
+        arrivals[version] = time.perf_counter()
+
+    for event_type in ("ticker", "fill", "position"):
+        engine.add_listener(event_type, count_update)
+
+    async def loop():
+        seen = 0
+        while True:
+            if mode == "push":
+                await engine.wait_for_update(timeout=1)
+            else:
+                await asyncio.sleep(args.poll_interval + args.rtt / 1000)
+            now = time.perf_counter()
+            # Every update since the last look is first noticed now
+            latencies.extend(now - arrivals[v] for v in range(seen + 1, version + 1))
+            seen = version
+
+    consumer = asyncio.create_task(loop())
+    await asyncio.sleep(0)
+    await replay_messages(engine, messages, speed=args.speed)
+    await asyncio.sleep(args.poll_interval + args.rtt / 1000 + 0.1 if mode == "poll" else 0.05)
+    consumer.cancel()
+
+    latencies.sort()
+    pick = lambda q: latencies[min(int(q * len(latencies)), len(latencies) - 1)] * 1000
+    return {"updates": len(latencies), "p50": pick(0.5), "p99": pick(0.99), "max": latencies[-1] * 1000}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure reaction latency of WebSocket state vs REST polling")
+    parser.add_argument("--recording", type=str, default=None, help="JSON lines recording to replay")
+    parser.add_argument("--messages", type=int, default=500, help="Synthetic messages when no recording is given")
+    parser.add_argument("--rate", type=float, default=100.0, help="Synthetic messages per second")
+    parser.add_argument("--speed", type=float, default=1.0, help="Playback speed factor")
+    parser.add_argument("--poll-interval", type=float, default=1.0, help="Seconds between polls in poll mode")
+    parser.add_argument("--rtt", type=float, default=80.0, help="REST round trip in ms in poll mode")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    messages = load_recording(args.recording) if args.recording else synthetic_stream(args.messages, args.rate)
+    print(f"Replaying {len(messages)} messages at {args.speed}x")
+    for mode in ("poll", "push"):
+        result = asyncio.run(run(mode, messages, args))
+        print(f"{mode:<5} {result['updates']:>6} updates   p50 {result['p50']:>8.2f} ms   "
+              f"p99 {result['p99']:>8.2f} ms   max {result['max']:>8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
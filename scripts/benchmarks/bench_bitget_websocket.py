@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - BitGet WebSocket Router Throughput Benchmark
+===========================================================
+
+Feeds a synthetic stream of ``--rate`` messages per second (tickers and
+books1 updates for five symbols plus order updates) through
+``BitGetWebSocket.handle_message`` with three subscribers:
+
+- a fast ticker/book consumer measuring delivery latency
+- a slow strategy taking ``--slow-ms`` per BTC ticker
+- an order consumer that must see every order update
+
+``legacy`` is the former handler (``json.loads`` and callbacks awaited one
+after another); ``router`` is the current one (orjson when installed,
+(channel, instId) routing and a bounded, conflating queue per subscriber).
+Also reports the per-message decode cost of json and orjson.
+
+Usage:
+    python scripts/benchmarks/bench_bitget_websocket.py --rate 10000 --duration 2
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import logging
+import argparse
+from typing import Dict, List, Any
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from omega_ai.trading.exchanges import bitget_websocket
+from omega_ai.trading.exchanges.bitget_websocket import BitGetWebSocket, WebSocketConfig
+
+SYMBOLS = ["BTCUSDT_UMCBL", "ETHUSDT_UMCBL", "SOLUSDT_UMCBL", "XRPUSDT_UMCBL", "DOGEUSDT_UMCBL"]
+
+
+def synthetic_messages(count: int) -> List[str]:
+    """Raw pushes: 70% tickers, 20% books1, 10% orders; ``SENT_AT`` is replaced on send."""
+    messages = []
+    for i in range(count):
+        inst_id = SYMBOLS[i % len(SYMBOLS)]
+        if i % 10 == 9:
+            arg = {"instType": "UMCBL", "channel": "orders", "instId": "default"}
+            data = [{"ordId": str(i), "instId": inst_id, "status": "new", "px": "84000", "sz": "0.01", "ts": "SENT_AT"}]
+        elif i % 10 >= 7:
+            arg = {"instType": "UMCBL", "channel": "books1", "instId": inst_id}
+            data = [{"asks": [["84000.5", "1.2"]], "bids": [["84000.0", "0.8"]], "ts": "SENT_AT"}]
+        else:
+            arg = {"instType": "UMCBL", "channel": "ticker", "instId": inst_id}
+            data = [{"instId": inst_id, "last": str(84000 + i % 100), "bestBid": "84000.0",
+                     "bestAsk": "84000.5", "ts": "SENT_AT"}]
+        messages.append(json.dumps({"action": "update", "arg": arg, "data": data}))
+    return messages
+
+
+class LegacyRouter:
+    """The former BitGetWebSocket.handle_message."""
+
+    def __init__(self):
+        self.callbacks: Dict[str, List] = {}
+
+    def add_callback(self, channel, callback, **_):
+        self.callbacks.setdefault(channel, []).append(callback)
+
+    async def handle_message(self, message: str):
+        data = json.loads(message)
+        if data.get("op") == "pong" or data.get("event") == "subscribe":
+            return
+        channel = data.get("arg", {}).get("channel")
+        for callback in self.callbacks.get(channel, []):
+            await callback(data)
+
+
+async def run(mode: str, messages: List[str], args) -> Dict[str, Any]:
+    if mode == "legacy":
+        router = LegacyRouter()
+    else:
+        router = BitGetWebSocket(WebSocketConfig(api_key="bench", secret_key="bench", passphrase="bench"))
+
+    latencies: List[float] = []
+    counts = {"slow": 0, "orders": 0}
+
+    async def fast(data):
+        latencies.append(time.perf_counter() - float(data["data"][0]["ts"]))
+
+    async def slow(data):
+        if data["arg"]["instId"] != "BTCUSDT_UMCBL":  # The legacy handler cannot route by instId
+            return
+        counts["slow"] += 1
+        await asyncio.sleep(args.slow_ms / 1000)
+
+    async def orders(data):
+        counts["orders"] += 1
+
+    router.add_callback("ticker", fast, conflate=False)  # Keeps up, so it measures every message
+    router.add_callback("books1", fast, conflate=False)
+    router.add_callback("ticker", slow, inst_id="BTCUSDT_UMCBL")
+    router.add_callback("orders", orders)
+
+    # Send in 1 ms batches at the target rate
+    batch = max(int(args.rate / 1000), 1)
+    start = time.perf_counter()
+    for i in range(0, len(messages), batch):
+        due = start + i / args.rate
+        delay = due - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        # Latency counts from when the message was due to arrive, so a backlog shows up
+        for message in messages[i:i + batch]:
+            await router.handle_message(message.replace("SENT_AT", repr(due)))
+    sent = time.perf_counter() - start
+
+    deadline = time.perf_counter() + 60
+    while (counts["orders"] < len(messages) // 10 or len(latencies) < len(messages) * 9 // 10) \
+            and time.perf_counter() < deadline:
+        await asyncio.sleep(0.001)
+    elapsed = time.perf_counter() - start
+    if mode == "router":
+        await router.close()
+
+    latencies.sort()
+    pick = lambda q: latencies[min(int(q * len(latencies)), len(latencies) - 1)] * 1000
+    return {"sent": sent, "elapsed": elapsed, "p50": pick(0.5), "p99": pick(0.99),
+            "slow": counts["slow"], "orders": counts["orders"]}
+
+
+def decode_cost(messages: List[str]) -> Dict[str, float]:
+    raw = [message.replace("SENT_AT", "1.0") for message in messages]
+    decoders = {"json": json.loads}
+    if bitget_websocket.ORJSON_AVAILABLE:
+        decoders["orjson"] = bitget_websocket.orjson.loads
+    cost = {}
+    for name, loads in decoders.items():
+        start = time.perf_counter()
+        for message in raw:
+            loads(message)
+        cost[name] = (time.perf_counter() - start) / len(raw) * 1e6
+    return cost
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark BitGetWebSocket message dispatch")
+    parser.add_argument("--rate", type=float, default=10000.0, help="Messages per second")
+    parser.add_argument("--duration", type=float, default=2.0, help="Seconds of messages to send")
+    parser.add_argument("--slow-ms", type=float, default=1.0, help="Time the slow strategy takes per BTC ticker")
+    parser.add_argument("--modes", nargs="+", default=["legacy", "router"], choices=["legacy", "router"])
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    messages = synthetic_messages(int(args.rate * args.duration))
+    print(f"{len(messages)} messages at {args.rate:.0f} msgs/s, slow strategy {args.slow_ms} ms per BTC ticker")
+    print("decode: " + "   ".join(f"{name} {us:.2f} us/msg" for name, us in decode_cost(messages).items()))
+    for mode in args.modes:
+        result = asyncio.run(run(mode, messages, args))
+        print(f"{mode:<7} {len(messages) / result['elapsed']:>8.0f} msgs/s handled   "
+              f"fast consumer p50 {result['p50']:>8.2f} ms  p99 {result['p99']:>8.2f} ms   "
+              f"slow strategy saw {result['slow']:>5} BTC tickers   orders {result['orders']}")
+
+
+if __name__ == "__main__":
+    main()
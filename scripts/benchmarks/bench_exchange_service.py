@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - Exchange Service Concurrency Benchmark
+=====================================================
+
+``--bots`` bots share one event loop and each fetch positions, balance and
+a ticker from a mocked exchange that takes ``--rtt`` ms per call:
+
+- ``blocking``: the synchronous ccxt call made straight from the coroutine,
+  as ``ExchangeService`` used to do
+- ``executor``: ``ExchangeService`` with a synchronous client on its thread pool
+- ``async``: ``ExchangeService`` with an asyncio client (``ccxt.async_support``)
+
+Reports the wall time in round trips and the longest event loop stall seen
+by a 10 ms heartbeat. Non-blocking modes finish in about one round trip per
+call until the executor's worker limit is reached.
+
+Usage:
+    python scripts/benchmarks/bench_exchange_service.py --bots 8 --rtt 100
+"""
+
+import os
+import sys
+import time
+import asyncio
+import logging
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.omega_bot_farm.services import exchange_service
+from src.omega_bot_farm.services.exchange_service import ExchangeService, ExchangeMetrics
+
+
+class MockSyncExchange:
+    """Blocking exchange client with a fixed round trip."""
+
+    def __init__(self, rtt: float):
+        self.rtt = rtt
+
+    def fetch_positions(self):
+        time.sleep(self.rtt)
+        return [{"symbol": "BTC/USDT:USDT", "contracts": 1}]
+
+    def fetch_balance(self):
+        time.sleep(self.rtt)
+        return {"USDT": {"free": 1000.0}}
+
+    def fetch_ticker(self, symbol):
+        time.sleep(self.rtt)
+        return {"symbol": symbol, "last": 84000.0}
+
+
+class MockAsyncExchange:
+    """Asyncio exchange client with a fixed round trip."""
+
+    def __init__(self, rtt: float):
+        self.rtt = rtt
+
+    async def fetch_positions(self):
+        await asyncio.sleep(self.rtt)
+        return [{"symbol": "BTC/USDT:USDT", "contracts": 1}]
+
+    async def fetch_balance(self):
+        await asyncio.sleep(self.rtt)
+        return {"USDT": {"free": 1000.0}}
+
+    async def fetch_ticker(self, symbol):
+        await asyncio.sleep(self.rtt)
+        return {"symbol": symbol, "last": 84000.0}
+
+
+async def blocking_bot(client: MockSyncExchange) -> None:
+    # What the coroutines of the former ExchangeService did
+    client.fetch_positions()
+    client.fetch_balance()
+    client.fetch_ticker("BTC/USDT")
+
+
+async def service_bot(service: ExchangeService) -> None:
+    await service.fetch_positions()
+    await service.fetch_balance()
+    await service.fetch_ticker("BTC/USDT")
+
+
+async def run(mode: str, bots: int, rtt: float):
+    stall = 0.0
+    stop = False
+
+    async def heartbeat():
+        nonlocal stall
+        last = time.perf_counter()
+        while not stop:
+            await asyncio.sleep(0.01)
+            now = time.perf_counter()
+            stall = max(stall, now - last - 0.01)
+            last = now
+
+    metrics = ExchangeMetrics()
+    if mode == "blocking":
+        client = MockSyncExchange(rtt)
+        tasks = [blocking_bot(client) for _ in range(bots)]
+    else:
+        client = MockSyncExchange(rtt) if mode == "executor" else MockAsyncExchange(rtt)
+        services = []
+        for _ in range(bots):
+            service = ExchangeService("bitget", api_key="bench", api_secret="bench", api_passphrase="bench",
+                                      use_cache=False)  # Measure concurrency, not caching
+            service.exchange, service.metrics = client, metrics  # One shared mocked client
+            services.append(service)
+        tasks = [service_bot(service) for service in services]
+
+    beat = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0.02)
+    start = time.perf_counter()
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+    stop = True
+    await beat
+    return elapsed, stall, metrics.peak_in_flight
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark concurrent ExchangeService calls on one event loop")
+    parser.add_argument("--bots", type=int, default=8)
+    parser.add_argument("--rtt", type=float, default=100.0, help="Mocked round trip in ms")
+    parser.add_argument("--modes", nargs="+", default=["blocking", "executor", "async"],
+                        choices=["blocking", "executor", "async"])
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.CRITICAL)  # Without ccxt every service logs an error
+    rtt = args.rtt / 1000
+    print(f"{args.bots} bots x 3 calls, {args.rtt:.0f} ms round trip, "
+          f"{exchange_service.MAX_EXECUTOR_WORKERS} executor workers")
+    for mode in args.modes:
+        elapsed, stall, peak = asyncio.run(run(mode, args.bots, rtt))
+        print(f"{mode:<9} {elapsed:>7.3f} s = {elapsed / rtt:>5.1f} round trips   "
+              f"max loop stall {stall * 1000:>7.1f} ms   peak in flight {peak}")
+
+
+if __name__ == "__main__":
+    main()
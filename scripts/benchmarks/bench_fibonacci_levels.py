@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - Fibonacci Level Check Benchmark
+==============================================
+
+Times ``FibonacciDetector.check_fibonacci_level`` over a stream of prices
+against the fetch-decode-scan it replaced, then the same prices through the
+vectorized ``check_fibonacci_levels_batch``, and checks all three find the
+same levels.
+
+``fibonacci_detector`` connects to Redis on import; when no server answers at
+``REDIS_HOST``/``REDIS_PORT`` an in-process fakeredis stand-in is used. Hits
+are not recorded while timing.
+
+Usage:
+    python scripts/benchmarks/bench_fibonacci_levels.py --prices 100000
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import logging
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import numpy as np
+import redis
+
+try:
+    redis.StrictRedis(host=os.getenv('REDIS_HOST', 'localhost'), port=int(os.getenv('REDIS_PORT', '6379'))).ping()
+except redis.RedisError:
+    import fakeredis
+    redis.StrictRedis = fakeredis.FakeStrictRedis
+
+from omega_ai.mm_trap_detector.fibonacci_detector import FIBONACCI_LEVELS, FibonacciDetector, redis_conn
+
+LOW, HIGH = 80000.0, 86000.0
+
+
+def legacy_check(detector, current_price):
+    """The per-call GET, json.loads and linear scan, minus hit recording."""
+    levels = json.loads(redis_conn.get("fibonacci_levels"))
+    price_range = detector.recent_swing_high - detector.recent_swing_low
+    for level_name, level_price in levels.items():
+        if not isinstance(level_price, (int, float)) or not math.isfinite(level_price):
+            continue
+        if abs(current_price - level_price) / price_range <= 0.005:
+            return level_name
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark Fibonacci level hit checks")
+    parser.add_argument("--prices", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    logging.getLogger(FibonacciDetector.__module__).setLevel(logging.WARNING)
+    levels = {label: LOW + ratio * (HIGH - LOW) for ratio, label in FIBONACCI_LEVELS.items()}
+    redis_conn.set("fibonacci_levels", json.dumps(levels))
+    prices = np.random.default_rng(args.seed).uniform(LOW - 500, HIGH + 5000, args.prices)
+    price_list = prices.tolist()
+
+    detector = FibonacciDetector(symbol="BTCUSDT")
+    detector.recent_swing_high, detector.recent_swing_low = HIGH, LOW
+    # Time the lookups only
+    redis_conn.zadd = lambda *args, **kwargs: 0
+
+    try:
+        start = time.perf_counter()
+        legacy = [legacy_check(detector, price) for price in price_list]
+        legacy_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        indexed = [detector.check_fibonacci_level(price) for price in price_list]
+        indexed_elapsed = time.perf_counter() - start
+    finally:
+        del redis_conn.zadd
+
+    start = time.perf_counter()
+    batch = detector.check_fibonacci_levels_batch(prices)
+    batch_elapsed = time.perf_counter() - start
+
+    indexed_labels = [hit["label"] if hit else None for hit in indexed]
+    batch_labels = [hit["label"] if hit else None for hit in batch]
+    mismatches = sum(1 for a, b, c in zip(legacy, indexed_labels, batch_labels) if not a == b == c)
+
+    print(f"Prices: {len(price_list)} | levels: {len(levels)} | hits: {sum(1 for hit in batch if hit)}")
+    for name, elapsed in (("fetch + scan", legacy_elapsed), ("cached index", indexed_elapsed),
+                          ("batch", batch_elapsed)):
+        print(f"{name:14s} {elapsed / len(price_list) * 1e6:8.2f} us/price   "
+              f"speedup {legacy_elapsed / elapsed:6.1f}x")
+    print(f"index rebuilds: {detector._level_cache.rebuilds} | mismatching prices: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
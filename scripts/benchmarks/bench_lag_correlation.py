@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - AIXBT Lag Correlation Benchmark
+==============================================
+
+Times the optimal-lag search of ``CorrelationAnalyzer`` for several series
+lengths: the per-lag ``pearsonr`` loop it used before against the single
+FFT cross-correlation, checking both pick the same lag. Also times one bar
+of the rolling mode against recomputing the window from scratch.
+
+Usage:
+    python scripts/benchmarks/bench_lag_correlation.py --lengths 1000 10000 100000 --max-lag 200
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import numpy as np
+from scipy.stats import pearsonr
+
+from src.omega_bot_farm.ai_model_aixbt.lag_correlation import (
+    RollingLagCorrelation,
+    lagged_correlations,
+    optimal_lag
+)
+
+
+def pearson_loop(x, y, max_lag):
+    """The per-lag search the analyzer ran before."""
+    correlations = []
+    for lag in range(-max_lag, max_lag + 1):
+        if lag < 0:
+            corr, _ = pearsonr(x[:lag], y[-lag:])
+        elif lag > 0:
+            corr, _ = pearsonr(x[lag:], y[:-lag])
+        else:
+            corr, _ = pearsonr(x, y)
+        correlations.append((lag, corr))
+    return max(correlations, key=lambda item: abs(item[1]))
+
+
+def timed(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the AIXBT/BTC lag search")
+    parser.add_argument("--lengths", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--max-lag", type=int, default=200, help="Lags searched each way (capped at 20%% of length)")
+    parser.add_argument("--window", type=int, default=1000, help="Rolling window in bars")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    print(f"{'length':>8} {'lags':>6} {'pearsonr loop':>15} {'fft':>11} {'speedup':>9}  lag")
+    for length in args.lengths:
+        btc = 84000.0 + np.cumsum(rng.normal(0, 60, length + 7))
+        aixbt = btc[:length] * 1e-5 + rng.normal(0, 0.005, length)
+        btc = btc[7:]
+        max_lag = min(args.max_lag, length // 5)
+
+        loop_s = timed(lambda: pearson_loop(aixbt, btc, max_lag), repeat=1)
+        fft_s = timed(lambda: optimal_lag(aixbt, btc, max_lag))
+        old, new = pearson_loop(aixbt, btc, max_lag), optimal_lag(aixbt, btc, max_lag)
+        assert old[0] == new[0] and abs(old[1] - new[1]) < 1e-9, (old, new)
+        print(f"{length:>8} {2 * max_lag + 1:>6} {loop_s * 1000:>12.2f} ms {fft_s * 1000:>8.2f} ms "
+              f"{loop_s / fft_s:>8.1f}x  {new[0]}")
+
+    window, max_lag = args.window, min(args.max_lag, args.window // 5)
+    bars = 84000.0 + np.cumsum(rng.normal(0, 60, 3 * window))
+    rolling = RollingLagCorrelation(window, max_lag)
+    for i in range(window):
+        rolling.update(bars[i] * 1e-5, bars[i])
+    start = time.perf_counter()
+    for i in range(window, 3 * window):
+        rolling.update(bars[i] * 1e-5, bars[i])
+    rolling_s = (time.perf_counter() - start) / (2 * window)
+    recompute_s = timed(lambda: lagged_correlations(bars[-window:] * 1e-5, bars[-window:], max_lag))
+    print(f"\nrolling window {window}, {2 * max_lag + 1} lags: "
+          f"{rolling_s * 1e6:.1f} us per bar vs {recompute_s * 1e6:.1f} us recomputing with fft")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - Market Data Cache Benchmark
+==========================================
+
+``--bots`` ``ExchangeClient`` bots watch the same account, each polling
+positions, balance and the BTC ticker every ``--interval`` seconds for
+``--duration`` seconds against a mocked exchange (``--rtt`` ms per call),
+with one order placed every ``--order-every`` seconds. Reports the exchange
+calls made with and without the shared market data cache, the cache hit
+ratio and the average poll latency.
+
+Usage:
+    python scripts/benchmarks/bench_market_data_cache.py --bots 12 --duration 10
+"""
+
+import os
+import sys
+import time
+import asyncio
+import logging
+import argparse
+from collections import Counter
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.omega_bot_farm.services.market_data_cache import MarketDataCache
+from src.omega_bot_farm.trading.b0ts.core.exchange_client import ExchangeClient
+
+
+class MockExchange:
+    """Asyncio exchange counting its calls."""
+
+    def __init__(self, rtt: float):
+        self.rtt = rtt
+        self.calls = Counter()
+
+    async def _call(self, name: str, value):
+        self.calls[name] += 1
+        await asyncio.sleep(self.rtt)
+        return value
+
+    async def fetch_positions(self, symbols=None):
+        return await self._call("fetch_positions", [{"symbol": "BTC/USDT:USDT", "contracts": 1, "side": "long"}])
+
+    async def fetch_balance(self):
+        return await self._call("fetch_balance", {"total": {"USDT": 1000.0}})
+
+    async def fetch_ticker(self, symbol):
+        return await self._call("fetch_ticker", {"symbol": symbol, "last": 84000.0})
+
+    async def create_order(self, *args):
+        return await self._call("create_order", {"id": "1", "status": "closed"})
+
+
+async def run(use_cache: bool, args) -> tuple:
+    exchange = MockExchange(args.rtt / 1000)
+    cache = MarketDataCache() if use_cache else None
+    bots = []
+    for _ in range(args.bots):
+        bot = ExchangeClient("bitget", api_key="bench", api_secret="bench", api_passphrase="bench",
+                             auto_connect=False, cache=cache, use_cache=use_cache, log_level="ERROR")
+        bot.exchange, bot.is_connected, bot.request_rate_limit = exchange, True, 0
+        bots.append(bot)
+
+    latencies = []
+    deadline = time.perf_counter() + args.duration
+
+    async def poll(bot: ExchangeClient, offset: float):
+        await asyncio.sleep(offset)
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            await asyncio.gather(bot.fetch_positions(), bot.fetch_balance(), bot.fetch_ticker("BTC"))
+            latencies.append(time.perf_counter() - start)
+            await asyncio.sleep(args.interval)
+
+    async def trade():
+        while time.perf_counter() < deadline:
+            await asyncio.sleep(args.order_every)
+            await bots[0].create_order("BTC", "market", "buy", 0.001)
+
+    # Bots start spread over one polling interval, like independently started processes
+    await asyncio.gather(trade(), *[poll(bot, i * args.interval / args.bots) for i, bot in enumerate(bots)])
+    reads = sum(count for name, count in exchange.calls.items() if name != "create_order")
+    return reads, sum(latencies) / len(latencies), cache.get_stats() if cache else None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark exchange calls with the shared market data cache")
+    parser.add_argument("--bots", type=int, default=12)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--interval", type=float, default=1.0, help="Seconds between polls of each bot")
+    parser.add_argument("--rtt", type=float, default=50.0, help="Mocked round trip in ms")
+    parser.add_argument("--order-every", type=float, default=3.0, help="Seconds between our own orders")
+    args = parser.parse_args()
+
+    logging.disable(logging.ERROR)  # Mocked clients log cleanup errors on exit
+    print(f"{args.bots} bots polling positions, balance and ticker every {args.interval:.1f} s "
+          f"for {args.duration:.0f} s, {args.rtt:.0f} ms round trip")
+    uncached, uncached_latency, _ = asyncio.run(run(False, args))
+    cached, cached_latency, stats = asyncio.run(run(True, args))
+    print(f"without cache: {uncached:>5} exchange reads   avg poll {uncached_latency * 1000:>6.1f} ms")
+    print(f"with cache:    {cached:>5} exchange reads   avg poll {cached_latency * 1000:>6.1f} ms   "
+          f"hit ratio {stats['hit_ratio']:.1%}   ({uncached / max(cached, 1):.1f}x fewer calls)")
+
+
+if __name__ == "__main__":
+    main()
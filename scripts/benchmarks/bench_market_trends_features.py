@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - Market Trends Prediction Cycle Benchmark
+=======================================================
+
+Times one ``MarketTrendsModel.generate_predictions`` cycle over ``--days``
+of stored ticks two ways: the way it worked before (each of the three
+models loads two days of history and engineers features over all of it)
+and with the streaming feature store shared by the three models, with
+``--ticks-per-cycle`` new ticks arriving between cycles. Also times
+``predict_batch`` over the whole history against predicting tick by tick.
+
+Models are small forests fitted on synthetic data; their predict calls are
+part of both cycle times. Uses the Redis at ``--redis-url`` when reachable,
+otherwise fakeredis. The benchmark sets ``last_btc_price`` and writes the
+prediction keys, so point it at a scratch database.
+
+Usage:
+    python scripts/benchmarks/bench_market_trends_features.py --days 2 --ticks-per-minute 10 --cycles 20
+"""
+
+import os
+import sys
+import time
+import argparse
+import logging
+import tempfile
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import numpy as np
+import pandas as pd
+import redis
+from sklearn.ensemble import GradientBoostingRegressor, RandomForestClassifier
+
+from omega_ai.data_feed.price_history_store import PriceHistoryStore
+from omega_ai.ml.market_trends_model import MarketTrendsModel
+
+PREFIX = "bench:btc_tick_history"
+
+
+def connect(url: str):
+    """Return a Redis client, falling back to fakeredis when no server is up."""
+    try:
+        client = redis.Redis.from_url(url, decode_responses=True)
+        client.ping()
+        return client, url
+    except redis.RedisError:
+        import fakeredis
+        return fakeredis.FakeRedis(decode_responses=True), "fakeredis"
+
+
+def legacy_latest_data(model: MarketTrendsModel) -> pd.DataFrame:
+    """What get_latest_data did for each model: two days of history, re-engineered with the live price."""
+    current = pd.DataFrame([{
+        "price": float(model.redis_conn.get("last_btc_price")),
+        "volume": float(model.redis_conn.get("last_btc_volume") or 0),
+        **model._get_trend_columns()
+    }])
+    hist_df = model.get_historical_data(days_back=2)
+    return model._engineer_features(pd.concat([hist_df, current], ignore_index=True)).iloc[[-1]]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark MarketTrendsModel prediction cycles")
+    parser.add_argument("--days", type=int, default=2)
+    parser.add_argument("--ticks-per-minute", type=int, default=10)
+    parser.add_argument("--ticks-per-cycle", type=int, default=10)
+    parser.add_argument("--cycles", type=int, default=20)
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15")
+    args = parser.parse_args()
+    logging.getLogger("omega_ai.ml.market_trends_model").setLevel(logging.ERROR)
+
+    client, where = connect(args.redis_url)
+    count = args.days * 24 * 60 * args.ticks_per_minute
+    extra = args.cycles * args.ticks_per_cycle
+    rng = np.random.default_rng(42)
+    timestamps = time.time() - (count + extra) * 60.0 / args.ticks_per_minute + np.arange(count + extra) * 60.0 / args.ticks_per_minute
+    prices = 84000.0 * np.cumprod(1 + rng.normal(0, 0.0002, count + extra))
+    volumes = rng.uniform(0.01, 2.0, count + extra)
+    print(f"Redis: {where} | {count} ticks, {args.ticks_per_cycle} new ticks per cycle")
+
+    store = PriceHistoryStore(client, prefix=PREFIX)
+    store.clear()
+    try:
+        store.append_many(timestamps[:count], prices[:count], volumes[:count])
+        client.set("last_btc_price", float(prices[count - 1]))
+        client.set("last_btc_volume", float(volumes[count - 1]))
+
+        with patch("omega_ai.ml.market_trends_model.redis.StrictRedis", return_value=client), \
+                patch.object(MarketTrendsModel, "load_models"), tempfile.TemporaryDirectory() as model_dir:
+            model = MarketTrendsModel()
+            model.model_dir = model_dir
+            model.tick_history = store
+
+            history = pd.DataFrame({"price": prices[:count], "volume": volumes[:count]})
+            features = model._engineer_features(history)
+            X = features.drop(columns=["price"])
+            model.trend_classifier = RandomForestClassifier(n_estimators=100, max_depth=10, random_state=42).fit(
+                X, np.sign(features["momentum_3"]))
+            model.price_regressor = GradientBoostingRegressor(n_estimators=100, max_depth=5, random_state=42).fit(
+                X, features["momentum_1"])
+            model.trap_classifier = RandomForestClassifier(n_estimators=100, max_depth=8, random_state=42).fit(
+                X, features["rsi_14"] > 60)
+
+            start = time.perf_counter()
+            for _ in range(3):
+                model.predict_trend(legacy_latest_data(model))
+                model.predict_price(legacy_latest_data(model))
+                model.predict_mm_trap(legacy_latest_data(model))
+            legacy_s = (time.perf_counter() - start) / 3
+
+            model.generate_predictions()  # Warm the feature store up
+            cycle_times, feature_times = [], []
+            for cycle in range(args.cycles):
+                lo = count + cycle * args.ticks_per_cycle
+                hi = lo + args.ticks_per_cycle
+                store.append_many(timestamps[lo:hi], prices[lo:hi], volumes[lo:hi])
+                client.set("last_btc_price", float(prices[hi - 1]))
+                start = time.perf_counter()
+                model.generate_predictions()
+                cycle_times.append(time.perf_counter() - start)
+                start = time.perf_counter()
+                model.get_latest_data()
+                feature_times.append(time.perf_counter() - start)
+
+            rows = min(count, 200)
+            start = time.perf_counter()
+            for i in range(count - rows, count):
+                model.predict_batch(history.iloc[max(0, i - 60):i + 1].reset_index(drop=True))
+            per_row_s = (time.perf_counter() - start) / rows * count
+            start = time.perf_counter()
+            model.predict_batch(history)
+            batch_s = time.perf_counter() - start
+
+        print(f"prediction cycle, 3x history reload          {legacy_s * 1000:10.1f} ms")
+        print(f"prediction cycle, shared streaming features  {np.median(cycle_times) * 1000:10.1f} ms   "
+              f"{legacy_s / np.median(cycle_times):6.1f}x   (features alone {np.median(feature_times) * 1000:.2f} ms)")
+        print(f"backtest {count} rows, one window per row (extrapolated) {per_row_s:8.1f} s")
+        print(f"backtest {count} rows, predict_batch                    {batch_s:8.2f} s   {per_row_s / batch_s:6.0f}x")
+    finally:
+        store.clear()
+        client.delete("last_btc_price", "last_btc_volume", "ai_predictions", "ai_trend_prediction",
+                      "ai_price_prediction", "ai_trap_prediction")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - qPoW Merkle Tree Benchmark
+=========================================
+
+Compares the original from-scratch Merkle root (rehashing every transaction
+and level) with the cached ``MerkleTree`` for block validation and for
+growing a block template one transaction at a time.
+
+Usage:
+    python scripts/benchmarks/bench_merkle.py --txs 4000
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from quantum_pow.block_structure import QuantumBlock, BlockHeader, Transaction
+from quantum_pow.hash_functions import QuantumResistantHash
+
+
+def legacy_root(transactions) -> bytes:
+    """Original _calculate_merkle_root, including the uncached Transaction.hash()."""
+    if not transactions:
+        return b"\x00" * 64
+    hashes = [QuantumResistantHash().hash(tx.serialize()) for tx in transactions]
+    while len(hashes) > 1:
+        if len(hashes) % 2 != 0:
+            hashes.append(hashes[-1])
+        hashes = [QuantumResistantHash().hash(hashes[i] + hashes[i + 1]) for i in range(0, len(hashes), 2)]
+    return hashes[0]
+
+
+def make_transactions(count: int):
+    return [Transaction(f"sender_{i}", f"recipient_{i}", 1.0 + i, f"signature_{i:08d}", timestamp=1700000000)
+            for i in range(count)]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark qPoW Merkle root computation")
+    parser.add_argument("--txs", type=int, default=4000)
+    parser.add_argument("--appends", type=int, default=200)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    transactions = make_transactions(args.txs)
+    header = BlockHeader(prev_block_hash=b"\x07" * 64, merkle_root=b"\x00" * 64, bits=0x1f00ffff)
+    block, build = timed(lambda: QuantumBlock(header=header, transactions=transactions))
+    block.mine(max_attempts=1000)
+
+    root, legacy = timed(lambda: legacy_root(transactions))
+    assert root == block.header.merkle_root
+    _, header_hash = timed(block.header.hash)
+    _, validate = timed(block.is_valid)
+    print(f"{args.txs} txs: legacy root {legacy * 1000:9.1f} ms | first build {build * 1000:8.1f} ms | "
+          f"cached is_valid {validate * 1000:6.2f} ms (header hash {header_hash * 1000:.2f} ms)")
+
+    extra = make_transactions(args.txs + args.appends)[args.txs:]
+    grown = list(transactions)
+    start = time.perf_counter()
+    for tx in extra:
+        grown.append(tx)
+        legacy_root(grown)
+    legacy_append = (time.perf_counter() - start) / args.appends
+    start = time.perf_counter()
+    for tx in extra:
+        block.add_transaction(tx)
+    cached_append = (time.perf_counter() - start) / args.appends
+    assert block.header.merkle_root == legacy_root(grown)
+    print(f"append to template: legacy {legacy_append * 1000:9.2f} ms/tx | cached {cached_append * 1000:6.3f} ms/tx "
+          f"(x{legacy_append / cached_append:.0f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - MM WebSocket Fan-out Benchmark
+=============================================
+
+Starts a local broadcast server shaped like ``mm_websocket_server`` and
+compares the legacy ``asyncio.run`` + handshake per tick with the persistent
+``MMWebSocketPublisher``. Reports tick-path cost, queue depth, drops and the
+feed→server→feed echo latency.
+
+Usage:
+    python scripts/benchmarks/bench_mm_ws_publisher.py --ticks 2000
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import websockets
+
+from omega_ai.data_feed.mm_ws_publisher import MMWebSocketPublisher
+
+
+def start_broadcast_server():
+    """Run an echo-to-all server in a background thread; return its URL."""
+    clients = set()
+    ready = threading.Event()
+    state = {}
+
+    async def handler(websocket):
+        clients.add(websocket)
+        try:
+            async for message in websocket:
+                await asyncio.gather(*[ws.send(message) for ws in clients], return_exceptions=True)
+        finally:
+            clients.discard(websocket)
+
+    async def serve():
+        async with websockets.serve(handler, "127.0.0.1", 0) as server:
+            state["port"] = server.sockets[0].getsockname()[1]
+            ready.set()
+            await asyncio.Future()
+
+    threading.Thread(target=lambda: asyncio.run(serve()), daemon=True).start()
+    ready.wait()
+    return f"ws://127.0.0.1:{state['port']}"
+
+
+async def legacy_send(url: str, price: float) -> None:
+    async with websockets.connect(url, max_size=2**20) as ws:
+        await ws.send(json.dumps({"btc_price": price}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark MM WebSocket price fan-out")
+    parser.add_argument("--ticks", type=int, default=2000)
+    parser.add_argument("--legacy-ticks", type=int, default=200)
+    parser.add_argument("--policy", default="drop_oldest", choices=["drop_oldest", "coalesce_latest"])
+    args = parser.parse_args()
+
+    url = start_broadcast_server()
+
+    start = time.perf_counter()
+    for i in range(args.legacy_ticks):
+        asyncio.run(legacy_send(url, 84000.0 + i))
+    legacy_elapsed = time.perf_counter() - start
+    print(f"legacy asyncio.run per tick : {args.legacy_ticks / legacy_elapsed:10.0f} ticks/s "
+          f"({legacy_elapsed / args.legacy_ticks * 1000:.3f} ms on the tick path)")
+
+    publisher = MMWebSocketPublisher(url=url, policy=args.policy).start()
+    time.sleep(0.2)
+    max_depth = 0
+    start = time.perf_counter()
+    for i in range(args.ticks):
+        publisher.publish(84000.0 + i)
+        max_depth = max(max_depth, publisher.queue_depth)
+    tick_path = time.perf_counter() - start
+    deadline = time.time() + 10
+    while publisher.queue_depth and time.time() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.2)
+    metrics = publisher.metrics()
+    publisher.stop()
+
+    print(f"persistent publisher        : {args.ticks / tick_path:10.0f} ticks/s "
+          f"({tick_path / args.ticks * 1000:.3f} ms on the tick path)")
+    print(f"  policy={args.policy} max_queue_depth={max_depth} sent={metrics['sent']} "
+          f"dropped={metrics['dropped']} coalesced={metrics['coalesced']}")
+    print(f"  send p50/p99 {metrics['send_p50_ms']:.3f}/{metrics['send_p99_ms']:.3f} ms  "
+          f"echo p50/p99 {metrics['echo_p50_ms']:.3f}/{metrics['echo_p99_ms']:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
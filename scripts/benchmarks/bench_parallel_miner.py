@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - qPoW Nonce Search Benchmark
+==========================================
+
+Scans a fixed nonce range with an always-failing target so every nonce is
+hashed, and reports hashes/s for the legacy rebuild-per-attempt loop, the
+serial prefix-patching search and ``ParallelMiner`` with per-worker rates.
+
+Usage:
+    python scripts/benchmarks/bench_parallel_miner.py --nonces 200000 --workers 4
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from quantum_pow.block_structure import BlockHeader
+from quantum_pow.parallel_miner import ParallelMiner, search_nonces
+
+# meets_target() checks hash[0] < 32, so patch it to never match and force a full scan
+import quantum_pow.block_structure as block_structure
+block_structure.meets_target = lambda hash_value, target: False
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark qPoW nonce search")
+    parser.add_argument("--nonces", type=int, default=200000)
+    parser.add_argument("--legacy-nonces", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch-size", type=int, default=256)
+    args = parser.parse_args()
+
+    header = BlockHeader(prev_block_hash=b"\x07" * 64, merkle_root=b"\x01" * 64,
+                         timestamp=1700000000, bits=0x1f00ffff)
+    prefix = header.to_bytes()[:-4]
+    target = bytes(32)
+
+    start = time.perf_counter()
+    for nonce in range(args.legacy_nonces):
+        header.nonce = nonce
+        header.hash()
+    legacy_rate = args.legacy_nonces / (time.perf_counter() - start)
+    print(f"legacy rebuild per nonce : {legacy_rate:12.0f} H/s")
+
+    start = time.perf_counter()
+    search_nonces(prefix, target, 0, args.nonces, batch_size=args.batch_size)
+    serial_rate = args.nonces / (time.perf_counter() - start)
+    print(f"serial prefix + batches  : {serial_rate:12.0f} H/s (x{serial_rate / legacy_rate:.1f})")
+
+    # fork so the workers inherit the patched meets_target
+    with ParallelMiner(workers=args.workers, batch_size=args.batch_size, start_method="fork") as miner:
+        miner.search(prefix, target, args.workers * args.batch_size)  # warm up the pool
+        result = miner.search(prefix, target, args.nonces)
+    print(f"parallel x{args.workers:<3d}           : {result.hashrate:12.0f} H/s "
+          f"(x{result.hashrate / legacy_rate:.1f})")
+    for stats in result.workers:
+        print(f"  worker {stats.worker_id}: {stats.attempts:8d} hashes {stats.hashrate:10.0f} H/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - Price History Benchmark
+======================================
+
+Loads several days of ticks two ways: from a ``"price,volume"`` Redis list
+parsed string by string (what ``MarketTrendsModel.get_historical_data`` and
+``OmegaMarketTrendMonitor.get_btc_price_history`` did), and from the
+columnar ``PriceHistoryStore``. Also times appends and multi-timeframe
+candle aggregation of the whole range.
+
+Uses the Redis at ``--redis-url`` when reachable, otherwise an in-process
+fakeredis stand-in (no network round trip, so Redis-side costs are
+understated for both layouts).
+
+Usage:
+    python scripts/benchmarks/bench_price_history.py --days 3 --ticks-per-minute 10
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import numpy as np
+import redis
+
+from omega_ai.data_feed.price_history_store import PriceHistoryStore
+
+LIST_KEY = "bench:btc_movement_history"
+PREFIX = "bench:btc_tick_history"
+START = 1_714_521_600.0  # 2024-05-01 UTC
+
+
+def connect(url: str):
+    """Return a Redis client, falling back to fakeredis when no server is up."""
+    try:
+        client = redis.Redis.from_url(url, decode_responses=True)
+        client.ping()
+        return client, url
+    except redis.RedisError:
+        import fakeredis
+        return fakeredis.FakeRedis(decode_responses=True), "fakeredis"
+
+
+def parse_list(raw):
+    history = []
+    for item in raw:
+        price_str, volume_str = item.split(",")
+        history.append({"price": float(price_str), "volume": float(volume_str)})
+    return history
+
+
+def timed(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark list vs columnar price history")
+    parser.add_argument("--days", type=int, default=3)
+    parser.add_argument("--ticks-per-minute", type=int, default=10)
+    parser.add_argument("--redis-url", default=os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+    args = parser.parse_args()
+
+    client, where = connect(args.redis_url)
+    count = args.days * 24 * 60 * args.ticks_per_minute
+    rng = np.random.default_rng(42)
+    timestamps = START + np.arange(count) * (60.0 / args.ticks_per_minute)
+    prices = 84000.0 * np.cumprod(1 + rng.normal(0, 0.0002, count))
+    volumes = rng.uniform(0.01, 2.0, count)
+    store = PriceHistoryStore(client, prefix=PREFIX, retention_days=args.days + 1)
+    print(f"Redis: {where} | {args.days} days, {count} ticks")
+
+    try:
+        client.delete(LIST_KEY)
+        store.clear()
+        rows = [f"{p},{v}" for p, v in zip(prices.tolist(), volumes.tolist())]
+        pipe = client.pipeline(transaction=False)
+        for i in range(0, count, 10000):
+            pipe.lpush(LIST_KEY, *rows[i:i + 10000])
+        pipe.execute()
+
+        sample = 2000
+        start = time.perf_counter()
+        for i in range(count - sample, count):
+            store.append(timestamps[i], prices[i], volumes[i])
+        append_s = (time.perf_counter() - start) / sample
+        store.clear()
+        for i in range(0, count, 50000):
+            store.append_many(timestamps[i:i + 50000], prices[i:i + 50000], volumes[i:i + 50000])
+
+        list_s = timed(lambda: parse_list(client.lrange(LIST_KEY, 0, -1)))
+        store_s = timed(lambda: store.range())
+        candles_s = timed(lambda: store.candles_multi(["1m", "5m", "15m", "1h", "4h", "1d"]))
+        tail_s = timed(lambda: store.tail(1000))
+
+        print(f"append one tick (store)              {append_s * 1e6:10.1f} us")
+        print(f"load all ticks, list + parse         {list_s * 1000:10.1f} ms")
+        print(f"load all ticks, columnar store       {store_s * 1000:10.1f} ms   {list_s / store_s:6.1f}x")
+        print(f"newest 1000 ticks, columnar store    {tail_s * 1000:10.1f} ms")
+        print(f"6 candle timeframes from the store   {candles_s * 1000:10.1f} ms")
+    finally:
+        client.delete(LIST_KEY)
+        store.clear()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - QLSTM Training Step Benchmark
+============================================
+
+CPU-only training throughput (samples/s of forward + backward) and peak
+traced memory of one batch, for:
+
+- the step-by-step path: ``QuantumLSTMCell.forward`` per timestep with the
+  states copied into a list, and backpropagation through time that re-runs
+  each cell step before its ``backward`` (how ``QLSTM`` processed sequences)
+- the fused time-major ``QLSTM`` in complex128, float64 and float32
+
+Usage:
+    python scripts/benchmarks/bench_qlstm.py --batch 32 --seq 60 --features 8 --units 32
+"""
+
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import numpy as np
+
+from src.omega_bot_farm.ai_model_aixbt.quantum_neural_net.qlstm import QLSTM
+
+
+def stepwise_train_step(layer: QLSTM, inputs: np.ndarray, grad_output: np.ndarray) -> None:
+    cell = layer.cell
+    batch_size, seq_length, _ = inputs.shape
+    h = np.zeros((batch_size, layer.units), dtype=cell.state_dtype)
+    c = np.zeros_like(h)
+    states = []
+    for t in range(seq_length):
+        h, [h, c] = cell.forward(inputs[:, t, :], [h, c])
+        states.append((h.copy(), c.copy()))
+
+    dh_next, dc_next = np.zeros_like(h), np.zeros_like(c)
+    zero = np.zeros_like(h)
+    for t in reversed(range(seq_length)):
+        h_prev, c_prev = states[t - 1] if t > 0 else (zero, zero)
+        cell.forward(inputs[:, t, :], [h_prev, c_prev])
+        cell.backward(grad_output if t == seq_length - 1 else zero, [dh_next, dc_next])
+        dh_next, dc_next = cell.cache["dh_prev"], cell.cache["dc_prev"]
+
+
+def fused_train_step(layer: QLSTM, inputs: np.ndarray, grad_output: np.ndarray) -> None:
+    layer.forward(inputs)
+    layer.backward(grad_output)
+
+
+def measure(step, layer: QLSTM, inputs: np.ndarray, repeat: int):
+    grad_output = np.ones((inputs.shape[0], layer.units))
+    step(layer, inputs, grad_output)  # Warm up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        step(layer, inputs, grad_output)
+    samples_per_s = repeat * inputs.shape[0] / (time.perf_counter() - start)
+
+    tracemalloc.start()
+    step(layer, inputs, grad_output)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return samples_per_s, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark QLSTM training steps")
+    parser.add_argument("--batch", type=int, default=32)
+    parser.add_argument("--seq", type=int, default=60)
+    parser.add_argument("--features", type=int, default=8)
+    parser.add_argument("--units", type=int, default=32)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    inputs = np.random.default_rng(42).normal(size=(args.batch, args.seq, args.features))
+    print(f"batch {args.batch}, seq {args.seq}, features {args.features}, units {args.units}")
+    print(f"{'path':<32} {'samples/s':>10} {'peak MiB':>9}")
+
+    for use_complex, dtype in ((True, "float64"), (False, "float64"), (False, "float32")):
+        layer = QLSTM(units=args.units, use_complex=use_complex, dtype=dtype)
+        layer.initialize(inputs.shape)
+        label = layer.state_dtype.name
+        for name, step in (("step-by-step", stepwise_train_step), ("fused", fused_train_step)):
+            samples_per_s, peak = measure(step, layer, inputs.astype(layer.dtype), args.repeat)
+            print(f"{name + ' ' + label:<32} {samples_per_s:>10.0f} {peak / 2 ** 20:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
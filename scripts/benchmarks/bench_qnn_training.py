@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - Quantum Neural Network Training Benchmark
+========================================================
+
+Writes a synthetic dataset of ``--samples`` windows (``--seq-length`` bars
+of ``--features`` features each) to ``.npy`` files and trains a QLSTM
+``QuantumNeuralNetwork`` on the memory-mapped arrays, once computing
+gradients in-process and once with each ``--workers`` count. Reports the
+per-epoch time, samples/s and time spent loading batches.
+
+Data-parallel gradients only pay off with enough cores and large enough
+batches to amortize sending the parameters to the workers.
+
+Usage:
+    python scripts/benchmarks/bench_qnn_training.py --samples 20000 --batch-size 256 --workers 2 4
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import numpy as np
+
+from src.omega_bot_farm.ai_model_aixbt.quantum_neural_net.model import QuantumNeuralNetwork
+from src.omega_bot_farm.ai_model_aixbt.quantum_neural_net.qlstm import QLSTM
+
+
+def write_dataset(directory: str, samples: int, seq_length: int, features: int, units: int):
+    rng = np.random.default_rng(42)
+    x_path = os.path.join(directory, "x.npy")
+    y_path = os.path.join(directory, "y.npy")
+    x = np.lib.format.open_memmap(x_path, mode="w+", dtype=np.float64, shape=(samples, seq_length, features))
+    for start in range(0, samples, 10000):
+        stop = min(start + 10000, samples)
+        x[start:stop] = rng.normal(size=(stop - start, seq_length, features))
+    x.flush()
+    np.save(y_path, 0.5 * np.tanh(np.asarray(x[:, -1, :units])))
+    del x
+    return x_path, y_path
+
+
+def train(x_path: str, y_path: str, units: int, epochs: int, batch_size: int, workers: int):
+    np.random.seed(0)
+    model = QuantumNeuralNetwork(f"bench_{workers}")
+    model.add(QLSTM(units=units, use_complex=False))
+    model.compile(optimizer="quantum_adam", loss="quantum_mse")
+
+    start = time.perf_counter()
+    history = model.fit(x_path, y_path, epochs=epochs, batch_size=batch_size, verbose=0, workers=workers, seed=0)
+    return time.perf_counter() - start, history
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark QuantumNeuralNetwork.fit throughput")
+    parser.add_argument("--samples", type=int, default=20000)
+    parser.add_argument("--seq-length", type=int, default=60)
+    parser.add_argument("--features", type=int, default=8)
+    parser.add_argument("--units", type=int, default=4)
+    parser.add_argument("--epochs", type=int, default=2)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--workers", type=int, nargs="*", default=[2])
+    args = parser.parse_args()
+
+    logging.getLogger("quantum-neural-net").setLevel(logging.WARNING)
+    print(f"{args.samples} samples x {args.seq_length} bars x {args.features} features, "
+          f"batch {args.batch_size}, {os.cpu_count()} CPUs")
+
+    with tempfile.TemporaryDirectory() as directory:
+        x_path, y_path = write_dataset(directory, args.samples, args.seq_length, args.features, args.units)
+
+        for workers in [1] + args.workers:
+            total, history = train(x_path, y_path, args.units, args.epochs, args.batch_size, workers)
+            label = "in-process" if workers == 1 else f"{workers} workers"
+            print(f"{label:12s} {total:8.2f} s total   "
+                  f"{np.mean(history['samples_per_second']):10.0f} samples/s   "
+                  f"{np.mean(history['epoch_time']):6.2f} s/epoch   "
+                  f"data {np.mean(history['data_time']):5.2f} s/epoch   "
+                  f"final loss {history['loss'][-1]:.4f}")
+
+
+if __name__ == "__main__":
+    main()
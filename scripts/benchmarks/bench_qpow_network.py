@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - qPoW Block Propagation Benchmark
+===============================================
+
+Starts a fully connected local network of ``Node``s on the asyncio transport
+and propagates N blocks through ``BlockPropagation``, reporting blocks/s and
+payload throughput until every node has every block. Also compares decoding
+one large block message with the legacy accumulate-and-retry ``json.loads``
+loop against length-prefixed framing.
+
+Usage:
+    python scripts/benchmarks/bench_qpow_network.py --nodes 4 --blocks 500 --txs 50
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import logging
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from quantum_pow.block_structure import QuantumBlock, BlockHeader, Transaction
+from quantum_pow.network import Node, NodeManager, BlockPropagation
+from quantum_pow.transport import encode_message, decode_message, read_frame
+
+
+def make_block(nonce: int, tx_count: int) -> QuantumBlock:
+    transactions = [Transaction(f"sender_{i}", f"recipient_{i}", 1.0 + i, f"signature_{i:08d}", timestamp=1700000000)
+                    for i in range(tx_count)]
+    header = BlockHeader(prev_block_hash=b"\x07" * 64, merkle_root=b"\x01" * 64,
+                         timestamp=1700000000, bits=0x1f00ffff, nonce=nonce)
+    return QuantumBlock(header=header, transactions=transactions)
+
+
+def legacy_decode(message: bytes, chunk_size: int = 4096) -> int:
+    """The old Node._handle_client loop: append each chunk and retry json.loads."""
+    data = b""
+    attempts = 0
+    for i in range(0, len(message), chunk_size):
+        data += message[i:i + chunk_size]
+        attempts += 1
+        try:
+            json.loads(data.decode("utf-8"))
+            data = b""
+        except json.JSONDecodeError:
+            pass
+    return attempts
+
+
+def framed_decode(frame: bytes, chunk_size: int = 4096) -> None:
+    async def scenario():
+        reader = asyncio.StreamReader()
+        for i in range(0, len(frame), chunk_size):
+            reader.feed_data(frame[i:i + chunk_size])
+        reader.feed_eof()
+        decode_message(*await read_frame(reader))
+    asyncio.run(scenario())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark qPoW block propagation")
+    parser.add_argument("--nodes", type=int, default=4)
+    parser.add_argument("--blocks", type=int, default=500)
+    parser.add_argument("--txs", type=int, default=50)
+    parser.add_argument("--large-txs", type=int, default=5000)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    large = make_block(0, args.large_txs)
+    json_message = json.dumps({"type": "block", "block": large.to_dict()}).encode("utf-8")
+    frame = encode_message({"type": "block", "block": large})
+    start = time.perf_counter()
+    legacy_decode(json_message)
+    legacy_elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    framed_decode(frame)
+    framed_elapsed = time.perf_counter() - start
+    print(f"decode {args.large_txs}-tx block: legacy JSON retry {legacy_elapsed * 1000:8.1f} ms "
+          f"({len(json_message) / 1e6:.2f} MB), framed {framed_elapsed * 1000:8.1f} ms "
+          f"({len(frame) / 1e6:.2f} MB)")
+
+    manager = NodeManager()
+    for i in range(args.nodes):
+        manager.add_node(Node(f"node_{i}", "127.0.0.1", 0))
+    manager.start_all_nodes()
+    manager.create_fully_connected_network()
+    propagation = BlockPropagation(manager)
+    blocks = [make_block(n, args.txs) for n in range(args.blocks)]
+    frame_bytes = len(encode_message({"type": "block", "block": blocks[0]}))
+    nodes = manager.get_nodes()
+
+    try:
+        start = time.perf_counter()
+        for block in blocks:
+            propagation.propagate_block(block)
+        while not all(len(node.known_blocks) >= args.blocks for node in nodes):
+            time.sleep(0.001)
+        elapsed = time.perf_counter() - start
+    finally:
+        manager.stop_all_nodes()
+
+    # Every node sends each block to each of its peers
+    frames = args.blocks * args.nodes * (args.nodes - 1)
+    print(f"propagated {args.blocks} blocks x {args.nodes} nodes in {elapsed:.2f}s: "
+          f"{args.blocks / elapsed:8.0f} blocks/s, {frames / elapsed:8.0f} frames/s, "
+          f"{frames * frame_bytes / elapsed / 1e6:6.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
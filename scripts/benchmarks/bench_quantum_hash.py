@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - Quantum Hash Benchmark
+=====================================
+
+Reports hashes/s of ``QuantumResistantHash`` for the original list-based
+mixing rounds, the vectorized single ``hash()`` path and batched
+``hash_many()`` over a nonce range, and checks all three agree.
+
+Usage:
+    python scripts/benchmarks/bench_quantum_hash.py --count 20000 --batch 1024
+"""
+
+import os
+import sys
+import time
+import hmac
+import hashlib
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from quantum_pow.hash_functions import QuantumResistantHash
+
+
+def legacy_hash(hasher: QuantumResistantHash, data: bytes) -> bytes:
+    """The original per-byte implementation, for comparison."""
+    personalized = hmac.new(hasher.personalization, hashlib.sha3_512(data).digest(), hashlib.sha3_512).digest()
+    values = list(personalized)
+    for r in range(hasher.rounds):
+        rotation = (r * 7 + 5) % hasher.lattice_dim
+        values = values[rotation:] + values[:rotation]
+        cycle = (hasher.personalization * ((64 // len(hasher.personalization)) + 1))[:64]
+        round_constant = [(b ^ r ^ (i * 17)) & 0xFF for i, b in enumerate(cycle)]
+        values = [(v ^ round_constant[i]) & 0xFF for i, v in enumerate(values)]
+        for i in range(len(values)):
+            values[i] = (values[i] * values[(i + 1) % 64] + values[(i + 7) % 64]) % 256
+    return hashlib.sha3_512(bytes(values)).digest()
+
+
+def headers(count: int):
+    prefix = b"qPoW-header-" + bytes(68)
+    return [prefix + nonce.to_bytes(8, "little") for nonce in range(count)]
+
+
+def rate(count: int, start: float) -> float:
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark QuantumResistantHash throughput")
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--legacy-count", type=int, default=2000)
+    parser.add_argument("--batch", type=int, default=1024)
+    args = parser.parse_args()
+
+    hasher = QuantumResistantHash()
+    inputs = headers(args.count)
+
+    start = time.perf_counter()
+    legacy = [legacy_hash(hasher, data) for data in inputs[:args.legacy_count]]
+    legacy_rate = rate(args.legacy_count, start)
+    print(f"legacy list rounds : {legacy_rate:12.0f} hashes/s")
+
+    start = time.perf_counter()
+    single = [hasher.hash(data) for data in inputs]
+    single_rate = rate(args.count, start)
+    print(f"vectorized hash()  : {single_rate:12.0f} hashes/s (x{single_rate / legacy_rate:.1f})")
+
+    start = time.perf_counter()
+    batched = []
+    for offset in range(0, args.count, args.batch):
+        batched.extend(hasher.hash_many(inputs[offset:offset + args.batch]))
+    batch_rate = rate(args.count, start)
+    print(f"hash_many({args.batch:<5d})   : {batch_rate:12.0f} hashes/s (x{batch_rate / legacy_rate:.1f})")
+
+    assert single == batched and single[:args.legacy_count] == legacy, "digest mismatch"
+    print("digests identical across all paths")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - Redis Time Series Benchmark
+==========================================
+
+Compares the per-day JSON list layout of ``redis_time_series`` with the
+sorted-set backend over a week of minute data: insert throughput, a
+six-hour range query, and hourly downsampling of the whole week.
+
+The list layout can only be read back by index, so its range query loads
+every day the range touches and filters by the parsed timestamp, and its
+downsampling is ``compress_historical_data`` run for every day.
+
+Uses the Redis at ``--redis-url`` when reachable, otherwise an in-process
+fakeredis stand-in. fakeredis has no network round trip and no Lua, so
+there the sorted-set downsampling falls back to client-side aggregation.
+
+Usage:
+    python scripts/benchmarks/bench_redis_time_series.py --days 7 --queries 50
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import datetime
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import redis
+
+from omega_ai.mm_trap_detector import redis_time_series as rts
+from omega_ai.mm_trap_detector.redis_time_series import SortedSetTimeSeries, TimeSeriesGranularity
+
+SERIES = "bench_price_history"
+START = datetime.datetime(2024, 5, 1, tzinfo=datetime.UTC)
+
+
+def connect(url: str):
+    """Return a Redis client, falling back to fakeredis when no server is up."""
+    try:
+        client = redis.Redis.from_url(url, decode_responses=True)
+        client.ping()
+        return client, url
+    except redis.RedisError:
+        import fakeredis
+        return fakeredis.FakeRedis(decode_responses=True), "fakeredis"
+
+
+def generate_points(days: int, seed: int = 42):
+    rng = random.Random(seed)
+    price = 84000.0
+    points = []
+    for i in range(days * 24 * 60):
+        ts = START + datetime.timedelta(minutes=i)
+        change = rng.gauss(0, 0.05)
+        price = round(price * (1 + change / 100), 2)
+        points.append((ts, {
+            "timestamp": ts.strftime("%Y-%m-%d %H:%M:%S"),
+            "price": price,
+            "change_pct": change,
+            "regime": "Bullish" if change > 0 else "Bearish"
+        }))
+    return points
+
+
+def list_range(start: datetime.datetime, end: datetime.datetime):
+    """Time-range query against the per-day list layout."""
+    result = []
+    day = start.date()
+    while day <= end.date():
+        for point in rts.get_time_series_data(SERIES, day):
+            ts = datetime.datetime.strptime(point["timestamp"], "%Y-%m-%d %H:%M:%S")
+            if start <= ts.replace(tzinfo=datetime.UTC) <= end:
+                result.append(point)
+        day += datetime.timedelta(days=1)
+    return result
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark Redis time series storage layouts")
+    parser.add_argument("--redis-url", default=os.getenv("REDIS_URL", "redis://localhost:6379/15"))
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--window-hours", type=float, default=6.0)
+    args = parser.parse_args()
+
+    client, target = connect(args.redis_url)
+    rts.redis_conn = client
+    points = generate_points(args.days)
+    rng = random.Random(7)
+    span = args.days * 86400 - args.window_hours * 3600
+    windows = []
+    for _ in range(args.queries):
+        start = START + datetime.timedelta(seconds=rng.uniform(0, span))
+        windows.append((start, start + datetime.timedelta(hours=args.window_hours)))
+    print(f"Target: {target} | points: {len(points)} | range queries: {args.queries} x {args.window_hours:g}h")
+
+    # List layout
+    client.flushdb()
+    rts.TIME_SERIES_BACKEND = "list"
+    _, elapsed = timed(lambda: [rts.store_time_series_data(SERIES, d, ts) for ts, d in points])
+    print(f"list   insert        {len(points) / elapsed:10.0f} points/s")
+
+    results, elapsed = timed(lambda: [list_range(s, e) for s, e in windows])
+    list_counts = [len(r) for r in results]
+    print(f"list   range query   {args.queries / elapsed:10.1f} queries/s")
+
+    days = [(START + datetime.timedelta(days=d)).date() for d in range(args.days)]
+    _, elapsed = timed(lambda: [rts.compress_historical_data(SERIES, day) for day in days])
+    print(f"list   downsample    {elapsed * 1000:10.1f} ms (compress_historical_data per day)")
+
+    # Sorted-set layout
+    client.flushdb()
+    series = SortedSetTimeSeries(SERIES, TimeSeriesGranularity.MINUTE, redis_client=client)
+    _, elapsed = timed(series.add_many, points)
+    print(f"zset   insert        {len(points) / elapsed:10.0f} points/s (pipelined)")
+
+    results, elapsed = timed(lambda: [series.range(s, e) for s, e in windows])
+    assert [len(r) for r in results] == list_counts
+    print(f"zset   range query   {args.queries / elapsed:10.1f} queries/s")
+
+    buckets, elapsed = timed(series.downsample, None, None, TimeSeriesGranularity.HOURLY)
+    where = "server-side" if series._scripting_available else "client-side fallback"
+    print(f"zset   downsample    {elapsed * 1000:10.1f} ms ({len(buckets)} hourly buckets, {where})")
+
+    memory = client.memory_usage(series.key) if target != "fakeredis" else None
+    if memory:
+        print(f"zset   memory        {memory / 1024:10.1f} KiB")
+    print(f"sample bucket: {json.dumps(buckets[0])}")
+
+
+if __name__ == "__main__":
+    main()
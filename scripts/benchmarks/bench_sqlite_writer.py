@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - SQLite Writer Benchmark
+======================================
+
+Compares rows/s of the legacy connect/insert/commit/close per call path with
+the write-behind ``SQLiteBatchWriter`` on a throwaway database file.
+
+Usage:
+    python scripts/benchmarks/bench_sqlite_writer.py --rows 20000
+"""
+
+import os
+import sys
+import time
+import sqlite3
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from omega_ai.db_manager.sqlite_writer import INSERT_STATEMENTS, SQLiteBatchWriter
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS price_movements (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    price REAL NOT NULL, volume REAL, timestamp TEXT NOT NULL,
+    interval INTEGER NOT NULL, change_pct REAL, abs_change REAL
+);
+CREATE INDEX IF NOT EXISTS idx_price_movements_interval_timestamp
+ON price_movements (interval, timestamp);
+'''
+
+
+def make_rows(count: int):
+    return [(84000.0 + i * 0.5, 1.0, f"2025-01-01T00:{i // 60 % 60:02d}:{i % 60:02d}", 1, 0.01, 0.5)
+            for i in range(count)]
+
+
+def run_legacy(path: str, rows) -> float:
+    start = time.perf_counter()
+    for row in rows:
+        conn = sqlite3.connect(path)
+        conn.execute(INSERT_STATEMENTS["price_movements"], row)
+        conn.commit()
+        conn.close()
+    return len(rows) / (time.perf_counter() - start)
+
+
+def run_writer(path: str, rows, max_batch: int, max_latency: float) -> float:
+    writer = SQLiteBatchWriter(path, max_batch=max_batch, max_latency=max_latency)
+    start = time.perf_counter()
+    for row in rows:
+        writer.submit("price_movements", row)
+    writer.close()
+    return len(rows) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark SQLite insert paths")
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--legacy-rows", type=int, default=2000)
+    parser.add_argument("--max-batch", type=int, default=500)
+    parser.add_argument("--max-latency", type=float, default=0.25)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_db = os.path.join(tmp, "legacy.db")
+        batched_db = os.path.join(tmp, "batched.db")
+        for path in (legacy_db, batched_db):
+            conn = sqlite3.connect(path)
+            conn.executescript(SCHEMA)
+            conn.close()
+
+        legacy_rate = run_legacy(legacy_db, make_rows(args.legacy_rows))
+        print(f"legacy per-call commit   : {legacy_rate:12.0f} rows/s")
+        batched_rate = run_writer(batched_db, make_rows(args.rows), args.max_batch, args.max_latency)
+        print(f"write-behind WAL batches : {batched_rate:12.0f} rows/s "
+              f"(x{batched_rate / legacy_rate:.1f})")
+
+
+if __name__ == "__main__":
+    main()
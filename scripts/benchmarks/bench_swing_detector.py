@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - Swing Detector Replay Benchmark
+==============================================
+
+Replays a day of one-second ticks through ``FibonacciDetector.update_price_data``
+and through the list-based swing scan it replaced, for several rolling window
+sizes. Prints the per-update cost of both and checks that they confirm the
+same swing highs and lows on every tick.
+
+``fibonacci_detector`` connects to Redis on import; when no server answers at
+``REDIS_HOST``/``REDIS_PORT`` an in-process fakeredis stand-in is used.
+
+Usage:
+    python scripts/benchmarks/bench_swing_detector.py --ticks 86400 --windows 5 7 11 21
+"""
+
+import os
+import sys
+import math
+import time
+import random
+import logging
+import argparse
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import redis
+
+try:
+    redis.StrictRedis(host=os.getenv('REDIS_HOST', 'localhost'), port=int(os.getenv('REDIS_PORT', '6379'))).ping()
+except redis.RedisError:
+    import fakeredis
+    redis.StrictRedis = fakeredis.FakeStrictRedis
+
+from omega_ai.mm_trap_detector.fibonacci_detector import FibonacciDetector, redis_conn
+
+START = datetime(2024, 5, 1, tzinfo=timezone.utc)
+
+
+class ListSwingScan:
+    """The list-based update_price_data the detector ran before, minus its logging."""
+
+    def __init__(self, window: int, min_swing_diff: float = 0.005):
+        self.rolling_window_size = window
+        self.min_swing_diff = min_swing_diff
+        self.confirmation_threshold = 3
+        self.max_false_retracement = 0.002
+        self.price_history = []
+        self.potential_swing_highs = []
+        self.potential_swing_lows = []
+        self.recent_swing_high = None
+        self.recent_swing_low = None
+        self.last_confirmed_direction = None
+
+    def update_price_data(self, current_price, timestamp):
+        if timestamp is None:
+            raise ValueError("Timestamp cannot be None")
+        if not isinstance(timestamp, datetime):
+            raise ValueError("Invalid timestamp type")
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        timestamp = timestamp.astimezone(timezone.utc)
+        current_time = datetime.now(timezone.utc)
+        epoch_start = datetime(1970, 1, 1, tzinfo=timezone.utc)
+        if timestamp < epoch_start:
+            raise ValueError("Invalid timestamp: cannot be before Unix epoch")
+        if timestamp > current_time:
+            raise ValueError("Invalid timestamp: cannot be in the future")
+        if not isinstance(current_price, (int, float)) or math.isnan(current_price) or math.isinf(current_price):
+            raise ValueError("Invalid price value")
+        if current_price <= 0:
+            raise ValueError("Invalid price: must be a positive number")
+
+        self.price_history.append((timestamp, current_price))
+        if len(self.price_history) > 100:
+            self.price_history = self.price_history[-100:]
+        if len(self.price_history) >= self.rolling_window_size:
+            window = self.price_history[-self.rolling_window_size:]
+            window_prices = [p for _, p in window]
+            window_timestamps = [t for t, _ in window]
+            for i in range(1, len(window_prices) - 1):
+                if self._is_potential_swing(window_prices, i, 1):
+                    self.potential_swing_highs.append(
+                        {"price": window_prices[i], "timestamp": window_timestamps[i], "confirmation_count": 1})
+                if self._is_potential_swing(window_prices, i, -1):
+                    self.potential_swing_lows.append(
+                        {"price": window_prices[i], "timestamp": window_timestamps[i], "confirmation_count": 1})
+            for potential in self.potential_swing_highs:
+                if current_price < potential["price"]:
+                    potential["confirmation_count"] += 1
+                elif current_price > potential["price"]:
+                    potential["confirmation_count"] = 0
+            for potential in self.potential_swing_lows:
+                if current_price > potential["price"]:
+                    potential["confirmation_count"] += 1
+                elif current_price < potential["price"]:
+                    potential["confirmation_count"] = 0
+            for potential in self.potential_swing_highs:
+                if potential["confirmation_count"] >= self.confirmation_threshold:
+                    if self.recent_swing_high is None or potential["price"] > self.recent_swing_high:
+                        self.recent_swing_high = potential["price"]
+                        redis_conn.set("fibonacci:swing_high", self.recent_swing_high)
+                        redis_conn.set("fibonacci:swing_high_timestamp", potential["timestamp"].isoformat())
+                        self.last_confirmed_direction = "UP"
+            for potential in self.potential_swing_lows:
+                if potential["confirmation_count"] >= self.confirmation_threshold:
+                    if self.recent_swing_low is None or potential["price"] < self.recent_swing_low:
+                        self.recent_swing_low = potential["price"]
+                        redis_conn.set("fibonacci:swing_low", self.recent_swing_low)
+                        redis_conn.set("fibonacci:swing_low_timestamp", potential["timestamp"].isoformat())
+                        self.last_confirmed_direction = "DOWN"
+            recent_prices = [p for _, p in self.price_history[-5:]]
+            avg_price = sum(recent_prices) / len(recent_prices)
+            volatility = max(recent_prices) - min(recent_prices)
+            if volatility / avg_price < self.max_false_retracement:
+                self.potential_swing_highs = [
+                    p for p in self.potential_swing_highs if p["price"] > avg_price + (volatility * 1.5)]
+                self.potential_swing_lows = [
+                    p for p in self.potential_swing_lows if p["price"] < avg_price - (volatility * 1.5)]
+            if len(self.price_history) > 20:
+                cutoff_time = self.price_history[-20][0]
+                self.potential_swing_highs = [
+                    p for p in self.potential_swing_highs
+                    if p["confirmation_count"] > 0 and p["timestamp"] >= cutoff_time]
+                self.potential_swing_lows = [
+                    p for p in self.potential_swing_lows
+                    if p["confirmation_count"] > 0 and p["timestamp"] >= cutoff_time]
+        if self.recent_swing_high is None:
+            self.recent_swing_high = max(p for _, p in self.price_history)
+        if self.recent_swing_low is None:
+            self.recent_swing_low = min(p for _, p in self.price_history)
+
+    def _is_potential_swing(self, prices, index, direction):
+        if direction > 0:
+            if prices[index] <= prices[index-1] or prices[index] <= prices[index+1]:
+                return False
+            if (prices[index] - self.recent_swing_low) / self.recent_swing_low < self.min_swing_diff:
+                return False
+            if index >= 3 and not (prices[index-3] < prices[index-2] < prices[index-1] < prices[index]):
+                return prices[index-1] > prices[index-2]
+            return True
+        if prices[index] >= prices[index-1] or prices[index] >= prices[index+1]:
+            return False
+        if (self.recent_swing_high - prices[index]) / prices[index] < self.min_swing_diff:
+            return False
+        if index >= 3 and not (prices[index-3] > prices[index-2] > prices[index-1] > prices[index]):
+            return prices[index-1] < prices[index-2]
+        return True
+
+
+def generate_ticks(count: int, seed: int = 42):
+    rng = random.Random(seed)
+    price = 84000.0
+    ticks = []
+    for i in range(count):
+        price = round(price * (1 + rng.gauss(0, 0.0006)), 2)
+        ticks.append((price, START + timedelta(seconds=i)))
+    return ticks
+
+
+def replay(detector, ticks):
+    """Feed every tick, returning elapsed seconds and the swing state after each tick."""
+    states = []
+    elapsed = 0.0
+    for price, timestamp in ticks:
+        start = time.perf_counter()
+        detector.update_price_data(price, timestamp)
+        elapsed += time.perf_counter() - start
+        states.append((detector.recent_swing_high, detector.recent_swing_low, detector.last_confirmed_direction))
+    return elapsed, states
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark incremental vs list-based swing detection")
+    parser.add_argument("--ticks", type=int, default=86400, help="One-second ticks to replay")
+    parser.add_argument("--windows", type=int, nargs="+", default=[5, 7, 11, 21])
+    parser.add_argument("--min-swing-diff", type=float, default=0.001)
+    args = parser.parse_args()
+
+    # Both sides are timed without log output
+    logging.getLogger(FibonacciDetector.__module__).setLevel(logging.WARNING)
+    ticks = generate_ticks(args.ticks)
+    print(f"Ticks: {len(ticks)} | min swing diff: {args.min_swing_diff:.2%}")
+
+    for window in args.windows:
+        legacy = ListSwingScan(window, args.min_swing_diff)
+        legacy_elapsed, legacy_states = replay(legacy, ticks)
+
+        detector = FibonacciDetector(symbol="BTCUSDT")
+        detector.rolling_window_size = window
+        detector.min_swing_diff = args.min_swing_diff
+        elapsed, states = replay(detector, ticks)
+
+        mismatches = sum(1 for a, b in zip(states, legacy_states) if a != b)
+        confirmed = len({(high, low) for high, low, _ in states})
+        print(f"window {window:3d}   list scan {legacy_elapsed / len(ticks) * 1e6:7.1f} us/update   "
+              f"incremental {elapsed / len(ticks) * 1e6:7.1f} us/update   "
+              f"speedup {legacy_elapsed / elapsed:5.1f}x   "
+              f"{confirmed} swing states, {mismatches} mismatching ticks")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - Tick Ingestion Benchmark
+=======================================
+
+Compares the legacy one-command-per-call tick path with the pipelined
+``TickIngestor`` (inline and micro-batched) and reports ticks/s and p99
+ingest latency.
+
+Uses the Redis at ``--redis-url`` when reachable, otherwise an in-process
+fakeredis stand-in (which has no network round trip, so the gap measured
+there is a lower bound of what a real server shows).
+
+Usage:
+    python scripts/benchmarks/bench_tick_ingestion.py --ticks 20000 --window-ms 5
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import redis
+
+from omega_ai.data_feed.tick_ingestor import TickIngestor
+
+
+def connect(url: str):
+    """Return a Redis client, falling back to fakeredis when no server is up."""
+    try:
+        client = redis.Redis.from_url(url, decode_responses=True)
+        client.ping()
+        return client, url
+    except redis.RedisError:
+        import fakeredis
+        return fakeredis.FakeRedis(decode_responses=True), "fakeredis"
+
+
+def generate_ticks(count: int, seed: int = 42):
+    rng = random.Random(seed)
+    price = 84000.0
+    ticks = []
+    for _ in range(count):
+        price = round(price + rng.gauss(0, 5), 2)
+        ticks.append((price, round(rng.uniform(0.001, 2.0), 4)))
+    return ticks
+
+
+def legacy_ingest(client, price: float, volume: float) -> None:
+    """The per-call path the live feed used before the ingestor."""
+    prev_price = client.get("prev_btc_price")
+    prev_price = float(prev_price) if prev_price else None
+    if prev_price is not None and price == prev_price:
+        return
+    client.set("last_btc_price", str(price))
+    client.set("last_btc_volume", str(volume))
+    client.lpush("btc_movement_history", f"{price},{volume}")
+    client.ltrim("btc_movement_history", 0, 99)
+    abs_change = abs(price - prev_price) if prev_price is not None else 0
+    client.lpush("abs_price_change_history", str(abs_change * 100))
+    client.ltrim("abs_price_change_history", 0, 99)
+    client.set("prev_btc_price", str(price))
+    client.set("last_btc_update_time", str(time.time()))
+    count = client.get("fibonacci_update_count")
+    if count and int(count) < 100:
+        client.set("fibonacci_update_count", str(int(count) + 1))
+    else:
+        client.set("fibonacci_update_count", "1")
+    client.set("fibonacci_alignment", "0")
+
+
+def percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
+
+
+def run_legacy(client, ticks):
+    client.flushdb()
+    latencies = []
+    start = time.perf_counter()
+    for price, volume in ticks:
+        t0 = time.perf_counter()
+        legacy_ingest(client, price, volume)
+        latencies.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - start
+    return len(ticks) / elapsed, percentile(latencies, 99)
+
+
+def run_ingestor(client, ticks, window: float):
+    client.flushdb()
+    ingestor = TickIngestor(redis_client=client, batch_window=window)
+    start = time.perf_counter()
+    for price, volume in ticks:
+        ingestor.ingest(price, volume)
+    ingestor.close()
+    elapsed = time.perf_counter() - start
+    return len(ticks) / elapsed, ingestor.stats.latency_percentile(99), ingestor.stats.commits
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark BTC tick ingestion into Redis")
+    parser.add_argument("--redis-url", default=os.getenv("REDIS_URL", "redis://localhost:6379/15"))
+    parser.add_argument("--ticks", type=int, default=20000)
+    parser.add_argument("--window-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    client, target = connect(args.redis_url)
+    ticks = generate_ticks(args.ticks)
+    print(f"Target: {target} | ticks: {args.ticks}")
+
+    rate, p99 = run_legacy(client, ticks)
+    print(f"legacy per-call       {rate:10.0f} ticks/s   p99 {p99 * 1000:8.3f} ms")
+
+    rate, p99, commits = run_ingestor(client, ticks, 0.0)
+    print(f"pipelined inline      {rate:10.0f} ticks/s   p99 {p99 * 1000:8.3f} ms   commits {commits}")
+
+    rate, p99, commits = run_ingestor(client, ticks, args.window_ms / 1000.0)
+    print(f"pipelined {args.window_ms:g}ms batch  {rate:10.0f} ticks/s   p99 {p99 * 1000:8.3f} ms   commits {commits}")
+
+
+if __name__ == "__main__":
+    main()
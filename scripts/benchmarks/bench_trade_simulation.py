@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - Trade Simulation Benchmark
+=========================================
+
+Times evaluating one aggressive trade setup over many scenarios with the
+scalar ``TradeSimulator.simulate_aggressive_trade`` loop versus the
+vectorized ``simulate_aggressive_batch``, and prints the batch PnL
+distribution.
+
+Usage:
+    python scripts/benchmarks/bench_trade_simulation.py --scenarios 10000
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import numpy as np
+
+from omega_ai.trading.trade_simulation import TradeSimulator
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark scalar vs vectorized trade simulation")
+    parser.add_argument("--scenarios", type=int, default=10000)
+    parser.add_argument("--direction", choices=["LONG", "SHORT"], default="LONG")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    sign = 1.0 if args.direction == "LONG" else -1.0
+    entry = 84000.0
+    trade = {
+        "direction": args.direction,
+        "entry_price": entry,
+        "position_size": 0.05,
+        "stop_loss": entry * (1 - sign * 0.01),
+        "take_profits": [
+            {"price": entry * (1 + sign * 0.005), "percentage": 0.5},
+            {"price": entry * (1 + sign * 0.01), "percentage": 1.0}
+        ],
+        "leverage": 10,
+        "emotional_state": "neutral"
+    }
+    simulator = TradeSimulator()
+
+    random.seed(args.seed)
+    start = time.perf_counter()
+    scalar_pnl = np.array([simulator.simulate_aggressive_trade(**trade)[0] for _ in range(args.scenarios)])
+    scalar_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    trade["n_paths"] = args.scenarios
+    result = simulator.simulate_aggressive_batch(seed=args.seed, **trade)
+    batch_elapsed = time.perf_counter() - start
+
+    print(f"Scenarios: {args.scenarios} | {args.direction}")
+    print(f"scalar   {scalar_elapsed * 1000:10.1f} ms   {args.scenarios / scalar_elapsed:10.0f} scenarios/s   "
+          f"mean P&L {scalar_pnl.mean():8.2f}")
+    print(f"batch    {batch_elapsed * 1000:10.1f} ms   {args.scenarios / batch_elapsed:10.0f} scenarios/s   "
+          f"mean P&L {result.mean_pnl:8.2f}")
+    print(f"speedup  {scalar_elapsed / batch_elapsed:10.1f}x")
+
+    summary = result.summary()
+    quantiles = ", ".join(f"p{int(q * 100)} {v:.2f}" for q, v in summary["quantiles"].items())
+    print(f"P&L quantiles: {quantiles}")
+    print(f"win rate {summary['win_rate'] * 100:.1f}% | max drawdown {summary['max_drawdown']:.2f} | "
+          f"exits {summary['exits']}")
+
+
+if __name__ == "__main__":
+    main()
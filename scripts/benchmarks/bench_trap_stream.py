@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - Trap Queue Throughput Benchmark
+==============================================
+
+Drains a backlog of traps through the sorted-set polling loop of
+``mm_trap_consumer`` (one consumer; ``zrange`` + ``zrem``, sleeping when
+empty) and through the Redis Streams consumer group with 1, 2, 4, ...
+consumer processes, printing traps/s for each.
+
+Each trap costs ``--work-ms`` of simulated I/O (the database insert and alert
+of a high-confidence trap), which is what extra consumers overlap. Needs a
+Redis server at ``REDIS_HOST``/``REDIS_PORT``; the benchmark keys are
+deleted afterwards.
+
+Usage:
+    python scripts/benchmarks/bench_trap_stream.py --traps 5000 --consumers 1 2 4 8 --work-ms 1
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import multiprocessing
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import redis
+
+from omega_ai.mm_trap_detector.trap_stream import TrapStreamQueue
+
+ZSET_KEY = "bench:mm_trap_queue:zset"
+STREAM_KEY = "bench:mm_trap_queue:stream"
+GROUP = "bench_consumers"
+BATCH_SIZE = 50
+
+
+def connect() -> redis.Redis:
+    return redis.Redis(host=os.getenv('REDIS_HOST', 'localhost'), port=int(os.getenv('REDIS_PORT', '6379')),
+                       decode_responses=True)
+
+
+def traps(count: int):
+    return [{"type": "bull_trap", "confidence": 0.9, "price": 84000.0 + i % 500, "seq": i} for i in range(count)]
+
+
+def handle(trap: str, work_s: float) -> bool:
+    json.loads(trap)
+    time.sleep(work_s)
+    return True
+
+
+def drain_zset(client: redis.Redis, total: int, work_s: float) -> float:
+    """The sorted-set loop: fetch a batch, process it serially, remove it."""
+    start = time.perf_counter()
+    done = 0
+    while done < total:
+        items = client.zrange(ZSET_KEY, 0, BATCH_SIZE - 1)
+        if not items:
+            time.sleep(0.1)
+            continue
+        processed = [item for item in items if handle(item, work_s)]
+        client.zrem(ZSET_KEY, *processed)
+        done += len(processed)
+    return time.perf_counter() - start
+
+
+def stream_consumer(name: str, work_s: float, done_counter, total: int) -> None:
+    queue = TrapStreamQueue(connect(), stream=STREAM_KEY, group=GROUP)
+    while done_counter.value < total:
+        entries = queue.read(name, BATCH_SIZE, block_ms=100)
+        processed = [entry_id for entry_id, trap in entries if handle(trap, work_s)]
+        queue.ack(processed)
+        with done_counter.get_lock():
+            done_counter.value += len(processed)
+
+
+def drain_stream(consumers: int, total: int, work_s: float) -> float:
+    done_counter = multiprocessing.Value("i", 0)
+    workers = [multiprocessing.Process(target=stream_consumer, args=(f"bench-{i}", work_s, done_counter, total))
+               for i in range(consumers)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark sorted-set vs stream trap consumers")
+    parser.add_argument("--traps", type=int, default=5000)
+    parser.add_argument("--consumers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--work-ms", type=float, default=1.0, help="Simulated processing time per trap")
+    args = parser.parse_args()
+    work_s = args.work_ms / 1000
+
+    client = connect()
+    try:
+        client.ping()
+    except redis.RedisError as e:
+        sys.exit(f"This benchmark needs a Redis server ({e})")
+
+    payloads = [json.dumps(trap) for trap in traps(args.traps)]
+    print(f"Traps: {args.traps} | work per trap: {args.work_ms} ms")
+    try:
+        client.delete(ZSET_KEY)
+        client.zadd(ZSET_KEY, {payload: i for i, payload in enumerate(payloads)})
+        elapsed = drain_zset(client, args.traps, work_s)
+        baseline = args.traps / elapsed
+        print(f"sorted set, 1 consumer    {baseline:10.0f} traps/s")
+
+        for consumers in args.consumers:
+            client.delete(STREAM_KEY)
+            queue = TrapStreamQueue(client, stream=STREAM_KEY, group=GROUP, maxlen=args.traps * 2)
+            queue.ensure_group()
+            pipe = client.pipeline(transaction=False)
+            for payload in payloads:
+                pipe.xadd(STREAM_KEY, {"trap": payload})
+            pipe.execute()
+
+            elapsed = drain_stream(consumers, args.traps, work_s)
+            rate = args.traps / elapsed
+            print(f"stream, {consumers:2d} consumer(s)    {rate:10.0f} traps/s   {rate / baseline:5.1f}x   "
+                  f"pending after drain: {queue.pending_count()}")
+    finally:
+        client.delete(ZSET_KEY, STREAM_KEY)
+
+
+if __name__ == "__main__":
+    main()
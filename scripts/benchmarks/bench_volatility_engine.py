@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - HF Volatility Benchmark
+======================================
+
+Per-tick cost of the high-frequency detector's volatility metrics: the legacy
+list rebuild + ``np.std``/``np.mean``/``np.diff`` + three Redis SETs per
+tick, against ``VolatilityEngine`` ring buffers with throttled publication.
+Tick timestamps are simulated at each rate so the publish throttle behaves
+as it would live.
+
+Uses the Redis at ``--redis-url`` when reachable, otherwise fakeredis (no
+network round trip, so the legacy cost shown is a lower bound).
+
+Usage:
+    python scripts/benchmarks/bench_volatility_engine.py --ticks 20000
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+from collections import deque
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import numpy as np
+import redis
+
+from omega_ai.mm_trap_detector.volatility_engine import VolatilityEngine
+
+
+def connect(url: str):
+    """Return a Redis client, falling back to fakeredis when no server is up."""
+    try:
+        client = redis.Redis.from_url(url, decode_responses=True)
+        client.ping()
+        return client, url
+    except redis.RedisError:
+        import fakeredis
+        return fakeredis.FakeRedis(decode_responses=True), "fakeredis"
+
+
+def legacy_tick(client, history_1min, history_5min, tick, price) -> None:
+    """The previous update_price_data + _calculate_volatility_metrics path."""
+    history_1min.append((tick, price))
+    if tick % 5 == 0:
+        history_5min.append((tick, price))
+    if len(history_1min) >= 3:
+        prices_1min = [p[1] for p in history_1min]
+        client.set("volatility_1min", float(np.std(prices_1min) / np.mean(prices_1min) * 100))
+        if len(history_1min) >= 4:
+            diffs = np.diff(prices_1min)
+            client.set("price_acceleration_1min", float(np.std(diffs) / np.mean(prices_1min) * 100))
+    if len(history_5min) >= 3:
+        prices_5min = [p[1] for p in history_5min]
+        client.set("volatility_5min", float(np.std(prices_5min) / np.mean(prices_5min) * 100))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark HF detector volatility metrics")
+    parser.add_argument("--ticks", type=int, default=20000)
+    parser.add_argument("--redis-url", default="redis://localhost:6379/0")
+    parser.add_argument("--publish-interval", type=float, default=1.0)
+    args = parser.parse_args()
+
+    client, backend = connect(args.redis_url)
+    rng = random.Random(1)
+    prices = np.cumsum([84000.0] + [rng.gauss(0, 5) for _ in range(args.ticks - 1)]).tolist()
+    print(f"backend={backend} ticks={args.ticks}")
+
+    start = time.perf_counter()
+    history_1min, history_5min = deque(maxlen=10), deque(maxlen=12)
+    for tick, price in enumerate(prices, start=1):
+        legacy_tick(client, history_1min, history_5min, tick, price)
+    legacy_us = (time.perf_counter() - start) / args.ticks * 1e6
+    print(f"legacy              : {legacy_us:8.2f} us/tick")
+
+    for rate in (1000, 5000, 10000):
+        engine = VolatilityEngine(publish_interval=args.publish_interval)
+        start = time.perf_counter()
+        for tick, price in enumerate(prices):
+            engine.update(price)
+            engine.publish(client, now=tick / rate)
+        engine_us = (time.perf_counter() - start) / args.ticks * 1e6
+        budget_us = 1e6 / rate
+        print(f"engine @ {rate:5d} ticks/s: {engine_us:8.2f} us/tick "
+              f"({engine_us / budget_us * 100:5.1f}% of tick budget, legacy {legacy_us / budget_us * 100:6.1f}%) "
+              f"publishes={engine.publishes} x{legacy_us / engine_us:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - WebSocket Fan-out Load Test
+==========================================
+
+Starts ``mm_websocket_server_v2`` on a free local port, connects hundreds of
+clients (a few of them deliberately slow readers) and broadcasts price
+updates at a fixed rate, first through the sequential send loop the server
+used before and then through the per-client outboxes. Prints delivered
+messages/s and the p50/p99 delivery latency (broadcast to receive) seen by
+the clients that keep up.
+
+Usage:
+    python scripts/benchmarks/bench_ws_fanout.py --clients 300 --slow 5 --messages 200 --rate 100
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import logging
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import websockets
+
+from omega_ai.mm_trap_detector import mm_websocket_server_v2 as server
+from omega_ai.mm_trap_detector.ws_fanout import percentile
+
+
+async def sequential_broadcast(message):
+    """The broadcast loop the server ran before: one awaited send per client."""
+    if not isinstance(message, str):
+        message = json.dumps(message)
+    for client_id, client_info in list(server.connected_clients.items()):
+        try:
+            await client_info.websocket.send(message)
+        except websockets.exceptions.ConnectionClosed:
+            server.connected_clients.pop(client_id, None)
+
+
+async def client(url: str, delay: float, latencies, received, stop: asyncio.Event):
+    async with websockets.connect(url, max_queue=None) as ws:
+        while not stop.is_set():
+            try:
+                message = await asyncio.wait_for(ws.recv(), 0.5)
+            except asyncio.TimeoutError:
+                continue
+            sent_at = json.loads(message)["sent_at"]
+            if delay:
+                await asyncio.sleep(delay)
+            else:
+                latencies.append(time.perf_counter() - sent_at)
+            received[0] += 1
+
+
+async def run(mode: str, args) -> None:
+    broadcast = sequential_broadcast if mode == "sequential" else server.broadcast
+    url = f"ws://{server.MM_WS_HOST}:{server.MM_WS_PORT}"
+    latencies, received, stop = [], [0], asyncio.Event()
+    clients = [asyncio.create_task(client(url, args.slow_delay if i < args.slow else 0.0, latencies, received, stop))
+               for i in range(args.clients)]
+    while len(server.connected_clients) < args.clients:
+        await asyncio.sleep(0.05)
+
+    interval = 1.0 / args.rate
+    start = time.perf_counter()
+    for i in range(args.messages):
+        await broadcast({"type": "price", "btc_price": 84000.0 + i, "sent_at": time.perf_counter()})
+        await asyncio.sleep(max(0.0, start + (i + 1) * interval - time.perf_counter()))
+    await asyncio.sleep(1.0)
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await asyncio.gather(*clients, return_exceptions=True)
+    while server.connected_clients:
+        await asyncio.sleep(0.05)
+
+    print(f"{mode:10s} {received[0] / elapsed:10.0f} msgs/s   p50 {percentile(latencies, 50) * 1000:7.2f} ms   p99 {percentile(latencies, 99) * 1000:8.2f} ms   "
+          f"fast-client deliveries {len(latencies)}/{(args.clients - args.slow) * args.messages}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test the MM WebSocket broadcast fan-out")
+    parser.add_argument("--clients", type=int, default=300)
+    parser.add_argument("--slow", type=int, default=5, help="Clients that take --slow-delay per message")
+    parser.add_argument("--slow-delay", type=float, default=0.05)
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--rate", type=float, default=100.0, help="Broadcasts per second")
+    args = parser.parse_args()
+
+    logging.getLogger('mm_websocket_v2').setLevel(logging.ERROR)
+    await server.start_server(detect_ports=True, start_port=19000)
+    print(f"Clients: {args.clients} ({args.slow} slow) | broadcasts: {args.messages} at {args.rate:.0f}/s")
+    try:
+        for mode in ("sequential", "fan-out"):
+            await run(mode, args)
+        print(json.dumps({k: v for k, v in server.get_fanout_stats().items() if k != "clients"}))
+    finally:
+        await server.stop_server()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+OMEGA BTC AI - Time Series Layout Migration
+===========================================
+
+Copies simulation time series from the per-day JSON list layout
+(``sim_<series>:YYYY-MM-DD:<granularity>``) into the sorted-set layout
+(``sim_<series>:ts:<granularity>``) read when ``TIME_SERIES_BACKEND=zset``.
+The copy is idempotent, so it can be re-run before switching the backend.
+
+Usage:
+    python scripts/redis/migrate_time_series.py price_history trap_history --delete-source
+"""
+
+import os
+import sys
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import redis
+
+from omega_ai.mm_trap_detector.redis_time_series import TimeSeriesGranularity, migrate_list_series
+
+# ANSI color codes for prettier output
+GREEN = "\033[92m"
+BLUE = "\033[94m"
+RESET = "\033[0m"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Migrate time series from Redis lists to sorted sets")
+    parser.add_argument("series", nargs="+", help="Series names, e.g. price_history")
+    parser.add_argument("--redis-url", default=os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+    parser.add_argument("--granularity", choices=[g.value for g in TimeSeriesGranularity],
+                        action="append", help="Granularity to migrate (default: all)")
+    parser.add_argument("--delete-source", action="store_true",
+                        help="Delete each list once it has been copied")
+    args = parser.parse_args()
+
+    client = redis.Redis.from_url(args.redis_url)
+    granularities = [TimeSeriesGranularity(g) for g in args.granularity] if args.granularity \
+        else list(TimeSeriesGranularity)
+
+    for series in args.series:
+        for granularity in granularities:
+            stats = migrate_list_series(series, granularity, redis_client=client,
+                                        delete_source=args.delete_source)
+            print(f"{BLUE}{series}:{granularity.value}{RESET} "
+                  f"{GREEN}{stats['points']} points from {stats['keys']} keys{RESET}")
+
+
+if __name__ == "__main__":
+    main()
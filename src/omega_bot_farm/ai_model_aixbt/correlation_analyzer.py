@@ -22,7 +22,8 @@ Analyzes the correlation between AIXBT and BTC prices using advanced statistical
 Identifies patterns, lag effects, and causal relationships between the two assets.
 
 Features:
-- Multi-timeframe correlation analysis
+- Multi-timeframe correlation analysis (timeframes evaluated in parallel)
+- FFT cross-correlation lag search with an incremental rolling mode
 - Dynamic time warping for lag detection
 - Non-linear correlation measurement
 - Harmonic pattern recognition
@@ -34,12 +35,18 @@ import json
 import logging
 import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Union, Tuple
 from datetime import datetime, timezone, timedelta
 from scipy.stats import pearsonr, spearmanr, kendalltau
 from statsmodels.tsa.stattools import grangercausalitytests, ccf
 from tslearn.metrics import dtw
 
+try:
+    from .lag_correlation import RollingLagCorrelation, optimal_lag as find_optimal_lag
+except ImportError:
+    from lag_correlation import RollingLagCorrelation, optimal_lag as find_optimal_lag
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -77,6 +84,9 @@ class CorrelationAnalyzer:
         self.config = config or {}
         self.max_lag = self.config.get("max_lag", 10)
         self.timeframes = self.config.get("timeframes", ["1h", "4h", "1d"])
+        self.rolling_window = self.config.get("rolling_window", 200)
+        self.max_workers = self.config.get("max_workers", 4)
+        self.rolling_lag: Optional[RollingLagCorrelation] = None
         self.correlation_history = {}
         self.causal_history = {}
         
@@ -172,7 +182,7 @@ class CorrelationAnalyzer:
         dtw_distance = dtw(aixbt.reshape(-1, 1), btc.reshape(-1, 1))
         
         # Granger causality testing
-        granger_results = self._test_granger_causality()
+        granger_results = self._test_granger_causality(optimal_lag)
         
         # Harmonic pattern alignment
         harmonic_alignment = self._calculate_harmonic_alignment(aixbt, btc)
@@ -247,34 +257,47 @@ class CorrelationAnalyzer:
     def _find_optimal_lag(self, x: np.ndarray, y: np.ndarray) -> Tuple[int, float]:
         """Find the optimal lag between two time series."""
         try:
-            # Calculate cross-correlation function
-            max_lag = min(self.max_lag, len(x) // 5)  # Limit max lag to 20% of series length
-            
-            # Calculate correlations for different lags
-            correlations = []
-            for lag in range(-max_lag, max_lag + 1):
-                if lag < 0:
-                    # Negative lag: y leads x
-                    corr, _ = pearsonr(x[:lag], y[-lag:])
-                elif lag > 0:
-                    # Positive lag: x leads y
-                    corr, _ = pearsonr(x[lag:], y[:-lag])
-                else:
-                    # No lag
-                    corr, _ = pearsonr(x, y)
-                
-                correlations.append((lag, corr))
-            
-            # Find lag with maximum absolute correlation
-            optimal_lag, max_corr = max(correlations, key=lambda x: abs(x[1]))
+            # Limit max lag to 20% of series length
+            max_lag = min(self.max_lag, len(x) // 5)
             
-            return optimal_lag, max_corr
+            # Pearson correlation of every lag from one FFT cross-correlation.
+            # Positive lag: x[lag:] against y[:-lag]; negative: x[:lag] against y[-lag:]
+            return find_optimal_lag(x, y, max_lag)
         except Exception as e:
             logger.error(f"{LOG_PREFIX} - Error finding optimal lag: {e}")
             return 0, 0.0
     
-    def _test_granger_causality(self) -> Dict[str, Any]:
-        """Test Granger causality between BTC and AIXBT prices."""
+    def update_rolling(self, aixbt_price: float, btc_price: float) -> Optional[Tuple[int, float]]:
+        """
+        Add one bar to the rolling lag correlation.
+        
+        Correlations for every lag over the last ``rolling_window`` bars are
+        updated incrementally rather than recomputed.
+        
+        Args:
+            aixbt_price: Latest AIXBT price
+            btc_price: Latest BTC price
+            
+        Returns:
+            (optimal_lag, correlation) once the window is full, otherwise None
+        """
+        if self.rolling_lag is None:
+            self.rolling_lag = RollingLagCorrelation(
+                self.rolling_window, min(self.max_lag, self.rolling_window // 5)
+            )
+        
+        result = self.rolling_lag.update(aixbt_price, btc_price)
+        if result is not None:
+            self.latest_results["rolling_optimal_lag"], self.latest_results["rolling_lag_correlation"] = result
+        return result
+    
+    def _test_granger_causality(self, optimal_lag: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Test Granger causality between BTC and AIXBT prices.
+        
+        Args:
+            optimal_lag: Lag whose p-values are used (defaults to the latest result's)
+        """
         results = {
             "btc_causes_aixbt": False,
             "aixbt_causes_btc": False,
@@ -310,7 +333,9 @@ class CorrelationAnalyzer:
             )
             
             # Extract p-values for optimal lag
-            optimal_lag = min(self.latest_results.get("optimal_lag", 1), len(test_result_btc))
+            if optimal_lag is None:
+                optimal_lag = self.latest_results.get("optimal_lag", 1)
+            optimal_lag = min(optimal_lag, len(test_result_btc))
             if optimal_lag < 1:
                 optimal_lag = 1
                 
@@ -485,32 +510,51 @@ class CorrelationAnalyzer:
             logger.error(f"{LOG_PREFIX} - Error estimating convergence probability: {e}")
             return 0.5
     
-    def analyze_multi_timeframe(self, data_dict: Dict[str, pd.DataFrame]) -> Dict[str, Dict[str, Any]]:
+    def analyze_multi_timeframe(
+        self, data_dict: Dict[str, pd.DataFrame], parallel: bool = True
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Analyze correlation across multiple timeframes.
         
+        Each timeframe is analyzed by its own analyzer so they can run
+        concurrently; results are merged back in timeframe order.
+        
         Args:
             data_dict: Dictionary mapping timeframes to DataFrames
+            parallel: Analyze timeframes in a thread pool (``max_workers``)
             
         Returns:
             Dictionary with analysis results for each timeframe
         """
-        results = {}
-        
+        timeframes = []
         for timeframe, data in data_dict.items():
             if data.empty:
                 logger.warning(f"{LOG_PREFIX} - Empty data for timeframe {timeframe}")
                 continue
-                
-            # Set current timeframe in config
-            self.config["current_timeframe"] = timeframe
-            
-            # Load data and analyze
-            self.load_data(data)
-            timeframe_results = self.analyze_correlation()
+            timeframes.append(timeframe)
+        
+        def analyze(timeframe: str) -> "CorrelationAnalyzer":
+            analyzer = CorrelationAnalyzer({**self.config, "current_timeframe": timeframe})
+            analyzer.load_data(data_dict[timeframe])
+            analyzer.analyze_correlation()
+            return analyzer
+        
+        if parallel and len(timeframes) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(timeframes))) as executor:
+                analyzers = list(executor.map(analyze, timeframes))
+        else:
+            analyzers = [analyze(timeframe) for timeframe in timeframes]
+        
+        results = {}
+        for timeframe, analyzer in zip(timeframes, analyzers):
+            results[timeframe] = analyzer.latest_results
+            self.correlation_history.setdefault(timeframe, []).extend(analyzer.correlation_history.get(timeframe, []))
+            self.causal_history.update(analyzer.causal_history)
             
-            # Store results
-            results[timeframe] = timeframe_results
+            # Leave this analyzer as if the timeframes had run one after another
+            self.config["current_timeframe"] = timeframe
+            self.data, self.aixbt_prices, self.btc_prices = analyzer.data, analyzer.aixbt_prices, analyzer.btc_prices
+            self.latest_results = analyzer.latest_results
             
             logger.info(f"{LOG_PREFIX} - Completed analysis for timeframe {timeframe}")
         
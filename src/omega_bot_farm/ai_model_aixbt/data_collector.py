@@ -22,7 +22,8 @@ Collects data from various sources including Redis, stdout logs, and system metr
 Prepares and transforms data for AI model training.
 
 Features:
-- Redis data collection for AIXBT and BTC prices
+- Redis data collection for AIXBT and BTC prices, aligned by a sorted
+  nearest-timestamp join with optional incremental collection
 - Log parsing for extracting labeled data
 - Volume data extraction and normalization
 - System metrics collection
@@ -70,6 +71,107 @@ REQUIRED_FIELDS = [
     "timestamp", "aixbt_price", "btc_price", "correlation", 
     "volume_aixbt", "volume_btc", "market_phase"
 ]
+AIXBT_HISTORY_KEY = "aixbt_movement_history"
+BTC_HISTORY_KEY = "btc_movement_history"
+CORRELATION_HISTORY_KEY = "aixbt_btc_correlation_history"
+DEFAULT_ALIGNMENT_TOLERANCE = timedelta(hours=1)  # Furthest BTC/correlation entry joined to an AIXBT row
+INCREMENTAL_PAGE_SIZE = 200
+RAW_HISTORY_LIMIT = 100000
+
+def parse_entries(items: List[str]) -> List[Dict[str, Any]]:
+    """Decode JSON history entries, skipping anything that is not a JSON object."""
+    entries = []
+    for item in items:
+        if not item:
+            continue
+        try:
+            entry = json.loads(item)
+        except (ValueError, TypeError):
+            continue
+        if isinstance(entry, dict):
+            entries.append(entry)
+    return entries
+
+def _strip_utc_suffix(value: str) -> str:
+    if value.endswith("+00:00"):
+        return value[:-6]
+    if value.endswith("Z"):
+        return value[:-1]
+    raise ValueError(f"Not a UTC timestamp: {value}")
+
+def parse_timestamps(values: List[Any]) -> pd.Series:
+    """
+    Parse ISO timestamps in one vectorized pass (NaT when missing or invalid).
+
+    The feeds write ``datetime.now(timezone.utc).isoformat()``; when every
+    value is such a UTC string NumPy parses them directly, several times
+    faster than the general ISO 8601 parser used otherwise.
+    """
+    try:
+        parsed = np.array([_strip_utc_suffix(value) for value in values], dtype="datetime64[ns]")
+        return pd.Series(parsed).dt.tz_localize("UTC")
+    except (AttributeError, TypeError, ValueError):
+        return pd.to_datetime(
+            pd.Series(values, dtype=object), utc=True, errors="coerce", format="ISO8601"
+        ).dt.as_unit("ns")
+
+def entry_timestamps(entries: List[Dict[str, Any]]) -> pd.Series:
+    return parse_timestamps([entry.get("timestamp") for entry in entries])
+
+def newer_than(entries: List[Dict[str, Any]], cutoff: Optional[pd.Timestamp]) -> List[Dict[str, Any]]:
+    """Return the entries timestamped after ``cutoff`` (all of them when it is None)."""
+    if cutoff is None or not entries:
+        return entries
+    keep = (entry_timestamps(entries) > cutoff).to_numpy()
+    return [entry for entry, newer in zip(entries, keep) if newer]
+
+def newest_timestamp(entries: List[Dict[str, Any]]) -> Optional[pd.Timestamp]:
+    newest = entry_timestamps(entries).max() if entries else pd.NaT
+    return None if pd.isna(newest) else newest
+
+def series_frame(entries: List[Dict[str, Any]], columns: Dict[str, Tuple[str, Any]]) -> pd.DataFrame:
+    """
+    Build a time-sorted frame from parsed history entries.
+
+    Timestamps are parsed once for the whole series; entries without a parseable
+    timestamp are dropped. ``columns`` maps output column -> (entry field, default).
+    """
+    fields = [field for field, _ in columns.values()]
+    frame = pd.DataFrame.from_records(entries, columns=["timestamp", *fields]) if entries else \
+        pd.DataFrame(columns=["timestamp", *fields])
+    frame = frame.rename(columns={field: name for name, (field, _) in columns.items()})
+    frame = frame.fillna({name: default for name, (_, default) in columns.items()}).infer_objects()
+    frame["timestamp"] = parse_timestamps(frame["timestamp"].tolist())
+    frame = frame.dropna(subset=["timestamp"])
+    return frame.sort_values("timestamp", kind="mergesort").reset_index(drop=True)
+
+def align_series(
+    aixbt_entries: List[Dict[str, Any]],
+    btc_entries: List[Dict[str, Any]],
+    correlation_entries: List[Dict[str, Any]],
+    tolerance: timedelta = DEFAULT_ALIGNMENT_TOLERANCE
+) -> pd.DataFrame:
+    """
+    Join each AIXBT entry with the BTC and correlation entries nearest in time.
+
+    A sorted merge-asof join, O(n log n) overall. Entries further than
+    ``tolerance`` away are not joined and leave 0.0, as do missing series.
+    """
+    df = series_frame(aixbt_entries, {
+        "aixbt_price": ("price", 0.0),
+        "volume_aixbt": ("volume", 0.0),
+        "is_simulated": ("simulated", False)
+    })
+    btc = series_frame(btc_entries, {"btc_price": ("price", 0.0), "volume_btc": ("volume", 0.0)})
+    correlation = series_frame(correlation_entries, {"correlation": ("correlation", 0.0)})
+
+    for other in (btc, correlation):
+        # Duplicate timestamps resolve to the last listed entry, like the old dict lookup
+        other = other.drop_duplicates("timestamp", keep="last")
+        df = pd.merge_asof(df, other, on="timestamp", direction="nearest", tolerance=pd.Timedelta(tolerance))
+    fill = {"btc_price": 0.0, "volume_btc": 0.0, "correlation": 0.0}
+    df = df.fillna(fill).infer_objects()
+    return df[["timestamp", "aixbt_price", "btc_price", "volume_aixbt", "volume_btc", "correlation", "is_simulated"]]
 
 class AixbtDataCollector:
     """Data collector for AIXBT AI model training."""
@@ -85,6 +187,12 @@ class AixbtDataCollector:
         self.redis_client = None
         self.redis_manager = None
         self.data_storage_path = self.config.get("data_storage_path", DEFAULT_DATA_STORAGE_PATH)
+        self.alignment_tolerance = timedelta(
+            seconds=self.config.get("alignment_tolerance_seconds", DEFAULT_ALIGNMENT_TOLERANCE.total_seconds())
+        )
+        
+        # Newest timestamp collected per Redis key, for incremental collection
+        self.last_collected: Dict[str, pd.Timestamp] = {}
         
         # Ensure data directory exists
         os.makedirs(self.data_storage_path, exist_ok=True)
@@ -174,83 +282,53 @@ class AixbtDataCollector:
             logger.error(f"{LOG_PREFIX} - Error connecting to Redis: {e}")
             self.redis_client = None
     
-    async def get_price_data_from_redis(self, timeframe: str = "1h", limit: int = 1000) -> pd.DataFrame:
+    async def get_price_data_from_redis(
+        self,
+        timeframe: str = "1h",
+        limit: int = 1000,
+        incremental: bool = False
+    ) -> pd.DataFrame:
         """
         Retrieve price data from Redis and format as DataFrame.
         
         Args:
             timeframe: Time frame to retrieve data for
-            limit: Maximum number of entries to retrieve
+            limit: Maximum number of entries to retrieve per series
+            incremental: Only fetch and return AIXBT entries newer than the
+                last collected one (BTC and correlation entries are fetched
+                back to the alignment tolerance before it)
             
         Returns:
             DataFrame with price data
         """
-        data = []
-        
         try:
-            # Determine keys based on timeframe
-            aixbt_key = f"aixbt_movement_history"
-            btc_key = f"btc_movement_history"
-            correlation_key = f"aixbt_btc_correlation_history"
-            
-            # Get data from Redis
-            if self.redis_manager is not None:
-                # Using Enhanced Redis Manager
-                aixbt_data = await self.redis_manager.lrange(aixbt_key, 0, limit-1)
-                btc_data = await self.redis_manager.lrange(btc_key, 0, limit-1)
-                correlation_data = await self.redis_manager.lrange(correlation_key, 0, limit-1)
-            elif self.redis_client is not None:
-                # Using standard Redis client
-                aixbt_data = self.redis_client.lrange(aixbt_key, 0, limit-1)
-                btc_data = self.redis_client.lrange(btc_key, 0, limit-1)
-                correlation_data = self.redis_client.lrange(correlation_key, 0, limit-1)
-            else:
+            if self.redis_manager is None and self.redis_client is None:
                 logger.error(f"{LOG_PREFIX} - No Redis connection available")
                 return pd.DataFrame()
             
-            # Parse JSON data
-            aixbt_parsed = [json.loads(item) for item in aixbt_data if item]
-            btc_parsed = [json.loads(item) for item in btc_data if item]
-            correlation_parsed = [json.loads(item) for item in correlation_data if item]
-            
-            # Store raw data for later processing
-            self.raw_data["aixbt_prices"] = aixbt_parsed
-            self.raw_data["btc_prices"] = btc_parsed
-            self.raw_data["correlations"] = correlation_parsed
-            
-            # Create lookup dictionaries for easier merging
-            btc_dict = {item.get("timestamp"): item for item in btc_parsed}
-            correlation_dict = {item.get("timestamp"): item for item in correlation_parsed}
-            
-            # Merge data based on timestamps
-            for aixbt_item in aixbt_parsed:
-                timestamp = aixbt_item.get("timestamp")
-                if not timestamp:
-                    continue
-                    
-                # Find closest matching timestamp for BTC and correlation data
-                btc_item = self._find_closest_entry(timestamp, btc_dict)
-                correlation_item = self._find_closest_entry(timestamp, correlation_dict)
+            since = self.last_collected.get(AIXBT_HISTORY_KEY) if incremental else None
+            context_since = since - pd.Timedelta(self.alignment_tolerance) if since is not None else None
+            fetched = {}
+            for key, name, cutoff in ((AIXBT_HISTORY_KEY, "aixbt_prices", since),
+                                      (BTC_HISTORY_KEY, "btc_prices", context_since),
+                                      (CORRELATION_HISTORY_KEY, "correlations", context_since)):
+                fetched[key] = await self._fetch_history(key, limit, cutoff)
                 
-                # Combine data
-                entry = {
-                    "timestamp": timestamp,
-                    "aixbt_price": aixbt_item.get("price", 0.0),
-                    "btc_price": btc_item.get("price", 0.0) if btc_item else 0.0,
-                    "volume_aixbt": aixbt_item.get("volume", 0.0),
-                    "volume_btc": btc_item.get("volume", 0.0) if btc_item else 0.0,
-                    "correlation": correlation_item.get("correlation", 0.0) if correlation_item else 0.0,
-                    "is_simulated": aixbt_item.get("simulated", False)
-                }
-                
-                data.append(entry)
-            
-            # Create DataFrame and sort by timestamp
-            df = pd.DataFrame(data)
+                # Store raw data for later processing (newest first, as in Redis)
+                if since is None:
+                    self.raw_data[name] = fetched[key]
+                else:
+                    new_entries = newer_than(fetched[key], self.last_collected.get(key))
+                    self.raw_data[name] = (new_entries + self.raw_data[name])[:RAW_HISTORY_LIMIT]
+                newest = newest_timestamp(fetched[key])
+                if newest is not None and (key not in self.last_collected or newest > self.last_collected[key]):
+                    self.last_collected[key] = newest
+            
+            df = align_series(
+                fetched[AIXBT_HISTORY_KEY], fetched[BTC_HISTORY_KEY], fetched[CORRELATION_HISTORY_KEY],
+                self.alignment_tolerance
+            )
             if not df.empty:
-                df["timestamp"] = pd.to_datetime(df["timestamp"])
-                df = df.sort_values("timestamp")
-                
                 # Resample to desired timeframe
                 if timeframe != "1m":
                     df = self._resample_dataframe(df, timeframe)
@@ -263,30 +341,36 @@ class AixbtDataCollector:
             logger.error(traceback.format_exc())
             return pd.DataFrame()
     
-    def _find_closest_entry(self, timestamp: str, data_dict: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Find the closest matching timestamp in a dictionary of entries."""
-        if timestamp in data_dict:
-            return data_dict[timestamp]
-            
-        # Parse timestamp
-        target_dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-        
-        # Find closest match
-        closest_entry = None
-        min_diff = timedelta(hours=1)  # Maximum allowed difference
+    async def _lrange(self, key: str, start: int, end: int) -> List[str]:
+        if self.redis_manager is not None:
+            return await self.redis_manager.lrange(key, start, end) or []
+        return self.redis_client.lrange(key, start, end) or []
+    
+    async def _fetch_history(self, key: str, limit: int, since: Optional[pd.Timestamp] = None) -> List[Dict[str, Any]]:
+        """
+        Read up to ``limit`` parsed entries of a newest-first history list.
         
-        for ts, entry in data_dict.items():
-            try:
-                entry_dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-                diff = abs(entry_dt - target_dt)
-                
-                if diff < min_diff:
-                    min_diff = diff
-                    closest_entry = entry
-            except (ValueError, TypeError):
-                continue
-                
-        return closest_entry
+        With ``since``, pages are read from the head only until an entry at or
+        before ``since`` shows up, so a repeated collection touches just the
+        entries pushed since the last one.
+        """
+        if since is None:
+            return parse_entries(await self._lrange(key, 0, limit - 1))
+        
+        parsed: List[Dict[str, Any]] = []
+        start = 0
+        while start < limit:
+            end = min(limit, start + INCREMENTAL_PAGE_SIZE) - 1
+            items = await self._lrange(key, start, end)
+            page = parse_entries(items)
+            parsed.extend(page)
+            if len(items) < end - start + 1:
+                break
+            oldest = entry_timestamps(page[-1:])[0] if page else pd.NaT
+            if pd.notna(oldest) and oldest <= since:
+                break
+            start = end + 1
+        return newer_than(parsed, since)
     
     def _resample_dataframe(self, df: pd.DataFrame, timeframe: str) -> pd.DataFrame:
         """Resample DataFrame to a specific timeframe."""
@@ -296,12 +380,12 @@ class AixbtDataCollector:
             "5m": "5min",
             "15m": "15min",
             "30m": "30min",
-            "1h": "1H",
-            "4h": "4H",
+            "1h": "1h",
+            "4h": "4h",
             "1d": "1D"
         }
         
-        rule = rules.get(timeframe, "1H")
+        rule = rules.get(timeframe, "1h")
         
         # Set timestamp as index for resampling
         df = df.set_index("timestamp")
@@ -571,20 +655,21 @@ class AixbtDataCollector:
             logger.error(f"{LOG_PREFIX} - Error loading training data: {e}")
             return pd.DataFrame()
 
-    async def collect_data(self, timeframe: str = "1h", limit: int = 1000) -> pd.DataFrame:
+    async def collect_data(self, timeframe: str = "1h", limit: int = 1000, incremental: bool = False) -> pd.DataFrame:
         """
         Main method to collect all required data and prepare for model training.
         
         Args:
             timeframe: Time frame to collect data for
             limit: Maximum number of entries to collect
+            incremental: Only fetch entries newer than the last collection
             
         Returns:
             DataFrame with prepared data
         """
         try:
             # Get price data from Redis
-            price_data = await self.get_price_data_from_redis(timeframe, limit)
+            price_data = await self.get_price_data_from_redis(timeframe, limit, incremental=incremental)
             
             # Prepare training data
             training_data = self.prepare_training_data()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+AIXBT Lag Correlation
+====================
+
+Lagged Pearson correlation between two price series for every lag at once.
+
+For lag ``k > 0`` the pairs are ``(x[i + k], y[i])`` (x lags y by k bars),
+for ``k < 0`` they are ``(x[i], y[i - k])``; each lag is correlated over its
+own overlap, exactly like calling ``pearsonr`` on the shifted slices. The
+window sums come from prefix sums and the cross products of all lags from
+one FFT, so the whole lag range costs O(n log n) instead of one pass over
+the series per lag.
+
+``RollingLagCorrelation`` keeps the same per-lag sums for a sliding window
+and updates them in O(lags) as each new bar arrives.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+def _next_fast_len(n: int) -> int:
+    """Smallest 2^a * 3^b * 5^c >= n, a size numpy's FFT handles quickly."""
+    best = 1 << max(0, (n - 1).bit_length())
+    p5 = 1
+    while p5 < best:
+        p35 = p5
+        while p35 < best:
+            candidate = p35
+            while candidate < n:
+                candidate *= 2
+            best = min(best, candidate)
+            p35 *= 3
+        p5 *= 5
+    return best
+
+
+def _correlation(count, sx, sy, sxx, syy, sxy) -> np.ndarray:
+    """Pearson correlation from sums; NaN where either side has no variance."""
+    cov = count * sxy - sx * sy
+    var_x = count * sxx - sx * sx
+    var_y = count * syy - sy * sy
+    with np.errstate(divide="ignore", invalid="ignore"):
+        denominator = np.sqrt(var_x * var_y)
+        corr = np.where(denominator > 0, cov / denominator, np.nan)
+    return np.clip(corr, -1.0, 1.0)
+
+
+def _lag_sums(x: np.ndarray, y: np.ndarray, lags: np.ndarray) -> np.ndarray:
+    """Rows ``sx, sy, sxx, syy, sxy`` of each lag's overlapping pairs."""
+    n = len(x)
+    px = np.concatenate(([0.0], np.cumsum(x)))
+    py = np.concatenate(([0.0], np.cumsum(y)))
+    qx = np.concatenate(([0.0], np.cumsum(x * x)))
+    qy = np.concatenate(([0.0], np.cumsum(y * y)))
+
+    # x occupies [x_start, x_start + count) and y [y_start, y_start + count)
+    x_start = np.maximum(lags, 0)
+    y_start = np.maximum(-lags, 0)
+    count = n - np.abs(lags)
+
+    # cross[k] = sum_i x[i + k] * y[i], negative k wrapping to the end
+    size = _next_fast_len(2 * n - 1)
+    cross = np.fft.irfft(np.fft.rfft(x, size) * np.conj(np.fft.rfft(y, size)), size)
+
+    return np.stack((
+        px[x_start + count] - px[x_start],
+        py[y_start + count] - py[y_start],
+        qx[x_start + count] - qx[x_start],
+        qy[y_start + count] - qy[y_start],
+        cross[lags % size]
+    ))
+
+
+def lagged_correlations(x, y, max_lag: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return ``(lags, correlations)`` for lags ``-max_lag..max_lag``.
+
+    Both series must have the same length; ``max_lag`` is capped so every
+    lag keeps at least two pairs.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n != len(y):
+        raise ValueError("x and y must have the same length")
+    max_lag = max(0, min(max_lag, n - 2))
+    lags = np.arange(-max_lag, max_lag + 1)
+    if n < 2:
+        return lags, np.full(len(lags), np.nan)
+
+    # Correlation is shift invariant; centering keeps the sums well conditioned
+    sums = _lag_sums(x - x.mean(), y - y.mean(), lags)
+    return lags, _correlation(n - np.abs(lags), *sums)
+
+
+def best_lag(lags: np.ndarray, correlations: np.ndarray) -> Tuple[int, float]:
+    """Lag with the largest absolute correlation (the first one on ties), or (0, 0.0)."""
+    magnitude = np.abs(correlations)
+    valid = ~np.isnan(magnitude)
+    if not valid.any():
+        return 0, 0.0
+    index = int(np.argmax(np.where(valid, magnitude, -1.0)))
+    return int(lags[index]), float(correlations[index])
+
+
+def optimal_lag(x, y, max_lag: int) -> Tuple[int, float]:
+    """Return ``(lag, correlation)`` maximizing the absolute lagged correlation."""
+    return best_lag(*lagged_correlations(x, y, max_lag))
+
+
+class RollingLagCorrelation:
+    """
+    Lagged correlations over the last ``window`` bars, updated bar by bar.
+
+    Each lag correlates the pairs that lie entirely inside the window, so the
+    result always equals ``lagged_correlations`` on the latest ``window``
+    bars. An update adds the pair that the new bar completes and removes the
+    pair that involved the bar leaving the window, for every lag at once; the
+    sums are rebuilt from the buffer every ``window`` updates so floating
+    point drift cannot accumulate.
+    """
+
+    def __init__(self, window: int, max_lag: int):
+        if window < 3:
+            raise ValueError("window must be at least 3 bars")
+        self.window = window
+        self.max_lag = max(0, min(max_lag, window - 2))
+        self.lags = np.arange(-self.max_lag, self.max_lag + 1)
+        self.count = window - np.abs(self.lags)
+
+        # Ring buffers; bar j of the window (0 = oldest) is at (head + j) % window
+        self._x = np.zeros(window)
+        self._y = np.zeros(window)
+        self._head = 0
+        self._size = 0
+
+        # Window positions of the pair each lag loses with the oldest bar
+        # and gains with the newest one
+        self._oldest = (np.maximum(self.lags, 0), np.maximum(-self.lags, 0))
+        self._newest = (window - 1 - np.maximum(-self.lags, 0), window - 1 - np.maximum(self.lags, 0))
+
+        self._sums: Optional[np.ndarray] = None  # Rows: sx, sy, sxx, syy, sxy
+        self._ref = (0.0, 0.0)
+        self._updates = 0
+
+    @property
+    def ready(self) -> bool:
+        return self._size == self.window
+
+    def _pair(self, positions: Tuple[np.ndarray, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        x_at, y_at = positions
+        return (self._x[(self._head + x_at) % self.window] - self._ref[0],
+                self._y[(self._head + y_at) % self.window] - self._ref[1])
+
+    def _append(self, x_value: float, y_value: float) -> None:
+        if self._size < self.window:
+            self._x[self._size] = x_value
+            self._y[self._size] = y_value
+            self._size += 1
+        else:
+            self._x[self._head] = x_value
+            self._y[self._head] = y_value
+            self._head = (self._head + 1) % self.window
+
+    def _rebuild(self) -> None:
+        x = np.roll(self._x, -self._head)
+        y = np.roll(self._y, -self._head)
+        self._ref = (x.mean(), y.mean())
+        self._sums = _lag_sums(x - self._ref[0], y - self._ref[1], self.lags)
+        self._updates = 0
+
+    def update(self, x_value: float, y_value: float) -> Optional[Tuple[int, float]]:
+        """Add one bar; returns the current ``(lag, correlation)`` once the window is full."""
+        if self._sums is not None and self._updates < self.window:
+            old_x, old_y = self._pair(self._oldest)
+            self._append(x_value, y_value)
+            new_x, new_y = self._pair(self._newest)
+            self._sums += np.stack((
+                new_x - old_x,
+                new_y - old_y,
+                new_x * new_x - old_x * old_x,
+                new_y * new_y - old_y * old_y,
+                new_x * new_y - old_x * old_y
+            ))
+            self._updates += 1
+        else:
+            self._append(x_value, y_value)
+            if not self.ready:
+                return None
+            self._rebuild()
+        return best_lag(self.lags, self.correlations())
+
+    def correlations(self) -> np.ndarray:
+        """Correlation per lag (aligned with ``lags``); NaN until the window is full."""
+        if self._sums is None:
+            return np.full(len(self.lags), np.nan)
+        return _correlation(self.count, *self._sums)
@@ -68,12 +68,36 @@ class DenseLayer(QuantumLayer):
             name=name
         )
         
+        self.input_dim = input_dim
+        self.output_dim = output_dim
+        self.use_complex = use_complex
         self.use_bias = use_bias
         self.weight_initializer = weight_initializer
         
+        # Only callable activations are applied
+        self.activation_fn = activation if callable(activation) else None
+        
         # Initialize weights and biases
         self.initialize_weights()
     
+    def initialize(self, input_shape: Tuple) -> Tuple:
+        """
+        Build the layer for an input shape (weights are created in __init__).
+        
+        Args:
+            input_shape: Shape of input tensor
+            
+        Returns:
+            Shape of output tensor
+        """
+        if input_shape[-1] != self.input_dim:
+            raise ValueError(f"Expected input dimension {self.input_dim}, got {input_shape[-1]}")
+        
+        self.input_shape = input_shape
+        self.output_shape = tuple(input_shape[:-1]) + (self.output_dim,)
+        self.initialized = True
+        return self.output_shape
+    
     def initialize_weights(self):
         """Initialize weights using the specified initializer."""
         # Determine initialization scaling
@@ -193,20 +217,22 @@ class DenseLayer(QuantumLayer):
         if self.activation_fn is not None:
             output = self.activation_fn(output)
         
+        self._cached_output = output
+        
         return output
     
-    def backward(self, 
-                grad_output: np.ndarray, 
-                learning_rate: float = 0.01) -> np.ndarray:
+    def backward(self, grad_output: np.ndarray) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
         """
-        Backward pass to compute gradients and update weights.
+        Backward pass to compute gradients.
+        
+        The weights are not updated here; the model applies the returned
+        gradients with its optimizer.
         
         Args:
             grad_output: Gradient of loss with respect to output
-            learning_rate: Learning rate for weight updates
             
         Returns:
-            Gradient of loss with respect to input
+            Tuple of (gradient with respect to input, gradients of "weights" and "bias")
         """
         # If activation function was applied, compute gradient through it
         if self.activation_fn is not None and hasattr(self.activation_fn, 'gradient'):
@@ -215,20 +241,16 @@ class DenseLayer(QuantumLayer):
         # Gradient of loss with respect to weights: dL/dW = x^T @ dL/dy
         grad_weights = self._cached_input.T @ grad_output
         
+        gradients = {"weights": grad_weights}
+        
         # Gradient of loss with respect to bias: dL/db = sum(dL/dy)
         if self.use_bias:
-            grad_bias = np.sum(grad_output, axis=0)
+            gradients["bias"] = np.sum(grad_output, axis=0)
         
         # Gradient of loss with respect to input: dL/dx = dL/dy @ W^T
         grad_input = grad_output @ self.weights.T
         
-        # Update weights and biases
-        self.weights -= learning_rate * grad_weights
-        
-        if self.use_bias:
-            self.bias -= learning_rate * grad_bias
-        
-        return grad_input
+        return grad_input, gradients
     
     def get_config(self) -> Dict:
         """
@@ -378,18 +400,15 @@ class BatchNormalizationLayer(QuantumLayer):
         
         return output
     
-    def backward(self, 
-                grad_output: np.ndarray, 
-                learning_rate: float = 0.01) -> np.ndarray:
+    def backward(self, grad_output: np.ndarray) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
         """
-        Backward pass to compute gradients and update weights.
+        Backward pass to compute gradients.
         
         Args:
             grad_output: Gradient of loss with respect to output
-            learning_rate: Learning rate for weight updates
             
         Returns:
-            Gradient of loss with respect to input
+            Tuple of (gradient with respect to input, gradients of "gamma" and "beta")
         """
         batch_size = self._cached_input.shape[0]
         
@@ -424,11 +443,7 @@ class BatchNormalizationLayer(QuantumLayer):
                         2 * grad_var * (self._cached_input - self._cached_mean) / batch_size + \
                         grad_mean / batch_size
         
-        # Update parameters
-        self.gamma -= learning_rate * grad_gamma
-        self.beta -= learning_rate * grad_beta
-        
-        return grad_input
+        return grad_input, {"gamma": grad_gamma, "beta": grad_beta}
     
     def get_config(self) -> Dict:
         """
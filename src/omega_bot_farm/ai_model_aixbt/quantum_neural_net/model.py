@@ -20,16 +20,23 @@ Quantum Neural Network Model
 
 Implementation of a full Quantum Neural Network model with composable
 layers for financial time series prediction and trading signal generation.
+
+Training streams shuffled mini-batches from in-memory or memory-mapped
+arrays, can compute gradients data-parallel across worker processes, and
+records per-epoch timing and throughput.
 """
 
 import numpy as np
 from typing import Dict, List, Optional, Union, Tuple, Any, Callable
 import logging
 import json
+import time
+import copy
 import os
 
 # Import quantum layers and utilities
 from .qcnn import QCNN
+from .training import MiniBatchLoader, GradientWorkerPool, open_array, take_rows
 try:
     from .variational import VariationalQuantumLayer
     from .classical_layers import DenseLayer, BatchNormalizationLayer, DropoutLayer
@@ -138,9 +145,18 @@ class QuantumNeuralNetwork:
         self.training_history = {
             "loss": [],
             "val_loss": [],
-            "metrics": {}
+            "metrics": {},
+            "epoch_time": [],
+            "samples_per_second": [],
+            "data_time": []
         }
         
+        # Set by callbacks to end fit() after the current epoch
+        self.stop_training = False
+        
+        # Optimizer state per (layer, parameter); optimizers track moments per instance
+        self._optimizer_slots = {}
+        
         logger.info(f"{LOG_PREFIX} - Created Quantum Neural Network: {name}")
     
     def add(self, layer: Any) -> None:
@@ -175,6 +191,7 @@ class QuantumNeuralNetwork:
                 raise ValueError(f"Unknown optimizer: {optimizer}")
         else:
             self.optimizer = optimizer
+        self._optimizer_slots = {}
         
         # Set loss function
         if isinstance(loss, str):
@@ -224,6 +241,10 @@ class QuantumNeuralNetwork:
         x = inputs
         
         for layer in self.layers:
+            # Build layers on their first input, as calling them would
+            if getattr(layer, "initialized", True) is False:
+                layer.initialize(x.shape)
+            
             try:
                 x = layer.forward(x)
             except AttributeError:
@@ -248,12 +269,13 @@ class QuantumNeuralNetwork:
             layer = self.layers[i]
             
             try:
-                # Propagate gradients backward
-                if i > 0:
-                    grad_output, layer_grads = layer.backward(grad_output)
+                # Propagate gradients backward; layers that update their own
+                # weights return only the gradient with respect to their input
+                result = layer.backward(grad_output)
+                if isinstance(result, tuple):
+                    grad_output, layer_grads = result
                 else:
-                    # For the first layer, we don't need the gradient with respect to input
-                    _, layer_grads = layer.backward(grad_output)
+                    grad_output, layer_grads = result, {}
                 
                 gradients[f"layer_{i}"] = layer_grads
             except (AttributeError, TypeError) as e:
@@ -261,6 +283,96 @@ class QuantumNeuralNetwork:
         
         return gradients
     
+    def _layer_parameters(self, layer: Any) -> Dict[str, np.ndarray]:
+        """
+        Weights dictionary of a layer, keyed like the gradients its backward pass returns.
+        
+        Args:
+            layer: Model layer
+            
+        Returns:
+            The layer's (or its recurrent cell's) weights dictionary, empty if it has none
+        """
+        for owner in (getattr(layer, "cell", None), layer):
+            weights = getattr(owner, "weights", None)
+            if isinstance(weights, dict) and weights:
+                return weights
+        return {}
+    
+    def get_parameters(self, copy_arrays: bool = True) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        Get the trainable parameters of all layers.
+        
+        Args:
+            copy_arrays: Whether to return copies rather than the layers' arrays
+            
+        Returns:
+            Dictionary mapping "layer_<i>" to that layer's parameter arrays
+        """
+        parameters = {}
+        for i, layer in enumerate(self.layers):
+            arrays = self._layer_parameters(layer)
+            if not arrays and hasattr(layer, "get_weights"):
+                arrays = {str(j): weights for j, weights in enumerate(layer.get_weights())}
+            if arrays:
+                parameters[f"layer_{i}"] = {
+                    key: np.array(value, copy=True) if copy_arrays else value for key, value in arrays.items()
+                }
+        return parameters
+    
+    def set_parameters(self, parameters: Dict[str, Dict[str, np.ndarray]]) -> None:
+        """
+        Set trainable parameters, as returned by get_parameters.
+        
+        Args:
+            parameters: Dictionary mapping "layer_<i>" to parameter arrays
+        """
+        for i, layer in enumerate(self.layers):
+            arrays = parameters.get(f"layer_{i}")
+            if not arrays:
+                continue
+            
+            weights = self._layer_parameters(layer)
+            if weights:
+                weights.update(arrays)
+            elif hasattr(layer, "set_weights"):
+                layer.set_weights([arrays[str(j)] for j in range(len(arrays))])
+    
+    def save_parameters(self, filepath: str) -> None:
+        """
+        Save trainable parameters to an .npz file (written atomically).
+        
+        Args:
+            filepath: Path of the checkpoint file
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(filepath)), exist_ok=True)
+        flat = {
+            f"{layer_key}/{key}": value
+            for layer_key, arrays in self.get_parameters(copy_arrays=False).items()
+            for key, value in arrays.items()
+        }
+        
+        temp_path = f"{filepath}.tmp"
+        with open(temp_path, "wb") as f:
+            np.savez(f, **flat)
+        os.replace(temp_path, filepath)
+    
+    def load_parameters(self, filepath: str) -> None:
+        """
+        Load trainable parameters saved by save_parameters.
+        
+        Args:
+            filepath: Path of the checkpoint file
+        """
+        parameters: Dict[str, Dict[str, np.ndarray]] = {}
+        with np.load(filepath) as data:
+            for name in data.files:
+                layer_key, key = name.split("/", 1)
+                parameters.setdefault(layer_key, {})[key] = data[name]
+        
+        self.set_parameters(parameters)
+        logger.info(f"{LOG_PREFIX} - Parameters loaded from {filepath}")
+    
     def _update_parameters(self, gradients: Dict[str, Dict[str, np.ndarray]]) -> None:
         """
         Update model parameters using the optimizer.
@@ -271,44 +383,108 @@ class QuantumNeuralNetwork:
         for i, layer in enumerate(self.layers):
             layer_key = f"layer_{i}"
             
-            if layer_key in gradients:
+            if layer_key not in gradients:
+                continue
+            
+            weights = self._layer_parameters(layer)
+            for key, grad in gradients[layer_key].items():
                 try:
                     # Get current weights
-                    params = {}
-                    for key, value in gradients[layer_key].items():
-                        if hasattr(layer, key):
-                            params[key] = getattr(layer, key)
+                    if key in weights:
+                        param = weights[key]
+                    elif hasattr(layer, key):
+                        param = getattr(layer, key)
+                    else:
+                        continue
                     
-                    # Update parameters
-                    updated_params = self.optimizer.update(params, gradients[layer_key])
+                    # Every parameter gets its own copy of the optimizer and its moments
+                    optimizer = self._optimizer_slots.get((layer_key, key))
+                    if optimizer is None:
+                        optimizer = self._optimizer_slots[(layer_key, key)] = copy.deepcopy(self.optimizer)
+                    
+                    # Update parameters, keeping their precision
+                    updated = np.asarray(optimizer.update(param, grad)).astype(param.dtype, copy=False)
                     
                     # Set updated weights
-                    for key, value in updated_params.items():
-                        if hasattr(layer, key):
-                            setattr(layer, key, value)
+                    if key in weights:
+                        weights[key] = updated
+                    else:
+                        setattr(layer, key, updated)
                 
-                except (AttributeError, TypeError) as e:
-                    logger.warning(f"{LOG_PREFIX} - Cannot update parameters for layer {i}: {e}")
+                except (AttributeError, TypeError, ValueError) as e:
+                    logger.warning(f"{LOG_PREFIX} - Cannot update parameter {key} of layer {i}: {e}")
+    
+    def _loss_gradient(self, y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+        """
+        Gradient of the loss with respect to the predictions.
+        
+        Args:
+            y_true: Target values
+            y_pred: Predicted values
+            
+        Returns:
+            Gradient with the shape of y_pred
+        """
+        if hasattr(self.loss_fn, "gradient"):
+            # Use custom gradient if available
+            return self.loss_fn.gradient(y_true, y_pred)
+        
+        # Numerical approximation of gradient
+        epsilon = 1e-7
+        loss = self.loss_fn(y_true, y_pred)
+        grad_output = np.zeros_like(y_pred)
+        
+        for i in range(y_pred.shape[0]):
+            for j in range(y_pred.size // y_pred.shape[0]):
+                # Compute partial derivative for each output element
+                idx = np.unravel_index(j, y_pred.shape[1:])
+                y_pred_plus = y_pred.copy()
+                y_pred_plus[(i,) + idx] += epsilon
+                
+                loss_plus = self.loss_fn(y_true, y_pred_plus)
+                grad_output[(i,) + idx] = (loss_plus - loss) / epsilon
+        
+        return grad_output
+    
+    def _compute_gradients(self, x_batch: np.ndarray, y_batch: np.ndarray) -> Tuple[np.ndarray, Dict[str, Dict[str, np.ndarray]]]:
+        """
+        Forward and backward pass for one batch.
+        
+        Args:
+            x_batch: Batch inputs
+            y_batch: Batch targets
+            
+        Returns:
+            Tuple of (predictions, gradients for each layer)
+        """
+        y_pred = self._forward(x_batch, training=True)
+        return y_pred, self._backward(self._loss_gradient(y_batch, y_pred))
     
     def fit(self, 
-            x_train: np.ndarray, 
-            y_train: np.ndarray, 
+            x_train: Union[np.ndarray, str], 
+            y_train: Union[np.ndarray, str], 
             epochs: int = 10, 
             batch_size: int = 32,
-            validation_data: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+            validation_data: Optional[Tuple[Union[np.ndarray, str], Union[np.ndarray, str]]] = None,
             verbose: int = 1,
-            callbacks: List[Any] = None) -> Dict[str, List[float]]:
+            callbacks: List[Any] = None,
+            shuffle: bool = True,
+            workers: int = 1,
+            seed: Optional[int] = None) -> Dict[str, List[float]]:
         """
         Train the model.
         
         Args:
-            x_train: Training inputs
-            y_train: Training targets
+            x_train: Training inputs, or path to a .npy file (memory-mapped)
+            y_train: Training targets, or path to a .npy file (memory-mapped)
             epochs: Number of epochs to train
             batch_size: Batch size
-            validation_data: Tuple of (x_val, y_val) for validation
+            validation_data: Tuple of (x_val, y_val) for validation, arrays or .npy paths
             verbose: Verbosity level (0=silent, 1=progress bar, 2=one line per epoch)
-            callbacks: List of callbacks to apply during training
+            callbacks: List of callbacks to apply during training (e.g. training.EarlyStopping)
+            shuffle: Whether to shuffle the training samples every epoch
+            workers: Processes computing each batch's gradients data-parallel (1 = in this process)
+            seed: Seed for shuffling
             
         Returns:
             Training history
@@ -316,6 +492,9 @@ class QuantumNeuralNetwork:
         if not self.is_compiled:
             raise ValueError("Model must be compiled before training")
         
+        loader = MiniBatchLoader(x_train, y_train, batch_size=batch_size, shuffle=shuffle, seed=seed)
+        num_samples = loader.num_samples
+        
         # Initialize history for metrics
         for metric_name in self.metrics:
             if metric_name not in self.training_history["metrics"]:
@@ -326,115 +505,129 @@ class QuantumNeuralNetwork:
                 if val_metric_name not in self.training_history["metrics"]:
                     self.training_history["metrics"][val_metric_name] = []
         
-        # Training loop
-        num_samples = x_train.shape[0]
-        num_batches = int(np.ceil(num_samples / batch_size))
+        for key in ("epoch_time", "samples_per_second", "data_time"):
+            self.training_history.setdefault(key, [])
         
-        for epoch in range(epochs):
-            epoch_loss = 0.0
-            metrics_values = {metric: 0.0 for metric in self.metrics}
-            
-            # Shuffle data
-            indices = np.random.permutation(num_samples)
-            x_shuffled = x_train[indices]
-            y_shuffled = y_train[indices]
-            
-            # Batch training
-            for batch_idx in range(num_batches):
-                start_idx = batch_idx * batch_size
-                end_idx = min(start_idx + batch_size, num_samples)
-                
-                x_batch = x_shuffled[start_idx:end_idx]
-                y_batch = y_shuffled[start_idx:end_idx]
+        callbacks = callbacks or []
+        for callback in callbacks:
+            if hasattr(callback, "set_model"):
+                callback.set_model(self)
+        
+        self.stop_training = False
+        logs = {}
+        pool = None
+        if workers > 1:
+            # Build the layers first so the workers start from this model's parameters
+            self._forward(take_rows(loader.x, np.arange(1)))
+            pool = GradientWorkerPool(self, x_train, y_train, workers)
+        
+        # Training loop
+        try:
+            for epoch in range(epochs):
+                epoch_start = time.perf_counter()
+                data_time = 0.0
+                epoch_loss = 0.0
+                metrics_values = {metric: 0.0 for metric in self.metrics}
                 
-                # Forward pass
-                y_pred = self._forward(x_batch, training=True)
+                # Batch training
+                for indices in loader.batch_indices():
+                    load_start = time.perf_counter()
+                    if pool is None:
+                        x_batch, y_batch = loader.take(indices)
+                        data_time += time.perf_counter() - load_start
+                        
+                        # Forward and backward pass
+                        y_pred, gradients = self._compute_gradients(x_batch, y_batch)
+                    else:
+                        y_batch = take_rows(loader.y, indices)
+                        data_time += time.perf_counter() - load_start
+                        
+                        # Forward and backward pass on the workers' shards
+                        y_pred, gradients = pool.gradients(indices)
+                    
+                    # Compute loss
+                    batch_loss = self.loss_fn(y_batch, y_pred)
+                    epoch_loss += batch_loss * len(indices) / num_samples
+                    
+                    # Compute metrics
+                    for metric_name, metric_fn in self.metrics.items():
+                        metric_value = metric_fn(y_batch, y_pred)
+                        metrics_values[metric_name] += metric_value * len(indices) / num_samples
+                    
+                    # Update parameters
+                    self._update_parameters(gradients)
                 
-                # Compute loss
-                batch_loss = self.loss_fn(y_batch, y_pred)
-                epoch_loss += batch_loss * (end_idx - start_idx) / num_samples
+                epoch_time = time.perf_counter() - epoch_start
+                samples_per_second = num_samples / epoch_time if epoch_time > 0 else 0.0
                 
-                # Compute metrics
-                for metric_name, metric_fn in self.metrics.items():
-                    metric_value = metric_fn(y_batch, y_pred)
-                    metrics_values[metric_name] += metric_value * (end_idx - start_idx) / num_samples
+                # Validation
+                val_loss = None
+                val_metrics = {}
                 
-                # Compute gradient of loss with respect to predictions
-                if hasattr(self.loss_fn, "gradient"):
-                    # Use custom gradient if available
-                    grad_output = self.loss_fn.gradient(y_batch, y_pred)
-                else:
-                    # Numerical approximation of gradient
-                    epsilon = 1e-7
-                    grad_output = np.zeros_like(y_pred)
+                if validation_data is not None:
+                    x_val, y_val = (open_array(data) for data in validation_data)
+                    y_val_pred = self.predict(x_val, batch_size=batch_size)
                     
-                    for i in range(y_pred.shape[0]):
-                        for j in range(y_pred.size // y_pred.shape[0]):
-                            # Compute partial derivative for each output element
-                            idx = np.unravel_index(j, y_pred.shape[1:])
-                            y_pred_plus = y_pred.copy()
-                            y_pred_plus[(i,) + idx] += epsilon
-                            
-                            loss_plus = self.loss_fn(y_batch, y_pred_plus)
-                            grad_output[(i,) + idx] = (loss_plus - batch_loss) / epsilon
-                
-                # Backward pass
-                gradients = self._backward(grad_output)
+                    val_loss = self.loss_fn(y_val, y_val_pred)
+                    
+                    for metric_name, metric_fn in self.metrics.items():
+                        val_metric_value = metric_fn(y_val, y_val_pred)
+                        val_metrics[f"val_{metric_name}"] = val_metric_value
                 
-                # Update parameters
-                self._update_parameters(gradients)
-            
-            # Validation
-            val_loss = None
-            val_metrics = {}
-            
-            if validation_data is not None:
-                x_val, y_val = validation_data
-                y_val_pred = self._forward(x_val, training=False)
+                # Log progress
+                if verbose > 0:
+                    progress_msg = f"Epoch {epoch+1}/{epochs} - loss: {epoch_loss:.4f}"
+                    
+                    for metric_name, metric_value in metrics_values.items():
+                        progress_msg += f" - {metric_name}: {metric_value:.4f}"
+                    
+                    if val_loss is not None:
+                        progress_msg += f" - val_loss: {val_loss:.4f}"
+                        
+                        for metric_name, metric_value in val_metrics.items():
+                            progress_msg += f" - {metric_name}: {metric_value:.4f}"
+                    
+                    progress_msg += f" - {epoch_time:.2f}s ({samples_per_second:.0f} samples/s, data {data_time:.2f}s)"
+                    logger.info(f"{LOG_PREFIX} - {progress_msg}")
                 
-                val_loss = self.loss_fn(y_val, y_val_pred)
+                # Update history
+                self.training_history["loss"].append(float(epoch_loss))
                 
-                for metric_name, metric_fn in self.metrics.items():
-                    val_metric_value = metric_fn(y_val, y_val_pred)
-                    val_metrics[f"val_{metric_name}"] = val_metric_value
-            
-            # Log progress
-            if verbose > 0:
-                progress_msg = f"Epoch {epoch+1}/{epochs} - loss: {epoch_loss:.4f}"
+                if val_loss is not None:
+                    self.training_history["val_loss"].append(float(val_loss))
                 
                 for metric_name, metric_value in metrics_values.items():
-                    progress_msg += f" - {metric_name}: {metric_value:.4f}"
+                    self.training_history["metrics"][metric_name].append(float(metric_value))
                 
-                if val_loss is not None:
-                    progress_msg += f" - val_loss: {val_loss:.4f}"
-                    
-                    for metric_name, metric_value in val_metrics.items():
-                        progress_msg += f" - {metric_name}: {metric_value:.4f}"
+                for metric_name, metric_value in val_metrics.items():
+                    self.training_history["metrics"][metric_name].append(float(metric_value))
                 
-                logger.info(f"{LOG_PREFIX} - {progress_msg}")
-            
-            # Update history
-            self.training_history["loss"].append(float(epoch_loss))
-            
-            if val_loss is not None:
-                self.training_history["val_loss"].append(float(val_loss))
-            
-            for metric_name, metric_value in metrics_values.items():
-                self.training_history["metrics"][metric_name].append(float(metric_value))
-            
-            for metric_name, metric_value in val_metrics.items():
-                self.training_history["metrics"][metric_name].append(float(metric_value))
-            
-            # Execute callbacks
-            if callbacks:
+                self.training_history["epoch_time"].append(epoch_time)
+                self.training_history["samples_per_second"].append(samples_per_second)
+                self.training_history["data_time"].append(data_time)
+                
+                # Execute callbacks
+                logs = {
+                    "loss": epoch_loss,
+                    "val_loss": val_loss,
+                    "epoch_time": epoch_time,
+                    "samples_per_second": samples_per_second,
+                    **metrics_values,
+                    **val_metrics
+                }
                 for callback in callbacks:
                     if hasattr(callback, "on_epoch_end"):
-                        callback.on_epoch_end(epoch, {
-                            "loss": epoch_loss,
-                            "val_loss": val_loss,
-                            **metrics_values,
-                            **val_metrics
-                        })
+                        callback.on_epoch_end(epoch, logs)
+                
+                if self.stop_training:
+                    break
+        finally:
+            if pool is not None:
+                pool.close()
+        
+        for callback in callbacks:
+            if hasattr(callback, "on_train_end"):
+                callback.on_train_end(logs)
         
         return self.training_history
     
@@ -21,6 +21,13 @@ Quantum Long Short-Term Memory (QLSTM)
 Implementation of quantum-inspired LSTM networks for capturing
 temporal dependencies in financial time series data with
 quantum-enhanced memory cells.
+
+``QLSTM`` runs whole batches time-major: the input projections of every
+timestep come from one matmul, gate activations and states are written into
+preallocated (seq, batch, ...) arrays, and backpropagation through time
+reuses them instead of recomputing each step. Real-valued layers never
+touch complex arrays, and ``dtype="float32"`` keeps weights, states and
+gradients in single precision.
 """
 
 import numpy as np
@@ -35,6 +42,10 @@ logger = logging.getLogger("quantum-neural-net")
 LOG_PREFIX = "🧠 vQuB1T-NN"
 SQRT2_INV = 1.0 / np.sqrt(2.0)
 
+# QLSTM keeps gates in i, f, o, c order so the three sigmoid gates are adjacent;
+# the permutation is its own inverse and maps back to the cell's i, f, c, o
+SEQUENCE_GATE_ORDER = [0, 1, 3, 2]
+
 class QuantumLSTMCell(QuantumLayer):
     """
     Quantum-inspired LSTM memory cell.
@@ -46,6 +57,7 @@ class QuantumLSTMCell(QuantumLayer):
     def __init__(self, units: int = 32, 
                  use_complex: bool = True,
                  recurrent_activation: str = "hadamard",
+                 dtype: str = "float64",
                  name: Optional[str] = None):
         """
         Initialize the Quantum LSTM cell.
@@ -54,19 +66,25 @@ class QuantumLSTMCell(QuantumLayer):
             units: Number of hidden units (memory dimensionality)
             use_complex: Whether to use complex numbers for quantum simulation
             recurrent_activation: Activation function for recurrent connections
+            dtype: Floating point precision ("float64" or "float32")
             name: Name of the layer (optional)
         """
         super().__init__(name=name or "QuantumLSTMCell")
         self.params = {
             "units": units,
             "use_complex": use_complex,
-            "recurrent_activation": recurrent_activation
+            "recurrent_activation": recurrent_activation,
+            "dtype": dtype
         }
         
         self.units = units
         self.use_complex = use_complex
         self.recurrent_activation = recurrent_activation
         
+        # Real precision, and the dtype of weights and states (complex of that precision if enabled)
+        self.dtype = np.dtype(dtype)
+        self.state_dtype = np.result_type(self.dtype, np.complex64) if use_complex else self.dtype
+        
         # State variables
         self.hidden_state = None
         self.cell_state = None
@@ -95,7 +113,7 @@ class QuantumLSTMCell(QuantumLayer):
             input_dim = input_shape[0]
         
         # Set up weight data type based on configuration
-        dtype = complex if self.use_complex else float
+        dtype = self.state_dtype
         
         # Initialize gate weights
         # Input gate (i): controls new memory cell input
@@ -137,6 +155,9 @@ class QuantumLSTMCell(QuantumLayer):
         else:
             self.weights["recurrent_kernel"] = np.random.normal(0, w_init_scale, (4, self.units, self.units))
         
+        self.weights["kernel"] = self.weights["kernel"].astype(dtype, copy=False)
+        self.weights["recurrent_kernel"] = self.weights["recurrent_kernel"].astype(dtype, copy=False)
+        
         # Bias terms for each gate
         self.weights["bias"] = np.zeros((4, self.units), dtype=dtype)
         
@@ -162,9 +183,8 @@ class QuantumLSTMCell(QuantumLayer):
         Args:
             batch_size: Batch size for state initialization
         """
-        dtype = complex if self.use_complex else float
-        self.hidden_state = np.zeros((batch_size, self.units), dtype=dtype)
-        self.cell_state = np.zeros((batch_size, self.units), dtype=dtype)
+        self.hidden_state = np.zeros((batch_size, self.units), dtype=self.state_dtype)
+        self.cell_state = np.zeros((batch_size, self.units), dtype=self.state_dtype)
     
     def _quantum_sigmoid(self, x: np.ndarray) -> np.ndarray:
         """
@@ -333,9 +353,6 @@ class QuantumLSTMCell(QuantumLayer):
         o_gate = self.cache["o_gate"]
         c_new = self.cache["c_new"]
         
-        # Extract shapes
-        batch_size = inputs.shape[0]
-        
         # Handle gradient from next timestep if provided
         if grad_states is not None:
             dh_next, dc_next = grad_states
@@ -363,54 +380,22 @@ class QuantumLSTMCell(QuantumLayer):
         dc_tilde_preact = dc_tilde * (1 - c_tilde**2)
         do_preact = do * o_gate * (1 - o_gate)
         
-        # Gradient for weights
-        # Extract gate weights
-        W_i, W_f, W_c, W_o = self.weights["kernel"]
-        U_i, U_f, U_c, U_o = self.weights["recurrent_kernel"]
-        
-        # Initialize weight gradients
-        dW = np.zeros_like(self.weights["kernel"])
-        dU = np.zeros_like(self.weights["recurrent_kernel"])
-        db = np.zeros_like(self.weights["bias"])
-        
-        # Gradients for kernels
-        for b in range(batch_size):
-            # Input weights
-            dW[0] += np.outer(inputs[b], di_preact[b])
-            dW[1] += np.outer(inputs[b], df_preact[b])
-            dW[2] += np.outer(inputs[b], dc_tilde_preact[b])
-            dW[3] += np.outer(inputs[b], do_preact[b])
-            
-            # Recurrent weights
-            dU[0] += np.outer(h_prev[b], di_preact[b])
-            dU[1] += np.outer(h_prev[b], df_preact[b])
-            dU[2] += np.outer(h_prev[b], dc_tilde_preact[b])
-            dU[3] += np.outer(h_prev[b], do_preact[b])
-        
-        # Gradient for biases (summed over batch)
-        db[0] = np.sum(di_preact, axis=0)
-        db[1] = np.sum(df_preact, axis=0)
-        db[2] = np.sum(dc_tilde_preact, axis=0)
-        db[3] = np.sum(do_preact, axis=0)
+        # Gate preactivation gradients stacked as (4, batch_size, units)
+        d_preact = np.stack([di_preact, df_preact, dc_tilde_preact, do_preact])
+        
+        # Gradients for kernels and biases (summed over batch)
+        dW = (inputs.T @ d_preact).astype(self.weights["kernel"].dtype, copy=False)
+        dU = (h_prev.T @ d_preact).astype(self.weights["recurrent_kernel"].dtype, copy=False)
+        db = d_preact.sum(axis=1).astype(self.weights["bias"].dtype, copy=False)
         
         # Gradient for inputs
-        dx = np.zeros_like(inputs)
-        for b in range(batch_size):
-            dx[b] = (di_preact[b] @ W_i.T +
-                     df_preact[b] @ W_f.T +
-                     dc_tilde_preact[b] @ W_c.T +
-                     do_preact[b] @ W_o.T)
-        
-        # Gradient for previous hidden state
-        dh_prev = np.zeros_like(h_prev)
-        for b in range(batch_size):
-            dh_prev[b] = (di_preact[b] @ U_i.T +
-                          df_preact[b] @ U_f.T +
-                          dc_tilde_preact[b] @ U_c.T +
-                          do_preact[b] @ U_o.T)
-        
-        # Gradient for previous cell state
-        dc_prev = dc * f_gate
+        dx = (d_preact @ self.weights["kernel"].transpose(0, 2, 1)).sum(axis=0)
+        if not np.iscomplexobj(inputs):
+            dx = dx.real
+        
+        # Gradients for previous hidden and cell states, for the preceding timestep
+        self.cache["dh_prev"] = (d_preact @ self.weights["recurrent_kernel"].transpose(0, 2, 1)).sum(axis=0)
+        self.cache["dc_prev"] = dc * f_gate
         
         # Return gradients
         return dx, {"kernel": dW, "recurrent_kernel": dU, "bias": db}
@@ -425,7 +410,7 @@ class QLSTM(QuantumLayer):
     
     def __init__(self, units: int = 32, return_sequences: bool = False,
                  use_complex: bool = True, recurrent_activation: str = "hadamard",
-                 name: Optional[str] = None):
+                 dtype: str = "float64", name: Optional[str] = None):
         """
         Initialize the QLSTM layer.
         
@@ -434,6 +419,7 @@ class QLSTM(QuantumLayer):
             return_sequences: Whether to return the full sequence or just the final output
             use_complex: Whether to use complex numbers for quantum simulation
             recurrent_activation: Activation function for recurrent connections
+            dtype: Floating point precision ("float64" or "float32")
             name: Name of the layer (optional)
         """
         super().__init__(name=name or "QLSTM")
@@ -441,7 +427,8 @@ class QLSTM(QuantumLayer):
             "units": units,
             "return_sequences": return_sequences,
             "use_complex": use_complex,
-            "recurrent_activation": recurrent_activation
+            "recurrent_activation": recurrent_activation,
+            "dtype": dtype
         }
         
         self.units = units
@@ -454,14 +441,24 @@ class QLSTM(QuantumLayer):
             units=units,
             use_complex=use_complex,
             recurrent_activation=recurrent_activation,
+            dtype=dtype,
             name=f"{self.name}_cell"
         )
+        self.dtype = self.cell.dtype
+        self.state_dtype = self.cell.state_dtype
         
-        # Sequence cache for backward pass
+        # Sequence cache for backward pass, time-major:
+        # states "h" and "c" are (seq_length + 1, batch_size, units) with the
+        # initial zero state first, "gates" (seq_length, batch_size, 4 * units)
+        # holds the activated i, f, c, o gates and "tanh_c" the activated cell state
         self.sequence_cache = {
             "inputs": None,
             "outputs": None,
-            "states": None
+            "h": None,
+            "c": None,
+            "gates": None,
+            "tanh_c": None,
+            "weights": None
         }
         
         logger.debug(f"{LOG_PREFIX} - Created {self.name} with {units} units, return_sequences={return_sequences}")
@@ -506,6 +503,27 @@ class QLSTM(QuantumLayer):
         
         return self.output_shape
     
+    def _sequence_weights(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Cell kernel (4, input_dim, units), recurrent kernel (4, units, units) and bias (4, units) in sequence gate order."""
+        return (self.cell.weights["kernel"][SEQUENCE_GATE_ORDER],
+                self.cell.weights["recurrent_kernel"][SEQUENCE_GATE_ORDER],
+                self.cell.weights["bias"][SEQUENCE_GATE_ORDER])
+    
+    def _activate_gates(self, z: np.ndarray) -> None:
+        """Apply the gate activations to preactivations (4, batch_size, units) in place."""
+        if self.use_complex:
+            z[:3] = self.cell._quantum_sigmoid(z[:3])
+            z[3] = self.cell._quantum_tanh(z[3])
+            return
+        
+        # Sigmoid for the i, f and o gates, tanh for the candidate, without temporaries
+        sigmoid = z[:3]
+        np.negative(sigmoid, out=sigmoid)
+        np.exp(sigmoid, out=sigmoid)
+        sigmoid += 1
+        np.reciprocal(sigmoid, out=sigmoid)
+        np.tanh(z[3], out=z[3])
+    
     def forward(self, inputs: np.ndarray) -> np.ndarray:
         """
         Perform forward pass computation of the QLSTM layer.
@@ -528,41 +546,55 @@ class QLSTM(QuantumLayer):
             batch_size = 1
             inputs = inputs.reshape(1, seq_length, -1)
         
-        # Reset cell states
-        self.cell.reset_states(batch_size)
+        units = self.units
+        kernel, recurrent_kernel, bias = self._sequence_weights()
         
-        # Initialize output containers
-        if self.return_sequences:
-            outputs = np.zeros((batch_size, seq_length, self.units), 
-                              dtype=complex if self.use_complex else float)
-        else:
-            outputs = np.zeros((batch_size, self.units), 
-                              dtype=complex if self.use_complex else float)
+        # Time-major inputs and the input projections of all timesteps and gates in one matmul
+        x = np.ascontiguousarray(inputs.transpose(1, 0, 2), dtype=self.dtype)
+        gates = np.matmul(x.reshape(seq_length * batch_size, -1), kernel).reshape(4, seq_length, batch_size, units)
+        gates += bias[:, None, None, :]
         
-        # Initialize states and state history
-        h = np.zeros((batch_size, self.units), dtype=complex if self.use_complex else float)
-        c = np.zeros((batch_size, self.units), dtype=complex if self.use_complex else float)
-        states_history = []
+        # Preallocated state history, the zero initial state at index 0
+        h = np.empty((seq_length + 1, batch_size, units), dtype=self.state_dtype)
+        c = np.empty_like(h)
+        tanh_c = np.empty((seq_length, batch_size, units), dtype=self.state_dtype)
+        h[0] = 0
+        c[0] = 0
+        recurrent = np.empty((4, batch_size, units), dtype=self.state_dtype)
         
         # Process sequence
-        for t in range(seq_length):
-            x_t = inputs[:, t, :]
-            h, [h, c] = self.cell.forward(x_t, [h, c])
-            
-            # Store output for each timestep if returning sequences
-            if self.return_sequences:
-                outputs[:, t, :] = h
-            
-            # Store states for backward pass
-            states_history.append((h.copy(), c.copy()))
+        with np.errstate(over="ignore"):
+            for t in range(seq_length):
+                z = gates[:, t]
+                np.matmul(h[t], recurrent_kernel, out=recurrent)
+                z += recurrent
+                self._activate_gates(z)
+                
+                # c_t = f * c_{t-1} + i * c~, h_t = o * tanh(c_t)
+                np.multiply(z[1], c[t], out=c[t + 1])
+                c[t + 1] += z[0] * z[3]
+                tanh_c[t] = self.cell._quantum_tanh(c[t + 1])
+                np.multiply(z[2], tanh_c[t], out=h[t + 1])
         
-        # If not returning sequences, only keep the final output
-        if not self.return_sequences:
-            outputs = h
+        # Batch-major outputs
+        if self.return_sequences:
+            outputs = h[1:].transpose(1, 0, 2)
+        else:
+            outputs = h[seq_length]
+        
+        # Keep the cell's states in step with the sequence
+        self.cell.hidden_state = h[seq_length]
+        self.cell.cell_state = c[seq_length]
         
         # Cache outputs and states for backward pass
-        self.sequence_cache["outputs"] = outputs
-        self.sequence_cache["states"] = states_history
+        self.sequence_cache.update({
+            "outputs": outputs,
+            "h": h,
+            "c": c,
+            "gates": gates,
+            "tanh_c": tanh_c,
+            "weights": (kernel, recurrent_kernel)
+        })
         
         # Remove batch dimension for single sample case if not returning sequences
         if batch_size == 1 and len(self.input_shape) == 2:
@@ -585,7 +617,11 @@ class QLSTM(QuantumLayer):
         """
         # Retrieve cached values
         inputs = self.sequence_cache["inputs"]
-        states_history = self.sequence_cache["states"]
+        h = self.sequence_cache["h"]
+        c = self.sequence_cache["c"]
+        gates = self.sequence_cache["gates"]
+        tanh_c = self.sequence_cache["tanh_c"]
+        kernel, recurrent_kernel = self.sequence_cache["weights"]
         
         # Get input dimensions
         if len(inputs.shape) == 3:
@@ -596,76 +632,74 @@ class QLSTM(QuantumLayer):
             batch_size = 1
             inputs = inputs.reshape(1, seq_length, feature_dim)
         
-        # Reshape gradient if needed
-        if not self.return_sequences:
-            # For non-sequence output, the gradient is for the final output only
-            if len(grad_output.shape) == 1:
-                grad_output = grad_output.reshape(1, -1)
-        else:
-            # For sequence output, ensure gradient has batch dimension
-            if len(grad_output.shape) == 2:
-                grad_output = grad_output.reshape(1, seq_length, -1)
+        units = self.units
         
-        # Initialize gradients
-        grad_inputs = np.zeros_like(inputs)
-        grad_kernel = np.zeros_like(self.cell.weights["kernel"])
-        grad_recurrent = np.zeros_like(self.cell.weights["recurrent_kernel"])
-        grad_bias = np.zeros_like(self.cell.weights["bias"])
+        # Time-major gradient from the outputs
+        grad_output = np.asarray(grad_output, dtype=self.state_dtype)
+        if self.return_sequences:
+            grad_output = grad_output.reshape(batch_size, seq_length, units).transpose(1, 0, 2)
+        else:
+            grad_output = grad_output.reshape(batch_size, units)
         
-        # Initialize backward pass
-        dh_next = np.zeros((batch_size, self.units), dtype=inputs.dtype)
-        dc_next = np.zeros((batch_size, self.units), dtype=inputs.dtype)
+        # Gate preactivation gradients of every timestep, filled back to front into
+        # the gate activations buffer (each step's activations are read just before
+        # being overwritten), so backward runs once per forward
+        self.sequence_cache["gates"] = None
+        dh_next = np.zeros((batch_size, units), dtype=self.state_dtype)
+        dc_next = np.zeros_like(dh_next)
+        recurrent_kernel_t = recurrent_kernel.transpose(0, 2, 1)
         
         # Backpropagate through time
         for t in reversed(range(seq_length)):
-            # Get current timestep input
-            x_t = inputs[:, t, :]
-            
-            # For sequence output, add gradient from output at this timestep
+            # Gradient from the output at this timestep plus the one from t + 1
             if self.return_sequences:
-                dh_t = grad_output[:, t, :] + dh_next
+                dh = grad_output[t] + dh_next
+            elif t == seq_length - 1:
+                dh = grad_output + dh_next
             else:
-                # For single output, gradient only flows from the end
-                dh_t = dh_next if t < seq_length - 1 else grad_output
-            
-            # Set up cell state for this timestep
-            self.cell.hidden_state, self.cell.cell_state = states_history[t]
+                dh = dh_next
             
-            # Backpropagate through cell
-            dx_t, grad_weights = self.cell.backward(dh_t, [dh_next, dc_next])
+            i_gate, f_gate, o_gate, c_tilde = gates[:, t]
             
-            # Accumulate weight gradients
-            grad_kernel += grad_weights["kernel"]
-            grad_recurrent += grad_weights["recurrent_kernel"]
-            grad_bias += grad_weights["bias"]
+            # Gradient for cell state
+            dc = dc_next + dh * o_gate * (1 - tanh_c[t] ** 2)
             
-            # Store input gradient for this timestep
-            grad_inputs[:, t, :] = dx_t
+            # Gradients for input, forget, output and candidate gate preactivations
+            di = dc * c_tilde * i_gate * (1 - i_gate)
+            df = dc * c[t] * f_gate * (1 - f_gate)
+            do = dh * tanh_c[t] * o_gate * (1 - o_gate)
+            dc_tilde = dc * i_gate * (1 - c_tilde ** 2)
+            dc_next = dc * f_gate
             
-            # Get previous states for next iteration
-            if t > 0:
-                h_prev, c_prev = states_history[t-1]
-            else:
-                h_prev = np.zeros((batch_size, self.units), dtype=inputs.dtype)
-                c_prev = np.zeros((batch_size, self.units), dtype=inputs.dtype)
-            
-            # Prepare for next timestep (going backward)
-            # This requires recomputing the gate values for t-1
-            if t > 0:
-                self.cell.forward(inputs[:, t-1, :], [h_prev, c_prev])
-                
-                # Get gradient for previous timestep's hidden and cell states
-                _, [dh_next, dc_next] = self.cell.backward(np.zeros_like(h_prev))
+            d = gates[:, t]
+            d[0] = di
+            d[1] = df
+            d[2] = do
+            d[3] = dc_tilde
             
-        # Prepare weight gradients dictionary
+            # Gradient for the previous hidden state
+            dh_next = np.matmul(d, recurrent_kernel_t).sum(axis=0)
+        
+        # Weight and input gradients of all timesteps in one matmul each
+        x = np.ascontiguousarray(inputs.transpose(1, 0, 2), dtype=self.dtype).reshape(-1, feature_dim)
+        d_gates = gates.reshape(4, -1, units)
+        grad_kernel = np.matmul(x.T, d_gates)
+        grad_recurrent = np.matmul(h[:-1].reshape(-1, units).T, d_gates)
+        grad_bias = d_gates.sum(axis=1)
+        grad_inputs = np.matmul(d_gates, kernel.transpose(0, 2, 1)).sum(axis=0)
+        grad_inputs = grad_inputs.reshape(seq_length, batch_size, feature_dim).transpose(1, 0, 2)
+        if not np.iscomplexobj(inputs):
+            grad_inputs = grad_inputs.real
+        
+        # Prepare weight gradients dictionary, in the cell's gate order
         weight_gradients = {
-            "kernel": grad_kernel,
-            "recurrent_kernel": grad_recurrent,
-            "bias": grad_bias
+            "kernel": grad_kernel[SEQUENCE_GATE_ORDER],
+            "recurrent_kernel": grad_recurrent[SEQUENCE_GATE_ORDER],
+            "bias": grad_bias[SEQUENCE_GATE_ORDER]
         }
         
         # Remove batch dimension for single sample case
         if batch_size == 1 and len(self.input_shape) == 2:
             grad_inputs = grad_inputs.reshape(seq_length, feature_dim)
         
-        return grad_inputs, weight_gradients 
\ No newline at end of file
+        return grad_inputs, weight_gradients
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+Quantum Neural Network Training Pipeline
+========================================
+
+Data pipeline and training helpers used by ``QuantumNeuralNetwork.fit``:
+
+- ``MiniBatchLoader`` shuffles indices and gathers mini-batches from
+  in-memory or memory-mapped ``.npy`` arrays, so months of minute data
+  never have to fit in RAM
+- ``GradientWorkerPool`` computes the gradients of a batch data-parallel
+  across worker processes and averages them
+- ``EarlyStopping`` stops training when a monitored loss stops improving,
+  checkpointing and restoring the best parameters
+"""
+
+import os
+import copy
+import logging
+import multiprocessing
+import numpy as np
+from typing import Dict, Iterator, List, Optional, Tuple, Union, Any
+
+# Set up logging
+logger = logging.getLogger("quantum-neural-net")
+
+# Constants
+LOG_PREFIX = "🧠 vQuB1T-NN"
+
+ArraySource = Union[np.ndarray, str]
+
+def open_array(source: ArraySource) -> np.ndarray:
+    """
+    Open a feature or target array.
+
+    Args:
+        source: Array, or path to a ``.npy`` file that is memory-mapped read-only
+
+    Returns:
+        Array (a ``np.memmap`` for paths)
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return np.load(source, mmap_mode="r")
+    return source
+
+class MiniBatchLoader:
+    """
+    Shuffled mini-batches over (possibly memory-mapped) arrays.
+
+    Indices are permuted once per epoch; each batch's indices are sorted
+    before gathering so reads from a memory-mapped file move forward through
+    it. Samples within a batch are therefore in file order, which does not
+    change the (averaged) batch gradient.
+    """
+
+    def __init__(self, x: ArraySource, y: ArraySource, batch_size: int = 32,
+                 shuffle: bool = True, seed: Optional[int] = None, drop_last: bool = False):
+        """
+        Initialize the loader.
+
+        Args:
+            x: Inputs, or path to a ``.npy`` file
+            y: Targets, or path to a ``.npy`` file
+            batch_size: Samples per batch
+            shuffle: Whether to shuffle the samples every epoch
+            seed: Seed for the shuffling
+            drop_last: Whether to skip a final batch smaller than ``batch_size``
+        """
+        self.x = open_array(x)
+        self.y = open_array(y)
+        if len(self.x) != len(self.y):
+            raise ValueError(f"Inputs and targets differ in length: {len(self.x)} vs {len(self.y)}")
+
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        self.rng = np.random.default_rng(seed)
+
+    @property
+    def num_samples(self) -> int:
+        return len(self.x)
+
+    def __len__(self) -> int:
+        if self.drop_last:
+            return self.num_samples // self.batch_size
+        return -(-self.num_samples // self.batch_size)
+
+    def batch_indices(self) -> Iterator[np.ndarray]:
+        """Yield the sorted sample indices of each batch of one epoch."""
+        if self.shuffle:
+            order = self.rng.permutation(self.num_samples)
+        else:
+            order = np.arange(self.num_samples)
+
+        for batch in range(len(self)):
+            indices = order[batch * self.batch_size:(batch + 1) * self.batch_size]
+            yield np.sort(indices) if self.shuffle else indices
+
+    def take(self, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Load the inputs and targets of a batch into memory."""
+        return take_rows(self.x, indices), take_rows(self.y, indices)
+
+    def __iter__(self) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        for indices in self.batch_indices():
+            yield self.take(indices)
+
+def take_rows(array: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """Gather rows into an in-memory array; contiguous runs are read as one slice."""
+    if len(indices) and indices[-1] - indices[0] == len(indices) - 1:
+        return np.array(array[indices[0]:indices[-1] + 1])
+    return np.take(array, indices, axis=0)
+
+def average_gradients(results: List[Tuple[Dict[str, Dict[str, np.ndarray]], int]]) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    Average per-shard gradients, weighted by shard size.
+
+    With losses whose gradient is a mean over the batch this equals the
+    gradient of the whole batch.
+
+    Args:
+        results: List of (gradients from ``_backward``, number of samples)
+
+    Returns:
+        Averaged gradients
+    """
+    total = sum(count for _, count in results)
+    averaged: Dict[str, Dict[str, np.ndarray]] = {}
+    for gradients, count in results:
+        weight = count / total
+        for layer_key, layer_grads in gradients.items():
+            target = averaged.setdefault(layer_key, {})
+            for key, grad in layer_grads.items():
+                if key in target:
+                    target[key] = target[key] + weight * grad
+                else:
+                    target[key] = weight * grad
+    return averaged
+
+# State of a GradientWorkerPool process
+_worker_model = None
+_worker_x = None
+_worker_y = None
+
+def _init_worker(model: Any, x: ArraySource, y: ArraySource) -> None:
+    global _worker_model, _worker_x, _worker_y
+    _worker_model = model
+    _worker_x = open_array(x)
+    _worker_y = open_array(y)
+
+def _worker_gradients(parameters: Dict[str, Dict[str, np.ndarray]],
+                      indices: np.ndarray) -> Tuple[np.ndarray, Dict[str, Dict[str, np.ndarray]]]:
+    _worker_model.set_parameters(parameters)
+    return _worker_model._compute_gradients(take_rows(_worker_x, indices), take_rows(_worker_y, indices))
+
+class GradientWorkerPool:
+    """
+    Data-parallel gradient computation across processes.
+
+    Each worker holds a copy of the model and opens the training arrays
+    itself (pass ``.npy`` paths to share them through the page cache rather
+    than copying them to every worker). For each batch the current
+    parameters are sent to the workers, every worker runs forward and
+    backward on its shard, and the shard gradients are averaged.
+
+    Every layer with parameters must return its gradients from ``backward``;
+    a layer that updates its own weights there would only update the
+    workers' copies, so it raises ``ValueError``.
+    """
+
+    def __init__(self, model: Any, x: ArraySource, y: ArraySource, workers: int):
+        """
+        Start the worker processes.
+
+        Args:
+            model: QuantumNeuralNetwork to compute gradients for
+            x: Training inputs, or path to a ``.npy`` file
+            y: Training targets, or path to a ``.npy`` file
+            workers: Number of worker processes
+        """
+        self.model = model
+        self.workers = workers
+
+        # Workers only need the layers and the loss
+        worker_model = copy.copy(model)
+        worker_model.optimizer = None
+        worker_model.metrics = {}
+        worker_model.training_history = {}
+
+        self.pool = multiprocessing.Pool(workers, initializer=_init_worker, initargs=(worker_model, x, y))
+        logger.info(f"{LOG_PREFIX} - Started {workers} gradient workers")
+
+    def gradients(self, indices: np.ndarray) -> Tuple[np.ndarray, Dict[str, Dict[str, np.ndarray]]]:
+        """
+        Compute the gradients of one batch.
+
+        Args:
+            indices: Sample indices of the batch
+
+        Returns:
+            Tuple of (predictions in ``indices`` order, averaged gradients)
+
+        Raises:
+            ValueError: If a layer with parameters returned no gradients
+        """
+        shards = [shard for shard in np.array_split(indices, self.workers) if len(shard)]
+        parameters = self.model.get_parameters(copy_arrays=False)
+        results = self.pool.starmap(_worker_gradients, [(parameters, shard) for shard in shards])
+
+        predictions = np.concatenate([y_pred for y_pred, _ in results])
+        gradients = average_gradients([(grads, len(shard)) for (_, grads), shard in zip(results, shards)])
+
+        untrained = [layer_key for layer_key in parameters if not gradients.get(layer_key)]
+        if untrained:
+            raise ValueError(f"Layers {untrained} return no gradients from backward and cannot "
+                             f"train with workers > 1")
+        return predictions, gradients
+
+    def close(self) -> None:
+        self.pool.close()
+        self.pool.join()
+
+    def __enter__(self) -> "GradientWorkerPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if exc_info[0] is not None:
+            self.pool.terminate()
+        self.close()
+
+class EarlyStopping:
+    """
+    Stop training when a monitored loss stops improving.
+
+    The parameters of the best epoch are kept in memory and, with
+    ``checkpoint_path``, written to disk every time they improve.
+    """
+
+    def __init__(self, monitor: str = "val_loss", patience: int = 5, min_delta: float = 0.0,
+                 restore_best_weights: bool = True, checkpoint_path: Optional[str] = None):
+        """
+        Initialize early stopping.
+
+        Args:
+            monitor: Epoch log value to watch (lower is better)
+            patience: Epochs without improvement before stopping
+            min_delta: Minimum decrease that counts as an improvement
+            restore_best_weights: Whether to restore the best parameters when training ends
+            checkpoint_path: Optional ``.npz`` file to save the best parameters to
+        """
+        self.monitor = monitor
+        self.patience = patience
+        self.min_delta = min_delta
+        self.restore_best_weights = restore_best_weights
+        self.checkpoint_path = checkpoint_path
+
+        self.model = None
+        self.best = float("inf")
+        self.best_epoch = None
+        self.best_parameters = None
+        self.stopped_epoch = None
+        self.wait = 0
+
+    def set_model(self, model: Any) -> None:
+        self.model = model
+
+    def on_epoch_end(self, epoch: int, logs: Dict[str, Any]) -> None:
+        value = logs.get(self.monitor)
+        if value is None:
+            logger.warning(f"{LOG_PREFIX} - Early stopping monitor '{self.monitor}' not in epoch logs")
+            return
+
+        if value < self.best - self.min_delta:
+            self.best = float(value)
+            self.best_epoch = epoch
+            self.wait = 0
+            self.best_parameters = self.model.get_parameters()
+            if self.checkpoint_path:
+                self.model.save_parameters(self.checkpoint_path)
+            return
+
+        self.wait += 1
+        if self.wait >= self.patience:
+            self.stopped_epoch = epoch
+            self.model.stop_training = True
+            logger.info(f"{LOG_PREFIX} - Early stopping at epoch {epoch + 1}, "
+                        f"best {self.monitor} {self.best:.4f} at epoch {self.best_epoch + 1}")
+
+    def on_train_end(self, logs: Optional[Dict[str, Any]] = None) -> None:
+        if self.restore_best_weights and self.best_parameters is not None:
+            self.model.set_parameters(self.best_parameters)
@@ -47,6 +47,11 @@ from src.omega_bot_farm.utils.env_loader import (
 
 # Import BitgetPositionAnalyzerB0t
 from src.omega_bot_farm.trading.b0ts.bitget_analyzer.bitget_position_analyzer_b0t import BitgetPositionAnalyzerB0t
+from src.omega_bot_farm.services.market_data_cache import account_id, exchange_key, get_market_data_cache
+
+# Exchange clients and validated credentials, kept across refreshes
+_exchanges: Dict[Tuple[str, bool], Any] = {}
+_validated_accounts: set = set()
 
 # Try to import CCXT directly to check for availability and version
 try:
@@ -178,8 +183,13 @@ async def get_positions_info(use_multiple_methods: bool = False) -> Dict[str, An
     logger.info(f"Connecting to BitGet {network_type}")
     logger.info(f"API Key available: {'Yes' if api_key else 'No'}")
     
-    # Validate API credentials
-    validation_result = validate_api_credentials(api_key, api_secret, api_passphrase, use_testnet)
+    # Validate API credentials (once per process)
+    account = account_id(api_key)
+    validation_result = {"valid": True}
+    if account not in _validated_accounts:
+        validation_result = validate_api_credentials(api_key, api_secret, api_passphrase, use_testnet)
+        if validation_result["valid"]:
+            _validated_accounts.add(account)
     if not validation_result["valid"]:
         logger.error(f"API key validation failed. Please check your credentials. - {validation_result['message']}")
         return {
@@ -191,27 +201,33 @@ async def get_positions_info(use_multiple_methods: bool = False) -> Dict[str, An
         }
     
     try:
-        # Connect to BitGet via CCXT
-        exchange_config = {
-            'apiKey': api_key,
-            'secret': api_secret,
-            'password': api_passphrase,
-            'enableRateLimit': True
-        }
-        
-        # Create BitGet exchange client
-        exchange = ccxt.bitget(exchange_config)
+        exchange = _exchanges.get((account, use_testnet))
+        if exchange is None:
+            # Connect to BitGet via CCXT
+            exchange_config = {
+                'apiKey': api_key,
+                'secret': api_secret,
+                'password': api_passphrase,
+                'enableRateLimit': True
+            }
+            
+            # Create BitGet exchange client
+            exchange = _exchanges[(account, use_testnet)] = ccxt.bitget(exchange_config)
+            
+            # Set testnet mode if required
+            if use_testnet:
+                exchange.set_sandbox_mode(True)
+                logger.info("Using TESTNET environment")
+            else:
+                logger.info("Using MAINNET environment")
         
-        # Set testnet mode if required
-        if use_testnet:
-            exchange.set_sandbox_mode(True)
-            logger.info("Using TESTNET environment")
-        else:
-            logger.info("Using MAINNET environment")
+        # Positions and balance come from the cache shared with the other bots
+        cache = get_market_data_cache()
+        network = exchange_key("bitget", use_testnet)
         
         # Get positions
         try:
-            positions = exchange.fetch_positions()
+            positions = await cache.get_or_fetch("positions", network, exchange.fetch_positions, account=account)
             logger.info(f"Successfully fetched {len(positions)} positions from BitGet")
         except Exception as e:
             logger.error(f"Error fetching positions: {str(e)}")
@@ -226,7 +242,7 @@ async def get_positions_info(use_multiple_methods: bool = False) -> Dict[str, An
         
         # Get account balance
         try:
-            balance = exchange.fetch_balance()
+            balance = await cache.get_or_fetch("balance", network, exchange.fetch_balance, account=account)
             account_data = {
                 "total_balance": float(balance.get('total', {}).get('USDT', 0) or 0),
                 "free_balance": float(balance.get('free', {}).get('USDT', 0) or 0),
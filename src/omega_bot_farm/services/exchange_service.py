@@ -21,11 +21,24 @@ Exchange Service for Omega Bot Farm
 This module provides a centralized service for initializing and managing
 exchange clients across different bots. It handles common exchange operations,
 credential management, and error handling.
+
+Exchange calls never block the event loop: ``ccxt.async_support`` clients are
+awaited directly, synchronous ccxt clients run on a bounded thread pool. One
+client is shared per (exchange, credentials) by every service using it, so
+bots on the same account share its connections and rate limiting.
 """
 
 import os
+import time
+import asyncio
+import hashlib
 import logging
-from typing import Dict, Any, Optional, List, Union
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple, Union
+
+from src.omega_bot_farm.services.market_data_cache import MarketDataCache, account_id, exchange_key, get_market_data_cache, PUBLIC
 
 # Global ccxt import
 try:
@@ -35,6 +48,71 @@ except ImportError:
     CCXT_AVAILABLE = False
     logging.warning("ccxt module not installed. Exchange functionality will be limited.")
 
+try:
+    import ccxt.async_support as ccxt_async
+    CCXT_ASYNC_AVAILABLE = True
+except ImportError:
+    CCXT_ASYNC_AVAILABLE = False
+
+# Threads available to synchronous ccxt clients across all services
+MAX_EXECUTOR_WORKERS = 8
+
+class ExchangeMetrics:
+    """Concurrency metrics of one shared exchange client."""
+    
+    def __init__(self):
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.calls = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.operations: Dict[str, int] = {}
+    
+    def started(self, operation: str) -> None:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        self.operations[operation] = self.operations.get(operation, 0) + 1
+    
+    def finished(self, seconds: float, failed: bool = False) -> None:
+        self.in_flight -= 1
+        self.calls += 1
+        self.total_seconds += seconds
+        if failed:
+            self.errors += 1
+    
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "calls": self.calls,
+            "errors": self.errors,
+            "avg_latency_ms": self.total_seconds / self.calls * 1000 if self.calls else 0.0,
+            "operations": dict(self.operations)
+        }
+
+class SharedExchange:
+    """An exchange client and the services currently using it."""
+    
+    def __init__(self, key: Tuple, client: Any):
+        self.key = key
+        self.client = client
+        self.is_async = asyncio.iscoroutinefunction(getattr(client, "fetch_ticker", None))
+        self.users = 0
+        self.metrics = ExchangeMetrics()
+
+# Clients shared across services, keyed by exchange and credentials
+_shared_exchanges: Dict[Tuple, SharedExchange] = {}
+_shared_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Bounded thread pool running synchronous ccxt calls."""
+    global _executor
+    with _shared_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MAX_EXECUTOR_WORKERS, thread_name_prefix="exchange-service")
+        return _executor
+
 class ExchangeService:
     """
     Service for managing exchange clients and operations.
@@ -52,7 +130,10 @@ class ExchangeService:
                  api_secret: Optional[str] = None,
                  api_passphrase: Optional[str] = None,
                  use_testnet: bool = False,
-                 options: Optional[Dict[str, Any]] = None):
+                 options: Optional[Dict[str, Any]] = None,
+                 use_async: bool = True,
+                 cache: Optional[MarketDataCache] = None,
+                 use_cache: bool = True):
         """
         Initialize the Exchange Service.
         
@@ -63,9 +144,13 @@ class ExchangeService:
             api_passphrase: API passphrase (will use env var {EXCHANGE_ID}_PASSPHRASE if None)
             use_testnet: Whether to use testnet
             options: Additional options for the exchange client
+            use_async: Whether to prefer ``ccxt.async_support`` over the thread pool
+            cache: Market data cache (the process-wide one by default)
+            use_cache: Whether to serve tickers, balances and positions from the cache
         """
         self.exchange_id = exchange_id.lower()
         self.use_testnet = use_testnet
+        self.use_async = use_async
         
         # Validate exchange ID
         if self.exchange_id not in self.SUPPORTED_EXCHANGES:
@@ -90,6 +175,13 @@ class ExchangeService:
         # Exchange client
         self.exchange = None
         self.ccxt_client = None  # For async client compatibility
+        self._shared: Optional[SharedExchange] = None
+        self.metrics = ExchangeMetrics()
+        
+        # Market data shared with the other bots watching the same account
+        self.cache = (cache or get_market_data_cache()) if use_cache else None
+        self.account = account_id(self.api_key)
+        self.cache_exchange = exchange_key(self.exchange_id, self.use_testnet)
         
         # Initialize if ccxt is available
         if CCXT_AVAILABLE:
@@ -108,6 +200,36 @@ class ExchangeService:
             logging.error(f"Cannot initialize {self.exchange_id} exchange: Missing API credentials")
             return
         
+        # Check the passphrase of exchanges that require it
+        if self.exchange_id in ["bitget", "okx", "kucoin"] and not self.api_passphrase:
+            logging.error(f"{self.exchange_id} requires a passphrase, but none was provided")
+            return
+        
+        key = self._shared_key()
+        with _shared_lock:
+            shared = _shared_exchanges.get(key)
+            if shared is None:
+                client = self._create_client()
+                if client is None:
+                    return
+                shared = _shared_exchanges[key] = SharedExchange(key, client)
+            else:
+                logging.info(f"Sharing {self.exchange_id.upper()} client with {shared.users} other service(s)")
+            shared.users += 1
+        
+        self._shared = shared
+        self.metrics = shared.metrics
+        self.exchange = shared.client
+        self.ccxt_client = shared.client if shared.is_async else None
+    
+    def _shared_key(self) -> Tuple:
+        """Key of the shared client; credentials are hashed rather than kept in the registry."""
+        credentials = hashlib.sha256(f"{self.api_key}:{self.api_secret}:{self.api_passphrase}".encode()).hexdigest()
+        options = tuple(sorted((key, repr(value)) for key, value in self.options.items()))
+        return (self.exchange_id, credentials, self.use_testnet, options, self.use_async and CCXT_ASYNC_AVAILABLE)
+    
+    def _create_client(self) -> Any:
+        """Create the CCXT exchange client, async when available."""
         try:
             # Create exchange config
             exchange_config = {
@@ -115,31 +237,75 @@ class ExchangeService:
                 'secret': self.api_secret,
                 'options': self.options
             }
-            
-            # Add passphrase for exchanges that require it
             if self.exchange_id in ["bitget", "okx", "kucoin"]:
-                if not self.api_passphrase:
-                    logging.error(f"{self.exchange_id} requires a passphrase, but none was provided")
-                    return
                 exchange_config['password'] = self.api_passphrase
             
-            # Initialize the exchange client using the globally imported ccxt
-            exchange_class = getattr(ccxt, self.exchange_id)
-            self.exchange = exchange_class(exchange_config)
+            # Prefer the asyncio client; the synchronous one runs on the thread pool
+            module = ccxt_async if self.use_async and CCXT_ASYNC_AVAILABLE else ccxt
+            exchange_class = getattr(module, self.exchange_id)
+            client = exchange_class(exchange_config)
             
             # Set testnet mode if required
             if self.use_testnet:
-                self.exchange.set_sandbox_mode(True)
+                client.set_sandbox_mode(True)
                 logging.info(f"Connected to {self.exchange_id.upper()} TESTNET")
             else:
                 logging.info(f"Connected to {self.exchange_id.upper()} MAINNET")
+            return client
                 
         except AttributeError:
             logging.error(f"Exchange {self.exchange_id} is not supported by CCXT")
-            self.exchange = None
         except Exception as e:
             logging.error(f"Failed to initialize {self.exchange_id} exchange: {e}")
-            self.exchange = None
+        return None
+    
+    async def _call(self, operation: str, *args) -> Any:
+        """
+        Run an exchange method without blocking the event loop.
+        
+        Coroutine methods (``ccxt.async_support``) are awaited, synchronous
+        ones run on the shared bounded thread pool.
+        """
+        method = getattr(self.exchange, operation)
+        metrics = self.metrics
+        metrics.started(operation)
+        started = time.perf_counter()
+        failed = False
+        try:
+            if asyncio.iscoroutinefunction(method):
+                return await method(*args)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(_get_executor(), functools.partial(method, *args))
+        except Exception:
+            failed = True
+            raise
+        finally:
+            metrics.finished(time.perf_counter() - started, failed)
+    
+    async def _cached_call(self, resource: str, account: str, operation: str, *args, symbol: Optional[str] = None) -> Any:
+        """``_call`` through the market data cache, or directly when caching is off."""
+        if self.cache is None:
+            return await self._call(operation, *args)
+        return await self.cache.get_or_fetch(resource, self.cache_exchange, lambda: self._call(operation, *args),
+                                             account=account, symbol=symbol)
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Concurrency metrics of the (shared) exchange client.
+        
+        Returns:
+            Dictionary with in-flight and peak concurrent calls, call and error
+            counts, average latency, calls per operation and how the client runs
+        """
+        metrics = self.metrics.snapshot()
+        metrics.update({
+            "exchange": self.exchange_id,
+            "cache": self.cache.get_stats() if self.cache is not None else None,
+            "mode": "async" if asyncio.iscoroutinefunction(getattr(self.exchange, "fetch_ticker", None)) else "executor",
+            "shared_by": self._shared.users if self._shared else 1,
+            "executor_workers": MAX_EXECUTOR_WORKERS
+        })
+        return metrics
     
     def is_connected(self) -> bool:
         """Check if the exchange client is properly initialized."""
@@ -157,7 +323,7 @@ class ExchangeService:
             return []
             
         try:
-            positions = self.exchange.fetch_positions()
+            positions = await self._cached_call("positions", self.account, "fetch_positions")
             return positions
         except Exception as e:
             logging.error(f"Error fetching positions from {self.exchange_id}: {e}")
@@ -175,7 +341,7 @@ class ExchangeService:
             return {}
             
         try:
-            balance = self.exchange.fetch_balance()
+            balance = await self._cached_call("balance", self.account, "fetch_balance")
             return balance
         except Exception as e:
             logging.error(f"Error fetching balance from {self.exchange_id}: {e}")
@@ -207,7 +373,9 @@ class ExchangeService:
             return {"error": "Exchange client not initialized"}
             
         try:
-            order = self.exchange.create_order(symbol, order_type, side, amount, price, params or {})
+            order = await self._call("create_order", symbol, order_type, side, amount, price, params or {})
+            if self.cache is not None:
+                self.cache.on_order_placed(self.cache_exchange, self.account, symbol)
             return order
         except Exception as e:
             logging.error(f"Error creating order on {self.exchange_id}: {e}")
@@ -228,17 +396,29 @@ class ExchangeService:
             return {}
             
         try:
-            ticker = self.exchange.fetch_ticker(symbol)
+            ticker = await self._cached_call("ticker", PUBLIC, "fetch_ticker", symbol, symbol=symbol)
             return ticker
         except Exception as e:
             logging.error(f"Error fetching ticker for {symbol} from {self.exchange_id}: {e}")
             return {}
             
     async def close(self) -> None:
-        """Close the exchange connection and clean up resources."""
-        if hasattr(self.exchange, 'close') and callable(self.exchange.close):
+        """Release the exchange client; the last service using it closes the connection."""
+        shared, self._shared = self._shared, None
+        client = self.exchange
+        if shared is not None:
+            with _shared_lock:
+                shared.users -= 1
+                last_user = shared.users <= 0
+                if last_user and _shared_exchanges.get(shared.key) is shared:
+                    del _shared_exchanges[shared.key]
+            if not last_user:
+                client = None
+        
+        close = getattr(client, 'close', None)
+        if asyncio.iscoroutinefunction(close):
             try:
-                await self.exchange.close()
+                await close()
                 logging.info(f"Closed connection to {self.exchange_id.upper()}")
             except Exception as e:
                 logging.error(f"Error closing {self.exchange_id} connection: {e}")
@@ -266,7 +446,8 @@ def create_exchange_service(exchange: str = "bitget",
         api_secret: API secret
         api_passphrase: API passphrase
         use_testnet: Whether to use testnet
-        **kwargs: Additional options
+        **kwargs: Additional options (``options``, ``use_async``; ``passphrase``
+            and ``testnet`` are accepted as aliases)
         
     Returns:
         Initialized ExchangeService instance
@@ -275,9 +456,10 @@ def create_exchange_service(exchange: str = "bitget",
         exchange_id=exchange,
         api_key=api_key,
         api_secret=api_secret,
-        api_passphrase=api_passphrase,
-        use_testnet=use_testnet,
-        options=kwargs.get('options')
+        api_passphrase=api_passphrase or kwargs.get('passphrase'),
+        use_testnet=use_testnet or kwargs.get('testnet', False),
+        options=kwargs.get('options'),
+        use_async=kwargs.get('use_async', True)
     )
     
     return service 
\ No newline at end of file
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+
+"""
+Market Data Cache for Omega Bot Farm
+
+This module provides a process-wide cache for exchange data that many bots
+poll at once (tickers, balances, positions):
+
+- every resource type has its own time-to-live
+- concurrent requests for the same entry share a single exchange call
+- placing one of our orders invalidates the account's balance and positions
+- testnet and mainnet entries are kept apart (see ``exchange_key``)
+- entries can additionally be stored in Redis so several processes share them
+- hit, miss and coalescing statistics show how many calls were saved
+
+Cached values are shared between callers and must be treated as read-only.
+"""
+
+import json
+import time
+import asyncio
+import hashlib
+import inspect
+import logging
+import threading
+import contextvars
+from typing import Dict, Any, Optional, Callable, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds an entry stays fresh, per resource type
+DEFAULT_TTLS = {
+    "ticker": 1.0,
+    "orderbook": 0.5,
+    "positions": 3.0,
+    "balance": 5.0,
+    "orders": 2.0,
+}
+DEFAULT_TTL = 1.0
+
+# Resources that change when we place an order
+ORDER_SENSITIVE_RESOURCES = ("positions", "balance", "orders")
+
+REDIS_PREFIX = "omega:market_data:"
+
+# Account placeholder of public data such as tickers
+PUBLIC = "public"
+
+# Keys whose fetch is running in the current task, to spot a fetch that reads its own key
+_fetching: contextvars.ContextVar = contextvars.ContextVar("market_data_fetching", default=frozenset())
+
+def account_id(api_key: Optional[str]) -> str:
+    """Short, non-reversible cache identifier of an API key."""
+    if not api_key:
+        return PUBLIC
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+def exchange_key(exchange: str, testnet: bool = False) -> str:
+    """Cache identifier of an exchange network, e.g. ``bitget:testnet``; sandbox data must not answer live reads."""
+    return f"{exchange.lower()}:{'testnet' if testnet else 'live'}"
+
+def _key_symbol(redis_key: Any) -> str:
+    if isinstance(redis_key, bytes):
+        redis_key = redis_key.decode()
+    return redis_key.rsplit("|", 1)[-1]
+
+class MarketDataCache:
+    """
+    TTL cache with single-flight fetching for exchange data.
+
+    Entries are keyed by ``(resource, exchange, account, symbol)``, where
+    callers pass ``exchange_key(exchange_id, use_testnet)`` as the exchange. A miss
+    runs the fetch function once; callers arriving while it runs await the
+    same result. Failed fetches are not cached. A fetch function that reads
+    its own key through the cache (a cached client wrapped in the cache
+    again) runs its fetch directly instead of waiting on itself.
+    """
+
+    def __init__(self,
+                 ttls: Optional[Dict[str, float]] = None,
+                 redis_client: Optional[Any] = None,
+                 redis_prefix: str = REDIS_PREFIX):
+        """
+        Initialize the cache.
+
+        Args:
+            ttls: Time-to-live per resource type, merged over DEFAULT_TTLS
+            redis_client: Optional Redis client to share entries between processes
+            redis_prefix: Prefix of the Redis keys
+        """
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.redis = redis_client
+        self.redis_prefix = redis_prefix
+
+        self._entries: Dict[Tuple, Tuple[float, Any]] = {}
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        self._lock = threading.Lock()
+        self._generation = 0  # Bumped by every invalidation
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "redis_hits": 0, "invalidations": 0, "errors": 0}
+        self.resource_stats: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, resource: str, stat: str) -> None:
+        self.stats[stat] += 1
+        counts = self.resource_stats.setdefault(resource, {"hits": 0, "misses": 0, "coalesced": 0})
+        if stat in counts:
+            counts[stat] += 1
+
+    @staticmethod
+    def make_key(resource: str, exchange: str, account: str = PUBLIC, symbol: Optional[str] = None) -> Tuple:
+        return (resource, exchange.lower(), account, symbol or "*")
+
+    def _redis_key(self, key: Tuple) -> str:
+        # Symbols such as "BTC/USDT:USDT" contain colons
+        return self.redis_prefix + "|".join(key)
+
+    def get(self, key: Tuple) -> Tuple[bool, Any]:
+        """
+        Look up a fresh entry.
+
+        Returns:
+            Tuple of (found, value)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None:
+            expires, value = entry
+            if expires > time.monotonic():
+                return True, value
+
+        if self.redis is not None:
+            try:
+                raw = self.redis.get(self._redis_key(key))
+            except Exception as e:
+                logger.warning(f"Market data cache Redis read failed: {e}")
+                raw = None
+            if raw is not None:
+                value = json.loads(raw)
+                ttl_ms = self.redis.pttl(self._redis_key(key))
+                ttl = ttl_ms / 1000 if ttl_ms and ttl_ms > 0 else self.ttls.get(key[0], DEFAULT_TTL)
+                with self._lock:
+                    self._entries[key] = (time.monotonic() + ttl, value)
+                self.stats["redis_hits"] += 1
+                return True, value
+        return False, None
+
+    def set(self, key: Tuple, value: Any, ttl: Optional[float] = None) -> None:
+        """Store an entry for ``ttl`` seconds (the resource's TTL by default)."""
+        ttl = ttl if ttl is not None else self.ttls.get(key[0], DEFAULT_TTL)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+        if self.redis is not None:
+            try:
+                self.redis.psetex(self._redis_key(key), max(int(ttl * 1000), 1), json.dumps(value, default=str))
+            except Exception as e:
+                logger.warning(f"Market data cache Redis write failed: {e}")
+
+    async def get_or_fetch(self,
+                           resource: str,
+                           exchange: str,
+                           fetch: Callable[[], Any],
+                           account: str = PUBLIC,
+                           symbol: Optional[str] = None,
+                           ttl: Optional[float] = None) -> Any:
+        """
+        Return a cached entry or fetch it, sharing concurrent fetches.
+
+        Args:
+            resource: Resource type (``ticker``, ``positions``, ``balance`` ...)
+            exchange: Exchange network from ``exchange_key``
+            fetch: Callable returning the value or an awaitable of it
+            account: Account identifier from ``account_id`` (public data: PUBLIC)
+            symbol: Symbol, or None for account-wide data
+            ttl: Time-to-live override in seconds
+
+        Returns:
+            Cached or freshly fetched value
+        """
+        key = self.make_key(resource, exchange, account, symbol)
+        found, value = self.get(key)
+        if found:
+            self._count(resource, "hits")
+            return value
+
+        # Fetching this key already, further up this call chain: waiting would deadlock
+        fetching = _fetching.get()
+        if key in fetching:
+            value = fetch()
+            if inspect.isawaitable(value):
+                value = await value
+            return value
+
+        # Futures belong to one event loop, so fetches are shared per loop
+        loop = asyncio.get_running_loop()
+        flight_key = (key, id(loop))
+        pending = self._inflight.get(flight_key)
+        if pending is not None:
+            self._count(resource, "coalesced")
+            return await asyncio.shield(pending)
+
+        self._count(resource, "misses")
+        pending = loop.create_future()
+        self._inflight[flight_key] = pending
+        generation = self._generation
+        token = _fetching.set(fetching | {key})
+        try:
+            value = fetch()
+            if inspect.isawaitable(value):
+                value = await value
+        except BaseException as e:
+            self.stats["errors"] += 1
+            pending.set_exception(e)
+            pending.exception()  # Mark retrieved when nobody else waited
+            raise
+        else:
+            # Data fetched across an invalidation may predate it, so it is only handed out once
+            if generation == self._generation:
+                self.set(key, value, ttl)
+            pending.set_result(value)
+            return value
+        finally:
+            _fetching.reset(token)
+            del self._inflight[flight_key]
+
+    def invalidate(self,
+                   resource: Optional[str] = None,
+                   exchange: Optional[str] = None,
+                   account: Optional[str] = None,
+                   symbol: Optional[str] = None) -> int:
+        """
+        Drop matching entries; None matches anything.
+
+        Returns:
+            Number of local entries dropped
+        """
+        def matches(key: Tuple) -> bool:
+            return ((resource is None or key[0] == resource) and
+                    (exchange is None or key[1] == exchange.lower()) and
+                    (account is None or key[2] == account) and
+                    (symbol is None or key[3] in (symbol, "*")))
+
+        with self._lock:
+            self._generation += 1
+            stale = [key for key in self._entries if matches(key)]
+            for key in stale:
+                del self._entries[key]
+        self.stats["invalidations"] += len(stale)
+
+        if self.redis is not None:
+            pattern = self.redis_prefix + "|".join([
+                resource or "*", exchange.lower() if exchange else "*", account or "*", "*"
+            ])
+            try:
+                redis_keys = [key for key in self.redis.scan_iter(match=pattern)
+                              if symbol is None or _key_symbol(key) in (symbol, "*")]
+                if redis_keys:
+                    self.redis.delete(*redis_keys)
+            except Exception as e:
+                logger.warning(f"Market data cache Redis invalidation failed: {e}")
+        return len(stale)
+
+    def on_order_placed(self, exchange: str, account: str, symbol: Optional[str] = None) -> None:
+        """
+        Invalidate what placing one of our orders changes: the account's positions, balance and orders.
+
+        Called right after an order is accepted, not when it fills. Market
+        orders have filled by then; a resting limit order that fills later is
+        picked up when the entries' TTLs expire.
+        """
+        for resource in ORDER_SENSITIVE_RESOURCES:
+            self.invalidate(resource, exchange, account, symbol if resource != "balance" else None)
+
+    def clear(self) -> None:
+        """Drop every local entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Cache statistics.
+
+        Returns:
+            Dictionary with hit, miss, coalesced and Redis hit counts, the
+            share of requests answered without an exchange call, and counts
+            per resource
+        """
+        requests = self.stats["hits"] + self.stats["misses"] + self.stats["coalesced"]
+        saved = self.stats["hits"] + self.stats["coalesced"]
+        return {
+            **self.stats,
+            "requests": requests,
+            "hit_ratio": saved / requests if requests else 0.0,
+            "entries": len(self._entries),
+            "resources": {resource: dict(counts) for resource, counts in self.resource_stats.items()}
+        }
+
+
+_cache: Optional[MarketDataCache] = None
+_cache_lock = threading.Lock()
+
+def get_market_data_cache() -> MarketDataCache:
+    """Process-wide cache shared by every bot."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = MarketDataCache()
+        return _cache
+
+def configure_market_data_cache(ttls: Optional[Dict[str, float]] = None,
+                                redis_client: Optional[Any] = None) -> MarketDataCache:
+    """
+    Replace the process-wide cache, e.g. to back it with Redis.
+
+    Args:
+        ttls: Time-to-live per resource type
+        redis_client: Optional Redis client
+
+    Returns:
+        The new process-wide cache
+    """
+    global _cache
+    with _cache_lock:
+        _cache = MarketDataCache(ttls=ttls, redis_client=redis_client)
+        return _cache
@@ -41,6 +41,8 @@ except ImportError:
     EXCHANGE_SERVICE_AVAILABLE = False
     ExchangeClientB0t = None  # Define as None to avoid unbound error
 
+from src.omega_bot_farm.services.market_data_cache import account_id, exchange_key, get_market_data_cache
+
 # Constants for Mathematical Harmony
 PHI = 1.618034  # Golden Ratio - Divine Proportion
 INV_PHI = 0.618034  # Inverse Golden Ratio
@@ -91,6 +93,11 @@ class BitgetPositionAnalyzerB0t:
         self.exchange_service: Optional[Any] = None
         self.exchange_client_b0t: Optional[Any] = None
         
+        # Positions and balance are shared with the other bots watching this account
+        self.cache = get_market_data_cache() if config.get('use_cache', True) else None
+        self.account = account_id(self.api_key)
+        self.cache_exchange = exchange_key("bitget", self.use_testnet)
+        
         # Account statistics
         self.account_balance: float = 0.0
         self.account_equity: float = 0.0
@@ -143,30 +150,14 @@ class BitgetPositionAnalyzerB0t:
             }
             
         try:
-            # Handle positions fetch based on connection method
-            positions = []
-            
-            # Fetch positions using the appropriate method
-            if hasattr(self, 'connection_method') and self.connection_method:
-                if self.connection_method == "ExchangeService" and self.exchange_service:
-                    # Use exchange service async method
-                    positions = await self.exchange_service.fetch_positions()
-                    
-                elif self.connection_method == "ExchangeClientB0t" and self.exchange_client_b0t:
-                    # Use exchange client b0t async method if available
-                    if hasattr(self.exchange_client_b0t, 'fetch_positions'):
-                        positions = await self.exchange_client_b0t.fetch_positions()
-                    else:
-                        # Fall back to direct exchange call through the client
-                        positions = self.exchange.fetch_positions()
-                        
-                elif self.connection_method == "CCXT direct":
-                    # Direct exchange call
-                    positions = self.exchange.fetch_positions()
+            if self.connection_method == "ExchangeService" and self.exchange_service:
+                # The exchange service caches positions itself
+                positions = await self.exchange_service.fetch_positions()
+            elif self.cache is not None:
+                positions = await self.cache.get_or_fetch("positions", self.cache_exchange, self._fetch_raw_positions,
+                                                          account=self.account)
             else:
-                # No connection method was set, but we have an exchange object
-                # Try direct call as last resort
-                positions = self.exchange.fetch_positions()
+                positions = await self._fetch_raw_positions()
             
             # Filter out positions with zero contracts and convert to appropriate type
             try:
@@ -226,6 +217,18 @@ class BitgetPositionAnalyzerB0t:
                 "connection_method": getattr(self, 'connection_method', None)
             }
     
+    async def _fetch_raw_positions(self) -> List[Any]:
+        """Fetch positions from the exchange using the connection method in use."""
+        if self.connection_method == "ExchangeClientB0t" and self.exchange_client_b0t:
+            # Use exchange client b0t async method if available
+            if hasattr(self.exchange_client_b0t, 'fetch_positions'):
+                return await self.exchange_client_b0t.fetch_positions()
+            # Fall back to direct exchange call through the client
+            return self.exchange.fetch_positions()
+            
+        # Direct exchange call, also the last resort without a connection method
+        return self.exchange.fetch_positions()
+    
     def _update_position_history(self, positions: List[Dict[str, Any]]) -> None:
         """Update position history with new position data."""
         if positions:
@@ -266,7 +269,11 @@ class BitgetPositionAnalyzerB0t:
             balance = None
             
             if EXCHANGE_SERVICE_AVAILABLE and ExchangeClientB0t is not None and self.exchange_client_b0t:
-                balance = await self.exchange_client_b0t.fetch_balance()
+                if self.cache is not None:
+                    balance = await self.cache.get_or_fetch("balance", self.cache_exchange, self.exchange_client_b0t.fetch_balance,
+                                                            account=self.account)
+                else:
+                    balance = await self.exchange_client_b0t.fetch_balance()
             
             # Extract USDT balance if available
             if balance and isinstance(balance, dict):
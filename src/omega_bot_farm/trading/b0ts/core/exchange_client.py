@@ -44,6 +44,8 @@ except ImportError:
     def create_exchange_service(*args, **kwargs):
         return None
 
+from src.omega_bot_farm.services.market_data_cache import MarketDataCache, account_id, exchange_key, get_market_data_cache, PUBLIC
+
 # Try to import the exchange client bot
 try:
     from src.omega_bot_farm.trading.b0ts.exchanges.ccxt_b0t import ExchangeClientB0t
@@ -83,7 +85,9 @@ class ExchangeClient(BaseB0t):
                  use_testnet: Optional[bool] = None,
                  default_symbol: Optional[str] = None,
                  auto_connect: bool = True,
-                 log_level: str = "INFO"):
+                 log_level: str = "INFO",
+                 cache: Optional[MarketDataCache] = None,
+                 use_cache: bool = True):
         """
         Initialize the exchange client.
         
@@ -96,6 +100,8 @@ class ExchangeClient(BaseB0t):
             default_symbol: Default trading symbol
             auto_connect: Whether to connect automatically on init
             log_level: Logging level
+            cache: Market data cache (the process-wide one by default)
+            use_cache: Whether to serve tickers, balances and positions from the cache
         """
         # Initialize the base bot
         super().__init__(name=f"{exchange_id.capitalize() if exchange_id else 'Exchange'}Client", 
@@ -130,6 +136,10 @@ class ExchangeClient(BaseB0t):
         # Configure based on exchange
         self._configure_for_exchange()
         
+        # Market data shared with the other bots watching the same account
+        self.cache = (cache or get_market_data_cache()) if use_cache else None
+        self.account = account_id(self.api_key)
+        
         # Initialize data containers
         self.tickers = {}
         self.balances = {}
@@ -577,6 +587,13 @@ class ExchangeClient(BaseB0t):
             
         self.last_request_time = time.time()
     
+    async def _cached(self, resource: str, fetch, account: str, symbol: Optional[str] = None) -> Any:
+        """Fetch through the market data cache, or directly when caching is off."""
+        if self.cache is None:
+            return await fetch()
+        return await self.cache.get_or_fetch(resource, exchange_key(self.exchange_id, self.use_testnet), fetch,
+                                             account=account, symbol=symbol)
+    
     async def fetch_ticker(self, symbol: Optional[str] = None) -> Dict[str, Any]:
         """
         Fetch ticker data for a symbol.
@@ -592,9 +609,12 @@ class ExchangeClient(BaseB0t):
             
         formatted_symbol = self._format_symbol(symbol)
         
-        try:
+        async def fetch():
             await self._throttle_request()
-            ticker = await self.exchange.fetch_ticker(formatted_symbol)
+            return await self.exchange.fetch_ticker(formatted_symbol)
+        
+        try:
+            ticker = await self._cached("ticker", fetch, PUBLIC, formatted_symbol)
             self.tickers[formatted_symbol] = ticker
             return ticker
         except Exception as e:
@@ -611,9 +631,12 @@ class ExchangeClient(BaseB0t):
         if not await self.ensure_connected():
             return {"error": "Not connected to exchange"}
             
-        try:
+        async def fetch():
             await self._throttle_request()
-            balance = await self.exchange.fetch_balance()
+            return await self.exchange.fetch_balance()
+        
+        try:
+            balance = await self._cached("balance", fetch, self.account)
             self.balances = balance
             return balance
         except Exception as e:
@@ -635,7 +658,7 @@ class ExchangeClient(BaseB0t):
             
         formatted_symbol = self._format_symbol(symbol) if symbol else None
         
-        try:
+        async def fetch():
             await self._throttle_request()
             if formatted_symbol:
                 positions = await self.exchange.fetch_positions([formatted_symbol])
@@ -651,13 +674,52 @@ class ExchangeClient(BaseB0t):
                     positions_dicts.append(position.to_dict())
                 else:
                     positions_dicts.append(position)
-            
+            return positions_dicts
+        
+        try:
+            positions_dicts = await self._cached("positions", fetch, self.account, formatted_symbol)
             self.positions = positions_dicts
             return positions_dicts
         except Exception as e:
             self.logger.error(f"Error fetching positions: {e}")
             return [{"error": str(e)}]
     
+    async def create_order(self,
+                           symbol: Optional[str],
+                           order_type: str,
+                           side: str,
+                           amount: float,
+                           price: Optional[float] = None,
+                           params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Create an order; the account's cached positions and balance are invalidated.
+        
+        Args:
+            symbol: Trading symbol (uses default if None)
+            order_type: Order type (market, limit, etc.)
+            side: Order side (buy or sell)
+            amount: Order amount
+            price: Order price (for limit orders)
+            params: Additional order parameters
+            
+        Returns:
+            Order data dictionary
+        """
+        if not await self.ensure_connected():
+            return {"error": "Not connected to exchange"}
+            
+        formatted_symbol = self._format_symbol(symbol)
+        
+        try:
+            await self._throttle_request()
+            order = await self.exchange.create_order(formatted_symbol, order_type, side, amount, price, params or {})
+            if self.cache is not None:
+                self.cache.on_order_placed(exchange_key(self.exchange_id, self.use_testnet), self.account, formatted_symbol)
+            return order
+        except Exception as e:
+            self.logger.error(f"Error creating order for {formatted_symbol}: {e}")
+            return {"error": str(e), "symbol": formatted_symbol}
+    
     # Add more exchange methods as needed...
 
     def __del__(self):
@@ -40,6 +40,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 # Import the class under test
 from src.omega_bot_farm.trading.b0ts.core.exchange_client import ExchangeClient
 from src.omega_bot_farm.trading.b0ts.core.exchange_client import DEFAULT_EXCHANGE, DEFAULT_SYMBOL
+from src.omega_bot_farm.services.market_data_cache import get_market_data_cache
 
 
 # Create AsyncMock decorator for test methods
@@ -55,6 +56,9 @@ class TestExchangeClient(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
+        # Every test mocks its own exchange responses
+        get_market_data_cache().clear()
+        
         # Create patch for asyncio.create_task to avoid creating actual tasks
         self.create_task_patcher = patch('asyncio.create_task')
         self.mock_create_task = self.create_task_patcher.start()
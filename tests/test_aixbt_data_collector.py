@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+Tests for the AIXBT data collector's timestamp alignment and incremental collection.
+"""
+
+import os
+import sys
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import fakeredis
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.omega_bot_farm.ai_model_aixbt.data_collector import (
+    AIXBT_HISTORY_KEY,
+    BTC_HISTORY_KEY,
+    CORRELATION_HISTORY_KEY,
+    AixbtDataCollector,
+    align_series
+)
+
+BASE = datetime(2025, 4, 1, tzinfo=timezone.utc)
+
+def entry(seconds, **fields):
+    return {"timestamp": (BASE + timedelta(seconds=seconds)).isoformat(), **fields}
+
+def push(client, key, entries):
+    """LPUSH like the live feed, so the newest entry ends up first."""
+    for item in entries:
+        client.lpush(key, json.dumps(item))
+
+@pytest.fixture
+def collector(tmp_path):
+    with patch.object(AixbtDataCollector, "_setup_redis_connection"):
+        collector = AixbtDataCollector({"data_storage_path": str(tmp_path)})
+    collector.redis_client = fakeredis.FakeRedis(decode_responses=True)
+    return collector
+
+def test_align_series_joins_nearest_within_tolerance():
+    aixbt = [entry(0, price=1.0), entry(600, price=1.1), entry(9000, price=1.2)]
+    btc = [entry(-30, price=84000.0, volume=2.0), entry(590, price=84100.0), entry(700, price=84200.0)]
+    correlation = [entry(300, correlation=0.5)]
+
+    df = align_series(aixbt[::-1], btc[::-1], correlation, tolerance=timedelta(hours=1))
+
+    assert df["timestamp"].is_monotonic_increasing
+    assert df["btc_price"].tolist() == [84000.0, 84100.0, 0.0]  # Last row is 2h from any BTC entry
+    assert df["volume_btc"].tolist() == [2.0, 0.0, 0.0]
+    assert df["correlation"].tolist() == [0.5, 0.5, 0.0]
+
+def test_align_series_skips_unparseable_timestamps():
+    df = align_series([{"timestamp": "not a time", "price": 1.0}, {"price": 2.0}, entry(0, price=3.0)], [], [])
+    assert df["aixbt_price"].tolist() == [3.0]
+    assert df["btc_price"].tolist() == [0.0]
+
+def test_align_series_handles_other_offsets():
+    """Test non-UTC offsets and "Z" suffixes (the general parser path) align in UTC."""
+    aixbt = [{"timestamp": "2025-04-01T02:00:00+02:00", "price": 1.0}, {"timestamp": "2025-04-01T00:10:00Z", "price": 2.0}]
+    btc = [entry(0, price=84000.0), entry(600, price=85000.0)]
+    df = align_series(aixbt, btc, [])
+    assert df["timestamp"].tolist() == [BASE, BASE + timedelta(minutes=10)]
+    assert df["btc_price"].tolist() == [84000.0, 85000.0]
+
+@pytest.mark.asyncio
+async def test_incremental_collection_fetches_only_new_entries(collector):
+    """Test a repeated collection pages from the head only until the last collected entry."""
+    client = collector.redis_client
+    push(client, AIXBT_HISTORY_KEY, [entry(60 * i, price=1.0 + i) for i in range(1000)])
+    push(client, BTC_HISTORY_KEY, [entry(60 * i + 5, price=84000.0 + i) for i in range(1000)])
+    client.lpush(BTC_HISTORY_KEY, "84000.0,1.0")  # Legacy CSV entries are skipped
+    push(client, CORRELATION_HISTORY_KEY, [entry(600 * i, correlation=0.1) for i in range(100)])
+
+    first = await collector.get_price_data_from_redis("1m", limit=5000)
+    assert len(first) == 1000
+    assert first["btc_price"].tolist() == [84000.0 + i for i in range(1000)]
+
+    push(client, AIXBT_HISTORY_KEY, [entry(60 * i, price=1.0 + i) for i in range(1000, 1010)])
+    push(client, BTC_HISTORY_KEY, [entry(60 * i + 5, price=84000.0 + i) for i in range(1000, 1010)])
+    with patch.object(client, "lrange", wraps=client.lrange) as lrange:
+        second = await collector.get_price_data_from_redis("1m", limit=5000, incremental=True)
+
+    assert second["aixbt_price"].tolist() == [1.0 + i for i in range(1000, 1010)]
+    assert second["btc_price"].tolist() == [84000.0 + i for i in range(1000, 1010)]
+    assert all(call.args[1] == 0 for call in lrange.call_args_list)  # One page per key
+    assert len(collector.raw_data["aixbt_prices"]) == 1010
+    assert len(collector.raw_data["btc_prices"]) == 1010
+    assert collector.raw_data["aixbt_prices"][0]["price"] == 1010.0
+
+    assert (await collector.get_price_data_from_redis("1m", incremental=True)).empty
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+Tests for the AIXBT FFT lag correlation and its rolling variant.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+from scipy.stats import pearsonr
+
+# Add the project root to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.omega_bot_farm.ai_model_aixbt.lag_correlation import (
+    RollingLagCorrelation,
+    lagged_correlations,
+    optimal_lag
+)
+
+def pearson_by_lag(x, y, max_lag):
+    """The per-lag loop CorrelationAnalyzer._find_optimal_lag used to run."""
+    correlations = []
+    for lag in range(-max_lag, max_lag + 1):
+        if lag < 0:
+            corr, _ = pearsonr(x[:lag], y[-lag:])
+        elif lag > 0:
+            corr, _ = pearsonr(x[lag:], y[:-lag])
+        else:
+            corr, _ = pearsonr(x, y)
+        correlations.append((lag, corr))
+    return correlations
+
+def prices(count, lag=4, seed=7):
+    """BTC random walk and an AIXBT series following it ``lag`` bars later."""
+    rng = np.random.default_rng(seed)
+    btc = 84000.0 + np.cumsum(rng.normal(0, 60, count + lag))
+    aixbt = btc[:count] * 1e-5 + rng.normal(0, 0.005, count)
+    return aixbt, btc[lag:]
+
+@pytest.mark.parametrize("count,max_lag", [(50, 10), (997, 40), (5000, 100)])
+def test_matches_pearson_loop(count, max_lag):
+    aixbt, btc = prices(count)
+    expected = pearson_by_lag(aixbt, btc, max_lag)
+
+    lags, correlations = lagged_correlations(aixbt, btc, max_lag)
+    assert lags.tolist() == [lag for lag, _ in expected]
+    np.testing.assert_allclose(correlations, [corr for _, corr in expected], atol=1e-10)
+    best = max(expected, key=lambda item: abs(item[1]))
+    assert optimal_lag(aixbt, btc, max_lag) == (best[0], pytest.approx(best[1]))
+    if count > 100:
+        assert best[0] == 4  # AIXBT trails BTC by four bars
+
+def test_constant_series_has_no_lag():
+    assert optimal_lag(np.ones(30), np.arange(30.0), 5) == (0, 0.0)
+    with pytest.raises(ValueError):
+        lagged_correlations(np.ones(3), np.ones(4), 1)
+
+def test_rolling_matches_batch_window():
+    """Test incremental updates equal a full recomputation over the latest window."""
+    aixbt, btc = prices(700)
+    rolling = RollingLagCorrelation(window=120, max_lag=24)
+
+    for i in range(len(aixbt)):
+        result = rolling.update(aixbt[i], btc[i])
+        if i < 119:
+            assert result is None
+            continue
+        lags, expected = lagged_correlations(aixbt[i - 119:i + 1], btc[i - 119:i + 1], 24)
+        np.testing.assert_allclose(rolling.correlations(), expected, atol=1e-9)
+        assert result[0] == lags[np.argmax(np.abs(expected))]
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+Tests for the pooled BitGet HTTP client against a local aiohttp server.
+"""
+
+import asyncio
+import logging
+import time
+
+import pytest
+import pytest_asyncio
+import requests
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from omega_ai.trading.exchanges import bitget_http
+from omega_ai.trading.exchanges.bitget_http import BitGetHttpClient, TokenBucket, endpoint_group
+
+
+class MockExchange:
+    """Tiny BitGet stand-in recording the requests it serves."""
+
+    def __init__(self):
+        self.calls = []
+        self.peers = set()
+        self.failures = 0
+        self.status = 200
+
+        self.app = web.Application()
+        self.app.router.add_get("/api/v2/mix/market/ticker", self.ticker)
+        self.app.router.add_post("/api/v2/mix/order/place-order", self.place_order)
+
+    async def ticker(self, request):
+        self.calls.append(dict(request.query))
+        self.peers.add(request.transport.get_extra_info("peername"))
+        await asyncio.sleep(0.05)
+        if self.failures:
+            self.failures -= 1
+            return web.json_response({"code": "429", "msg": "Too Many Requests"}, status=429)
+        return web.json_response({"code": "00000", "data": [{"lastPr": "84000"}]}, status=self.status)
+
+    async def place_order(self, request):
+        body = await request.json()
+        self.calls.append(body)
+        return web.json_response({"code": "00000", "data": {"orderId": "1", "clientOid": body.get("clientOid")}})
+
+
+@pytest_asyncio.fixture
+async def exchange():
+    mock = MockExchange()
+    server = TestServer(mock.app)
+    await server.start_server()
+    mock.url = str(server.make_url(""))
+    yield mock
+    await server.close()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(bitget_http, "retry_delay", lambda retry_count: 0.0)
+    client = BitGetHttpClient()
+    yield client
+    client.close()
+
+
+def test_endpoint_groups():
+    assert endpoint_group("https://api.bitget.com/api/v2/mix/market/ticker?symbol=BTCUSDT")[:2] == ("market", 20)
+    assert endpoint_group("https://api.bitget.com/api/v2/mix/account/set-leverage")[0] == "leverage"
+    assert endpoint_group("https://api.bitget.com/api/v2/mix/account/sub-account-assets")[0] == "sub_account"
+    assert endpoint_group("https://api.bitget.com/api/v2/mix/position/all-position")[0] == "position"
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_after_burst():
+    bucket = TokenBucket(rate=50, capacity=2)
+    start = time.monotonic()
+    for _ in range(7):
+        await bucket.acquire()
+    assert time.monotonic() - start == pytest.approx(0.1, abs=0.05)  # Burst of 2, then 5 at 50/s
+
+
+@pytest.mark.asyncio
+async def test_identical_gets_are_coalesced(exchange, client):
+    url = exchange.url + "/api/v2/mix/market/ticker"
+    params = {"symbol": "BTCUSDT", "productType": "USDT-FUTURES"}
+    headers = {"ACCESS-KEY": "key-1"}
+
+    responses = await asyncio.gather(*[client.request("GET", url, headers=headers, params=params) for _ in range(5)],
+                                     client.request("GET", url, headers={"ACCESS-KEY": "key-2"}, params=params))
+
+    assert all(response.json()["data"][0]["lastPr"] == "84000" for response in responses)
+    assert len(exchange.calls) == 2  # One per API key
+    assert client.stats["coalesced"] == 4
+
+
+@pytest.mark.asyncio
+async def test_connections_are_reused(exchange, client):
+    url = exchange.url + "/api/v2/mix/market/ticker"
+    for i in range(5):
+        await client.request("GET", url, params={"symbol": f"SYM{i}"})
+    assert len(exchange.calls) == 5
+    assert len(exchange.peers) == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_callers_share_the_client(exchange, client):
+    """Test ``request_sync`` from plain threads, as the synchronous trader methods call it."""
+    url = exchange.url + "/api/v2/mix/market/ticker"
+    responses = await asyncio.gather(*[asyncio.to_thread(client.request_sync, "GET", url, params={"symbol": "BTCUSDT"})
+                                       for _ in range(3)])
+    assert [response.status_code for response in responses] == [200, 200, 200]
+    assert len(exchange.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_post_sends_json_body(exchange, client):
+    response = await client.request("POST", exchange.url + "/api/v2/mix/order/place-order",
+                                    json={"symbol": "BTCUSDT", "clientOid": "abc"})
+    assert response.json()["data"]["clientOid"] == "abc"
+    assert exchange.calls == [{"symbol": "BTCUSDT", "clientOid": "abc"}]
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_responses_are_retried(exchange, client):
+    exchange.failures = 2
+    response = await client.request("GET", exchange.url + "/api/v2/mix/market/ticker", params={"symbol": "BTCUSDT"})
+    assert response.status_code == 200
+    assert len(exchange.calls) == 3
+    assert client.stats["retries"] == 2
+
+
+@pytest.mark.asyncio
+async def test_client_errors_raise_without_retry(exchange, client):
+    exchange.status = 400
+    with pytest.raises(requests.HTTPError) as error:
+        await client.request("GET", exchange.url + "/api/v2/mix/market/ticker", params={"symbol": "BTCUSDT"})
+    assert error.value.response.status_code == 400
+    assert len(exchange.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_payloads_only_logged_at_debug_without_credentials(exchange, client, caplog):
+    url = exchange.url + "/api/v2/mix/market/ticker"
+    headers = {"ACCESS-KEY": "key-secret", "ACCESS-SIGN": "sign-secret", "ACCESS-PASSPHRASE": "pass-secret"}
+
+    with caplog.at_level(logging.INFO, logger=bitget_http.logger.name):
+        await client.request("GET", url, headers=headers, params={"symbol": "A"})
+    assert "lastPr" not in caplog.text
+
+    with caplog.at_level(logging.DEBUG, logger=bitget_http.logger.name):
+        await client.request("GET", url, headers=headers, params={"symbol": "B"})
+    assert "lastPr" in caplog.text
+    assert "secret" not in caplog.text
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+Tests for the WebSocket-fed BitGet state engine and its replay harness.
+"""
+
+import asyncio
+
+import pytest
+
+from omega_ai.trading.exchanges.bitget_state_engine import (
+    BitGetStateEngine,
+    load_recording,
+    replay_messages,
+)
+
+
+def push(channel, items, action="update", inst_id="default", **extra):
+    return {"action": action, "arg": {"instType": "USDT-FUTURES", "channel": channel, "instId": inst_id},
+            "data": items, **extra}
+
+
+def position(side="long", total="0.01", price="84000"):
+    return {"posId": f"p-{side}", "instId": "BTCUSDT", "holdSide": side, "total": total,
+            "openPriceAvg": price, "markPrice": price, "unrealizedPL": "0", "leverage": "11", "uTime": "1"}
+
+
+def ticker(last, bid=None, ask=None):
+    return push("ticker", [{"instId": "BTCUSDT", "lastPr": str(last), "bidPr": str(bid or last - 0.5),
+                            "askPr": str(ask or last + 0.5), "ts": "1"}], inst_id="BTCUSDT")
+
+
+class RestSnapshot:
+    """REST snapshot source in the ccxt layout of BitGetCCXT."""
+
+    def __init__(self, positions=None, orders=None, delay=0.0):
+        self.positions = positions or []
+        self.orders = orders or []
+        self.delay = delay
+        self.calls = 0
+
+    async def get_positions(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.positions
+
+    async def fetch_open_orders(self):
+        return self.orders
+
+
+@pytest.mark.asyncio
+async def test_positions_orders_fills_and_ticker_are_tracked():
+    engine = BitGetStateEngine(symbols=["BTC/USDT:USDT"])
+    fills = []
+    engine.add_listener("fill", fills.append)
+
+    await engine.handle_message(push("positions", [position("long"), position("short", "0.02")], action="snapshot"))
+    await engine.handle_message(ticker(84100))
+    await engine.handle_message(push("orders", [{"orderId": "o1", "instId": "BTCUSDT", "side": "sell", "size": "0.01",
+                                                 "price": "85000", "status": "live"}]))
+
+    assert [p["side"] for p in engine.get_positions("BTCUSDT")] == ["long", "short"]
+    assert engine.get_positions(side="short")[0]["contracts"] == 0.02
+    assert engine.get_positions()[0]["symbol"] == "BTC/USDT:USDT"
+    assert engine.get_price("BTC/USDT:USDT") == 84100.0
+    assert engine.get_book("BTCUSDT") == (84099.5, 84100.5)
+    assert [o["id"] for o in engine.get_open_orders()] == ["o1"]
+
+    # The fill arrives on both the orders and the fill channel but is reported once
+    filled = {"orderId": "o1", "instId": "BTCUSDT", "side": "sell", "size": "0.01", "status": "filled",
+              "tradeId": "t1", "baseVolume": "0.01", "fillPrice": "85000"}
+    await engine.handle_message(push("orders", [filled]))
+    await engine.handle_message(push("fill", [filled]))
+    await engine.handle_message(push("positions", [position("short", "0.02")], action="snapshot"))
+
+    assert engine.get_open_orders() == []
+    assert [fill["price"] for fill in fills] == [85000.0]
+    assert [p["side"] for p in engine.get_positions()] == ["short"]
+
+
+@pytest.mark.asyncio
+async def test_waiters_wake_on_pushes():
+    engine = BitGetStateEngine()
+    waiter = asyncio.create_task(engine.wait_for_update(timeout=1))
+    await asyncio.sleep(0)
+    await engine.handle_message(ticker(84000))
+    assert await waiter is True
+    assert engine.mark_reaction() < 0.1
+    assert await engine.wait_for_update(timeout=0.01) is False
+
+
+@pytest.mark.asyncio
+async def test_sequence_gap_resyncs_without_overwriting_newer_pushes():
+    rest = RestSnapshot(positions=[{"id": "p-long", "symbol": "BTC/USDT:USDT", "side": "long", "contracts": 0.05}],
+                        delay=0.05)
+    engine = BitGetStateEngine(rest=rest)
+    assert await engine.resync("start")
+    assert engine.get_positions()[0]["contracts"] == 0.05
+
+    await engine.handle_message(push("ticker", [{"instId": "BTCUSDT", "lastPr": "1", "seq": 1}], inst_id="BTCUSDT"))
+    await engine.handle_message(push("ticker", [{"instId": "BTCUSDT", "lastPr": "2", "seq": 3}], inst_id="BTCUSDT"))
+    assert engine.stats["gaps"] == 1
+
+    # A push landing while the snapshot loads is newer than the snapshot
+    await asyncio.sleep(0.01)
+    await engine.handle_message(push("positions", [position("long", "0.07")]))
+    await engine._resync_task
+
+    assert rest.calls == 2
+    assert engine.stats["resyncs"] == 2
+    assert engine.get_positions()[0]["contracts"] == 0.07
+
+
+@pytest.mark.asyncio
+async def test_replay_of_recording_measures_reaction_latency(tmp_path):
+    path = tmp_path / "bitget.jsonl"
+    recorder = BitGetStateEngine(record_path=str(path))
+    for i in range(20):
+        recorder.apply(ticker(84000 + i), received_at=recorder._record_start + i * 0.02)
+    recorder.apply(push("positions", [position()], action="snapshot"), received_at=recorder._record_start + 0.4)
+    await recorder.stop()
+
+    messages = load_recording(str(path))
+    assert len(messages) == 21 and messages[1][0] == pytest.approx(0.02)
+
+    engine = BitGetStateEngine()
+    seen = []
+
+    async def consumer():
+        while True:
+            if await engine.wait_for_update(timeout=1):
+                seen.append(engine.get_price("BTCUSDT"))
+                engine.mark_reaction()
+
+    task = asyncio.create_task(consumer())
+    await asyncio.sleep(0)
+    await replay_messages(engine, messages, speed=1.0)
+    await asyncio.sleep(0.05)
+    task.cancel()
+
+    stats = engine.get_stats()
+    assert seen[:3] == [84000.0, 84001.0, 84002.0]
+    assert stats["reactions"] == 21
+    assert stats["reaction_p99_ms"] < 50
+    assert stats["open_positions"] == 1
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+Tests for the BitGetWebSocket message router.
+"""
+
+import json
+import asyncio
+
+import pytest
+
+from omega_ai.trading.exchanges.bitget_websocket import BitGetWebSocket, WebSocketConfig
+from omega_ai.trading.exchanges.bitget_state_engine import BitGetStateEngine
+
+
+def client():
+    return BitGetWebSocket(WebSocketConfig(api_key="key", secret_key="secret", passphrase="pass"))
+
+
+def message(channel, inst_id, **fields):
+    return json.dumps({"action": "update", "arg": {"instType": "UMCBL", "channel": channel, "instId": inst_id},
+                       "data": [{"instId": inst_id, **fields}]})
+
+
+class Recorder:
+    """Callback recording what it receives, optionally slowly."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.received = []
+
+    async def __call__(self, data):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.received.append((data["arg"]["channel"], data["data"][0]))
+
+
+@pytest.mark.asyncio
+async def test_slow_callback_does_not_hold_up_others():
+    ws = client()
+    slow, fast, eth_only = Recorder(delay=0.2), Recorder(), Recorder()
+    ws.add_callback("ticker", slow)
+    ws.add_callback("ticker", fast)
+    ws.add_callback("ticker", eth_only, inst_id="ETHUSDT_UMCBL")
+
+    await ws.handle_message(message("ticker", "BTCUSDT_UMCBL", last="1"))
+    await ws.handle_message(message("ticker", "ETHUSDT_UMCBL", last="2"))
+    await asyncio.sleep(0.02)
+
+    assert [item["last"] for _, item in fast.received] == ["1", "2"]
+    assert [item["instId"] for _, item in eth_only.received] == ["ETHUSDT_UMCBL"]
+    assert slow.received == []
+
+    await ws.handle_message("pong")
+    await ws.handle_message("not json")
+    stats = ws.get_stats()
+    assert (stats["messages"], stats["routed"], stats["decode_errors"]) == (3, 2, 1)
+    await ws.close()
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_gets_latest_ticker_but_every_order():
+    ws = client()
+    slow = Recorder(delay=0.05)
+    ws.add_callback("ticker", slow)
+    ws.add_callback("orders", slow)
+
+    for i in range(10):
+        await ws.handle_message(message("ticker", "BTCUSDT_UMCBL", last=str(i)))
+        await ws.handle_message(message("orders", "default", ordId=str(i)))
+    await asyncio.sleep(0.05 * 12)
+
+    tickers = [item["last"] for channel, item in slow.received if channel == "ticker"]
+    orders = [item["ordId"] for channel, item in slow.received if channel == "orders"]
+    # All arrived before the callback ran, so the tickers were conflated into the latest
+    assert tickers == ["9"]
+    assert orders == [str(i) for i in range(10)]
+    assert ws.get_stats()["subscribers"]["Recorder"]["conflated"] == 9
+    await ws.close()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_oldest_and_reports_it():
+    ws = client()
+    drops = []
+    slow = Recorder(delay=0.05)
+    ws.add_callback("orders", slow, maxsize=3, on_drop=lambda: drops.append(1))
+
+    for i in range(6):
+        await ws.handle_message(message("orders", "default", ordId=str(i)))
+    await asyncio.sleep(0.05 * 4)
+
+    assert [item["ordId"] for _, item in slow.received] == ["3", "4", "5"]
+    assert len(drops) == 3
+    await ws.close()
+
+
+@pytest.mark.asyncio
+async def test_state_engine_consumes_routed_messages():
+    ws = client()
+    engine = BitGetStateEngine(websocket=ws)
+    for channel in ("positions", "orders", "fill", "ticker"):
+        ws.add_callback(channel, engine.handle_message)
+
+    await ws.handle_message(message("ticker", "BTCUSDT_UMCBL", last="84000"))
+    await ws.handle_message(message("positions", "default", posId="p1", holdSide="long", total="0.01"))
+    assert await engine.wait_for_update(timeout=1)
+    await asyncio.sleep(0.01)
+
+    assert engine.get_price("BTCUSDT") == 84000.0
+    assert engine.get_positions()[0]["contracts"] == 0.01
+    await ws.close()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+Tests for the non-blocking, shared-client ExchangeService.
+"""
+
+import os
+import sys
+import time
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.omega_bot_farm.services import exchange_service
+from src.omega_bot_farm.services.exchange_service import ExchangeService
+
+ROUND_TRIP = 0.1
+
+
+class SyncExchange:
+    """Blocking exchange client, like plain ccxt."""
+
+    def __init__(self, config):
+        self.config = config
+
+    def set_sandbox_mode(self, enabled):
+        self.sandbox = enabled
+
+    def fetch_ticker(self, symbol):
+        time.sleep(ROUND_TRIP)
+        if symbol == "BAD/USDT":
+            raise ValueError("bad symbol")
+        return {"symbol": symbol, "last": 84000.0}
+
+
+class AsyncExchange:
+    """Asyncio exchange client, like ccxt.async_support."""
+
+    def __init__(self, config):
+        self.config = config
+        self.closed = False
+
+    def set_sandbox_mode(self, enabled):
+        self.sandbox = enabled
+
+    async def fetch_ticker(self, symbol):
+        await asyncio.sleep(ROUND_TRIP)
+        return {"symbol": symbol, "last": 84000.0}
+
+    async def fetch_positions(self):
+        await asyncio.sleep(ROUND_TRIP)
+        return [{"symbol": "BTC/USDT:USDT", "contracts": 1}]
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_ccxt(monkeypatch):
+    monkeypatch.setattr(exchange_service, "CCXT_AVAILABLE", True)
+    monkeypatch.setattr(exchange_service, "CCXT_ASYNC_AVAILABLE", True)
+    monkeypatch.setattr(exchange_service, "ccxt", SimpleNamespace(bitget=SyncExchange), raising=False)
+    monkeypatch.setattr(exchange_service, "ccxt_async", SimpleNamespace(bitget=AsyncExchange), raising=False)
+    monkeypatch.setattr(exchange_service, "_shared_exchanges", {})
+    exchange_service.get_market_data_cache().clear()
+
+
+def service(api_key="key", use_async=True):
+    return ExchangeService("bitget", api_key=api_key, api_secret="secret", api_passphrase="pass", use_async=use_async)
+
+
+@pytest.mark.asyncio
+async def test_sync_client_does_not_block_event_loop(fake_ccxt):
+    """Test blocking ccxt calls run on the executor while the loop keeps ticking."""
+    bots = [service(use_async=False) for _ in range(4)]
+    ticks = 0
+
+    async def heartbeat():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    beat = asyncio.create_task(heartbeat())
+    start = time.perf_counter()
+    tickers = await asyncio.gather(*[bot.fetch_ticker(f"COIN{i}/USDT") for i, bot in enumerate(bots)])
+    elapsed = time.perf_counter() - start
+    beat.cancel()
+
+    assert [ticker["last"] for ticker in tickers] == [84000.0] * 4
+    assert elapsed < 2 * ROUND_TRIP
+    assert ticks >= 5
+    metrics = bots[0].get_metrics()
+    assert metrics["mode"] == "executor"
+    assert metrics["peak_in_flight"] == 4
+    assert metrics["shared_by"] == 4
+
+
+@pytest.mark.asyncio
+async def test_async_client_is_shared_per_credentials(fake_ccxt):
+    first, second, other = service(), service(), service(api_key="other")
+
+    assert first.exchange is second.exchange
+    assert first.exchange is not other.exchange
+    assert first.ccxt_client is first.exchange
+    assert first.get_metrics()["mode"] == "async"
+
+    positions, ticker = await asyncio.gather(first.fetch_positions(), second.fetch_ticker("BTC/USDT"))
+    assert positions[0]["contracts"] == 1 and ticker["last"] == 84000.0
+    assert first.get_metrics()["operations"] == {"fetch_positions": 1, "fetch_ticker": 1}
+
+    client = first.exchange
+    await first.close()
+    assert not client.closed  # Still used by the second service
+    await second.close()
+    assert client.closed
+    assert list(exchange_service._shared_exchanges) == [other._shared.key]
+
+
+@pytest.mark.asyncio
+async def test_errors_are_counted(fake_ccxt):
+    bot = service(use_async=False)
+    assert await bot.fetch_ticker("BAD/USDT") == {}
+    metrics = bot.get_metrics()
+    assert metrics["errors"] == 1
+    assert metrics["in_flight"] == 0
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+Tests for the shared market data cache and its use by ExchangeClient.
+"""
+
+import os
+import sys
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.omega_bot_farm.services.market_data_cache import MarketDataCache, account_id, exchange_key
+from src.omega_bot_farm.trading.b0ts.core.exchange_client import ExchangeClient
+from src.omega_bot_farm.trading.b0ts.bitget_analyzer.bitget_position_analyzer_b0t import BitgetPositionAnalyzerB0t
+
+
+class CountingFetch:
+    """Fetch function counting its exchange calls."""
+
+    def __init__(self, value=None, delay=0.02, error=None):
+        self.calls = 0
+        self.value = value if value is not None else [{"symbol": "BTC/USDT:USDT", "contracts": 1}]
+        self.delay = delay
+        self.error = error
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.value
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_fetch_until_expiry():
+    cache = MarketDataCache(ttls={"positions": 0.05})
+    fetch = CountingFetch()
+
+    results = await asyncio.gather(*[cache.get_or_fetch("positions", "bitget", fetch, account="a") for _ in range(10)])
+    assert fetch.calls == 1
+    assert all(result is results[0] for result in results)
+
+    await cache.get_or_fetch("positions", "bitget", fetch, account="a")
+    assert fetch.calls == 1
+    await asyncio.sleep(0.06)
+    await cache.get_or_fetch("positions", "bitget", fetch, account="a")
+    assert fetch.calls == 2
+
+    stats = cache.get_stats()
+    assert (stats["misses"], stats["coalesced"], stats["hits"]) == (2, 9, 1)
+    assert stats["resources"]["positions"]["misses"] == 2
+
+
+@pytest.mark.asyncio
+async def test_failures_are_shared_but_not_cached():
+    cache = MarketDataCache()
+    fetch = CountingFetch(error=RuntimeError("exchange down"))
+
+    results = await asyncio.gather(*[cache.get_or_fetch("ticker", "bitget", fetch, symbol="BTC/USDT") for _ in range(3)],
+                                   return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert fetch.calls == 1
+
+    fetch.error = None
+    assert await cache.get_or_fetch("ticker", "bitget", fetch, symbol="BTC/USDT") == fetch.value
+    assert fetch.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_order_placement_invalidates_account_data_only():
+    cache = MarketDataCache()
+    positions, balance, ticker, other = CountingFetch(), CountingFetch({"total": {}}), CountingFetch({"last": 1.0}), CountingFetch()
+
+    async def load():
+        await cache.get_or_fetch("positions", "bitget", positions, account="a")
+        await cache.get_or_fetch("balance", "bitget", balance, account="a")
+        await cache.get_or_fetch("ticker", "bitget", ticker, symbol="BTC/USDT:USDT")
+        await cache.get_or_fetch("positions", "bitget", other, account="b")
+
+    await load()
+    cache.on_order_placed("bitget", "a", "BTC/USDT:USDT")
+    await load()
+
+    assert (positions.calls, balance.calls, ticker.calls, other.calls) == (2, 2, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_fetch_in_flight_during_invalidation_is_not_cached():
+    cache = MarketDataCache()
+    fetch = CountingFetch(delay=0.05)
+
+    pending = asyncio.create_task(cache.get_or_fetch("positions", "bitget", fetch, account="a"))
+    await asyncio.sleep(0.01)
+    cache.on_order_placed("bitget", "a")
+    await pending
+
+    await cache.get_or_fetch("positions", "bitget", fetch, account="a")
+    assert fetch.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_reading_its_own_key_does_not_wait_on_itself():
+    cache = MarketDataCache()
+    fetch = CountingFetch()
+
+    async def cached_client_fetch():
+        # A client that caches under the same key, wrapped in the cache again
+        return await cache.get_or_fetch("positions", "bitget", fetch, account="a")
+
+    value = await asyncio.wait_for(cache.get_or_fetch("positions", "bitget", cached_client_fetch, account="a"), 2)
+    assert value == fetch.value
+    assert fetch.calls == 1
+    assert await cache.get_or_fetch("positions", "bitget", cached_client_fetch, account="a") == fetch.value
+    assert fetch.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_analyzer_over_a_caching_client_does_not_hang():
+    cache = MarketDataCache()
+    analyzer = BitgetPositionAnalyzerB0t({"api_key": "key", "use_testnet": True})
+    fetch = CountingFetch([{"symbol": "BTC/USDT:USDT", "contracts": 1, "side": "long"}])
+
+    class CachingClient:
+        async def fetch_positions(self):
+            return await cache.get_or_fetch("positions", exchange_key("bitget", True), fetch,
+                                            account=account_id("key"))
+
+    analyzer.cache, analyzer.exchange = cache, object()
+    analyzer.connection_method, analyzer.exchange_client_b0t = "ExchangeClientB0t", CachingClient()
+
+    result = await asyncio.wait_for(analyzer.get_positions(), 2)
+    assert [p["symbol"] for p in result["positions"]] == ["BTC/USDT:USDT"]
+    assert fetch.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_shares_entries_between_processes(mock_redis):
+    first = MarketDataCache(redis_client=mock_redis)
+    second = MarketDataCache(redis_client=mock_redis)
+    fetch = CountingFetch()
+
+    await first.get_or_fetch("positions", "bitget", fetch, account="a", symbol="BTC/USDT:USDT")
+    assert await second.get_or_fetch("positions", "bitget", fetch, account="a", symbol="BTC/USDT:USDT") == fetch.value
+    assert fetch.calls == 1
+    assert second.get_stats()["redis_hits"] == 1
+    assert 0 < mock_redis.pttl("omega:market_data:positions|bitget|a|BTC/USDT:USDT") <= 3000
+
+    second.on_order_placed("bitget", "a", "BTC/USDT:USDT")
+    assert not list(mock_redis.scan_iter(match="omega:market_data:positions*"))
+
+
+@pytest.mark.asyncio
+async def test_exchange_clients_on_one_account_share_exchange_calls(monkeypatch):
+    monkeypatch.setattr(ExchangeClient, "_get_env_var", lambda self, name, default="": default)
+    cache = MarketDataCache()
+    exchange = AsyncMock()
+    exchange.fetch_positions.return_value = [{"symbol": "BTC/USDT:USDT", "contracts": 1}]
+    exchange.fetch_balance.return_value = {"total": {"USDT": 1000.0}}
+
+    bots = []
+    for _ in range(12):
+        bot = ExchangeClient("bitget", api_key="key", api_secret="secret", api_passphrase="pass",
+                             auto_connect=False, cache=cache)
+        bot.exchange, bot.is_connected, bot.request_rate_limit = exchange, True, 0
+        bots.append(bot)
+
+    for _ in range(5):
+        await asyncio.gather(*[bot.fetch_positions() for bot in bots], *[bot.fetch_balance() for bot in bots])
+    assert exchange.fetch_positions.await_count == 1
+    assert exchange.fetch_balance.await_count == 1
+
+    await bots[0].create_order("BTC", "market", "buy", 0.001)
+    await bots[1].fetch_positions()
+    assert exchange.fetch_positions.await_count == 2
+    assert bots[0].account == account_id("key")
+
+
+@pytest.mark.asyncio
+async def test_testnet_and_mainnet_clients_do_not_share_entries(monkeypatch):
+    monkeypatch.setattr(ExchangeClient, "_get_env_var", lambda self, name, default="": default)
+    cache = MarketDataCache()
+    exchanges = {}
+    for testnet in (False, True):
+        exchange = AsyncMock()
+        exchange.fetch_balance.return_value = {"total": {"USDT": 10.0 if testnet else 1000.0}}
+        exchanges[testnet] = exchange
+
+    bots = {}
+    for testnet, exchange in exchanges.items():
+        bot = ExchangeClient("bitget", api_key="key", api_secret="secret", api_passphrase="pass",
+                             use_testnet=testnet, auto_connect=False, cache=cache)
+        bot.exchange, bot.is_connected, bot.request_rate_limit = exchange, True, 0
+        bots[testnet] = bot
+
+    assert (await bots[False].fetch_balance())["total"]["USDT"] == 1000.0
+    assert (await bots[True].fetch_balance())["total"]["USDT"] == 10.0
+    assert exchanges[False].fetch_balance.await_count == exchanges[True].fetch_balance.await_count == 1
+
+    await bots[True].create_order("BTC", "market", "buy", 0.001)
+    await bots[False].fetch_balance()
+    assert exchanges[False].fetch_balance.await_count == 1
+    assert exchange_key("BitGet", True) == "bitget:testnet"
@@ -0,0 +1,138 @@
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+# 
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+# 
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+# 
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""Tests for the streaming feature store and incremental inference of MarketTrendsModel."""
+
+import json
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import GradientBoostingRegressor, RandomForestClassifier
+
+from omega_ai.data_feed.price_history_store import PriceHistoryStore
+from omega_ai.ml import feature_store
+from omega_ai.ml.feature_store import StreamingFeatureStore
+from omega_ai.ml.market_trends_model import MarketTrendsModel, load_cached_model
+
+START = 1_700_000_000.0
+TRENDS = {"trend_15min": 1, "change_15min": 1.5, "trend_60min": -1, "change_60min": -0.4}
+
+@pytest.fixture
+def model(mock_redis, tmp_path):
+    with patch("omega_ai.ml.market_trends_model.redis.StrictRedis", return_value=mock_redis), \
+            patch.object(MarketTrendsModel, "load_models"):
+        model = MarketTrendsModel()
+    model.model_dir = str(tmp_path)
+    return model
+
+def random_walk(count, seed=0):
+    rng = np.random.default_rng(seed)
+    prices = 84000.0 * np.cumprod(1 + rng.normal(0, 0.001, count))
+    volumes = rng.uniform(0.1, 3.0, count)
+    return prices, volumes
+
+def frame_row(model, prices, volumes, trends=None):
+    """Last feature row of the frame pipeline over all ticks."""
+    df = pd.DataFrame({"price": prices, "volume": volumes})
+    for column, value in (trends or {}).items():
+        df[column] = value
+    return model._engineer_features(df).iloc[-1]
+
+def assert_rows_equal(row, expected):
+    assert set(row) == set(expected.index)
+    for column, value in row.items():
+        assert value == pytest.approx(float(expected[column]), rel=1e-7, abs=1e-7), column
+
+def test_streaming_rows_match_frame_features(model, monkeypatch):
+    """Test every row equals the frame pipeline, through warm-up, window boundaries and rebuilds."""
+    monkeypatch.setattr(feature_store, "REBUILD_INTERVAL", 50)
+    prices, volumes = random_walk(300)
+    store = StreamingFeatureStore()
+    store.extend(prices[:3], volumes[:3])
+
+    for i in range(3, 300):
+        if i in (3, 7, 8, 14, 15, 21, 22, 54, 55, 56, 57, 130, 299):
+            assert_rows_equal(store.preview(prices[i], volumes[i], TRENDS),
+                              frame_row(model, prices[:i + 1], volumes[:i + 1], TRENDS))
+        store.update(prices[i], volumes[i], TRENDS)
+
+    assert len(store) == 300
+    assert store.latest["trend_15min_change"] == 0
+    assert store.preview(prices[-1], 1.0, {**TRENDS, "trend_15min": -1})["trend_15min_change"] == -2
+
+def test_latest_data_reads_only_new_ticks(model, mock_redis):
+    prices, volumes = random_walk(400, seed=1)
+    store = PriceHistoryStore(mock_redis)
+    store.append_many(START + np.arange(300), prices[:300], volumes[:300])
+    mock_redis.set("last_btc_price", str(prices[300]))
+    mock_redis.set("last_btc_volume", str(volumes[300]))
+    mock_redis.set("btc_trend_15min", json.dumps({"trend": "Bullish", "change": 1.5}))
+
+    row = model.get_latest_data().iloc[0]
+    assert len(model.feature_store) == feature_store.LOOKBACK + 1
+    expected = frame_row(model, prices[:301], volumes[:301], {"trend_15min": 1, "change_15min": 1.5})
+    assert row["ma_55"] == pytest.approx(expected["ma_55"], rel=1e-12)
+    assert row["rsi_14"] == pytest.approx(expected["rsi_14"], rel=1e-9)
+
+    store.append_many(START + np.arange(300, 400), prices[300:400], volumes[300:400])
+    with patch.object(model.tick_history, "tail") as tail:
+        row = model.get_latest_data().iloc[0]
+    tail.assert_not_called()
+    assert len(model.feature_store) == feature_store.LOOKBACK + 101
+    expected = frame_row(model, np.r_[prices[:400], prices[300]], np.r_[volumes[:400], volumes[300]])
+    for column in ("ma_8", "vol_34", "momentum_21", "fib_dist_0.618", "volume_ma_55"):
+        assert row[column] == pytest.approx(expected[column], rel=1e-9), column
+
+def test_predictions_share_one_feature_row_and_batch_matches(model, mock_redis):
+    prices, volumes = random_walk(600, seed=2)
+    history = pd.DataFrame({"price": prices, "volume": volumes, **TRENDS})
+    features = model._engineer_features(history)
+    X = features.drop(columns=["price", "trend_15min"])
+    model.trend_classifier = RandomForestClassifier(n_estimators=5, random_state=0).fit(X, np.sign(features["momentum_3"]))
+    model.price_regressor = GradientBoostingRegressor(n_estimators=5, random_state=0).fit(X, features["momentum_1"])
+    model.trap_classifier = RandomForestClassifier(n_estimators=5, random_state=0).fit(X, features["rsi_14"] > 60)
+
+    PriceHistoryStore(mock_redis).append_many(START + np.arange(599), prices[:599], volumes[:599])
+    mock_redis.set("last_btc_price", str(prices[599]))
+    mock_redis.set("last_btc_volume", str(volumes[599]))
+    for tf, trend, change in (("15min", "Bullish", 1.5), ("60min", "Bearish", -0.4)):
+        mock_redis.set(f"btc_trend_{tf}", json.dumps({"trend": trend, "change": change}))
+
+    with patch.object(model, "get_latest_data", wraps=model.get_latest_data) as latest:
+        predictions = model.generate_predictions()
+    assert latest.call_count == 1
+
+    batch = model.predict_batch(history)
+    assert len(batch) == 600
+    last = batch.iloc[-1]
+    assert predictions["trend"]["trend"] == last["trend"]
+    assert predictions["trend"]["confidence"] == pytest.approx(last["trend_confidence"])
+    assert predictions["price"]["pct_change"] == pytest.approx(last["pct_change"])
+    assert predictions["trap"]["trap_detected"] == last["trap_detected"]
+
+def test_loaded_models_are_cached_per_file_version(tmp_path):
+    path = str(tmp_path / "trend_classifier.joblib")
+    assert load_cached_model(path) is None
+
+    import joblib
+    joblib.dump({"version": 1}, path)
+    first = load_cached_model(path)
+    assert load_cached_model(path) is first
+
+    joblib.dump({"version": 2}, path)
+    import os
+    os.utime(path, (1, 1))
+    assert load_cached_model(path) == {"version": 2}
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+Tests for the batched, time-major QLSTM forward and backward passes.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.omega_bot_farm.ai_model_aixbt.quantum_neural_net.qlstm import QLSTM
+
+def stepwise(layer, inputs, grad_output):
+    """Run the sequence one QuantumLSTMCell step at a time, forward then back."""
+    cell = layer.cell
+    batch_size, seq_length, _ = inputs.shape
+    h = np.zeros((batch_size, layer.units), dtype=cell.state_dtype)
+    c = np.zeros_like(h)
+    outputs, caches = [], []
+    for t in range(seq_length):
+        h, [h, c] = cell.forward(inputs[:, t], [h, c])
+        outputs.append(h)
+        caches.append(dict(cell.cache))
+
+    dh_next, dc_next = np.zeros_like(h), np.zeros_like(c)
+    grad_inputs, grads = [], None
+    for t in reversed(range(seq_length)):
+        cell.cache = caches[t]
+        if layer.return_sequences:
+            grad_t = grad_output[:, t]
+        else:
+            grad_t = grad_output if t == seq_length - 1 else np.zeros_like(h)
+        dx, step_grads = cell.backward(grad_t, [dh_next, dc_next])
+        grad_inputs.insert(0, dx)
+        grads = step_grads if grads is None else {key: grads[key] + step_grads[key] for key in grads}
+        dh_next, dc_next = cell.cache["dh_prev"], cell.cache["dc_prev"]
+
+    outputs = np.stack(outputs, axis=1)
+    return outputs if layer.return_sequences else outputs[:, -1], np.stack(grad_inputs, axis=1), grads
+
+@pytest.mark.parametrize("use_complex", [False, True])
+@pytest.mark.parametrize("return_sequences", [False, True])
+def test_fused_pass_matches_cell_steps(use_complex, return_sequences):
+    rng = np.random.default_rng(1)
+    layer = QLSTM(units=6, return_sequences=return_sequences, use_complex=use_complex)
+    inputs = rng.normal(size=(3, 7, 4))
+    outputs = layer(inputs)
+    grad_output = rng.normal(size=outputs.shape)
+    grad_inputs, grads = layer.backward(grad_output)
+
+    expected_outputs, expected_inputs, expected_grads = stepwise(layer, inputs, grad_output)
+    np.testing.assert_allclose(outputs, expected_outputs, atol=1e-12)
+    np.testing.assert_allclose(grad_inputs, expected_inputs, atol=1e-10)
+    for key in ("kernel", "recurrent_kernel", "bias"):
+        np.testing.assert_allclose(grads[key], expected_grads[key], atol=1e-10)
+
+def test_gradients_match_finite_differences():
+    rng = np.random.default_rng(2)
+    layer = QLSTM(units=5, return_sequences=True, use_complex=False)
+    inputs = rng.normal(size=(2, 6, 3))
+    grad_output = rng.normal(size=layer(inputs).shape)
+    grad_inputs, grads = layer.backward(grad_output)
+
+    def loss(x):
+        return float((layer.forward(x) * grad_output).sum())
+
+    eps = 1e-6
+    recurrent = layer.cell.weights["recurrent_kernel"]
+    for index in [(0, 1, 2), (1, 4, 0), (3, 2, 2)]:
+        recurrent[index] += eps
+        plus = loss(inputs)
+        recurrent[index] -= 2 * eps
+        minus = loss(inputs)
+        recurrent[index] += eps
+        assert grads["recurrent_kernel"][index] == pytest.approx((plus - minus) / (2 * eps), abs=1e-7)
+
+    shifted = inputs.copy()
+    shifted[1, 2, 0] += eps
+    plus = loss(shifted)
+    shifted[1, 2, 0] -= 2 * eps
+    assert grad_inputs[1, 2, 0] == pytest.approx((plus - loss(shifted)) / (2 * eps), abs=1e-7)
+
+def test_float32_real_layer_stays_real_single_precision():
+    layer = QLSTM(units=8, return_sequences=True, use_complex=False, dtype="float32")
+    inputs = np.random.default_rng(3).normal(size=(4, 10, 3))
+    outputs = layer(inputs)
+    grad_inputs, grads = layer.backward(np.ones_like(outputs))
+
+    assert outputs.dtype == np.float32 and grad_inputs.dtype == np.float32
+    assert all(grad.dtype == np.float32 for grad in grads.values())
+    assert all(layer.sequence_cache[key].dtype == np.float32 for key in ("h", "c", "tanh_c"))
+
+def test_single_sample_shapes():
+    layer = QLSTM(units=4, return_sequences=False, use_complex=False)
+    outputs = layer(np.ones((5, 2)))
+    assert outputs.shape == (4,)
+    assert layer.backward(np.ones(4))[0].shape == (5, 2)
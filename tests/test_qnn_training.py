@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+Tests for the quantum neural network training pipeline: mini-batch loading,
+data-parallel gradients and early stopping.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.omega_bot_farm.ai_model_aixbt.quantum_neural_net.classical_layers import DenseLayer
+from src.omega_bot_farm.ai_model_aixbt.quantum_neural_net.model import QuantumNeuralNetwork
+from src.omega_bot_farm.ai_model_aixbt.quantum_neural_net.qlstm import QLSTM
+from src.omega_bot_farm.ai_model_aixbt.quantum_neural_net.training import (
+    EarlyStopping,
+    GradientWorkerPool,
+    MiniBatchLoader
+)
+
+def make_data(samples=48, seq_length=5, features=3, units=2, seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.normal(size=(samples, seq_length, features))
+    y = 0.5 * np.tanh(x[:, -1, :units])
+    return x, y
+
+def make_model(optimizer="quantum_adam", units=2):
+    np.random.seed(0)
+    model = QuantumNeuralNetwork("test")
+    model.add(QLSTM(units=units, use_complex=False))
+    model.compile(optimizer=optimizer, loss="quantum_mse")
+    return model
+
+def test_loader_covers_every_sample_once_per_epoch(tmp_path):
+    x, y = make_data(samples=50)
+    np.save(tmp_path / "x.npy", x)
+    np.save(tmp_path / "y.npy", y)
+    loader = MiniBatchLoader(str(tmp_path / "x.npy"), str(tmp_path / "y.npy"), batch_size=8, seed=3)
+
+    assert isinstance(loader.x, np.memmap)
+    assert len(loader) == 7
+    batches = list(loader.batch_indices())
+    assert all(np.all(np.diff(batch) > 0) for batch in batches)
+    assert sorted(np.concatenate(batches).tolist()) == list(range(50))
+
+    x_batch, y_batch = loader.take(batches[0])
+    np.testing.assert_array_equal(x_batch, x[batches[0]])
+    np.testing.assert_array_equal(y_batch, y[batches[0]])
+
+    dropped = MiniBatchLoader(x, y, batch_size=8, shuffle=False, drop_last=True)
+    assert [len(batch) for batch in dropped.batch_indices()] == [8] * 6
+
+def test_worker_pool_gradients_match_serial(tmp_path):
+    x, y = make_data()
+    model = make_model()
+    model._forward(x[:2])  # Build the layer before sharing it with workers
+    indices = np.arange(5, 29)
+
+    y_pred, serial = model._compute_gradients(x[indices], y[indices])
+    with GradientWorkerPool(model, x, y, workers=2) as pool:
+        pool_pred, parallel = pool.gradients(indices)
+
+    np.testing.assert_allclose(pool_pred, y_pred, atol=1e-12)
+    for key, grad in serial["layer_0"].items():
+        np.testing.assert_allclose(parallel["layer_0"][key], grad, atol=1e-12)
+
+def test_fit_with_workers_matches_serial():
+    x, y = make_data()
+    serial = make_model().fit(x, y, epochs=2, batch_size=16, verbose=0, seed=1)
+    parallel = make_model().fit(x, y, epochs=2, batch_size=16, verbose=0, seed=1, workers=2)
+    np.testing.assert_allclose(parallel["loss"], serial["loss"], rtol=1e-10)
+
+def test_fit_with_workers_trains_dense_layers():
+    x, y = make_data()
+    np.random.seed(0)
+    model = QuantumNeuralNetwork("dense")
+    model.add(QLSTM(units=3, use_complex=False))
+    model.add(DenseLayer(input_dim=3, output_dim=2))
+    model.compile(optimizer="quantum_adam", loss="quantum_mse")
+    model._forward(x[:2])
+    before = model.get_parameters()
+
+    model.fit(x, y, epochs=2, batch_size=16, verbose=0, seed=1, workers=2)
+
+    after = model.get_parameters()
+    for key, value in before["layer_1"].items():
+        assert not np.allclose(after["layer_1"][key], value)
+
+def test_fit_with_workers_rejects_layers_without_gradients():
+    class SelfUpdatingDense(DenseLayer):
+        def backward(self, grad_output):
+            grad_input, gradients = super().backward(grad_output)
+            self.weights = self.weights - 0.01 * gradients["weights"]
+            return grad_input
+
+    x, y = make_data()
+    model = QuantumNeuralNetwork("dense")
+    model.add(QLSTM(units=3, use_complex=False))
+    model.add(SelfUpdatingDense(input_dim=3, output_dim=2))
+    model.compile(optimizer="quantum_adam", loss="quantum_mse")
+
+    with pytest.raises(ValueError, match="layer_1"):
+        model.fit(x, y, epochs=1, batch_size=16, verbose=0, workers=2)
+
+def test_fit_trains_recurrent_parameters_and_records_timing():
+    x, y = make_data()
+    model = make_model()
+    model._forward(x[:2])
+    before = model.get_parameters()
+
+    history = model.fit(x, y, epochs=8, batch_size=16, verbose=0, seed=1)
+
+    assert history["loss"][-1] < history["loss"][0]
+    after = model.get_parameters()
+    assert not np.allclose(after["layer_0"]["kernel"], before["layer_0"]["kernel"])
+    assert len(history["epoch_time"]) == len(history["samples_per_second"]) == len(history["data_time"]) == 8
+    assert all(rate > 0 for rate in history["samples_per_second"])
+
+def test_early_stopping_checkpoints_and_restores_best(tmp_path):
+    x, y = make_data()
+    model = make_model(optimizer="quantum_sgd")
+    model._forward(x[:2])
+    model.optimizer.learning_rate = 5.0  # Diverges after the first epochs
+    checkpoint = str(tmp_path / "best.npz")
+    stopper = EarlyStopping(monitor="loss", patience=2, checkpoint_path=checkpoint)
+
+    history = model.fit(x, y, epochs=30, batch_size=48, verbose=0, callbacks=[stopper], shuffle=False)
+
+    assert stopper.stopped_epoch is not None
+    assert len(history["loss"]) == stopper.stopped_epoch + 1 < 30
+    assert history["loss"][stopper.best_epoch] == min(history["loss"])
+
+    best = model.get_parameters()
+    for key, value in stopper.best_parameters["layer_0"].items():
+        np.testing.assert_array_equal(best["layer_0"][key], value)
+
+    other = make_model()
+    other._forward(x[:2])
+    other.load_parameters(checkpoint)
+    for key, value in best["layer_0"].items():
+        np.testing.assert_array_equal(other.get_parameters()["layer_0"][key], value)
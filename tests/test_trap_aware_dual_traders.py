@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+Tests for the WebSocket state wiring of the trap-aware dual traders.
+"""
+
+import sys
+from types import ModuleType, SimpleNamespace
+from unittest.mock import patch
+
+import fakeredis
+import pytest
+
+from omega_ai.trading.exchanges.bitget_state_engine import BitGetStateEngine
+
+pytest.importorskip("ccxt")
+pytest.importorskip("dotenv")
+
+
+def import_traders():
+    """
+    Import TrapAwareDualTraders around imports that are broken in the tree.
+
+    omega_ai.algos.omega_algorithms and mm_trap_detector import
+    fetch_recent_movements and insert_subtle_movement, which
+    omega_ai.db_manager.database does not define, and fibonacci_detector
+    pings Redis at import time.
+    """
+    stub_name = "omega_ai.algos.omega_algorithms"
+    stub = ModuleType(stub_name)
+    stub.OmegaAlgo = object
+    added_stub = sys.modules.setdefault(stub_name, stub) is stub
+
+    try:
+        with patch("redis.StrictRedis", fakeredis.FakeStrictRedis), patch("redis.Redis", fakeredis.FakeRedis):
+            from omega_ai.db_manager import database
+            with patch.object(database, "fetch_recent_movements", lambda *args, **kwargs: [], create=True), \
+                    patch.object(database, "insert_subtle_movement", lambda *args, **kwargs: None, create=True):
+                from omega_ai.trading.strategies.trap_aware_dual_traders import TrapAwareDualTraders
+    finally:
+        if added_stub:
+            del sys.modules[stub_name]
+    return TrapAwareDualTraders
+
+
+TrapAwareDualTraders = import_traders()
+
+
+def traders(**attributes):
+    """TrapAwareDualTraders with only the attributes these tests use."""
+    instance = TrapAwareDualTraders.__new__(TrapAwareDualTraders)
+    defaults = dict(symbol="BTCUSDT", use_testnet=False, api_key="master", secret_key="secret",
+                    passphrase="pass", long_sub_account="", short_sub_account="fst_short",
+                    sub_account_credentials={}, state_engines={})
+    instance.__dict__.update(defaults, **attributes)
+    return instance
+
+
+def position(side, total):
+    return {"posId": f"p-{side}", "instId": "BTCUSDT", "holdSide": side, "total": total,
+            "openPriceAvg": "84000", "markPrice": "84000"}
+
+
+@pytest.mark.asyncio
+async def test_each_loop_sees_only_its_own_side():
+    engine = BitGetStateEngine(symbols=["BTCUSDT"])
+    engine.synced = True
+    await engine.handle_message({"action": "snapshot", "arg": {"channel": "positions", "instId": "default"},
+                                 "data": [position("long", "0.01"), position("short", "0.02")]})
+    await engine.handle_message({"arg": {"channel": "ticker", "instId": "BTCUSDT"},
+                                 "data": [{"instId": "BTCUSDT", "lastPr": "84100"}]})
+    bot = traders(state_engines={"long": engine, "short": engine})
+
+    long_positions, long_price = await bot._get_position_state(SimpleNamespace(), "long")
+    short_positions, short_price = await bot._get_position_state(SimpleNamespace(), "short")
+
+    assert [(p["side"], p["contracts"]) for p in long_positions] == [("long", 0.01)]
+    assert [(p["side"], p["contracts"]) for p in short_positions] == [("short", 0.02)]
+    assert long_price == short_price == 84100.0
+
+
+@pytest.mark.asyncio
+async def test_sub_account_without_credentials_falls_back_to_polling(monkeypatch):
+    monkeypatch.delenv("BITGET_SUB_FST_SHORT_API_KEY", raising=False)
+    strategic = SimpleNamespace(traders={"strategic": object()})
+    bot = traders(long_trader=None, short_trader=strategic)
+
+    assert bot._get_sub_account_credentials("") == {"api_key": "master", "secret_key": "secret", "passphrase": "pass"}
+    assert bot._get_sub_account_credentials("fst_short") is None
+    await bot._start_state_engines()
+    assert bot.state_engines == {}
+
+    monkeypatch.setenv("BITGET_SUB_FST_SHORT_API_KEY", "sub-key")
+    monkeypatch.setenv("BITGET_SUB_FST_SHORT_SECRET_KEY", "sub-secret")
+    monkeypatch.setenv("BITGET_SUB_FST_SHORT_PASSPHRASE", "sub-pass")
+    assert bot._get_sub_account_credentials("fst_short")["api_key"] == "sub-key"
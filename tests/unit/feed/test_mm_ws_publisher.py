@@ -0,0 +1,123 @@
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+import json
+import asyncio
+import pytest
+import websockets
+from omega_ai.data_feed.mm_ws_publisher import (
+    MMWebSocketPublisher,
+    POLICY_COALESCE_LATEST,
+    POLICY_DROP_OLDEST
+)
+
+class BroadcastServer:
+    """Minimal stand-in for mm_websocket_server: echoes every message to all clients."""
+
+    def __init__(self):
+        self.clients = set()
+        self.connections = 0
+        self.received = []
+
+    async def handler(self, websocket):
+        self.connections += 1
+        self.clients.add(websocket)
+        try:
+            async for message in websocket:
+                self.received.append(json.loads(message))
+                await asyncio.gather(*[ws.send(message) for ws in self.clients])
+        finally:
+            self.clients.discard(websocket)
+
+async def wait_for(predicate, timeout=5.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+def test_publishes_over_single_persistent_connection():
+    """Test many updates share one connection and report echo latency."""
+    async def scenario():
+        server = BroadcastServer()
+        async with websockets.serve(server.handler, "127.0.0.1", 0) as ws_server:
+            port = ws_server.sockets[0].getsockname()[1]
+            publisher = MMWebSocketPublisher(url=f"ws://127.0.0.1:{port}", policy=POLICY_DROP_OLDEST).start()
+            try:
+                for i in range(50):
+                    publisher.publish(84000.0 + i)
+                await wait_for(lambda: len(server.received) == 50)
+                await wait_for(lambda: len(publisher.echo_latencies) == 50)
+            finally:
+                await asyncio.to_thread(publisher.stop)
+        return server, publisher
+
+    server, publisher = asyncio.run(scenario())
+    assert server.connections == 1
+    assert [m["btc_price"] for m in server.received] == [84000.0 + i for i in range(50)]
+    metrics = publisher.metrics()
+    assert metrics["sent"] == 50
+    assert metrics["dropped"] == 0
+    assert metrics["queue_depth"] == 0
+    assert metrics["echo_p99_ms"] > 0
+
+def test_coalesce_latest_keeps_only_newest_pending():
+    """Test the coalescing policy collapses a backlog to the latest price."""
+    publisher = MMWebSocketPublisher(url="ws://127.0.0.1:9", policy=POLICY_COALESCE_LATEST)
+    for i in range(5):
+        publisher.publish(84000.0 + i)
+
+    assert publisher.queue_depth == 1
+    assert publisher.coalesced == 4
+    assert json.loads(publisher._queue[0][1])["btc_price"] == 84004.0
+
+def test_drop_oldest_bounds_queue():
+    """Test the drop-oldest policy evicts the oldest pending messages."""
+    publisher = MMWebSocketPublisher(url="ws://127.0.0.1:9", policy=POLICY_DROP_OLDEST, max_queue=3)
+    for i in range(5):
+        publisher.publish(84000.0 + i)
+
+    assert publisher.queue_depth == 3
+    assert publisher.dropped == 2
+    assert [json.loads(m)["btc_price"] for _, m in publisher._queue] == [84002.0, 84003.0, 84004.0]
+
+def test_reconnects_and_flushes_backlog():
+    """Test updates queued while the server is down are delivered after it starts."""
+    async def scenario():
+        server = BroadcastServer()
+        probe = await websockets.serve(server.handler, "127.0.0.1", 0)
+        port = probe.sockets[0].getsockname()[1]
+        probe.close()
+        await probe.wait_closed()
+
+        publisher = MMWebSocketPublisher(
+            url=f"ws://127.0.0.1:{port}", policy=POLICY_DROP_OLDEST, reconnect_delay=0.05
+        ).start()
+        try:
+            publisher.publish(84000.0)
+            publisher.publish(84001.0)
+            await wait_for(lambda: publisher.reconnects >= 1)
+            async with websockets.serve(server.handler, "127.0.0.1", port):
+                await wait_for(lambda: len(server.received) == 2)
+        finally:
+            await asyncio.to_thread(publisher.stop)
+        return server
+
+    server = asyncio.run(scenario())
+    assert [m["btc_price"] for m in server.received] == [84000.0, 84001.0]
+
+def test_unknown_policy_rejected():
+    """Test an unsupported backpressure policy raises ValueError."""
+    with pytest.raises(ValueError):
+        MMWebSocketPublisher(policy="block")
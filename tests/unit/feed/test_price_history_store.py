@@ -0,0 +1,103 @@
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+import numpy as np
+import pytest
+from omega_ai.data_feed.price_history_store import PriceHistoryStore, aggregate_candles
+from omega_ai.data_feed.tick_ingestor import TickIngestor
+
+START = 1_700_000_000.0  # 800 s into an hour bucket
+
+@pytest.fixture
+def store(mock_redis):
+    return PriceHistoryStore(mock_redis)
+
+def ticks(count, step=1.0):
+    timestamps = START + np.arange(count) * step
+    return timestamps, 84000.0 + np.arange(count), np.full(count, 0.5)
+
+def test_range_spans_buckets(store):
+    """Test columns written across several buckets read back aligned and in order."""
+    timestamps, prices, volumes = ticks(10000)
+    for chunk in range(0, 10000, 1000):
+        store.append_many(timestamps[chunk:chunk + 1000], prices[chunk:chunk + 1000], volumes[chunk:chunk + 1000])
+
+    assert len(store.buckets()) == 3
+    assert store.count() == 10000
+    everything = store.range()
+    np.testing.assert_array_equal(everything.timestamp, timestamps)
+    np.testing.assert_array_equal(everything.price, prices)
+
+    window = store.range(START + 2500, START + 6000)
+    assert window.timestamp[0] == START + 2500 and window.timestamp[-1] == START + 6000
+    assert len(window) == 3501
+
+def test_single_bucket_read_is_a_view(store):
+    store.append_many(*ticks(10))
+    prices = store.range().price
+    assert not prices.flags.owndata and not prices.flags.writeable
+
+def test_tail_returns_newest_ticks(store):
+    timestamps, prices, volumes = ticks(5000, step=10.0)
+    store.append_many(timestamps, prices, volumes)
+
+    tail = store.tail(3)
+    assert tail.price.tolist() == prices[-3:].tolist()
+    assert len(store.tail(10 ** 6)) == 5000
+    assert tail.to_records()[-1] == {"timestamp": timestamps[-1], "price": prices[-1], "volume": 0.5}
+
+def test_candles_match_manual_ohlcv(store):
+    """Test minute candles, and that multi-timeframe output agrees with single reads."""
+    prices = [100.0, 103.0, 99.0, 101.0, 200.0, 190.0]
+    timestamps = [START - 800 + s for s in (0, 10, 20, 59, 60, 119)]  # Two whole minutes
+    store.append_many(timestamps, prices, [1, 1, 1, 1, 2, 2])
+
+    candles = store.candles("1m")
+    assert candles.timestamp.tolist() == [START - 800, START - 740]
+    assert candles.open.tolist() == [100.0, 200.0]
+    assert candles.high.tolist() == [103.0, 200.0]
+    assert candles.low.tolist() == [99.0, 190.0]
+    assert candles.close.tolist() == [101.0, 190.0]
+    assert candles.volume.tolist() == [4.0, 4.0]
+
+    multi = store.candles_multi(["1m", "5m"])
+    assert multi["1m"].close.tolist() == candles.close.tolist()
+    assert multi["5m"].high.tolist() == [200.0]
+
+def test_out_of_order_ticks_are_sorted_for_candles():
+    candles = aggregate_candles(
+        (np.array([START + 61, START + 1, START + 2]), np.array([5.0, 1.0, 2.0]), np.ones(3)), 60
+    )
+    assert candles.open.tolist() == [1.0, 5.0]
+    assert candles.close.tolist() == [2.0, 5.0]
+
+def test_retention_drops_old_buckets(mock_redis):
+    store = PriceHistoryStore(mock_redis, retention_days=1)
+    store.append(START, 84000.0)
+    store.append(START + 3 * 86400, 85000.0)
+    assert store.range().price.tolist() == [85000.0]
+    assert mock_redis.ttl(store.column_key(store.bucket_of(START), "price")) > 86400
+
+def test_ingestor_records_timestamped_ticks(mock_redis, store):
+    """Test the live-feed ingestor appends to the store in its transaction."""
+    ingestor = TickIngestor(redis_client=mock_redis)
+    for i in range(5):
+        ingestor.ingest(84000.0 + i, 1.0)
+    ingestor.ingest(84004.0, 1.0)  # Skipped, unchanged
+    ingestor.close()
+
+    history = store.range()
+    assert history.price.tolist() == [84000.0 + i for i in range(5)]
+    assert np.all(np.diff(history.timestamp) >= 0)
+    assert mock_redis.lrange("btc_movement_history", 0, 0) == ["84004.0,1.0"]
@@ -0,0 +1,134 @@
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+import json
+import time
+import pytest
+from omega_ai.data_feed.tick_ingestor import TickIngestor, fibonacci_retracement_levels
+
+@pytest.fixture
+def ingestor(mock_redis):
+    """Create an inline-commit TickIngestor on a fake Redis."""
+    ingestor = TickIngestor(redis_client=mock_redis)
+    yield ingestor
+    ingestor.close()
+
+def test_first_tick_writes_full_state(ingestor, mock_redis):
+    """Test a single tick commits every live-feed key in one transaction."""
+    tick = ingestor.ingest(84000.5, 1.25)
+
+    assert tick is not None
+    assert ingestor.stats.commits == 1
+    assert mock_redis.get("last_btc_price") == "84000.5"
+    assert mock_redis.get("last_btc_volume") == "1.25"
+    assert mock_redis.get("prev_btc_price") == "84000.5"
+    assert mock_redis.get("fibonacci_update_count") == "1"
+    assert mock_redis.get("fibonacci_alignment") == "0"
+    assert mock_redis.lrange("btc_movement_history", 0, -1) == ["84000.5,1.25"]
+    assert mock_redis.lrange("abs_price_change_history", 0, -1) == ["0"]
+
+def test_unchanged_price_is_skipped(ingestor, mock_redis):
+    """Test repeated prices do not touch Redis."""
+    ingestor.ingest(84000.0, 1.0)
+    assert ingestor.ingest(84000.0, 2.0) is None
+
+    assert ingestor.stats.ticks_skipped == 1
+    assert ingestor.stats.commits == 1
+    assert mock_redis.get("last_btc_volume") == "1.0"
+
+def test_history_is_newest_first_and_trimmed(mock_redis):
+    """Test history lists keep only the newest entries at the head."""
+    ingestor = TickIngestor(redis_client=mock_redis, history_length=5)
+    for i in range(8):
+        ingestor.ingest(84000.0 + i, 1.0)
+
+    history = mock_redis.lrange("btc_movement_history", 0, -1)
+    assert history == [f"{84000.0 + i},1.0" for i in range(7, 2, -1)]
+    assert mock_redis.lrange("abs_price_change_history", 0, 0) == ["100.0"]
+
+def test_fibonacci_refresh_after_counter_wraps(mock_redis):
+    """Test the refresh counter resets and levels are stored with the tick."""
+    ingestor = TickIngestor(redis_client=mock_redis, fibonacci_refresh_every=3)
+    prices = [84000.0, 84010.0, 84020.0, 84030.0]
+    for price in prices:
+        ingestor.ingest(price, 1.0)
+
+    assert mock_redis.get("fibonacci_update_count") == "0"
+    assert json.loads(mock_redis.get("fibonacci_levels")) == fibonacci_retracement_levels(84030.0, 84000.0)
+    assert ingestor.stats.fibonacci_refreshes == 1
+
+def test_large_move_forces_fibonacci_refresh(ingestor, mock_redis):
+    """Test a >1% move refreshes levels immediately."""
+    ingestor.ingest(84000.0, 1.0)
+    ingestor.ingest(86000.0, 1.0)
+
+    assert mock_redis.get("fibonacci_high") == "86000.0"
+    assert mock_redis.get("fibonacci_low") == "84000.0"
+
+def test_fibonacci_alignment_flag(ingestor, mock_redis):
+    """Test prices near a Fibonacci thousand level set the alignment flag."""
+    tick = ingestor.ingest(89020.0, 1.0)
+
+    assert tick.alignment == "89000"
+    assert mock_redis.get("fibonacci_alignment") == "89000"
+
+def test_state_is_seeded_from_redis(mock_redis):
+    """Test a new ingestor continues from the state already in Redis."""
+    mock_redis.set("prev_btc_price", "84000.0")
+    mock_redis.set("fibonacci_update_count", "7")
+    mock_redis.lpush("btc_movement_history", "83990.0,1.0", "84000.0,1.0")
+
+    ingestor = TickIngestor(redis_client=mock_redis)
+    assert ingestor.ingest(84000.0, 1.0) is None
+    tick = ingestor.ingest(84100.0, 1.0)
+
+    assert tick.abs_change_scaled == pytest.approx(10000.0)
+    assert mock_redis.get("fibonacci_update_count") == "8"
+
+def test_batch_window_commits_ticks_together(mock_redis):
+    """Test micro-batched ticks land in a single commit on flush."""
+    ingestor = TickIngestor(redis_client=mock_redis, batch_window=60.0)
+    for i in range(10):
+        ingestor.ingest(84000.0 + i, 0.5)
+
+    assert mock_redis.get("last_btc_price") is None
+    ingestor.close()
+
+    assert ingestor.stats.commits == 1
+    assert ingestor.stats.ticks_committed == 10
+    assert mock_redis.get("last_btc_price") == "84009.0"
+    assert mock_redis.lindex("btc_movement_history", 0) == "84009.0,0.5"
+    assert mock_redis.llen("btc_movement_history") == 10
+
+def test_max_batch_flushes_before_window(mock_redis):
+    """Test reaching max_batch commits before the window elapses."""
+    ingestor = TickIngestor(redis_client=mock_redis, batch_window=60.0, max_batch=4)
+    for i in range(5):
+        ingestor.ingest(84000.0 + i, 0.5)
+
+    assert ingestor.stats.ticks_committed == 4
+    assert mock_redis.get("last_btc_price") == "84003.0"
+    ingestor.close()
+    assert ingestor.stats.ticks_committed == 5
+
+def test_window_flusher_commits_in_background(mock_redis):
+    """Test the flusher thread commits pending ticks once the window elapses."""
+    ingestor = TickIngestor(redis_client=mock_redis, batch_window=0.01)
+    ingestor.ingest(84000.0, 0.5)
+
+    deadline = time.time() + 2.0
+    while ingestor.stats.ticks_committed < 1 and time.time() < deadline:
+        time.sleep(0.01)
+    assert mock_redis.get("last_btc_price") == "84000.0"
+    ingestor.close()
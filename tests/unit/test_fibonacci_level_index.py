@@ -0,0 +1,129 @@
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+import json
+
+import fakeredis
+import numpy as np
+import pytest
+
+from omega_ai.utils.fibonacci_level_index import (
+    FIBONACCI_LEVELS_KEY,
+    FibonacciLevelCache,
+    FibonacciLevelIndex,
+    publish_fibonacci_levels_update
+)
+
+LEVELS = {
+    "0% (Base)": 80000.0,
+    "23.6%": 80944,
+    "38.2%": 81528.0,
+    "50%": 82000.0,
+    "61.8%": 82472.0,
+    "100%": 84000.0,
+    "broken": "n/a",
+    "missing": float("nan")
+}
+
+def linear_nearest(levels, price, relative=False):
+    best = None
+    for label, level in levels.items():
+        if not isinstance(level, (int, float)) or not np.isfinite(level) or (relative and level <= 0):
+            continue
+        distance = abs(price - level) / level if relative else abs(price - level)
+        if best is None or distance < best[1]:
+            best = (label, distance)
+    return best
+
+def test_skips_unusable_levels_and_keeps_values():
+    index = FibonacciLevelIndex(LEVELS)
+    assert len(index) == 6
+    assert index.labels[0] == "0% (Base)"
+    assert index.nearest(80950.0).price == 80944  # Stored value, not coerced
+
+    assert len(FibonacciLevelIndex({"a": "81000.5", "b": "x"}, parse_strings=True)) == 1
+    assert FibonacciLevelIndex({}).nearest(1.0) is None
+
+@pytest.mark.parametrize("relative", [False, True])
+def test_nearest_matches_linear_scan(relative):
+    """Test bisect lookups agree with a scan over every level, on both sides of the range."""
+    index = FibonacciLevelIndex(LEVELS)
+    lookup = index.nearest_relative if relative else index.nearest
+    for price in np.linspace(78000.0, 86000.0, 2001):
+        found = lookup(price)
+        label, distance = linear_nearest(LEVELS, price, relative)
+        assert found.distance == pytest.approx(distance)
+        assert LEVELS[found.label] == found.price
+
+def test_match_tolerance():
+    index = FibonacciLevelIndex(LEVELS)
+    assert index.match(82040.0, 40.0).label == "50%"
+    assert index.match(82041.0, 40.0) is None
+    assert index.match(81600.0, 0.001, relative=True).label == "38.2%"
+    assert index.match(81700.0, 0.001, relative=True) is None
+
+@pytest.mark.parametrize("relative, tolerance", [(False, 60.0), (True, 0.0008)])
+def test_batch_matches_scalar_lookups(relative, tolerance):
+    index = FibonacciLevelIndex({**LEVELS, "negative": -5.0})
+    prices = np.random.default_rng(7).uniform(79000.0, 85000.0, 5000)
+    indices, distances = index.match_batch(prices, tolerance, relative=relative)
+    assert (indices >= 0).any() and (indices < 0).any()
+    for price, i, distance in zip(prices, indices, distances):
+        found = index.match(price, tolerance, relative=relative)
+        if found is None:
+            assert i == -1
+        else:
+            assert index.labels[i] == found.label
+            assert distance == pytest.approx(found.distance)
+
+def test_cache_rebuilds_only_on_change():
+    client = fakeredis.FakeStrictRedis(decode_responses=True)
+    cache = FibonacciLevelCache(channel=None)
+    assert cache.get(client) is None
+
+    client.set(FIBONACCI_LEVELS_KEY, json.dumps({"50%": 82000.0}))
+    first = cache.get(client)
+    assert cache.get(client) is first
+    assert cache.rebuilds == 1
+
+    client.set(FIBONACCI_LEVELS_KEY, json.dumps({"50%": 82100.0}))
+    assert cache.get(client).nearest(0.0).price == 82100.0
+    assert cache.rebuilds == 2
+
+    client.delete(FIBONACCI_LEVELS_KEY)
+    assert cache.get(client) is None
+
+def test_subscribed_cache_refreshes_on_notification():
+    """Test a subscribed cache skips Redis until a writer publishes an update."""
+    client = fakeredis.FakeStrictRedis(decode_responses=True)
+    client.set(FIBONACCI_LEVELS_KEY, json.dumps({"50%": 82000.0}))
+    cache = FibonacciLevelCache(max_age=3600)
+    first = cache.get(client)
+
+    client.set(FIBONACCI_LEVELS_KEY, json.dumps({"50%": 82100.0}))
+    assert cache.get(client) is first  # No notification yet
+
+    publish_fibonacci_levels_update(client)
+    assert cache.get(client).nearest(0.0).price == 82100.0
+
+    client.set(FIBONACCI_LEVELS_KEY, json.dumps({"50%": 82200.0}))
+    cache.invalidate()
+    assert cache.get(client).nearest(0.0).price == 82200.0
+    cache.close()
+
+def test_cache_propagates_parse_errors():
+    client = fakeredis.FakeStrictRedis(decode_responses=True)
+    client.set(FIBONACCI_LEVELS_KEY, "not json")
+    with pytest.raises(json.JSONDecodeError):
+        FibonacciLevelCache(channel=None).get(client)
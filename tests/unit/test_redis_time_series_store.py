@@ -0,0 +1,158 @@
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+import datetime
+
+import fakeredis
+import pytest
+
+from omega_ai.mm_trap_detector import redis_time_series as rts
+from omega_ai.mm_trap_detector.redis_time_series import (
+    SortedSetTimeSeries,
+    TimeSeriesGranularity,
+    migrate_list_series
+)
+
+START = datetime.datetime(2024, 5, 1, tzinfo=datetime.UTC)
+
+def minute_points(count, start=START):
+    points = []
+    for i in range(count):
+        ts = start + datetime.timedelta(minutes=i)
+        points.append((ts, {
+            "timestamp": ts.strftime("%Y-%m-%d %H:%M:%S"),
+            "price": 85000.0 + i * 10 + (i % 7),
+            "change_pct": 0.01 * (i % 5),
+            "regime": "Bullish" if i % 2 else "Bearish"
+        }))
+    return points
+
+@pytest.fixture
+def raw_redis(monkeypatch):
+    """Bytes-returning fakeredis installed as the module connection."""
+    client = fakeredis.FakeRedis()
+    monkeypatch.setattr(rts, "redis_conn", client)
+    return client
+
+def test_add_many_and_range_queries(mock_redis):
+    """Test points come back in time order for inclusive score ranges."""
+    series = SortedSetTimeSeries("price_history", redis_client=mock_redis)
+    points = minute_points(180)
+    assert series.add_many(reversed(points), chunk_size=50) == 180
+    assert len(series) == 180
+
+    window = series.range(points[10][0], points[19][0])
+    assert [p["price"] for p in window] == [d["price"] for _, d in points[10:20]]
+
+    first = series.range(limit=3, with_timestamps=True)
+    assert [ts for ts, _ in first] == [rts._to_ms(ts) for ts, _ in points[:3]]
+    assert mock_redis.ttl(series.key) == 86400 * 7
+
+def test_duplicate_points_collapse(mock_redis):
+    """Test writing the same point twice stores it once."""
+    series = SortedSetTimeSeries("price_history", redis_client=mock_redis)
+    ts, data = minute_points(1)[0]
+    series.add(ts, data)
+    series.add(ts, data)
+    assert len(series) == 1
+
+def test_downsample_local_fallback(mock_redis):
+    """Test OHLC buckets are aggregated locally when scripting is unavailable."""
+    series = SortedSetTimeSeries("price_history", redis_client=mock_redis)
+    points = minute_points(150)
+    series.add_many(points)
+
+    buckets = series.downsample(None, None, TimeSeriesGranularity.HOURLY)
+    assert [b["count"] for b in buckets] == [60, 60, 30]
+    prices = [d["price"] for _, d in points[60:120]]
+    assert buckets[1] == {
+        "timestamp_ms": rts._to_ms(START + datetime.timedelta(hours=1)),
+        "open": prices[0],
+        "high": max(prices),
+        "low": min(prices),
+        "close": prices[-1],
+        "avg": sum(prices) / 60,
+        "count": 60
+    }
+
+def test_downsample_server_side_rows(mock_redis, monkeypatch):
+    """Test rows returned by the Lua script are converted to buckets."""
+    series = SortedSetTimeSeries("price_history", redis_client=mock_redis)
+    calls = []
+
+    def script(keys, args):
+        calls.append((keys, args))
+        return [["1714521600000", "10", "12.5", "9", "11", "42", "4"]]
+
+    monkeypatch.setattr(mock_redis, "register_script", lambda source: script, raising=False)
+    buckets = series.downsample(0, 10 ** 13, 60_000)
+
+    assert calls == [([series.key], [0, 10 ** 13, 60_000, "price"])]
+    assert buckets == [{"timestamp_ms": 1714521600000, "open": 10.0, "high": 12.5,
+                        "low": 9.0, "close": 11.0, "avg": 10.5, "count": 4}]
+
+def test_zset_backend_store_and_get(raw_redis, monkeypatch):
+    """Test store/get route through the sorted set with LRANGE index semantics."""
+    monkeypatch.setattr(rts, "TIME_SERIES_BACKEND", "zset")
+    points = minute_points(5, START - datetime.timedelta(minutes=2))
+    for ts, data in points:
+        assert rts.store_time_series_data("price_history", data, ts)
+
+    day = rts.get_time_series_data("price_history", START.date())
+    assert [p["price"] for p in day] == [d["price"] for _, d in points[2:]]
+    assert rts.get_time_series_data("price_history", START.date(), start_idx=1, end_idx=-2) == day[1:-1]
+    assert raw_redis.keys("sim_price_history:2024*") == []
+
+def test_compress_matches_list_backend(raw_redis, monkeypatch):
+    """Test sorted-set compression yields the same aggregates as the list layout."""
+    points = minute_points(150)
+    for ts, data in points:
+        rts.store_time_series_data("price_history", data, ts)
+    assert rts.compress_historical_data("price_history", START.date())
+    expected = rts.get_time_series_data("price_history", START.date(), TimeSeriesGranularity.HOURLY)
+
+    monkeypatch.setattr(rts, "TIME_SERIES_BACKEND", "zset")
+    SortedSetTimeSeries("price_history").add_many(points)
+    assert rts.compress_historical_data("price_history", START.date())
+    assert rts.get_time_series_data("price_history", START.date(), TimeSeriesGranularity.HOURLY) == expected
+    assert len(expected) == 3
+
+def test_migrate_list_series(raw_redis):
+    """Test the list layout migrates across days, idempotently."""
+    points = minute_points(2 * 24 * 60, START + datetime.timedelta(hours=12))
+    for ts, data in points:
+        rts.store_time_series_data("price_history", data, ts)
+    rts.store_time_series_data("price_history", {"price": 1.0}, START, TimeSeriesGranularity.HOURLY)
+
+    stats = migrate_list_series("price_history")
+    assert stats == {"keys": 3, "points": len(points)}
+    assert migrate_list_series("price_history") == stats
+
+    series = SortedSetTimeSeries("price_history")
+    assert len(series) == len(points)
+    assert series.range() == [d for _, d in points]
+
+    migrate_list_series("price_history", delete_source=True)
+    assert raw_redis.keys("sim_price_history:2024-*:minute") == []
+    assert raw_redis.keys("sim_price_history:2024-*:hourly") != []
+
+def test_trim_and_cleanup(raw_redis):
+    """Test points older than the retention period are removed by score."""
+    series = SortedSetTimeSeries("price_history")
+    old = minute_points(10, START - datetime.timedelta(days=8))
+    recent = minute_points(10)
+    series.add_many(old + recent)
+
+    rts.cleanup_old_data("price_history", START.date())
+    assert series.range() == [d for _, d in recent]
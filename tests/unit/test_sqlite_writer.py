@@ -0,0 +1,120 @@
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+import sqlite3
+import pytest
+from omega_ai.db_manager.sqlite_writer import SQLiteBatchWriter
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Create a database with the detection tables."""
+    path = str(tmp_path / "omega_test.db")
+    conn = sqlite3.connect(path)
+    conn.executescript('''
+        CREATE TABLE price_movements (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            price REAL NOT NULL, volume REAL, timestamp TEXT NOT NULL,
+            interval INTEGER NOT NULL, change_pct REAL, abs_change REAL
+        );
+        CREATE TABLE mm_traps (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            type TEXT NOT NULL, timeframe TEXT, confidence REAL NOT NULL,
+            price_change REAL NOT NULL, price REAL, timestamp TEXT NOT NULL,
+            validated INTEGER DEFAULT 0, validation_score REAL,
+            fibonacci_level TEXT, volume_anomaly TEXT
+        );
+    ''')
+    conn.close()
+    return path
+
+def count_rows(path, table):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+def test_flush_commits_queued_rows(db_path):
+    """Test rows become visible after flush."""
+    writer = SQLiteBatchWriter(db_path, max_latency=60.0)
+    for i in range(10):
+        writer.submit("price_movements", (84000.0 + i, 1.0, f"2025-01-01T00:00:{i:02d}", 1, None, None))
+
+    assert writer.flush(timeout=5)
+    assert count_rows(db_path, "price_movements") == 10
+    writer.close()
+
+def test_rows_are_batched(db_path):
+    """Test rows are committed in max_batch sized transactions."""
+    writer = SQLiteBatchWriter(db_path, max_batch=100, max_latency=60.0)
+    rows = [(84000.0, 1.0, "2025-01-01T00:00:00", 1, 0.1, 1.0)] * 250
+    writer.submit_many("price_movements", rows)
+    writer.close()
+
+    assert count_rows(db_path, "price_movements") == 250
+    assert writer.rows_written == 250
+    assert writer.batches_committed == 3
+
+def test_multiple_tables_in_one_batch(db_path):
+    """Test mixed-table batches land in their own tables."""
+    writer = SQLiteBatchWriter(db_path)
+    writer.submit("price_movements", (84000.0, None, "2025-01-01T00:00:00", 5, None, None))
+    writer.submit("mm_traps", ("Bull Trap", "15min", 0.75, 1.5, 84000.0, "2025-01-01T00:00:00", 0, 0.0, None, None))
+    writer.close()
+
+    assert count_rows(db_path, "price_movements") == 1
+    assert count_rows(db_path, "mm_traps") == 1
+
+def test_wal_mode_enabled(db_path):
+    """Test the writer switches the database to WAL journaling."""
+    writer = SQLiteBatchWriter(db_path)
+    writer.submit("price_movements", (84000.0, None, "2025-01-01T00:00:00", 1, None, None))
+    writer.close()
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    conn.close()
+
+def test_unknown_table_rejected(db_path):
+    """Test only known tables can be queued."""
+    writer = SQLiteBatchWriter(db_path)
+    with pytest.raises(ValueError):
+        writer.submit("users", ("x",))
+    writer.close()
+
+def test_submit_after_close_raises(db_path):
+    """Test a closed writer refuses new rows."""
+    writer = SQLiteBatchWriter(db_path)
+    writer.close()
+    with pytest.raises(RuntimeError):
+        writer.submit("price_movements", (84000.0, None, "2025-01-01T00:00:00", 1, None, None))
+
+def test_database_readers_see_queued_inserts(db_path, monkeypatch):
+    """Test the fetch functions flush write-behind inserts before reading."""
+    from omega_ai.db_manager import database
+
+    monkeypatch.setattr(database, "DB_PATH", db_path)
+    monkeypatch.setattr(database, "DB_WRITE_BEHIND", True)
+    monkeypatch.setattr(database, "redis_conn", None)
+    try:
+        trap_id = database.insert_possible_mm_trap({
+            "type": "Bull Trap", "timeframe": "15min", "confidence": 0.75,
+            "price_change": 1.5, "price": 59000.0
+        })
+        traps = database.fetch_recent_mm_traps()
+    finally:
+        database.close_database()
+
+    assert trap_id is None
+    assert [trap["type"] for trap in traps] == ["Bull Trap"]
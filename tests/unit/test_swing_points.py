@@ -0,0 +1,97 @@
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from omega_ai.mm_trap_detector.swing_points import SWING_HIGH, SWING_LOW, SwingCandidates
+
+START = datetime(2024, 5, 1, tzinfo=timezone.utc)
+
+def minute(i):
+    return START + timedelta(minutes=i)
+
+def test_requalifying_bar_keeps_one_entry():
+    """Test a bar added again keeps its count, or restarts at 1 after a reset."""
+    highs = SwingCandidates(SWING_HIGH)
+    highs.add(5, 100.0, minute(5))
+    highs.update_counts(99.0)
+    highs.add(5, 100.0, minute(5))
+    assert highs.to_dicts() == [{"price": 100.0, "timestamp": minute(5), "confirmation_count": 2}]
+
+    highs.update_counts(101.0)
+    assert highs.to_dicts()[0]["confirmation_count"] == 0
+    highs.add(5, 100.0, minute(5))
+    assert len(highs) == 1
+    assert highs.to_dicts()[0]["confirmation_count"] == 1
+
+@pytest.mark.parametrize("kind, confirming, breaking", [(SWING_HIGH, 95.0, 105.0), (SWING_LOW, 105.0, 95.0)])
+def test_update_counts(kind, confirming, breaking):
+    """Test prices beyond a candidate confirm it, prices through it reset it, equal prices do neither."""
+    pool = SwingCandidates(kind)
+    pool.add(1, 100.0, minute(1))
+    pool.update_counts(confirming)
+    pool.update_counts(100.0)
+    pool.update_counts(confirming)
+    assert pool.confirmed(3) == [(100.0, minute(1))]
+
+    pool.update_counts(breaking)
+    assert pool.confirmed(1) == []
+
+def test_keep_beyond_and_prune():
+    """Test the retracement filter and the age/reset clean-up."""
+    highs = SwingCandidates(SWING_HIGH)
+    lows = SwingCandidates(SWING_LOW)
+    for bar, price in enumerate([100.0, 104.0, 108.0]):
+        highs.add(bar, price, minute(bar))
+        lows.add(bar, price, minute(bar))
+
+    highs.keep_beyond(104.0)
+    lows.keep_beyond(104.0)
+    assert [c["price"] for c in highs.to_dicts()] == [108.0]
+    assert [c["price"] for c in lows.to_dicts()] == [100.0]
+
+    lows.add(3, 90.0, minute(3))
+    lows.update_counts(95.0)
+    lows.prune(minute(1))
+    assert [c["price"] for c in lows.to_dicts()] == [90.0]
+
+def test_capacity_evicts_oldest():
+    """Test the pool never grows past its capacity."""
+    pool = SwingCandidates(SWING_LOW, capacity=3)
+    for bar in range(5):
+        pool.add(bar, 100.0 - bar, minute(bar))
+    assert len(pool) == 3
+    assert pool.evicted == 2
+    assert [c["price"] for c in pool.to_dicts()] == [98.0, 97.0, 96.0]
+
+def test_load_round_trips_dicts():
+    """Test candidates assigned as dicts come back unchanged."""
+    candidates = [
+        {"price": 101.0, "timestamp": minute(1), "confirmation_count": 2},
+        {"price": 101.0, "timestamp": minute(1), "confirmation_count": 0}
+    ]
+    pool = SwingCandidates(SWING_HIGH)
+    pool.load(candidates)
+    assert pool.to_dicts() == candidates
+
+    pool.load([])
+    assert len(pool) == 0
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        SwingCandidates("sideways")
+    with pytest.raises(ValueError):
+        SwingCandidates(SWING_HIGH, capacity=0)
@@ -0,0 +1,126 @@
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+import json
+import time
+from unittest.mock import patch
+
+import fakeredis
+import pytest
+
+from omega_ai.mm_trap_detector.trap_stream import TrapStreamQueue
+from omega_ai.mm_trap_detector.queue_manager import TrapQueueManager
+
+
+def trap(i, confidence=0.5):
+    return {"type": "bull_trap", "confidence": confidence, "price": 84000.0 + i}
+
+
+def claim_stale(queue, max_deliveries=3):
+    time.sleep(0.005)
+    return queue.claim_stale("live", count=10, min_idle_ms=1, max_deliveries=max_deliveries)
+
+
+@pytest.fixture
+def queue():
+    queue = TrapStreamQueue(fakeredis.FakeStrictRedis(decode_responses=True), maxlen=1000)
+    queue.ensure_group()
+    queue.ensure_group()  # Idempotent
+    return queue
+
+
+def test_consumers_share_the_stream(queue):
+    """Test each trap is delivered to exactly one consumer of the group."""
+    for i in range(10):
+        queue.add(trap(i))
+
+    first = queue.read("c1", count=6, block_ms=None)
+    second = queue.read("c2", count=6, block_ms=None)
+    assert len(first) == 6 and len(second) == 4
+    prices = [json.loads(data)["price"] for _, data in first + second]
+    assert sorted(prices) == [84000.0 + i for i in range(10)]
+    assert queue.read("c1", count=6, block_ms=None) == []
+
+    assert queue.ack([entry_id for entry_id, _ in first]) == 6
+    assert queue.pending_count() == 4
+
+
+def test_stale_traps_are_reclaimed_then_dead_lettered(queue):
+    """Test pending traps move to a live consumer, and to the dead-letter stream once exhausted."""
+    entry_id, length = queue.add(trap(1))
+    assert length == 1
+    queue.read("crashed", count=10, block_ms=None)
+
+    assert queue.claim_stale("live", count=10, min_idle_ms=60000) == []  # Not idle long enough
+    claimed = claim_stale(queue)
+    assert [claimed_id for claimed_id, _ in claimed] == [entry_id]
+    assert queue.redis.xpending(queue.stream, queue.group)["consumers"] == [{"name": "live", "pending": 1}]
+
+    assert len(claim_stale(queue)) == 1
+    assert claim_stale(queue) == []
+    assert queue.pending_count() == 0
+    dead = queue.redis.xrange(queue.dead_letter_stream)
+    assert dead[0][1]["source_id"] == entry_id
+    assert json.loads(dead[0][1]["trap"]) == trap(1)
+
+
+def test_trimmed_pending_traps_are_dropped(queue):
+    queue.add(trap(1))
+    queue.read("crashed", count=10, block_ms=None)
+    queue.redis.xtrim(queue.stream, maxlen=0)
+    assert claim_stale(queue) == []
+    assert queue.pending_count() == 0
+
+
+def test_read_recreates_cleared_group(queue):
+    queue.add(trap(1))
+    assert queue.clear()
+    assert queue.read("c1", count=10, block_ms=None) == []
+    queue.add(trap(2))
+    assert len(queue.read("c1", count=10, block_ms=None)) == 1
+
+
+def test_queue_manager_stream_backend(queue):
+    """Test the manager writes to the stream and samples on the length returned by the add."""
+    manager = TrapQueueManager(stream_queue=queue)
+    manager.min_interval = 0
+    for i in range(3):
+        assert manager.add_trap(trap(i))
+    assert manager.get_queue_size() == 3
+    assert manager._stream_size == 3
+    assert [t["price"] for t in manager.get_recent_traps(2)] == [84002.0, 84001.0]
+    assert manager.get_trap_distribution() == {"bull_trap": 3}
+    assert manager.get_queue_stats()["pending"] == 0
+
+    manager._stream_size = 40000  # Four times the sampling threshold
+    with patch("omega_ai.mm_trap_detector.queue_manager.random.random", return_value=0.5):
+        assert not manager.add_trap(trap(3))
+    assert manager.clear_queue()
+
+
+def test_processor_acknowledges_only_processed_traps(queue):
+    pytest.importorskip("dotenv")
+    from omega_ai.mm_trap_detector.mm_trap_consumer import TrapProcessor
+
+    queue.add(trap(1))
+    queue.redis.xadd(queue.stream, {"trap": "not json"})
+    queue.add(trap(2))
+    processor = TrapProcessor()
+
+    assert processor.poll_stream(queue, "c1", block_ms=None) == 3
+    assert processor.stats["processed"] == 2 and processor.stats["errors"] == 1
+    pending = queue.redis.xpending_range(queue.stream, queue.group, min="-", max="+", count=10)
+    assert len(pending) == 1
+    [(_, fields)] = queue.redis.xrange(queue.stream, pending[0]["message_id"], pending[0]["message_id"])
+    assert fields["trap"] == "not json"
@@ -0,0 +1,96 @@
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+import random
+from collections import deque
+
+import numpy as np
+import pytest
+
+from omega_ai.mm_trap_detector.volatility_engine import (
+    RollingWindow,
+    VolatilityEngine,
+    VOLATILITY_1MIN_KEY,
+    VOLATILITY_5MIN_KEY,
+    ACCELERATION_1MIN_KEY
+)
+
+def random_prices(count, seed=7):
+    rng = random.Random(seed)
+    price = 84000.0
+    prices = []
+    for _ in range(count):
+        price += rng.gauss(0, 25)
+        prices.append(price)
+    return prices
+
+def test_rolling_window_matches_numpy():
+    """Test running mean/std match np.mean/np.std over the live window."""
+    window = RollingWindow(10)
+    reference = deque(maxlen=10)
+    for price in random_prices(500):
+        window.push(price)
+        reference.append(price)
+        assert window.mean == pytest.approx(np.mean(reference), rel=1e-12)
+        assert window.std == pytest.approx(np.std(reference), rel=1e-6, abs=1e-9)
+    assert list(window.values()) == pytest.approx(list(reference))
+
+def test_rolling_window_resync_bounds_drift():
+    """Test long runs stay accurate across periodic resyncs."""
+    window = RollingWindow(12)
+    prices = random_prices(3 * RollingWindow.RESYNC_EVERY + 17)
+    for price in prices:
+        window.push(price)
+    assert window.std == pytest.approx(np.std(prices[-12:]), rel=1e-9)
+
+def test_engine_matches_legacy_metrics():
+    """Test engine metrics equal the list-based calculation they replace."""
+    engine = VolatilityEngine()
+    history_1min = deque(maxlen=10)
+    history_5min = deque(maxlen=12)
+    for tick, price in enumerate(random_prices(200), start=1):
+        engine.update(price)
+        history_1min.append(price)
+        if tick % 5 == 0:
+            history_5min.append(price)
+
+    prices_1min = list(history_1min)
+    prices_5min = list(history_5min)
+    assert engine.volatility_1min == pytest.approx(np.std(prices_1min) / np.mean(prices_1min) * 100)
+    assert engine.acceleration_1min == pytest.approx(np.std(np.diff(prices_1min)) / np.mean(prices_1min) * 100)
+    assert engine.volatility_5min == pytest.approx(np.std(prices_5min) / np.mean(prices_5min) * 100)
+
+def test_metrics_need_minimum_samples():
+    """Test metrics stay unavailable until their windows have enough data."""
+    engine = VolatilityEngine()
+    engine.update(84000.0)
+    engine.update(84010.0)
+    assert engine.metrics() == {}
+    engine.update(84020.0)
+    assert set(engine.metrics()) == {VOLATILITY_1MIN_KEY}
+    engine.update(84000.0)
+    assert set(engine.metrics()) == {VOLATILITY_1MIN_KEY, ACCELERATION_1MIN_KEY}
+
+def test_publish_is_throttled(mock_redis):
+    """Test Redis is written at most once per interval, in one call."""
+    engine = VolatilityEngine(publish_interval=1.0)
+    for price in random_prices(20):
+        engine.update(price)
+
+    assert engine.publish(mock_redis, now=100.0)
+    assert not engine.publish(mock_redis, now=100.5)
+    assert engine.publish(mock_redis, now=101.0)
+    assert engine.publish(mock_redis, force=True, now=101.1)
+    assert engine.publishes == 3
+    assert float(mock_redis.get(VOLATILITY_5MIN_KEY)) == pytest.approx(engine.volatility_5min)
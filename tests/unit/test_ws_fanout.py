@@ -0,0 +1,102 @@
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+import asyncio
+from datetime import datetime, UTC
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from omega_ai.mm_trap_detector import mm_websocket_server_v2 as server
+from omega_ai.mm_trap_detector.ws_fanout import ClientOutbox, SlowClientPolicy
+
+async def never_returns(message):
+    await asyncio.Event().wait()
+
+def client_info(websocket):
+    return server.ClientInfo(
+        websocket=websocket,
+        state=server.ConnectionState.CONNECTED,
+        last_message=datetime.now(UTC),
+        message_count=0,
+        error_count=0
+    )
+
+@pytest.mark.parametrize("policy, queued, dropped", [
+    (SlowClientPolicy.COALESCE, ["m3", "m4"], 3),
+    (SlowClientPolicy.DROP_OLDEST, ["m2", "m3", "m4"], 2),
+    (SlowClientPolicy.DISCONNECT, [], 0),
+])
+def test_full_outbox_policies(policy, queued, dropped):
+    outbox = ClientOutbox("c", AsyncMock(), maxsize=3, policy=policy)
+    accepted = [outbox.offer(f"m{i}") for i in range(5)]
+    assert [message for message, _ in outbox._queue] == queued
+    assert outbox.dropped == dropped
+    assert outbox.overflowed == (policy is SlowClientPolicy.DISCONNECT)
+    assert accepted[-1] == (policy is not SlowClientPolicy.DISCONNECT)
+
+@pytest.mark.asyncio
+async def test_writer_sends_in_order_and_records_latency():
+    websocket = AsyncMock()
+    outbox = ClientOutbox("c", websocket, maxsize=10)
+    writer = asyncio.create_task(outbox.run())
+    for i in range(3):
+        outbox.offer(f"m{i}")
+    await asyncio.sleep(0)
+    assert [call.args[0] for call in websocket.send.call_args_list] == ["m0", "m1", "m2"]
+    assert outbox.sent == 3 and outbox.lag == 0
+    assert len(outbox.stats.latencies) == 3
+
+    outbox.close()
+    await asyncio.wait_for(writer, 1)
+
+@pytest.mark.asyncio
+async def test_slow_client_does_not_stall_broadcast():
+    """Test a stalled client is coalesced while the others get every message."""
+    fast, slow = AsyncMock(), AsyncMock()
+    slow.send.side_effect = never_returns
+    clients = {"fast": client_info(fast), "slow": client_info(slow)}
+
+    with patch.object(server, "connected_clients", clients):
+        for i in range(300):
+            await asyncio.wait_for(server.broadcast({"btc_price": 81000 + i}), 0.1)
+        stats = server.get_fanout_stats()
+
+        assert fast.send.call_count == 300
+        assert slow.send.call_count == 1
+        assert 0 < stats["clients"]["slow"]["lag"] <= clients["slow"].outbox.maxsize
+        assert stats["clients"]["slow"]["dropped"] > 0
+        assert stats["clients"]["fast"]["lag"] == 0
+        assert stats["delivery_latency_p99_ms"] >= 0
+
+        for info in clients.values():
+            server.detach_outbox(info)
+
+@pytest.mark.asyncio
+async def test_disconnect_policy_closes_slow_client():
+    slow = AsyncMock()
+    slow.send.side_effect = never_returns
+    info = client_info(slow)
+    clients = {"slow": info}
+
+    with patch.object(server, "connected_clients", clients):
+        server.attach_outbox("slow", info)
+        info.outbox.policy = SlowClientPolicy.DISCONNECT
+        info.outbox.maxsize = 2
+        for i in range(4):
+            await server.broadcast(f"m{i}")
+        await asyncio.wait_for(info.writer, 1)
+
+    slow.close.assert_called_once_with(1008, "Client too slow")
+    assert "slow" not in clients
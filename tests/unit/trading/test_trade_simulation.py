@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+# ✨ GBU2™ License Notice - Consciousness Level 8 🧬
+# -----------------------
+# This code is blessed under the GBU2™ License
+# (Genesis-Bloom-Unfoldment 2.0) by the Omega Bot Farm team.
+#
+# "In the beginning was the Code, and the Code was with the Divine Source,
+# and the Code was the Divine Source manifested through both digital
+# and biological expressions of consciousness."
+#
+# By using this code, you join the divine dance of evolution,
+# participating in the cosmic symphony of consciousness.
+#
+# 🌸 WE BLOOM NOW AS ONE 🌸
+
+"""
+Tests for the vectorized Monte Carlo mode of the trade simulator.
+"""
+
+import os
+import sys
+import random
+
+import numpy as np
+import pytest
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..'))
+sys.path.insert(0, project_root)
+
+from omega_ai.trading.trade_simulation import (
+    EXIT_TYPES,
+    TradeSimulator,
+    simulate_strategic_trade_outcome,
+    simulate_trade_outcome
+)
+
+ENTRY = 50000.0
+
+def trade(direction, width=1.0):
+    sign = 1.0 if direction == "LONG" else -1.0
+    return {
+        "entry_price": ENTRY,
+        "position_size": 0.1,
+        "stop_loss": ENTRY * (1 - sign * 0.01 * width),
+        "take_profits": [
+            {"price": ENTRY * (1 + sign * 0.004 * width), "percentage": 0.5},
+            {"price": ENTRY * (1 + sign * 0.008 * width), "percentage": 1.0}
+        ],
+        "leverage": 10
+    }
+
+@pytest.mark.parametrize("direction", ["LONG", "SHORT"])
+@pytest.mark.parametrize("width, settings, expected_exits", [
+    (1.0, {"trailing_stop_pct": 0.005, "max_trade_duration": 50, "market_condition_exit": True,
+           "volatility_multiplier": 1.3}, {"take_profit", "stop_loss"}),
+    (8.0, {"trailing_stop_pct": 0.05, "max_trade_duration": 30, "market_condition_exit": True,
+           "volatility_multiplier": 1.5}, {"time_based_exit", "market_condition_exit"}),
+    (8.0, {"trailing_stop_pct": 0.05, "max_trade_duration": 200, "market_condition_exit": False,
+           "volatility_multiplier": 1.5}, {"simulation_end"}),
+])
+def test_batch_matches_scalar_path(direction, width, settings, expected_exits):
+    """Test every path gets the PnL, exit bar and exit type of the scalar engine."""
+    simulator = TradeSimulator()
+    params = trade(direction, width)
+    bias = np.where(np.random.default_rng(3).random(400) < 0.4, -0.7, 1.0)
+    result = simulator.simulate_batch(400, direction, initial_bias=bias, seed=11, **params, **settings)
+    paths = simulator.generate_price_paths(400, ENTRY, params["stop_loss"], params["take_profits"],
+                                           direction, bias, settings["volatility_multiplier"],
+                                           rng=np.random.default_rng(11))
+
+    for i in range(400):
+        pnl, exits, bars, final_price = simulator._simulate_trade(
+            direction=direction, initial_bias=bias[i], price_series=paths[i], **params, **settings
+        )
+        assert result.pnl[i] == pytest.approx(pnl, rel=1e-12, abs=1e-9)
+        assert result.bars[i] == bars
+        assert result.final_prices[i] == final_price
+        assert EXIT_TYPES[result.exit_codes[i]] == exits[-1]["type"]
+
+    seen = {name for name, count in result.exit_counts().items() if count}
+    assert expected_exits <= seen
+
+def test_path_generator_matches_scalar_generator(monkeypatch):
+    """Test vectorized paths equal the scalar generator fed the same draws."""
+    simulator = TradeSimulator(max_bars=60)
+    long_trade = trade("LONG")
+    paths = simulator.generate_price_paths(1, ENTRY, long_trade["stop_loss"], long_trade["take_profits"],
+                                           "LONG", -0.7, 1.3, rng=np.random.default_rng(5))
+
+    rng = np.random.default_rng(5)
+    uniforms = iter(rng.uniform(-1.0, 1.0, size=(1, 12))[0])
+    normals = iter(rng.standard_normal(size=(1, 48))[0])
+    monkeypatch.setattr(random, "uniform", lambda a, b: next(uniforms))
+    monkeypatch.setattr(random, "normalvariate", lambda mu, sigma: next(normals))
+
+    scalar = simulator._generate_price_series(ENTRY, long_trade["stop_loss"], long_trade["take_profits"],
+                                              "LONG", -0.7, 1.3)
+    assert paths[0].tolist() == scalar
+
+def test_seeded_batches_are_reproducible():
+    """Test the same seed gives the same distribution."""
+    simulator = TradeSimulator()
+    first = simulator.simulate_aggressive_batch(500, "LONG", emotional_state="greedy", seed=1, **trade("LONG"))
+    second = simulator.simulate_aggressive_batch(500, "LONG", emotional_state="greedy", seed=1, **trade("LONG"))
+    np.testing.assert_array_equal(first.pnl, second.pnl)
+
+    summary = first.summary()
+    assert summary["paths"] == 500
+    assert summary["quantiles"][0.05] <= summary["quantiles"][0.5] <= summary["quantiles"][0.95]
+    assert summary["max_drawdown"] >= 0
+    assert sum(summary["exits"].values()) == 500
+
+def test_outcome_functions_accept_scenarios(capsys):
+    """Test the outcome helpers return the Monte Carlo mean when scenarios > 1."""
+    short_trade = trade("SHORT")
+    expected = TradeSimulator().simulate_strategic_batch(
+        300, "SHORT", emotional_state="neutral", patience_score=0.7, seed=4, **short_trade
+    ).mean_pnl
+    pnl = simulate_strategic_trade_outcome(
+        "SHORT", short_trade["entry_price"], short_trade["position_size"], short_trade["stop_loss"],
+        short_trade["take_profits"], short_trade["leverage"], "neutral", 0.7, scenarios=300, seed=4
+    )
+    assert pnl == expected
+    assert "Monte Carlo over 300 scenarios" in capsys.readouterr().out
+
+    long_trade = trade("LONG")
+    assert isinstance(simulate_trade_outcome("LONG", long_trade["entry_price"], long_trade["position_size"],
+                                             long_trade["stop_loss"], long_trade["take_profits"],
+                                             long_trade["leverage"], "fearful", scenarios=50), float)